@@ -170,6 +170,7 @@ from borb.pdf.toolkit.filter.page.odd_pages import OddPages
 from borb.pdf.toolkit.filter.right.right_of import RightOf
 from borb.pdf.toolkit.filter.right.right_of_image import RightOfImage
 from borb.pdf.toolkit.filter.right.right_of_text import RightOfText
+from borb.pdf.toolkit.filter.spatial_index import SpatialIndex
 from borb.pdf.toolkit.pipe import Pipe
 from borb.pdf.toolkit.pipeline import Pipeline
 from borb.pdf.toolkit.sink.get_colors import GetColors
@@ -16,7 +16,12 @@ import typing
 
 from borb.pdf.conformance import Conformance
 from borb.pdf.page import Page
-from borb.pdf.primitives import name, hexstr, PDFType, datestr
+from borb.pdf.primitives import name, hexstr, PDFType, datestr, reference
+from borb.pdf.visitor.read.lazy_dict import LazyDict
+from borb.pdf.visitor.read.page_tree import PageTree
+from borb.pdf.visitor.write_existing.incremental_update_snapshot import (
+    IncrementalUpdateSnapshot,
+)
 
 
 class Document(dict):
@@ -59,6 +64,11 @@ class Document(dict):
         self.__conformance_at_create: typing.Optional[Conformance] = conformance
         self.__on_non_conformance_print_warning: bool = on_non_conformance_print_warning
         self.__on_non_conformance_throw_assert: bool = on_non_conformance_throw_assert
+        self.__lazy_reference_resolver: typing.Optional[typing.Callable[[reference], PDFType]] = None  # type: ignore[annotation-unchecked]
+        self.__pages_in_order: typing.List[Page] = []  # type: ignore[annotation-unchecked]
+        self.__pages_in_order_root: typing.Optional[PDFType] = None  # type: ignore[annotation-unchecked]
+        self.__page_nr_per_page_id: typing.Dict[int, int] = {}  # type: ignore[annotation-unchecked]
+        self.__incremental_update_snapshot: typing.Optional[IncrementalUpdateSnapshot] = None  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
@@ -68,6 +78,24 @@ class Document(dict):
     def __get_now_as_date_str() -> str:
         return datestr(datetime.datetime.now().strftime("D:%Y%m%d%H%M%SZ00"))
 
+    def __get_pages_in_order(self) -> typing.List[Page]:
+        # IF the page-tree has not changed (since the index was built)
+        # THEN return the cached Page(s)
+        root: PDFType = self.get("Trailer", {}).get("Root", {}).get("Pages", {})
+        assert isinstance(root, dict)
+        if self.__pages_in_order_root is root and len(
+            self.__pages_in_order
+        ) == root.get("Count", 0):
+            return self.__pages_in_order
+
+        # walk the page-tree (depth-first, in order), and build the index
+        self.__pages_in_order = PageTree.get_pages(root)
+        self.__pages_in_order_root = root
+        self.__page_nr_per_page_id = {
+            id(p): i for i, p in enumerate(self.__pages_in_order)
+        }
+        return self.__pages_in_order
+
     @staticmethod
     def __get_random_id() -> hexstr:
         import random
@@ -76,6 +104,45 @@ class Document(dict):
             "".join([random.choice("0123456789ABCDEF") for _ in range(0, 32)])
         )
 
+    def __invalidate_pages_in_order(self) -> None:
+        self.__pages_in_order = []
+        self.__pages_in_order_root = None
+        self.__page_nr_per_page_id = {}
+
+    def __resolve_all_references(self) -> None:
+        # IF the Document was not read lazily
+        # THEN there is nothing to resolve
+        if self.__lazy_reference_resolver is None:
+            return
+
+        # walk the entire Document
+        LazyDict.resolve_all_references(self["Trailer"])
+        self.__lazy_reference_resolver = None
+
+        # (back)link Page(s) to Document
+        for p in self.__get_pages_in_order():
+            p._Page__document = self  # type: ignore[attr-defined]
+
+    def __resolve_lazily(self, o: PDFType) -> PDFType:
+        if self.__lazy_reference_resolver is None:
+            return o
+        if not isinstance(o, reference):
+            return o
+        retval: PDFType = self.__lazy_reference_resolver(o)
+        LazyDict.make_lazy(
+            reference_resolver=self.__resolve_lazily, referenced_object=retval
+        )
+
+        # IF the object was resolved (for the first time)
+        # THEN keep track of its state (for incremental updates)
+        if self.__incremental_update_snapshot is not None:
+            self.__incremental_update_snapshot.take_snapshot(
+                indirect_reference=o, referenced_object=retval
+            )
+
+        # return
+        return retval
+
     def __setup_document_skeleton(self) -> None:
         # /XRef
         if "XRef" not in self:
@@ -170,6 +237,7 @@ class Document(dict):
         self.__setup_document_skeleton()
 
         # add page
+        self.__invalidate_pages_in_order()
         self["Trailer"]["Root"]["Pages"]["Kids"] += [page]
         self["Trailer"]["Root"]["Pages"]["Count"] += 1
 
@@ -230,6 +298,18 @@ class Document(dict):
         except:
             return None
 
+    def get_incremental_update_snapshot(
+        self,
+    ) -> typing.Optional[IncrementalUpdateSnapshot]:
+        """
+        Retrieve the state of this Document at the time it was read, if `PDF.read` was asked to keep it.
+
+        `PDF.write` uses it to append only the objects that were added or modified (as an incremental update).
+
+        :return: The `IncrementalUpdateSnapshot`, or `None` if this Document can not be written incrementally.
+        """
+        return self.__incremental_update_snapshot
+
     def get_keywords(self) -> typing.Optional[str]:
         """
         Retrieve the keywords metadata from the PDF document, if available.
@@ -291,27 +371,41 @@ class Document(dict):
         :param index:   the index
         :return:        self
         """
-        pages_in_order = [self["Trailer"]["Root"]["Pages"]]
-        i: int = 0
-        while i < len(pages_in_order):
-            n = pages_in_order[i]
-
-            # page tree nodes are exploded and processed in next turn
-            if isinstance(n, dict) and "Kids" in n:
-                pages_in_order = (
-                    pages_in_order[0:i]
-                    + [x for x in n["Kids"]]
-                    + pages_in_order[i + 1 :]
-                )
-                continue
-
-            # IF we processed a Page
-            # THEN move ahead by 1
-            if isinstance(n, Page):
-                i += 1
+        # IF the Document was read lazily
+        # THEN only resolve the path to the Page
+        if self.__lazy_reference_resolver is not None:
+            page: Page = PageTree.get_page(
+                index=index, pages=self["Trailer"]["Root"]["Pages"]
+            )
+            page._Page__document = self  # type: ignore[attr-defined]
+            return page
 
-        # return
-        return pages_in_order[index]
+        return self.__get_pages_in_order()[index]
+
+    def get_page_nr(self, page: Page) -> int:
+        """
+        Retrieve the (zero-based) index of the given Page object in this document.
+
+        The first call builds an index of all Page objects (walking the page-tree once),
+        subsequent calls are a single dictionary lookup. The index is rebuilt whenever the
+        page-tree changes (e.g. when a Page is appended, inserted or removed).
+        If the Page does not belong to this document, -1 is returned.
+
+        :param page:    the Page
+        :return:        the index of the Page, or -1
+        """
+        pages_in_order: typing.List[Page] = self.__get_pages_in_order()
+        page_nr: int = self.__page_nr_per_page_id.get(id(page), -1)
+
+        # IF the Page was not found (e.g. because the Document was copied or unpickled)
+        # THEN rebuild the index (id(Page) -> index) and try again
+        if page_nr == -1 or pages_in_order[page_nr] is not page:
+            self.__page_nr_per_page_id = {
+                id(p): i for i, p in enumerate(pages_in_order)
+            }
+            page_nr = self.__page_nr_per_page_id.get(id(page), -1)
+        is_found: bool = page_nr != -1 and pages_in_order[page_nr] is page
+        return page_nr if is_found else -1
 
     def get_producer(self) -> typing.Optional[str]:
         """
@@ -372,37 +466,16 @@ class Document(dict):
         # check the index
         assert 0 <= index < self.get_number_of_pages()
 
-        # traverse the page-tree to insert the Page
-        page_id_to_parent: typing.Dict[int, PDFType] = {}
-        page_nr_to_page: typing.Dict[int, PDFType] = {}
-        todo: typing.List[PDFType] = [self["Trailer"]["Root"]["Pages"]]
-        while len(todo) > 0:
-            n: PDFType = todo.pop()
-            # thing has kids
-            if isinstance(n, dict) and ("Kids" in n):
-                for k in n["Kids"]:  # type: ignore[union-attr]
-                    todo = [k] + todo
-                    page_id_to_parent[id(k)] = n
-            # thing is a Page
-            if isinstance(n, Page):
-                page_nr_to_page[len(page_nr_to_page)] = n
-                continue
-
-        # determine where to insert (in the lowest level page-tree)
-        # fmt: off
-        prev_page_at_index = page_nr_to_page[index]
-        parent = page_id_to_parent[id(page_nr_to_page[index])]
-        index_in_kids: int = next(iter([(i, parent['Kids'][i]) for i in range(0, len(parent['Kids'])) if parent['Kids'][i] == prev_page_at_index]))[0] # type: ignore[arg-type, call-overload, index]
-        # fmt: on
-
-        # insert, change count
-        parent["Kids"].insert(index_in_kids, page)  # type: ignore[call-overload, index, union-attr]
-        parent["Count"] += 1  # type: ignore[call-overload, index, operator]
-
-        # propagate up
-        while id(parent) in page_id_to_parent and ("Count" in parent):  # type: ignore[operator]
-            parent = page_id_to_parent[id(parent)]
-            parent["Count"] += 1  # type: ignore[call-overload, index, operator]
+        # find the path (in the page-tree) to the Page at the index
+        path: typing.List[typing.Tuple[typing.Dict, int]] = PageTree.get_path_to_page(
+            index=index, pages=self["Trailer"]["Root"]["Pages"]
+        )
+
+        # insert (in the lowest level page-tree), change count (all the way up)
+        self.__invalidate_pages_in_order()
+        path[-1][0]["Kids"].insert(path[-1][1], page)
+        for parent, _ in path:
+            parent["Count"] += 1
 
         # return
         return self
@@ -424,37 +497,16 @@ class Document(dict):
         # check the index
         assert 0 <= index < self.get_number_of_pages()
 
-        # traverse the page-tree to remove the Page
-        page_id_to_parent: typing.Dict[int, PDFType] = {}
-        page_nr_to_page: typing.Dict[int, PDFType] = {}
-        todo: typing.List[PDFType] = [self["Trailer"]["Root"]["Pages"]]
-        while len(todo) > 0:
-            n: PDFType = todo.pop()
-            # thing has kids
-            if isinstance(n, dict) and ("Kids" in n):
-                for k in n["Kids"]:  # type: ignore[union-attr]
-                    todo = [k] + todo
-                    page_id_to_parent[id(k)] = n
-            # thing is a Page
-            if isinstance(n, Page):
-                page_nr_to_page[len(page_nr_to_page)] = n
-                continue
-
-        # determine where to remove (in the lowest level page-tree)
-        # fmt: off
-        prev_page_at_index = page_nr_to_page[index]
-        parent = page_id_to_parent[id(page_nr_to_page[index])]
-        index_in_kids: int = next(iter([(i, parent['Kids'][i]) for i in range(0, len(parent['Kids'])) if parent['Kids'][i] == prev_page_at_index]))[0] # type: ignore[arg-type, call-overload, index]
-        # fmt: on
-
-        # delete
-        del parent["Kids"][index_in_kids]  # type: ignore[arg-type, call-overload, index, union-attr]
-        parent["Count"] -= 1  # type: ignore[call-overload, index, operator]
-
-        # propagate up
-        while id(parent) in page_id_to_parent and ("Count" in parent):  # type: ignore[operator]
-            parent = page_id_to_parent[id(parent)]
-            parent["Count"] -= 1  # type: ignore[call-overload, index, operator]
+        # find the path (in the page-tree) to the Page at the index
+        path: typing.List[typing.Tuple[typing.Dict, int]] = PageTree.get_path_to_page(
+            index=index, pages=self["Trailer"]["Root"]["Pages"]
+        )
+
+        # delete (in the lowest level page-tree), change count (all the way up)
+        self.__invalidate_pages_in_order()
+        del path[-1][0]["Kids"][path[-1][1]]
+        for parent, _ in path:
+            parent["Count"] -= 1
 
         # return
         return self
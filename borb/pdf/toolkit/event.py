@@ -54,10 +54,24 @@ class Event:
     needed, facilitating ongoing expansion and customization of the PDF processing pipeline.
     """
 
+    __slots__ = ("__page_nr",)
+
     #
     # CONSTRUCTOR
     #
 
+    def __init__(self, page_nr: typing.Optional[int] = None):
+        """
+        Initialize an Event.
+
+        The (zero-based) index of the page where the Event occurred can be stamped on the Event
+        when it is created (typically by the `Source`, which knows which page it is processing).
+        This avoids having to look up the page in its `Document` for every Event.
+
+        :param page_nr: The (zero-based) index of the page in its document, if known.
+        """
+        self.__page_nr: typing.Optional[int] = page_nr
+
     #
     # PRIVATE
     #
@@ -90,15 +104,11 @@ class Event:
 
         :return: The page nr in the document where the Event occurred.
         """
-        page: Page = self.get_page()
-        document: Document = self.get_document()
-        return next(
-            iter(
-                [
-                    i
-                    for i in range(0, document.get_number_of_pages())
-                    if document.get_page(i) == page
-                ]
-            ),
-            -1,
-        )
+        # IF the page nr was stamped on the Event (when it was created)
+        # THEN return it
+        if self.__page_nr is not None:
+            return self.__page_nr
+
+        # look up the page in its Document (and remember the result)
+        self.__page_nr = self.get_document().get_page_nr(self.get_page())
+        return self.__page_nr
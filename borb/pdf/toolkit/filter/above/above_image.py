@@ -15,6 +15,7 @@ modifications in a PDF.
 import typing
 
 from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.filter.spatial_index import SpatialIndex
 from borb.pdf.toolkit.pipe import Pipe
 from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
 from borb.pdf.toolkit.source.event.image_event import ImageEvent
@@ -51,7 +52,7 @@ class AboveImage(Pipe):
         of content relative to images.
         """
         super().__init__()
-        self.__events_per_page: typing.Dict[int, typing.List[Event]] = {}  # type: ignore[annotation-unchecked]
+        self.__spatial_index_per_page: typing.Dict[int, SpatialIndex] = {}  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
@@ -61,18 +62,51 @@ class AboveImage(Pipe):
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Pipe` (and the `Pipe` objects after it) need(s).
+
+        This filter needs whatever the next `Pipe` needs, as well as the `ImageEvent` objects
+        that serve as anchor(s).
+
+        :return: The types of `Event` needed, or None if every type of `Event` is needed.
+        """
+        next_pipe: typing.Optional[Pipe] = self.get_next()
+        if next_pipe is None:
+            return set()
+        event_types: typing.Optional[typing.Set[typing.Type[Event]]] = (
+            next_pipe.get_event_types()
+        )
+        if event_types is None:
+            return None
+        return event_types | {ImageEvent}
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
 
-        This base implementation is a no-op. Subclasses should override this method
-        to provide specific processing logic.
+        Events are added to the `SpatialIndex` of their page. Once the page is finished
+        (i.e. when an `EndPageEvent` is processed) the anchor(s) are looked up,
+        and the events above the anchor(s) are found using region queries on the `SpatialIndex`.
+        Those events (and all events without a position) are then passed along, in their original order.
 
         :param event: The event object to process.
         """
-        self.__events_per_page[event.get_page_nr()] = self.__events_per_page.get(
-            event.get_page_nr(), []
-        ) + [event]
+        # add the event to the SpatialIndex of its page
+        page_nr: int = event.get_page_nr()
+        spatial_index: typing.Optional[SpatialIndex] = (
+            self.__spatial_index_per_page.get(page_nr)
+        )
+        if spatial_index is None:
+            spatial_index = SpatialIndex()
+            self.__spatial_index_per_page[page_nr] = spatial_index
+        spatial_index.add(event)
+
+        # IF the page is not finished
+        # THEN return
+        if not isinstance(event, EndPageEvent):
+            return
+        self.__spatial_index_per_page.pop(page_nr)
 
         # IF there is no next Pipe
         # THEN return
@@ -80,26 +114,31 @@ class AboveImage(Pipe):
         if next_pipe is None:
             return
 
-        # EndPageEvent
-        if isinstance(event, EndPageEvent):
-            y_limit: float = min(
-                [
-                    x.get_y() + x.get_height()
-                    for x in self.__events_per_page[event.get_page_nr()]
-                    if isinstance(x, ImageEvent)
-                ]
-                + [event.get_page().get_size()[1]]
-            )
-
-            for event_in_page in self.__events_per_page[event.get_page_nr()]:
-                # pass along to the next Pipe
-                if (
-                    isinstance(event_in_page, ShapeFillEvent)
-                    or isinstance(event_in_page, ShapeStrokeEvent)
-                    or isinstance(event_in_page, ImageEvent)
-                    or isinstance(event_in_page, TextEvent)
-                ):
-                    if event_in_page.get_y() >= y_limit:
-                        next_pipe.process(event_in_page)
-                else:
+        # find the anchor(s)
+        anchors: typing.List[ImageEvent] = [
+            x for x in spatial_index.get_events() if isinstance(x, ImageEvent)
+        ]
+
+        # determine the events above the anchor(s)
+        y_limit: float = min(
+            [x.get_y() + x.get_height() for x in anchors]
+            + [event.get_page().get_size()[1]]
+        )
+        selected_events: typing.Set[int] = {
+            id(x)
+            for x in spatial_index.get_events_in_region(min_y=y_limit)
+            if x.get_y() >= y_limit
+        }
+
+        for event_in_page in spatial_index.get_events():
+            # pass along to the next Pipe
+            if (
+                isinstance(event_in_page, ShapeFillEvent)
+                or isinstance(event_in_page, ShapeStrokeEvent)
+                or isinstance(event_in_page, ImageEvent)
+                or isinstance(event_in_page, TextEvent)
+            ):
+                if id(event_in_page) in selected_events:
                     next_pipe.process(event_in_page)
+            else:
+                next_pipe.process(event_in_page)
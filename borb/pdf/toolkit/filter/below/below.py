@@ -50,6 +50,19 @@ class Below(Pipe):
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Pipe` (and the `Pipe` objects after it) need(s).
+
+        This filter only ever removes events, so it needs whatever the next `Pipe` needs.
+
+        :return: The types of `Event` needed, or None if every type of `Event` is needed.
+        """
+        next_pipe: typing.Optional[Pipe] = self.get_next()
+        if next_pipe is None:
+            return set()
+        return next_pipe.get_event_types()
+
     def process(
         self,
         event: Event,
@@ -51,6 +51,16 @@ class ByFontSize(Pipe):
     #
     # PUBLIC
     #
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Pipe` (and the `Pipe` objects after it) need(s).
+
+        This filter only ever passes along `TextEvent` objects.
+
+        :return: The types of `Event` needed.
+        """
+        return {TextEvent}
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
@@ -55,6 +55,19 @@ class Inside(Pipe):
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Pipe` (and the `Pipe` objects after it) need(s).
+
+        This filter only ever removes events, so it needs whatever the next `Pipe` needs.
+
+        :return: The types of `Event` needed, or None if every type of `Event` is needed.
+        """
+        next_pipe: typing.Optional[Pipe] = self.get_next()
+        if next_pipe is None:
+            return set()
+        return next_pipe.get_event_types()
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
@@ -85,7 +98,7 @@ class Inside(Pipe):
         ) and (
             (event.get_y() >= self.__y)
             and (event.get_y() + event.get_height() <= self.__y + self.__height)
-            and (event.get_x() >= event.get_x())
+            and (event.get_x() >= self.__x)
             and (event.get_x() + event.get_width() <= self.__x + self.__width)
         ):
             next_pipe.process(event)
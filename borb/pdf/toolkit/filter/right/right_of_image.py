@@ -8,8 +8,16 @@ given image on the page. This can be useful for filtering or manipulating conten
 appears next to or after a specific image, such as extracting text or objects located
 to the right of the image.
 """
+import typing
+
 from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.filter.spatial_index import SpatialIndex
 from borb.pdf.toolkit.pipe import Pipe
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+from borb.pdf.toolkit.source.event.image_event import ImageEvent
+from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
 
 
 class RightOfImage(Pipe):
@@ -26,6 +34,18 @@ class RightOfImage(Pipe):
     # CONSTRUCTOR
     #
 
+    def __init__(self):
+        """
+        Initialize the RightOfImage filter.
+
+        This constructor sets up the necessary structures for processing events related
+        to content located right of images. It prepares the filter to capture events as the
+        PDF content streams are processed, allowing for filtering based on the position
+        of content relative to images.
+        """
+        super().__init__()
+        self.__spatial_index_per_page: typing.Dict[int, SpatialIndex] = {}  # type: ignore[annotation-unchecked]
+
     #
     # PRIVATE
     #
@@ -34,13 +54,84 @@ class RightOfImage(Pipe):
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Pipe` (and the `Pipe` objects after it) need(s).
+
+        This filter needs whatever the next `Pipe` needs, as well as the `ImageEvent` objects
+        that serve as anchor(s).
+
+        :return: The types of `Event` needed, or None if every type of `Event` is needed.
+        """
+        next_pipe: typing.Optional[Pipe] = self.get_next()
+        if next_pipe is None:
+            return set()
+        event_types: typing.Optional[typing.Set[typing.Type[Event]]] = (
+            next_pipe.get_event_types()
+        )
+        if event_types is None:
+            return None
+        return event_types | {ImageEvent}
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
 
-        This base implementation is a no-op. Subclasses should override this method
-        to provide specific processing logic.
+        Events are added to the `SpatialIndex` of their page. Once the page is finished
+        (i.e. when an `EndPageEvent` is processed) the anchor(s) are looked up,
+        and the events right of the anchor(s) are found using region queries on the `SpatialIndex`.
+        Those events (and all events without a position) are then passed along, in their original order.
 
         :param event: The event object to process.
         """
-        pass
+        # add the event to the SpatialIndex of its page
+        page_nr: int = event.get_page_nr()
+        spatial_index: typing.Optional[SpatialIndex] = (
+            self.__spatial_index_per_page.get(page_nr)
+        )
+        if spatial_index is None:
+            spatial_index = SpatialIndex()
+            self.__spatial_index_per_page[page_nr] = spatial_index
+        spatial_index.add(event)
+
+        # IF the page is not finished
+        # THEN return
+        if not isinstance(event, EndPageEvent):
+            return
+        self.__spatial_index_per_page.pop(page_nr)
+
+        # IF there is no next Pipe
+        # THEN return
+        next_pipe: typing.Optional[Pipe] = self.get_next()
+        if next_pipe is None:
+            return
+
+        # find the anchor(s)
+        anchors: typing.List[ImageEvent] = [
+            x for x in spatial_index.get_events() if isinstance(x, ImageEvent)
+        ]
+
+        # determine the events right of the anchor(s)
+        # (i.e. to the right of an anchor, and overlapping with it vertically)
+        selected_events: typing.Set[int] = set()
+        for anchor in anchors:
+            for x in spatial_index.get_events_in_region(
+                max_y=anchor.get_y() + anchor.get_height(),
+                min_x=anchor.get_x() + anchor.get_width(),
+                min_y=anchor.get_y(),
+            ):
+                if x.get_x() >= anchor.get_x() + anchor.get_width():
+                    selected_events.add(id(x))
+
+        for event_in_page in spatial_index.get_events():
+            # pass along to the next Pipe
+            if (
+                isinstance(event_in_page, ShapeFillEvent)
+                or isinstance(event_in_page, ShapeStrokeEvent)
+                or isinstance(event_in_page, ImageEvent)
+                or isinstance(event_in_page, TextEvent)
+            ):
+                if id(event_in_page) in selected_events:
+                    next_pipe.process(event_in_page)
+            else:
+                next_pipe.process(event_in_page)
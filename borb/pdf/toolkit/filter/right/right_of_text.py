@@ -8,8 +8,16 @@ given text string on the page. This can be useful for filtering or manipulating
 that appears next to or after a specific text, such as extracting text or objects located
 to the right of a particular word or phrase.
 """
+import typing
+
 from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.filter.spatial_index import SpatialIndex
 from borb.pdf.toolkit.pipe import Pipe
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+from borb.pdf.toolkit.source.event.image_event import ImageEvent
+from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
 
 
 class RightOfText(Pipe):
@@ -26,6 +34,22 @@ class RightOfText(Pipe):
     # CONSTRUCTOR
     #
 
+    def __init__(self, text: str):
+        """
+        Initialize the RightOfText filter.
+
+        This constructor sets up the necessary structures for processing events related
+        to content located right of the given text. Every `TextEvent` that contains the given
+        text is considered to be an anchor. Events are captured as the PDF content streams
+        are processed, and filtered (based on their position relative to the anchors)
+        once the page is finished.
+
+        :param text:    The text that marks the position of the anchor(s).
+        """
+        super().__init__()
+        self.__spatial_index_per_page: typing.Dict[int, SpatialIndex] = {}  # type: ignore[annotation-unchecked]
+        self.__text: str = text
+
     #
     # PRIVATE
     #
@@ -34,13 +58,86 @@ class RightOfText(Pipe):
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Pipe` (and the `Pipe` objects after it) need(s).
+
+        This filter needs whatever the next `Pipe` needs, as well as the `TextEvent` objects
+        that serve as anchor(s).
+
+        :return: The types of `Event` needed, or None if every type of `Event` is needed.
+        """
+        next_pipe: typing.Optional[Pipe] = self.get_next()
+        if next_pipe is None:
+            return set()
+        event_types: typing.Optional[typing.Set[typing.Type[Event]]] = (
+            next_pipe.get_event_types()
+        )
+        if event_types is None:
+            return None
+        return event_types | {TextEvent}
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
 
-        This base implementation is a no-op. Subclasses should override this method
-        to provide specific processing logic.
+        Events are added to the `SpatialIndex` of their page. Once the page is finished
+        (i.e. when an `EndPageEvent` is processed) the anchor(s) are looked up,
+        and the events right of the anchor(s) are found using region queries on the `SpatialIndex`.
+        Those events (and all events without a position) are then passed along, in their original order.
 
         :param event: The event object to process.
         """
-        pass
+        # add the event to the SpatialIndex of its page
+        page_nr: int = event.get_page_nr()
+        spatial_index: typing.Optional[SpatialIndex] = (
+            self.__spatial_index_per_page.get(page_nr)
+        )
+        if spatial_index is None:
+            spatial_index = SpatialIndex()
+            self.__spatial_index_per_page[page_nr] = spatial_index
+        spatial_index.add(event)
+
+        # IF the page is not finished
+        # THEN return
+        if not isinstance(event, EndPageEvent):
+            return
+        self.__spatial_index_per_page.pop(page_nr)
+
+        # IF there is no next Pipe
+        # THEN return
+        next_pipe: typing.Optional[Pipe] = self.get_next()
+        if next_pipe is None:
+            return
+
+        # find the anchor(s)
+        anchors: typing.List[TextEvent] = [
+            x
+            for x in spatial_index.get_events()
+            if isinstance(x, TextEvent) and self.__text in x.get_text()
+        ]
+
+        # determine the events right of the anchor(s)
+        # (i.e. to the right of an anchor, and overlapping with it vertically)
+        selected_events: typing.Set[int] = set()
+        for anchor in anchors:
+            for x in spatial_index.get_events_in_region(
+                max_y=anchor.get_y() + anchor.get_height(),
+                min_x=anchor.get_x() + anchor.get_width(),
+                min_y=anchor.get_y(),
+            ):
+                if x.get_x() >= anchor.get_x() + anchor.get_width():
+                    selected_events.add(id(x))
+
+        for event_in_page in spatial_index.get_events():
+            # pass along to the next Pipe
+            if (
+                isinstance(event_in_page, ShapeFillEvent)
+                or isinstance(event_in_page, ShapeStrokeEvent)
+                or isinstance(event_in_page, ImageEvent)
+                or isinstance(event_in_page, TextEvent)
+            ):
+                if id(event_in_page) in selected_events:
+                    next_pipe.process(event_in_page)
+            else:
+                next_pipe.process(event_in_page)
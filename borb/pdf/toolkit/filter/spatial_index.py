@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A grid-bucket index of the events on a single page, supporting fast region queries.
+
+The positional filters (e.g. `AboveImage`, `LeftOfText`) need to correlate the events on a page
+with one or more anchor elements (an image, a piece of text). Rather than scanning every event
+of the page for every anchor, the events are added to a `SpatialIndex` (once, as they arrive),
+after which every region query only needs to look at the events in the grid cells that overlap
+with the region.
+"""
+import math
+import typing
+
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.image_event import ImageEvent
+from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+
+
+class SpatialIndex:
+    """
+    A grid-bucket index of the events on a single page, supporting fast region queries.
+
+    The positional filters (e.g. `AboveImage`, `LeftOfText`) need to correlate the events on a page
+    with one or more anchor elements (an image, a piece of text). Rather than scanning every event
+    of the page for every anchor, the events are added to a `SpatialIndex` (once, as they arrive),
+    after which every region query only needs to look at the events in the grid cells that overlap
+    with the region.
+
+    Events that have no position (e.g. `EndPageEvent`) can be added as well.
+    They are kept (in order) by `get_events`, but they are never returned by `get_events_in_region`.
+    """
+
+    MAX_CELLS_PER_EVENT: int = 256
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(self, cell_size: int = 32):
+        """
+        Initialize a new (empty) SpatialIndex.
+
+        :param cell_size:   The width (and height) of a grid cell, in user space units.
+        """
+        self.__cell_size: int = cell_size
+        self.__events: typing.List[Event] = []  # type: ignore[annotation-unchecked]
+        self.__bounding_boxes: typing.Dict[int, typing.Tuple[float, float, float, float]] = {}  # type: ignore[annotation-unchecked]
+        self.__event_indices_per_cell: typing.Dict[typing.Tuple[int, int], typing.List[int]] = {}  # type: ignore[annotation-unchecked]
+        self.__large_event_indices: typing.List[int] = []  # type: ignore[annotation-unchecked]
+        self.__min_cell: typing.Tuple[int, int] = (0, 0)
+        self.__max_cell: typing.Tuple[int, int] = (-1, -1)
+
+    #
+    # PRIVATE
+    #
+
+    def __get_cell(self, x: float, y: float) -> typing.Tuple[int, int]:
+        return math.floor(x / self.__cell_size), math.floor(y / self.__cell_size)
+
+    #
+    # PUBLIC
+    #
+
+    def __len__(self) -> int:
+        """
+        Return the number of events in this SpatialIndex.
+
+        :return: The number of events (both positional and non-positional) in this SpatialIndex.
+        """
+        return len(self.__events)
+
+    def add(self, event: Event) -> None:
+        """
+        Add an event to this SpatialIndex.
+
+        Events that have a position (`ImageEvent`, `ShapeFillEvent`, `ShapeStrokeEvent` and `TextEvent`)
+        are added to every grid cell their bounding box overlaps with.
+
+        :param event:   The event to be added.
+        """
+        event_index: int = len(self.__events)
+        self.__events += [event]
+
+        # IF the event has no position
+        # THEN it can not be found using a region query
+        if not (
+            isinstance(event, ShapeFillEvent)
+            or isinstance(event, ShapeStrokeEvent)
+            or isinstance(event, ImageEvent)
+            or isinstance(event, TextEvent)
+        ):
+            return
+
+        # normalize the bounding box (width and height may be negative)
+        x: float = event.get_x()
+        y: float = event.get_y()
+        w: float = event.get_width()
+        h: float = event.get_height()
+        x0, x1 = min(x, x + w), max(x, x + w)
+        y0, y1 = min(y, y + h), max(y, y + h)
+        self.__bounding_boxes[event_index] = (x0, y0, x1, y1)
+
+        # IF the event spans (too) many cells
+        # THEN keep it aside, it is checked on every region query
+        c0: typing.Tuple[int, int] = self.__get_cell(x0, y0)
+        c1: typing.Tuple[int, int] = self.__get_cell(x1, y1)
+        if (c1[0] - c0[0] + 1) * (c1[1] - c0[1] + 1) > SpatialIndex.MAX_CELLS_PER_EVENT:
+            self.__large_event_indices += [event_index]
+            return
+
+        # add the event to every cell it overlaps with
+        for i in range(c0[0], c1[0] + 1):
+            for j in range(c0[1], c1[1] + 1):
+                self.__event_indices_per_cell.setdefault((i, j), []).append(event_index)
+
+        # keep track of the extent of the grid
+        # (the grid is empty as long as __min_cell comes after __max_cell)
+        if self.__min_cell > self.__max_cell:
+            self.__min_cell = c0
+            self.__max_cell = c1
+        else:
+            self.__min_cell = (
+                min(self.__min_cell[0], c0[0]),
+                min(self.__min_cell[1], c0[1]),
+            )
+            self.__max_cell = (
+                max(self.__max_cell[0], c1[0]),
+                max(self.__max_cell[1], c1[1]),
+            )
+
+    def get_events(self) -> typing.List[Event]:
+        """
+        Return all events in this SpatialIndex, in the order in which they were added.
+
+        :return: All events (both positional and non-positional) in this SpatialIndex.
+        """
+        return self.__events
+
+    def get_events_in_region(
+        self,
+        max_x: float = math.inf,
+        max_y: float = math.inf,
+        min_x: float = -math.inf,
+        min_y: float = -math.inf,
+    ) -> typing.List[
+        typing.Union[ImageEvent, ShapeFillEvent, ShapeStrokeEvent, TextEvent]
+    ]:
+        """
+        Return all (positional) events whose bounding box intersects with the given region.
+
+        The region is given by its lower-left corner (min_x, min_y) and its upper-right corner (max_x, max_y).
+        Any of these bounds may be infinite, which makes it easy to query (for instance)
+        everything below a given y-coordinate. Events are returned in the order in which they were added.
+
+        :param max_x:   The x-coordinate of the upper-right corner of the region.
+        :param max_y:   The y-coordinate of the upper-right corner of the region.
+        :param min_x:   The x-coordinate of the lower-left corner of the region.
+        :param min_y:   The y-coordinate of the lower-left corner of the region.
+        :return:        The events whose bounding box intersects with the region.
+        """
+        # IF the region is empty
+        # THEN return
+        if min_x > max_x or min_y > max_y or len(self.__bounding_boxes) == 0:
+            return []
+        candidate_event_indices: typing.Set[int] = set(self.__large_event_indices)
+
+        # clamp the region to the extent of the grid
+        # (this also takes care of infinite bounds)
+        gx0: float = self.__min_cell[0] * self.__cell_size
+        gy0: float = self.__min_cell[1] * self.__cell_size
+        gx1: float = (self.__max_cell[0] + 1) * self.__cell_size
+        gy1: float = (self.__max_cell[1] + 1) * self.__cell_size
+        c0: typing.Tuple[int, int] = self.__get_cell(
+            min(max(min_x, gx0), gx1), min(max(min_y, gy0), gy1)
+        )
+        c1: typing.Tuple[int, int] = self.__get_cell(
+            min(max(max_x, gx0), gx1), min(max(max_y, gy0), gy1)
+        )
+
+        # gather the (unique) events in the cells that overlap with the region
+        for i in range(c0[0], c1[0] + 1):
+            for j in range(c0[1], c1[1] + 1):
+                candidate_event_indices.update(
+                    self.__event_indices_per_cell.get((i, j), [])
+                )
+
+        # check the exact bounding box of each candidate
+        event_indices: typing.List[int] = []
+        for event_index in sorted(candidate_event_indices):
+            bx0, by0, bx1, by1 = self.__bounding_boxes[event_index]
+            if bx0 <= max_x and min_x <= bx1 and by0 <= max_y and min_y <= by1:
+                event_indices += [event_index]
+        return [self.__events[i] for i in event_indices]  # type: ignore[misc]
@@ -53,6 +53,20 @@ class Pipe:
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Pipe` (and the `Pipe` objects after it) need(s).
+
+        A `Source` uses this (on the `Pipe` that follows it) to skip the operators
+        that only produce events nobody needs. For instance, when the pipeline ends in `GetText`,
+        there is no need to construct paths or to look up image XObjects.
+        This base implementation returns None, meaning every type of `Event` is needed.
+        Filters typically return whatever the next `Pipe` needs (plus whatever they need themselves).
+
+        :return: The types of `Event` needed, or None if every type of `Event` is needed.
+        """
+        return None
+
     def get_next(self) -> typing.Optional["Pipe"]:
         """
         Retrieve the next `Pipe` in the processing pipeline.
@@ -72,6 +86,19 @@ class Pipe:
         """
         pass
 
+    def process_events(self, events: typing.List[Event]) -> None:
+        """
+        Process the given events (typically all events of a single page).
+
+        A `Source` can be configured to deliver the events of a page as a single list,
+        rather than one by one. This base implementation calls `process` for every event
+        (in order). Subclasses may override this method to handle a list of events at once.
+
+        :param events: The event objects to process.
+        """
+        for event in events:
+            self.process(event)
+
     def set_next(self, pipe: "Pipe") -> "Pipe":
         """
         Set the next `Pipe` in the pipeline and returns the current `Pipe` instance.
@@ -8,13 +8,15 @@ process content from a PDF. Each `Pipe` in the pipeline can perform a specific t
 and the `Pipeline` ensures that content flows through the sequence of `Pipe` objects
 in the defined order.
 
-This class supports processing both individual `Page` objects and entire `Document`
-objects, making it flexible for a variety of PDF manipulation tasks.
+This class supports processing individual `Page` objects, entire `Document`
+objects, and PDF files (given by their path), making it flexible for a variety
+of PDF manipulation tasks.
 
 The first `Pipe` in the pipeline may be a `Source` object, which acts as the entry
 point for processing content streams. Subsequent pipes can perform filtering,
 transformation, or extraction tasks.
 """
+import pathlib
 import typing
 
 from borb.pdf.document import Document
@@ -31,8 +33,9 @@ class Pipeline:
     and the `Pipeline` ensures that content flows through the sequence of `Pipe` objects
     in the defined order.
 
-    This class supports processing both individual `Page` objects and entire `Document`
-    objects, making it flexible for a variety of PDF manipulation tasks.
+    This class supports processing individual `Page` objects, entire `Document`
+    objects, and PDF files (given by their path), making it flexible for a variety
+    of PDF manipulation tasks.
 
     The first `Pipe` in the pipeline may be a `Source` object, which acts as the entry
     point for processing content streams. Subsequent pipes can perform filtering,
@@ -43,17 +46,27 @@ class Pipeline:
     # CONSTRUCTOR
     #
 
-    def __init__(self, pipes: typing.List[Pipe]):
+    def __init__(self, pipes: typing.List[Pipe], number_of_processes: int = 1):
         """
         Initialize the `Pipeline` with a list of `Pipe` objects.
 
         This constructor sets up the pipeline by connecting each `Pipe` to the next one
         in the sequence. The final `Pipe` in the list has no next pipe.
 
-        :param pipes: A list of `Pipe` objects representing the sequence of operations
-                      in the pipeline.
+        When `number_of_processes` is larger than 1, the pages of a PDF file (passed to `process` by its path)
+        are divided over that many worker processes (using a `concurrent.futures.ProcessPoolExecutor`).
+        Each worker reads the file (lazily) and runs its own copy of the pipeline on its range of pages.
+        The (per-page) results of the final `Sink` of each worker are merged (in page order) into the final
+        `Sink` of this pipeline. Only the path and the page range are sent to a worker, rather than a copy
+        of the `Document`. A `Document` (or `Page`) object is always processed in this process.
+
+        :param pipes:               A list of `Pipe` objects representing the sequence of operations
+                                    in the pipeline.
+        :param number_of_processes: The number of (worker) processes used to process a `Document` (default is 1)
         """
         super().__init__()
+        assert number_of_processes >= 1, "number_of_processes must be at least 1."
+        self.__number_of_processes: int = number_of_processes
         self.__pipes: typing.List[Pipe] = pipes
         for i in range(0, len(self.__pipes) - 1):
             self.__pipes[i].set_next(self.__pipes[i + 1])
@@ -62,19 +75,89 @@ class Pipeline:
     # PRIVATE
     #
 
+    def __process_file_in_parallel(self, where_from: pathlib.Path) -> None:
+        # IF the final Sink can not merge the results of the worker processes
+        # THEN refuse (before any worker process is started)
+        from borb.pdf.toolkit.sink.sink import Sink
+
+        sink: Pipe = self.__pipes[-1]
+        assert (
+            isinstance(sink, Sink) and sink.__class__.merge is not Sink.merge
+        ), f"{sink.__class__.__name__} can not be used in a Pipeline with more than one process."
+
+        # divide the pages (in contiguous blocks) over the worker processes
+        from borb.pdf.visitor.pdf import PDF
+
+        document: typing.Optional[Document] = PDF.read(where_from=where_from, lazy=True)
+        assert document is not None
+        number_of_pages: int = document.get_number_of_pages()
+        number_of_processes: int = max(
+            1, min(self.__number_of_processes, number_of_pages)
+        )
+        page_nrs_per_process: typing.List[typing.List[int]] = [
+            list(
+                range(
+                    (i * number_of_pages) // number_of_processes,
+                    ((i + 1) * number_of_pages) // number_of_processes,
+                )
+            )
+            for i in range(0, number_of_processes)
+        ]
+
+        # process
+        import concurrent.futures
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=number_of_processes
+        ) as executor:
+            futures: typing.List[concurrent.futures.Future] = [
+                executor.submit(
+                    Pipeline._process_pages,
+                    page_nrs=page_nrs,
+                    pipes=self.__pipes,
+                    where_from=where_from,
+                )
+                for page_nrs in page_nrs_per_process
+            ]
+
+            # merge the final Sink of each worker (in page order)
+            for future in futures:
+                sink.merge(future.result())
+
+    @staticmethod
+    def _process_pages(
+        page_nrs: typing.List[int], pipes: typing.List[Pipe], where_from: pathlib.Path
+    ) -> Pipe:
+        # this method runs in a worker process
+        # it reads the PDF (lazily, so that only the pages it needs are parsed)
+        # and returns the final Pipe of the pipeline (so that its results can be merged)
+        from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+        from borb.pdf.visitor.pdf import PDF
+
+        document: typing.Optional[Document] = PDF.read(where_from=where_from, lazy=True)
+        assert document is not None
+        source = pipes[0]
+        for i in page_nrs:
+            page: Page = document.get_page(i)
+            source.process_page(page=page, page_nr=i)  # type: ignore[attr-defined]
+            source.process(EndPageEvent(page=page, page_nr=i))
+        return pipes[-1]
+
     #
     # PUBLIC
     #
 
-    def process(self, document_or_page: typing.Union[Document, Page]):
+    def process(
+        self, document_or_page: typing.Union[Document, Page, pathlib.Path, str]
+    ):
         """
-        Process a PDF `Document` or `Page` through the pipeline.
+        Process a PDF `Document` or `Page` (or the PDF file at a given path) through the pipeline.
 
-        This method determines whether the input is a `Document` or a `Page` and processes
+        This method determines whether the input is a `Document`, a `Page` or a path and processes
         the content accordingly. If the first `Pipe` in the pipeline is a `Source`, it is
         responsible for initiating the processing of content streams.
 
-        :param document_or_page: A `Document` or `Page` object to be processed by the pipeline.
+        :param document_or_page: A `Document` or `Page` object (or the path of a PDF file) to be processed by the pipeline.
         """
         if len(self.__pipes) == 0:
             return None
@@ -87,6 +170,20 @@ class Pipeline:
         if source is None:
             return
 
+        # IF document_or_page is a path
+        # THEN divide its pages over the worker processes (or read it, and process it in this process)
+        if isinstance(document_or_page, str):
+            document_or_page = pathlib.Path(document_or_page)
+        if (
+            isinstance(document_or_page, pathlib.Path)
+            and self.__number_of_processes > 1
+        ):
+            self.__process_file_in_parallel(where_from=document_or_page)
+        elif isinstance(document_or_page, pathlib.Path):
+            from borb.pdf.visitor.pdf import PDF
+
+            document_or_page = PDF.read(where_from=document_or_page, lazy=True)  # type: ignore[assignment]
+
         # IF document_or_page is a Document
         # THEN iterate over all Page object(s) in the Document
         from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
@@ -94,8 +191,8 @@ class Pipeline:
         if isinstance(document_or_page, Document):
             for i in range(0, document_or_page.get_number_of_pages()):
                 page: Page = document_or_page.get_page(i)
-                source.process_page(page=page)
-                source.process(EndPageEvent(page=page))
+                source.process_page(page=page, page_nr=i)
+                source.process(EndPageEvent(page=page, page_nr=i))
 
         # IF document_or_page is a Page
         # THEN process the Page
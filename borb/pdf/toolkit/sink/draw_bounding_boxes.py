@@ -42,6 +42,17 @@ class DrawBoundingBoxes(Sink):
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Sink` needs.
+
+        `DrawBoundingBoxes` only uses `TextEvent` objects. This allows the `Source` to skip (for instance) the construction of paths
+        and the lookup of image XObjects.
+
+        :return: The types of `Event` needed.
+        """
+        return {TextEvent}
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
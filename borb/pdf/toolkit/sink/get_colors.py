@@ -140,6 +140,19 @@ class GetColors(Sink):
             for k0, v0 in self.__number_of_colored_points_per_page.items()
         }
 
+    def merge(self, other: "Sink") -> "Sink":
+        """
+        Merge the (per-page) results of another `GetColors` into this `GetColors`.
+
+        :param other:   The `GetColors` whose results should be merged into this `GetColors`.
+        :return:        This `GetColors` (to allow method chaining).
+        """
+        assert isinstance(other, GetColors), "Only GetColors objects can be merged."
+        self.__number_of_colored_points_per_page.update(
+            other.__number_of_colored_points_per_page
+        )
+        return self
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
@@ -14,9 +14,11 @@ and stores them for future use or analysis.
 import io
 import typing
 
+from borb.pdf.primitives import stream
 from borb.pdf.toolkit.event import Event
 from borb.pdf.toolkit.sink.sink import Sink
 from borb.pdf.toolkit.source.event.image_event import ImageEvent
+from borb.pdf.visitor.read.compression.decode_stream import decode_stream_in_chunks
 
 
 class GetImages(Sink):
@@ -32,6 +34,22 @@ class GetImages(Sink):
     and stores them for future use or analysis.
     """
 
+    __PIL_MODE_PER_COLOR_SPACE_AND_BITS_PER_COMPONENT: typing.Dict[
+        typing.Tuple[str, int], str
+    ] = {
+        ("DeviceCMYK", 8): "CMYK",
+        ("DeviceGray", 1): "1",
+        ("DeviceGray", 8): "L",
+        ("DeviceRGB", 8): "RGB",
+    }
+    __SAMPLE_FILTERS: typing.List[str] = [
+        "ASCII85Decode",
+        "Fl",
+        "FlateDecode",
+        "LZWDecode",
+        "RunLengthDecode",
+    ]
+
     #
     # CONSTRUCTOR
     #
@@ -52,10 +70,79 @@ class GetImages(Sink):
     # PRIVATE
     #
 
+    @staticmethod
+    def __get_image(event: ImageEvent) -> typing.Any:
+        import PIL.Image  # type: ignore[import-untyped, import-not-found]
+
+        # look up the image XObject
+        image_stream: typing.Optional[stream] = (
+            event.get_page()
+            .get("Resources", {})
+            .get("XObject", {})
+            .get(event.get_xobject_resource()[1:], None)
+        )
+
+        # IF the image XObject can not be found
+        # OR the image is (ultimately) encoded using an image format (e.g. DCTDecode, JPXDecode)
+        # THEN let PIL open the (raw) bytes
+        filters: typing.List[str] = []
+        if isinstance(image_stream, stream):
+            filters = image_stream.get("Filter", [])
+            if not isinstance(filters, list):
+                filters = [filters]
+        if (
+            not isinstance(image_stream, stream)
+            or any([f not in GetImages.__SAMPLE_FILTERS for f in filters])
+            or (image_stream.get("ColorSpace"), image_stream.get("BitsPerComponent"))
+            not in GetImages.__PIL_MODE_PER_COLOR_SPACE_AND_BITS_PER_COMPONENT
+        ):
+            return PIL.Image.open(io.BytesIO(event.get_image()))  # type: ignore[arg-type]
+
+        # build the image from the decoded samples, one band of (complete) rows at a time
+        # (decoding the stream one chunk at a time, without storing /DecodedBytes on the stream)
+        mode: str = GetImages.__PIL_MODE_PER_COLOR_SPACE_AND_BITS_PER_COMPONENT[
+            (image_stream["ColorSpace"], image_stream["BitsPerComponent"])
+        ]
+        width: int = int(image_stream["Width"])
+        height: int = int(image_stream["Height"])
+        image = PIL.Image.new(mode=mode, size=(width, height))
+        bytes_per_row: int = len(PIL.Image.new(mode=mode, size=(width, 1)).tobytes())
+        pending_bytes: bytearray = bytearray()
+        y: int = 0
+        for chunk in decode_stream_in_chunks(image_stream):
+            pending_bytes += chunk
+            number_of_rows: int = min(len(pending_bytes) // bytes_per_row, height - y)
+            if number_of_rows == 0:
+                continue
+            image.paste(
+                PIL.Image.frombytes(
+                    mode=mode,
+                    size=(width, number_of_rows),
+                    data=pending_bytes[: number_of_rows * bytes_per_row],
+                ),
+                (0, y),
+            )
+            del pending_bytes[: number_of_rows * bytes_per_row]
+            y += number_of_rows
+            if y == height:
+                break
+        return image
+
     #
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Sink` needs.
+
+        `GetImages` only uses `ImageEvent` objects. This allows the `Source` to skip (for instance) the construction of paths
+        and the decoding of text.
+
+        :return: The types of `Event` needed.
+        """
+        return {ImageEvent}
+
     def get_output(self) -> typing.Any:
         """
         Retrieve the aggregated results from the pipeline.
@@ -75,10 +162,21 @@ class GetImages(Sink):
                 "You can install it with 'pip install Pillow'."
             )
         return {
-            k: [PIL.Image.open(io.BytesIO(i.get_image())) for i in v]  # type: ignore[arg-type]
+            k: [GetImages.__get_image(i) for i in v]
             for k, v in self.__events_per_page.items()
         }
 
+    def merge(self, other: "Sink") -> "Sink":
+        """
+        Merge the (per-page) results of another `GetImages` into this `GetImages`.
+
+        :param other:   The `GetImages` whose results should be merged into this `GetImages`.
+        :return:        This `GetImages` (to allow method chaining).
+        """
+        assert isinstance(other, GetImages), "Only GetImages objects can be merged."
+        self.__events_per_page.update(other.__events_per_page)
+        return self
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
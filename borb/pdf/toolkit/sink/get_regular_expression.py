@@ -13,6 +13,7 @@ import typing
 from borb.pdf.page_size import PageSize
 from borb.pdf.toolkit.event import Event
 from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
 from borb.pdf.toolkit.source.event.text_event import TextEvent
 
 MatchType = collections.namedtuple(
@@ -57,64 +58,26 @@ class GetRegularExpression(Sink):
     # PRIVATE
     #
 
-    #
-    # PUBLIC
-    #
-
-    def get_output(self) -> typing.Any:
-        """
-        Retrieve the aggregated results from the pipeline.
-
-        This method should be overridden by subclasses to provide the specific output
-        collected by the `Sink`. By default, it returns `None`, indicating that no
-        aggregation or processing has been implemented.
-
-        :return: The aggregated output from the pipeline, or `None` if not implemented.
-        """
-        return self.__matches_per_page
-
-    def process(self, event: Event) -> None:
-        """
-        Process the given event.
-
-        This base implementation is a no-op. Subclasses should override this method
-        to provide specific processing logic.
-
-        :param event: The event object to process.
-        """
-        if not isinstance(event, TextEvent):
-            return
-
-        if len(event.get_text().strip()) == 0:
+    def __find_matches_on_page(self, page_nr: int) -> None:
+        # IF there are no events
+        # THEN return
+        if len(self.__events_per_page[page_nr]) == 0:
             return
 
-        page_nr: int = event.get_page_nr()
-        self.__events_per_page[page_nr] = self.__events_per_page.get(page_nr, []) + [
-            event
-        ]
-
         # define sort function
         def __indo_european_reading_order(e: TextEvent) -> int:
             y_upside_down: int = int(PageSize.A4_PORTRAIT[1] - e.get_y())
             # y_upside_down = y_upside_down - (y_upside_down % 12)
             return int(y_upside_down * PageSize.A4_PORTRAIT[1] + e.get_x())
 
-        # sort
-        self.__events_per_page[page_nr] = sorted(
-            self.__events_per_page[page_nr],
-            key=__indo_european_reading_order,
-        )
-
-        # IF there are no events
-        # THEN return
-        if len(self.__events_per_page[page_nr]) == 0:
-            return
+        # sort (once)
+        self.__events_per_page[page_nr].sort(key=__indo_european_reading_order)
 
         # get text
         prev_x: float = self.__events_per_page[page_nr][0].get_x()
         prev_y: float = self.__events_per_page[page_nr][0].get_y()
         text: str = ""
-        text_length_after_event: typing.Dict[TextEvent, int] = {}
+        text_length_after_event: typing.List[int] = []
         for e in self.__events_per_page[page_nr]:
 
             # IF the difference in y-coordinate is too large
@@ -133,22 +96,20 @@ class GetRegularExpression(Sink):
 
             # add text
             text += e.get_text() or ""
-            text_length_after_event[e] = len(text)
+            text_length_after_event += [len(text)]
 
             # calculate prev_x
             prev_x = e.get_x() + e.get_width()
 
         # get matches
+        # (text_length_after_event is sorted, so the events of a match can be found by bisection)
+        import bisect
         import re
 
         self.__matches_per_page[page_nr] = []
         for m in re.finditer(self.__pattern, text):
-            event_start_index = len(
-                [k for k, v in text_length_after_event.items() if v <= m.start()]
-            )
-            event_stop_index = len(
-                [k for k, v in text_length_after_event.items() if v < m.end()]
-            )
+            event_start_index = bisect.bisect_right(text_length_after_event, m.start())
+            event_stop_index = bisect.bisect_left(text_length_after_event, m.end())
 
             # add match
             events: typing.List[TextEvent] = self.__events_per_page[page_nr][
@@ -166,3 +127,101 @@ class GetRegularExpression(Sink):
                     re_match=m,
                 )
             ]
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the state of this `GetRegularExpression` (to be pickled), without its matches.
+
+        `re.Match` objects can not be pickled. They are found again (from the `TextEvent` objects) when unpickling.
+
+        :return: The state of this `GetRegularExpression`.
+        """
+        state: typing.Dict[str, typing.Any] = self.__dict__.copy()
+        state["_GetRegularExpression__matches_per_page"] = {}
+        return state
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        """
+        Restore the state of this `GetRegularExpression` (after unpickling), and find its matches again.
+
+        :param state: The state of this `GetRegularExpression`.
+        """
+        self.__dict__.update(state)
+        for page_nr in self.__events_per_page.keys():
+            self.__find_matches_on_page(page_nr)
+
+    #
+    # PUBLIC
+    #
+
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Sink` needs.
+
+        `GetRegularExpression` only uses `TextEvent` objects. This allows the `Source` to skip (for instance) the construction of paths
+        and the lookup of image XObjects.
+
+        :return: The types of `Event` needed.
+        """
+        return {TextEvent}
+
+    def get_output(self) -> typing.Any:
+        """
+        Retrieve the aggregated results from the pipeline.
+
+        This method should be overridden by subclasses to provide the specific output
+        collected by the `Sink`. By default, it returns `None`, indicating that no
+        aggregation or processing has been implemented.
+
+        :return: The aggregated output from the pipeline, or `None` if not implemented.
+        """
+        # IF some pages did not (yet) receive an EndPageEvent
+        # THEN find their matches now
+        for page_nr in self.__events_per_page.keys():
+            if page_nr not in self.__matches_per_page:
+                self.__find_matches_on_page(page_nr)
+        return self.__matches_per_page
+
+    def merge(self, other: "Sink") -> "Sink":
+        """
+        Merge the (per-page) results of another `GetRegularExpression` into this `GetRegularExpression`.
+
+        :param other:   The `GetRegularExpression` whose results should be merged into this `GetRegularExpression`.
+        :return:        This `GetRegularExpression` (to allow method chaining).
+        """
+        assert isinstance(
+            other, GetRegularExpression
+        ), "Only GetRegularExpression objects can be merged."
+        self.__events_per_page.update(other.__events_per_page)
+        self.__matches_per_page.update(other.__matches_per_page)
+        return self
+
+    def process(self, event: Event) -> None:
+        """
+        Process the given event.
+
+        Every `TextEvent` is buffered (per page). When the `EndPageEvent` of a page arrives,
+        the buffered events of that page are sorted (in reading order) once, joined into
+        the text of that page, and the regular expression is applied to that text.
+
+        :param event: The event object to process.
+        """
+        # IF the page has ended
+        # THEN sort its events and find the matches
+        if isinstance(event, EndPageEvent):
+            page_nr: int = event.get_page_nr()
+            if page_nr in self.__events_per_page:
+                self.__find_matches_on_page(page_nr)
+            return
+
+        if not isinstance(event, TextEvent):
+            return
+
+        if len(event.get_text().strip()) == 0:
+            return
+
+        # append TextEvent
+        page_nr = event.get_page_nr()
+        if page_nr not in self.__events_per_page:
+            self.__events_per_page[page_nr] = []
+        self.__events_per_page[page_nr].append(event)
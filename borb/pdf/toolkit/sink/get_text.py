@@ -13,6 +13,7 @@ import typing
 from borb.pdf.page_size import PageSize
 from borb.pdf.toolkit.event import Event
 from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
 from borb.pdf.toolkit.source.event.text_event import TextEvent
 
 
@@ -47,10 +48,65 @@ class GetText(Sink):
     # PRIVATE
     #
 
+    def __get_text_on_page(self, page_nr: int) -> None:
+        # IF there are no (buffered) events on the page
+        # THEN return
+        events: typing.List[TextEvent] = self.__events_per_page.pop(page_nr, [])
+        if len(events) == 0:
+            return
+
+        # define sort function
+        def __indo_european_reading_order(e: TextEvent) -> int:
+            y_upside_down: int = int(PageSize.A4_PORTRAIT[1] - e.get_y())
+            return int(y_upside_down * PageSize.A4_PORTRAIT[1] + e.get_x())
+
+        # sort (once)
+        events.sort(key=__indo_european_reading_order)
+
+        # convert to text
+        prev_x: float = events[0].get_x()
+        prev_y: float = events[0].get_y()
+        text: typing.List[str] = []
+        for e in events:
+
+            # IF the difference in y-coordinate is too large
+            # THEN add a <newline>
+            y: float = e.get_y()
+            if abs(prev_y - y) > e.get_height() // 2:
+                text += ["\n"]
+                prev_y = y
+                prev_x = e.get_x()
+
+            # IF the difference in x-coordinate is too large
+            # THEN add a <space>
+            x: float = e.get_x()
+            if abs(prev_x - x) > (0.250 * e.get_font_size()):
+                text += [" "]
+
+            # add text
+            text += [e.get_text() or ""]
+
+            # calculate prev_x
+            prev_x = e.get_x() + e.get_width()
+
+        # store
+        self.__text_per_page[page_nr] = "".join(text)
+
     #
     # PUBLIC
     #
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Return the types of `Event` this `Sink` needs.
+
+        `GetText` only uses `TextEvent` objects. This allows the `Source` to skip (for instance) the construction of paths
+        and the lookup of image XObjects.
+
+        :return: The types of `Event` needed.
+        """
+        return {TextEvent}
+
     def get_output(self) -> typing.Any:
         """
         Retrieve the aggregated results from the pipeline.
@@ -61,17 +117,40 @@ class GetText(Sink):
 
         :return: The aggregated output from the pipeline, or `None` if not implemented.
         """
+        # IF some pages did not (yet) receive an EndPageEvent
+        # THEN convert their (buffered) events to text now
+        for page_nr in [x for x in self.__events_per_page.keys()]:
+            self.__get_text_on_page(page_nr)
         return self.__text_per_page
 
+    def merge(self, other: "Sink") -> "Sink":
+        """
+        Merge the (per-page) results of another `GetText` into this `GetText`.
+
+        :param other:   The `GetText` whose results should be merged into this `GetText`.
+        :return:        This `GetText` (to allow method chaining).
+        """
+        assert isinstance(other, GetText), "Only GetText objects can be merged."
+        self.__events_per_page.update(other.__events_per_page)
+        self.__text_per_page.update(other.__text_per_page)
+        return self
+
     def process(self, event: Event) -> None:
         """
         Process the given event.
 
-        This base implementation is a no-op. Subclasses should override this method
-        to provide specific processing logic.
+        Every `TextEvent` is buffered (per page). When the `EndPageEvent` of a page arrives,
+        the buffered events of that page are sorted (in reading order) once, and joined into
+        the text of that page.
 
         :param event: The event object to process.
         """
+        # IF the page has ended
+        # THEN sort and join its events
+        if isinstance(event, EndPageEvent):
+            self.__get_text_on_page(event.get_page_nr())
+            return
+
         if not isinstance(event, TextEvent):
             return
 
@@ -80,46 +159,26 @@ class GetText(Sink):
 
         # append TextEvent
         page_nr: int = event.get_page_nr()
-        self.__events_per_page[page_nr] = self.__events_per_page.get(page_nr, []) + [
-            event
-        ]
+        if page_nr not in self.__events_per_page:
+            self.__events_per_page[page_nr] = []
+        self.__events_per_page[page_nr].append(event)
 
-        # define sort function
-        def __indo_european_reading_order(e: TextEvent) -> int:
-            y_upside_down: int = int(PageSize.A4_PORTRAIT[1] - e.get_y())
-            return int(y_upside_down * PageSize.A4_PORTRAIT[1] + e.get_x())
-
-        # sort
-        self.__events_per_page[page_nr] = sorted(
-            self.__events_per_page[page_nr],
-            key=__indo_european_reading_order,
-        )
-
-        # convert to text
-        prev_x: float = self.__events_per_page[page_nr][0].get_x()
-        prev_y: float = self.__events_per_page[page_nr][0].get_y()
-        text: str = ""
-        for e in self.__events_per_page[page_nr]:
-
-            # IF the difference in y-coordinate is too large
-            # THEN add a <newline>
-            y: float = e.get_y()
-            if abs(prev_y - y) > e.get_height() // 2:
-                text += "\n"
-                prev_y = y
-                prev_x = e.get_x()
-
-            # IF the difference in x-coordinate is too large
-            # THEN add a <space>
-            x: float = e.get_x()
-            if abs(prev_x - x) > (0.250 * e.get_font_size()):
-                text += " "
-
-            # add text
-            text += e.get_text() or ""
+    def process_events(self, events: typing.List[Event]) -> None:
+        """
+        Process the given events (typically all events of a single page).
 
-            # calculate prev_x
-            prev_x = e.get_x() + e.get_width()
+        This method is called (rather than `process`) when the `Source` delivers the events
+        of a page as a single list. The `TextEvent` objects are added to the per-page buffer
+        in one pass, without a method call per event.
 
-        # store
-        self.__text_per_page[page_nr] = text
+        :param events: The event objects to process.
+        """
+        for event in events:
+            if isinstance(event, EndPageEvent):
+                self.__get_text_on_page(event.get_page_nr())
+                continue
+            if not isinstance(event, TextEvent):
+                continue
+            if len(event.get_text().strip()) == 0:
+                continue
+            self.__events_per_page.setdefault(event.get_page_nr(), []).append(event)
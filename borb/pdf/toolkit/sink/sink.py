@@ -54,3 +54,19 @@ class Sink(Pipe):
         :return: The aggregated output from the pipeline, or `None` if not implemented.
         """
         return None
+
+    def merge(self, other: "Sink") -> "Sink":
+        """
+        Merge the (per-page) results of another `Sink` (of the same type) into this `Sink`.
+
+        This method is used by the `Pipeline` when the pages of a PDF are processed by several (worker) processes,
+        each running its own copy of the pipeline. A `Sink` that can be used that way overrides this method,
+        and merges its own (per-page) state. By default, a `Sink` can not be used in a `Pipeline` with more than
+        one process.
+
+        :param other:   The `Sink` whose results should be merged into this `Sink`.
+        :return:        This `Sink` (to allow method chaining).
+        """
+        assert (
+            False
+        ), f"{self.__class__.__name__} can not be used in a Pipeline with more than one process."
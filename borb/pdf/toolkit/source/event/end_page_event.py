@@ -9,6 +9,8 @@ page that was rendered, such as the page number and any other relevant details.
 triggered once all content for a page has been processed, allowing other components in the PDF
 generation pipeline to handle post-processing or cleanup tasks associated with the page.
 """
+import typing
+
 from borb.pdf.page import Page
 from borb.pdf.toolkit.event import Event
 
@@ -24,17 +26,20 @@ class EndPageEvent(Event):
     generation pipeline to handle post-processing or cleanup tasks associated with the page.
     """
 
+    __slots__ = ("__page",)
+
     #
     # CONSTRUCTOR
     #
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, page_nr: typing.Optional[int] = None):
         """
         Initialize an EndPageEvent instance.
 
         :param page: The page that has finished rendering.
+        :param page_nr: The (zero-based) index of the page in its document, if known.
         """
-        super().__init__()
+        super().__init__(page_nr=page_nr)
         self.__page: Page = page
 
     #
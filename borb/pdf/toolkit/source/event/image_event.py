@@ -7,6 +7,8 @@ This event encapsulates the details of an image being placed on a page, includin
 dimensions, position, the PDF image object, and other related information. It allows
 the event to be processed or handled by other components in the PDF generation pipeline.
 """
+import typing
+
 from borb.pdf.page import Page
 from borb.pdf.primitives import name, PDFType
 from borb.pdf.toolkit.event import Event
@@ -21,6 +23,16 @@ class ImageEvent(Event):
     the event to be processed or handled by other components in the PDF generation pipeline.
     """
 
+    __slots__ = (
+        "__height",
+        "__image",
+        "__page",
+        "__width",
+        "__x",
+        "__xobject_resource",
+        "__y",
+    )
+
     #
     # CONSTRUCTOR
     #
@@ -34,6 +46,7 @@ class ImageEvent(Event):
         x: float,
         xobject_resource: name,
         y: float,
+        page_nr: typing.Optional[int] = None,
     ):
         """
         Initialize an ImageEvent instance.
@@ -45,7 +58,9 @@ class ImageEvent(Event):
         :param x:                   The x-coordinate where the image will be placed.
         :param xobject_resource:    The name of the XObject resource representing the image.
         :param y:                   The y-coordinate where the image will be placed.
+        :param page_nr:             The (zero-based) index of the page in its document, if known.
         """
+        super().__init__(page_nr=page_nr)
         self.__height: float = height
         self.__image: PDFType = image
         self.__page: Page = page
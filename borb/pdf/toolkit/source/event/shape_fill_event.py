@@ -8,6 +8,8 @@ necessary data to describe the shape, its fill color, and whether the even-odd r
 is used for determining which areas to fill. The event encapsulates information that
 can be used by other components to process or render the filled shape on the page.
 """
+import typing
+
 from borb.pdf.color.color import Color
 from borb.pdf.page import Page
 from borb.pdf.toolkit.event import Event
@@ -24,6 +26,8 @@ class ShapeFillEvent(Event):
     can be used by other components to process or render the filled shape on the page.
     """
 
+    __slots__ = ("__fill_color", "__page", "__shape", "__use_even_odd_rule")
+
     #
     # CONSTRUCTOR
     #
@@ -33,6 +37,7 @@ class ShapeFillEvent(Event):
         page: Page,
         shape: ShapeType,
         use_even_odd_rule: bool,
+        page_nr: typing.Optional[int] = None,
     ):
         """
         Initialize a ShapeFillEvent instance.
@@ -42,8 +47,9 @@ class ShapeFillEvent(Event):
         :param shape: The shape being filled.
         :param use_even_odd_rule: Flag indicating whether the even-odd rule is used
                                    for filling the shape.
+        :param page_nr: The (zero-based) index of the page in its document, if known.
         """
-        super().__init__()
+        super().__init__(page_nr=page_nr)
         self.__fill_color: Color = fill_color
         self.__page: Page = page
         self.__shape: ShapeType = shape
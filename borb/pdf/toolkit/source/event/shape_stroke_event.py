@@ -8,6 +8,8 @@ PDF document. It encapsulates details such as the document and page context, the
 being stroked, the stroke's line width, and its color. This allows the event to be
 processed, analyzed, or modified by components in the PDF processing pipeline.
 """
+import typing
+
 from borb.pdf.color.color import Color
 from borb.pdf.page import Page
 from borb.pdf.toolkit.event import Event
@@ -24,6 +26,8 @@ class ShapeStrokeEvent(Event):
     processed, analyzed, or modified by components in the PDF processing pipeline.
     """
 
+    __slots__ = ("__line_width", "__page", "__shape", "__stroke_color")
+
     #
     # CONSTRUCTOR
     #
@@ -33,6 +37,7 @@ class ShapeStrokeEvent(Event):
         page: Page,
         shape: ShapeType,
         stroke_color: Color,
+        page_nr: typing.Optional[int] = None,
     ):
         """
         Initialize a new instance of the ShapeStrokeEvent class.
@@ -45,8 +50,9 @@ class ShapeStrokeEvent(Event):
         :param page:         The specific page of the document where the shape is stroked. Defines the placement context for the event.
         :param shape:        The shape to be stroked. Represents the geometric outline or path being rendered with a stroke.
         :param stroke_color: The color used for stroking the shape. Defines the visual appearance of the stroke.
+        :param page_nr:      The (zero-based) index of the page in its document, if known.
         """
-        super().__init__()
+        super().__init__(page_nr=page_nr)
         self.__line_width: float = line_width
         self.__page: Page = page
         self.__shape: ShapeType = shape
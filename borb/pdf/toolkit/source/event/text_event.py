@@ -8,6 +8,8 @@ essential details about the text, including its position, font, font size, font
 and the content itself. This allows the event to be processed, analyzed, or modified by
 components in the PDF processing pipeline.
 """
+import typing
+
 from borb.pdf.color.color import Color
 from borb.pdf.font.font import Font
 from borb.pdf.page import Page
@@ -24,6 +26,18 @@ class TextEvent(Event):
     components in the PDF processing pipeline.
     """
 
+    __slots__ = (
+        "__page",
+        "__s",
+        "__x",
+        "__y",
+        "__width",
+        "__height",
+        "__font",
+        "__font_color",
+        "__font_size",
+    )
+
     #
     # CONSTRUCTOR
     #
@@ -38,6 +52,7 @@ class TextEvent(Event):
         font_color: Color,
         font_size: float,
         page: Page,
+        page_nr: typing.Optional[int] = None,
     ):
         """
         Initialize a new instance of the TextEvent class.
@@ -56,8 +71,9 @@ class TextEvent(Event):
         :param font_color:  The color of the text. Defines the visual appearance of the text color.
         :param font_size:   The size of the font used for rendering the text. Controls the scaling of the text content.
         :param page:        The specific page of the document where the text is rendered. Defines the placement context for the event.
+        :param page_nr:     The (zero-based) index of the page in its document, if known.
         """
-        super().__init__()
+        super().__init__(page_nr=page_nr)
         self.__page: Page = page
         self.__s: str = s
         self.__x: float = x
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+PDF Content Stream Lexer Module.
+
+This module provides functionality for splitting the (decoded) bytes of a PDF content stream
+into its operators, and the operands that precede each operator.
+
+A content stream is a sequence of operands (numbers, names, strings, arrays, dictionaries, ..)
+each sequence being terminated by an operator (e.g. `Tj`, `cm`, `re`, ..). The `lex_content_stream`
+function in this module scans the content stream with a single (precompiled) regular expression,
+keeps track of (nested) arrays and dictionaries using an explicit stack, and yields each operator
+(along with its operands) as soon as it is encountered. This allows the `Source` (and any other
+consumer of content streams) to process a page without first building a list of all of its tokens.
+"""
+import re
+import typing
+
+from borb.pdf.primitives import PDFType, hexstr, name
+
+
+#
+# CONSTRUCTOR
+#
+
+#
+# PRIVATE
+#
+
+_TOKEN_PATTERN: typing.Pattern[bytes] = re.compile(
+    rb"""
+    (?P<whitespace>[\x00\t\n\x0c\r ]+)
+    |(?P<comment>%[^\r\n]*)
+    |(?P<real>[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+))
+    |(?P<integer>[+-]?[0-9]+)
+    |(?P<name>/[^\x00\t\n\x0c\r ()<>\[\]{}/%]*)
+    |(?P<string>\()
+    |(?P<hexstr><[0-9A-Fa-f\x00\t\n\x0c\r ]*>)
+    |(?P<open_dictionary><<)
+    |(?P<close_dictionary>>>)
+    |(?P<open_array>\[)
+    |(?P<close_array>\])
+    |(?P<keyword>[^\x00\t\n\x0c\r ()<>\[\]{}/%]+)
+    |(?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+_STRING_SPECIAL_CHARACTER_PATTERN: typing.Pattern[bytes] = re.compile(rb"[()\\]")
+_END_OF_INLINE_IMAGE_PATTERN: typing.Pattern[bytes] = re.compile(
+    rb"[\x00\t\n\x0c\r ]EI(?=[\x00\t\n\x0c\r ()<>\[\]{}/%]|$)"
+)
+_NON_HEX_PATTERN: typing.Pattern[bytes] = re.compile(rb"[^0-9A-Fa-f]")
+
+
+def _find_end_of_string(content_stream_bytes: bytes, i: int) -> int:
+    # i points to the byte right after the opening parenthesis
+    # the string ends at the matching (unescaped) closing parenthesis
+    depth: int = 1
+    while True:
+        m: typing.Optional[re.Match] = _STRING_SPECIAL_CHARACTER_PATTERN.search(
+            content_stream_bytes, i
+        )
+        if m is None:
+            return len(content_stream_bytes)
+        c: bytes = m.group(0)
+        i = m.end()
+
+        # IF we see a REVERSE SOLIDUS
+        # THEN skip the (escaped) byte that follows
+        if c == b"\\":
+            i += 1
+            continue
+
+        # keep track of balanced parentheses
+        if c == b"(":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            return i
+
+
+def _token_may_continue_in_next_chunk(content_stream_bytes: bytes, m: re.Match) -> bool:
+    # IF the token ends at the end of the bytes (e.g. a number, name or keyword)
+    # THEN it may continue in the next chunk
+    if m.end() >= len(content_stream_bytes):
+        return True
+
+    # IF the token opens a string
+    # THEN its closing parenthesis must be in this chunk
+    if m.lastgroup == "string":
+        return _find_end_of_string(content_stream_bytes, m.end()) >= len(
+            content_stream_bytes
+        )
+
+    # IF the token is a single LESS-THAN SIGN
+    # THEN it may start a hexadecimal string that ends in the next chunk
+    if m.lastgroup == "other" and m.group(0) == b"<":
+        return content_stream_bytes.find(b">", m.end()) == -1
+
+    # IF the token starts the (binary) data of an inline image
+    # THEN the end of the inline image must be in this chunk
+    # (an EI at the very end of the chunk may be followed by more binary data)
+    if m.lastgroup == "keyword" and m.group(0) == b"ID":
+        end_of_inline_image: typing.Optional[re.Match] = (
+            _END_OF_INLINE_IMAGE_PATTERN.search(content_stream_bytes, m.end())
+        )
+        return end_of_inline_image is None or end_of_inline_image.end() >= len(
+            content_stream_bytes
+        )
+
+    # default
+    return False
+
+
+#
+# PUBLIC
+#
+
+
+def lex_content_stream(
+    content_stream_bytes: typing.Union[bytes, typing.Iterable[bytes]],
+) -> typing.Iterator[typing.Tuple[typing.List[typing.Optional[PDFType]], str]]:
+    """
+    Split the (decoded) bytes of a PDF content stream into operators and their operands.
+
+    The content stream is scanned (from start to end) using a single precompiled regular expression.
+    Operands are collected until an operator is encountered, at which point a tuple (operands, operator)
+    is yielded. Arrays and dictionaries are built using an explicit stack, so nested structures
+    (such as the array of strings and numbers passed to `TJ`, or the property list passed to `BDC`)
+    are represented as (nested) `list` and `dict` objects.
+
+    The content stream can also be passed as an iterable of chunks (e.g. the output of `decode_stream_in_chunks`).
+    In that case, only the bytes of the token(s) that span the end of a chunk are kept around, rather than the
+    (decoded) content stream as a whole.
+
+    The following conventions are used (for compatibility with the `Operator` implementations):
+    - names keep their leading SOLIDUS (e.g. `/F1`)
+    - literal strings are returned (without their enclosing parentheses) as `str`, escape sequences are left untouched
+    - hexadecimal strings are returned (without whitespace) as `hexstr`
+    - the keywords `true`, `false` and `null` are returned as `True`, `False` and `None`
+    - the (binary) data of an inline image (between `ID` and `EI`) is skipped
+
+    Operators are yielded regardless of whether they are known, it is up to the consumer to ignore
+    the ones it does not (want to) support.
+
+    :param content_stream_bytes:    the (decoded) bytes of the content stream, or an iterable of chunks
+    :return:                        an iterator over (operands, operator) tuples
+    """
+    chunks: typing.Iterator[bytes] = iter(
+        [content_stream_bytes]
+        if isinstance(content_stream_bytes, (bytes, bytearray))
+        else content_stream_bytes
+    )
+    buffer: bytes = b""
+    next_chunk: typing.Optional[bytes] = next(chunks, None)
+    is_last_chunk: bool = next_chunk is None
+    stack: typing.List[typing.Tuple[bytes, typing.List[typing.Optional[PDFType]]]] = []
+    operands: typing.List[typing.Optional[PDFType]] = []
+    i: int = 0
+    while True:
+
+        # IF the token at i may continue in the next chunk (or there is no token at i)
+        # THEN append the next chunk (dropping the bytes that were lexed already)
+        m: typing.Optional[re.Match] = (
+            _TOKEN_PATTERN.match(buffer, i) if i < len(buffer) else None
+        )
+        if m is None or (
+            not is_last_chunk and _token_may_continue_in_next_chunk(buffer, m)
+        ):
+            if is_last_chunk:
+                return
+            buffer = buffer[i:] + next_chunk  # type: ignore[operator]
+            i = 0
+            next_chunk = next(chunks, None)
+            is_last_chunk = next_chunk is None
+            continue
+        token_type: typing.Optional[str] = m.lastgroup
+        i = m.end()
+
+        # whitespace, comments
+        if token_type == "whitespace" or token_type == "comment":
+            continue
+
+        # numbers
+        if token_type == "integer":
+            operands.append(int(m.group(0)))
+            continue
+        if token_type == "real":
+            operands.append(float(m.group(0)))
+            continue
+
+        # name
+        if token_type == "name":
+            operands.append(name(m.group(0).decode("latin1")))
+            continue
+
+        # string
+        if token_type == "string":
+            j: int = _find_end_of_string(buffer, i)
+            operands.append(buffer[i : j - 1].decode("latin1"))
+            i = j
+            continue
+
+        # hex string
+        if token_type == "hexstr":
+            operands.append(hexstr(_NON_HEX_PATTERN.sub(b"", m.group(0)).decode()))
+            continue
+
+        # open array / dictionary
+        # (push the current operands on the stack)
+        if token_type == "open_array" or token_type == "open_dictionary":
+            stack.append((m.group(0), operands))
+            operands = []
+            continue
+
+        # close array
+        if token_type == "close_array":
+            if len(stack) == 0 or stack[-1][0] != b"[":
+                continue
+            arr: typing.List[typing.Optional[PDFType]] = operands
+            operands = stack.pop()[1]
+            operands.append(arr)  # type: ignore[arg-type]
+            continue
+
+        # close dictionary
+        if token_type == "close_dictionary":
+            if len(stack) == 0 or stack[-1][0] != b"<<":
+                continue
+            arr_as_dict: typing.Dict[
+                typing.Optional[PDFType], typing.Optional[PDFType]
+            ] = {operands[k]: operands[k + 1] for k in range(0, len(operands) - 1, 2)}
+            operands = stack.pop()[1]
+            operands.append(arr_as_dict)  # type: ignore[arg-type]
+            continue
+
+        # keyword
+        if token_type == "keyword":
+            keyword: bytes = m.group(0)
+            if keyword == b"true":
+                operands.append(True)
+                continue
+            if keyword == b"false":
+                operands.append(False)
+                continue
+            if keyword == b"null":
+                operands.append(None)
+                continue
+
+            # IF an operator appears inside an array or dictionary
+            # THEN the content stream is malformed, ignore the operator
+            if len(stack) != 0:
+                continue
+
+            yield operands, keyword.decode("latin1")
+            operands = []
+
+            # IF the operator starts the (binary) data of an inline image
+            # THEN skip ahead to the end of the inline image
+            if keyword == b"ID":
+                end_of_inline_image: typing.Optional[re.Match] = (
+                    _END_OF_INLINE_IMAGE_PATTERN.search(buffer, i)
+                )
+                if end_of_inline_image is None:
+                    return
+                i = end_of_inline_image.end()
+                yield operands, "EI"
+                operands = []
+            continue
+
+        # any other (unexpected) byte is ignored
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A compact affine transformation matrix, used to represent the graphics state of a `Source`.
+
+PDF represents every transformation (the current transformation matrix, the text matrix,
+the text line matrix, ..) as a 3x3 matrix of which only six entries are meaningful:
+
+    [ a b 0 ]
+    [ c d 0 ]
+    [ e f 1 ]
+
+The `Matrix` class stores only those six numbers (in `__slots__`), and offers fused operations
+for the things content stream operators need: concatenating two matrices, and mapping a point
+(or a vector) through a matrix. Saving and restoring the graphics state (the `q` and `Q` operators)
+only requires a (cheap) copy of these six numbers.
+
+Refer to PDF specification section 8.3.3, "Common Transformations", for more information.
+"""
+import typing
+
+
+class Matrix:
+    """
+    A compact affine transformation matrix, used to represent the graphics state of a `Source`.
+
+    PDF represents every transformation (the current transformation matrix, the text matrix,
+    the text line matrix, ..) as a 3x3 matrix of which only six entries are meaningful:
+
+        [ a b 0 ]
+        [ c d 0 ]
+        [ e f 1 ]
+
+    The `Matrix` class stores only those six numbers (in `__slots__`), and offers fused operations
+    for the things content stream operators need: concatenating two matrices, and mapping a point
+    (or a vector) through a matrix. Saving and restoring the graphics state (the `q` and `Q` operators)
+    only requires a (cheap) copy of these six numbers.
+    """
+
+    __slots__ = ("a", "b", "c", "d", "e", "f")
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(
+        self,
+        a: float = 1.0,
+        b: float = 0.0,
+        c: float = 0.0,
+        d: float = 1.0,
+        e: float = 0.0,
+        f: float = 0.0,
+    ):
+        """
+        Initialize a `Matrix` from its six (meaningful) entries.
+
+        By default, the identity matrix is constructed.
+
+        :param a:   the entry at row 0, column 0
+        :param b:   the entry at row 0, column 1
+        :param c:   the entry at row 1, column 0
+        :param d:   the entry at row 1, column 1
+        :param e:   the entry at row 2, column 0 (horizontal translation)
+        :param f:   the entry at row 2, column 1 (vertical translation)
+        """
+        self.a: float = a
+        self.b: float = b
+        self.c: float = c
+        self.d: float = d
+        self.e: float = e
+        self.f: float = f
+
+    #
+    # PRIVATE
+    #
+
+    def __eq__(self, other) -> bool:
+        """
+        Check if this matrix is equal to another matrix.
+
+        :param other: Matrix - The other `Matrix` object to compare against.
+        :return: bool - True if all six entries of both matrices are equal, False otherwise.
+        """
+        if not isinstance(other, Matrix):
+            return False
+        return (
+            self.a == other.a
+            and self.b == other.b
+            and self.c == other.c
+            and self.d == other.d
+            and self.e == other.e
+            and self.f == other.f
+        )
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the matrix.
+
+        :return: str - The matrix in the format `Matrix(a, b, c, d, e, f)`.
+        """
+        return f"Matrix({self.a}, {self.b}, {self.c}, {self.d}, {self.e}, {self.f})"
+
+    #
+    # PUBLIC
+    #
+
+    def copy(self) -> "Matrix":
+        """
+        Return a copy of this `Matrix`.
+
+        :return:    a new `Matrix` with the same six entries
+        """
+        return Matrix(self.a, self.b, self.c, self.d, self.e, self.f)
+
+    def cross(self, x: float, y: float) -> typing.Tuple[float, float]:
+        """
+        Map the point (x, y) through this `Matrix`.
+
+        This is the product of the row vector [x y 1] and this (3x3) matrix.
+
+        :param x:   the x-coordinate of the point
+        :param y:   the y-coordinate of the point
+        :return:    the transformed point (x, y)
+        """
+        return (
+            x * self.a + y * self.c + self.e,
+            x * self.b + y * self.d + self.f,
+        )
+
+    def cross_vector(self, x: float, y: float) -> typing.Tuple[float, float]:
+        """
+        Map the vector (x, y) through this `Matrix`, ignoring the translation.
+
+        This is the product of the row vector [x y 0] and this (3x3) matrix.
+
+        :param x:   the x-component of the vector
+        :param y:   the y-component of the vector
+        :return:    the transformed vector (x, y)
+        """
+        return (
+            x * self.a + y * self.c,
+            x * self.b + y * self.d,
+        )
+
+    def mul(self, other: "Matrix") -> "Matrix":
+        """
+        Return the product of this `Matrix` (on the left) and another `Matrix` (on the right).
+
+        In PDF, concatenating a transformation m0 with a transformation m1 (such as the `cm`
+        operator does) is expressed as the product m0 x m1.
+
+        :param other:   the `Matrix` on the right-hand side of the product
+        :return:        a new `Matrix`, the product of both matrices
+        """
+        return Matrix(
+            self.a * other.a + self.b * other.c,
+            self.a * other.b + self.b * other.d,
+            self.c * other.a + self.d * other.c,
+            self.c * other.b + self.d * other.d,
+            self.e * other.a + self.f * other.c + other.e,
+            self.e * other.b + self.f * other.d + other.f,
+        )
@@ -18,6 +18,7 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.event import Event
 from borb.pdf.toolkit.source.operator.source import Source
 
 
@@ -68,6 +69,18 @@ class Operator:
         """
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        A `Source` skips every operator for which none of these event types are needed
+        by the rest of the pipeline. Operators that change state which is shared by all events
+        (e.g. "q", "Q" or "cm") should return None, meaning they are always applied.
+
+        :return: The types of `Event` this operator contributes to, or None if it should always be applied.
+        """
+        return None
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
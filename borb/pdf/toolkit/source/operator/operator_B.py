@@ -19,6 +19,9 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -106,6 +109,17 @@ class OperatorB(Operator):
         source.path = path_duplicate
         OperatorB.__apply_S(source=source, page=page)
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects the path (and the shapes that are filled or stroked),
+        so it can be skipped when neither `ShapeFillEvent` nor `ShapeStrokeEvent` is needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {ShapeFillEvent, ShapeStrokeEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
@@ -82,8 +82,8 @@ class OperatorBDC(Operator):
         if isinstance(operands[1], dict):
             property_dictionary = operands[1]  # type: ignore[assignment]
         if isinstance(operands[1], name):
-            property_dictionary = (
-                page.get("Resources", {}).get("Properties", {}).get(operands[0][1:], {})
+            property_dictionary = source.resources.get("Properties", {}).get(
+                operands[0][1:], {}
             )
         # TODO
         pass
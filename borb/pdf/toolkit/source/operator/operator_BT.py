@@ -18,6 +18,9 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.matrix import Matrix
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -69,18 +72,21 @@ class OperatorBT(Operator):
         :param source: The `Source` object managing the content stream.
         :param operands: A list of `PDFType` objects representing the operator's operands.
         """
-        source.text_matrix = [
-            [1.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0],
-            [0.0, 0.0, 1.0],
-        ]
-        source.text_line_matrix = [
-            [1.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0],
-            [0.0, 0.0, 1.0],
-        ]
+        source.text_matrix = Matrix()
+        source.text_line_matrix = Matrix()
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects (the position, state or content of) text,
+        so it can be skipped when `TextEvent` is not needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {TextEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
@@ -27,6 +27,10 @@ import typing
 from borb.pdf.color.x11_color import X11Color
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType, name
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -117,6 +121,17 @@ class OperatorCS(Operator):
         # TODO
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects the color of text and shapes,
+        so it can be skipped when none of `ShapeFillEvent`, `ShapeStrokeEvent` or `TextEvent` is needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {ShapeFillEvent, ShapeStrokeEvent, TextEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
@@ -20,7 +20,12 @@ For more information about XObjects and how they are used, refer to section 7.8.
 import typing
 
 from borb.pdf.page import Page
-from borb.pdf.primitives import PDFType, name
+from borb.pdf.primitives import PDFType, name, stream
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.image_event import ImageEvent
+from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -54,18 +59,6 @@ class OperatorDo(Operator):
     # PRIVATE
     #
 
-    @staticmethod
-    def __cross(
-        m: typing.List[typing.List[float]], v: typing.List[float]
-    ) -> typing.List[float]:
-        x: float = v[0]
-        y: float = v[1]
-        z: float = v[2]
-        x2 = x * m[0][0] + y * m[1][0] + z * m[2][0]
-        y2 = x * m[0][1] + y * m[1][1] + z * m[2][1]
-        z2 = x * m[0][2] + y * m[1][2] + z * m[2][2]
-        return [x2, y2, z2]
-
     #
     # PUBLIC
     #
@@ -90,10 +83,8 @@ class OperatorDo(Operator):
         # look up XObject
         assert isinstance(operands[0], name)
         xobject_resource_name: name = operands[0]
-        xobject: typing.Optional[PDFType] = (
-            page.get("Resources", {})
-            .get("XObject", {})
-            .get(xobject_resource_name[1:], None)
+        xobject: typing.Optional[PDFType] = source.resources.get("XObject", {}).get(
+            xobject_resource_name[1:], None
         )
 
         # /Image
@@ -104,14 +95,12 @@ class OperatorDo(Operator):
         ):
 
             # calculate position
-            v: typing.List[float] = OperatorDo.__cross(
-                m=source.transformation_matrix, v=[0, 0, 1]
-            )
-            x: float = v[0]
-            y: float = v[1]
+            x, y = source.transformation_matrix.cross(0, 0)
 
             # calculate display size
-            v = OperatorDo.__cross(m=source.transformation_matrix, v=[1, 1, 0])
+            v: typing.Tuple[float, float] = source.transformation_matrix.cross_vector(
+                1, 1
+            )
             width: float = max(abs(v[0]), 1)
             height: float = max(abs(v[1]), 1)
 
@@ -127,13 +116,30 @@ class OperatorDo(Operator):
             return
 
         # /Form
-        # TODO
+        if (
+            xobject is not None
+            and isinstance(xobject, stream)
+            and xobject.get("Subtype", None) == "Form"
+        ):
+            source.process_form_xobject(form=xobject)
+            return
 
         # /PS
         # TODO
 
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator renders image XObjects, and interprets Form XObjects (which may contain
+        text, shapes and images), so it can only be skipped when none of these events are needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {ImageEvent, ShapeFillEvent, ShapeStrokeEvent, TextEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
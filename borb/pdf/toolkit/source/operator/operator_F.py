@@ -15,6 +15,9 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -79,6 +82,17 @@ class OperatorF(Operator):
         OperatorF.__apply_f(page=page, source=source)
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects the path (and the shapes that are filled or stroked),
+        so it can be skipped when neither `ShapeFillEvent` nor `ShapeStrokeEvent` is needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {ShapeFillEvent, ShapeStrokeEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
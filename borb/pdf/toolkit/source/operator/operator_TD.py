@@ -20,6 +20,8 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.text_event import TextEvent
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -118,6 +120,17 @@ class OperatorTD(Operator):
         self.__apply_Td(page=page, source=source, tx=tx, ty=ty)
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects (the position, state or content of) text,
+        so it can be skipped when `TextEvent` is not needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {TextEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
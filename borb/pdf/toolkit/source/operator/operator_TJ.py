@@ -30,6 +30,8 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.text_event import TextEvent
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -72,20 +74,6 @@ class OperatorTJ(Operator):
     # PRIVATE
     #
 
-    @staticmethod
-    def __apply_Tj(page: Page, source: Source, text_to_render: str):
-        Tj_operator: typing.Optional[Operator] = next(
-            iter([x for x in source.operators if x.get_name() == "Tj"]),
-            None,
-        )
-        assert Tj_operator is not None
-        Tj_operator.apply(
-            page=page,
-            source=source,
-            operands=[text_to_render],
-        )
-        pass
-
     #
     # PUBLIC
     #
@@ -109,11 +97,18 @@ class OperatorTJ(Operator):
         """
         assert isinstance(operands[0], typing.List)
         array_to_render: typing.List = operands[0]
+
+        # look up the Tj operator (once)
+        Tj_operator: typing.Optional[Operator] = next(
+            (x for x in source.operators if x.get_name() == "Tj"), None
+        )
+        assert Tj_operator is not None
+
         for operand in array_to_render:
             if isinstance(operand, str):
-                self.__apply_Tj(page=page, source=source, text_to_render=operand)
+                Tj_operator.apply(page=page, source=source, operands=[operand])
             if isinstance(operand, float) or isinstance(operand, int):
-                source.text_matrix[2][0] += (
+                source.text_matrix.e += (
                     operand
                     * 0.001
                     * source.font_size
@@ -121,6 +116,17 @@ class OperatorTJ(Operator):
                 )
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects (the position, state or content of) text,
+        so it can be skipped when `TextEvent` is not needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {TextEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
@@ -21,6 +21,9 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.matrix import Matrix
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -54,28 +57,6 @@ class OperatorTd(Operator):
     # PRIVATE
     #
 
-    @staticmethod
-    def __mul(
-        m0: typing.List[typing.List[float]], m1: typing.List[typing.List[float]]
-    ) -> typing.List[typing.List[float]]:
-        return [
-            [
-                m0[0][0] * m1[0][0] + m0[0][1] * m1[1][0] + m0[0][2] * m1[2][0],
-                m0[0][0] * m1[0][1] + m0[0][1] * m1[1][1] + m0[0][2] * m1[2][1],
-                m0[0][0] * m1[0][2] + m0[0][1] * m1[1][2] + m0[0][2] * m1[2][2],
-            ],
-            [
-                m0[1][0] * m1[0][0] + m0[1][1] * m1[1][0] + m0[1][2] * m1[2][0],
-                m0[1][0] * m1[0][1] + m0[1][1] * m1[1][1] + m0[1][2] * m1[2][1],
-                m0[1][0] * m1[0][2] + m0[1][1] * m1[1][2] + m0[1][2] * m1[2][2],
-            ],
-            [
-                m0[2][0] * m1[0][0] + m0[2][1] * m1[1][0] + m0[2][2] * m1[2][0],
-                m0[2][0] * m1[0][1] + m0[2][1] * m1[1][1] + m0[2][2] * m1[2][1],
-                m0[2][0] * m1[0][2] + m0[2][1] * m1[1][2] + m0[2][2] * m1[2][2],
-            ],
-        ]
-
     #
     # PUBLIC
     #
@@ -101,15 +82,21 @@ class OperatorTd(Operator):
         assert isinstance(operands[1], float) or isinstance(operands[1], int)
         tx: typing.Union[float, int] = operands[0]
         ty: typing.Union[float, int] = operands[1]
-        source.text_line_matrix = self.__mul(
-            m0=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [tx, ty, 1.0]],
-            m1=source.text_line_matrix,
-        )
-        import copy
-
-        source.text_matrix = copy.deepcopy(source.text_line_matrix)
+        source.text_line_matrix = Matrix(e=tx, f=ty).mul(source.text_line_matrix)
+        source.text_matrix = source.text_line_matrix.copy()
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects (the position, state or content of) text,
+        so it can be skipped when `TextEvent` is not needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {TextEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
@@ -23,6 +23,8 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType, name
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.text_event import TextEvent
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -81,12 +83,21 @@ class OperatorTf(Operator):
         """
         assert isinstance(operands[0], name)
         assert isinstance(operands[1], float) or isinstance(operands[1], int)
-        source.font = (
-            page.get("Resources", {}).get("Font", {}).get(operands[0][1:], None)
-        )
+        source.font = source.resources.get("Font", {}).get(operands[0][1:], None)
         source.font_size = operands[1]
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects (the position, state or content of) text,
+        so it can be skipped when `TextEvent` is not needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {TextEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
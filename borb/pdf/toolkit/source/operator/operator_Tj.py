@@ -18,12 +18,17 @@ Note:
     - This operator does not automatically add any additional spacing between characters
       beyond what is defined by the current text state.
 """
+import collections
 import typing
 
 from borb.pdf.font.composite_font.composite_font import CompositeFont
+from borb.pdf.font.font import Font
 from borb.pdf.font.simple_font.simple_font import SimpleFont
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType, hexstr
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.matrix import Matrix
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -50,147 +55,61 @@ class OperatorTj(Operator):
           beyond what is defined by the current text state.
     """
 
-    #
-    # CONSTRUCTOR
-    #
+    __ESCAPE_SEQUENCES: typing.Dict[str, str] = {
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+        "b": "\b",
+        "f": "\f",
+        "(": "(",
+        ")": ")",
+    }
+    MAX_NUMBER_OF_CACHED_FONTS: int = 64
+    MAX_NUMBER_OF_CACHED_OPERANDS_PER_FONT: int = 1024
 
     #
-    # PRIVATE
+    # CONSTRUCTOR
     #
 
-    @staticmethod
-    def __cross(
-        m: typing.List[typing.List[float]], v: typing.List[float]
-    ) -> typing.List[float]:
-        x: float = v[0]
-        y: float = v[1]
-        z: float = v[2]
-        x2 = x * m[0][0] + y * m[1][0] + z * m[2][0]
-        y2 = x * m[0][1] + y * m[1][1] + z * m[2][1]
-        z2 = x * m[0][2] + y * m[1][2] + z * m[2][2]
-        return [x2, y2, z2]
-
-    @staticmethod
-    def __mul(
-        m0: typing.List[typing.List[float]], m1: typing.List[typing.List[float]]
-    ) -> typing.List[typing.List[float]]:
-        assert len(m0) == 3 and all(
-            [len(r) == 3 for r in m0]
-        ), "m0 must be a 3 by 3 matrix"
-        assert len(m1) == 3 and all(
-            [len(r) == 3 for r in m1]
-        ), "m1 must be a 3 by 3 matrix"
-        return [
-            [
-                m0[0][0] * m1[0][0] + m0[0][1] * m1[1][0] + m0[0][2] * m1[2][0],
-                m0[0][0] * m1[0][1] + m0[0][1] * m1[1][1] + m0[0][2] * m1[2][1],
-                m0[0][0] * m1[0][2] + m0[0][1] * m1[1][2] + m0[0][2] * m1[2][2],
-            ],
-            [
-                m0[1][0] * m1[0][0] + m0[1][1] * m1[1][0] + m0[1][2] * m1[2][0],
-                m0[1][0] * m1[0][1] + m0[1][1] * m1[1][1] + m0[1][2] * m1[2][1],
-                m0[1][0] * m1[0][2] + m0[1][1] * m1[1][2] + m0[1][2] * m1[2][2],
-            ],
-            [
-                m0[2][0] * m1[0][0] + m0[2][1] * m1[1][0] + m0[2][2] * m1[2][0],
-                m0[2][0] * m1[0][1] + m0[2][1] * m1[1][1] + m0[2][2] * m1[2][1],
-                m0[2][0] * m1[0][2] + m0[2][1] * m1[1][2] + m0[2][2] * m1[2][2],
-            ],
-        ]
-
-    @staticmethod
-    def __unescape_special_chars_in_ascii_mode(s: str) -> str:
-        s2: str = ""
-        i: int = 0
-        while i < len(s):
-            if s[i:].startswith("\\n"):
-                s2 += "\n"
-                i += 2
-                continue
-            if s[i:].startswith("\\r"):
-                s2 += "\r"
-                i += 2
-                continue
-            if s[i:].startswith("\\t"):
-                s2 += "\t"
-                i += 2
-                continue
-            if s[i:].startswith("\\b"):
-                s2 += "\b"
-                i += 2
-                continue
-            if s[i:].startswith("\\f"):
-                s2 += "\f"
-                i += 2
-                continue
-            if s[i:].startswith("\\("):
-                s2 += "("
-                i += 2
-                continue
-            if s[i:].startswith("\\)"):
-                s2 += ")"
-                i += 2
-                continue
-
-            # Handle octal escape sequences (\000 - \377)
-            if s[i] == "\\" and i + 1 < len(s) and s[i + 1] in "01234567":
-                j = i + 1
-                octal_digits = ""
-                while j < len(s) and len(octal_digits) < 3 and s[j] in "01234567":
-                    octal_digits += s[j]
-                    j += 1
-                s2 += chr(int(octal_digits, 8))  # Convert octal to character
-                i = j  # Move past the octal sequence
-                continue
-
-            # default
-            s2 += s[i]
-            i += 1
+    def __init__(self):
+        """
+        Initialize a new `OperatorTj` instance.
 
-        # return
-        return s2
+        Decoding a string operand (unescaping it, mapping every character code through the font,
+        and measuring the resulting text) is the most expensive part of this operator.
+        Since tables and forms tend to repeat the same strings over and over again,
+        the outcome is kept in a (least recently used) cache, per font.
+        """
+        super().__init__()
+        self.__decoded_operands_per_font: collections.OrderedDict[int, typing.Tuple[Font, collections.OrderedDict[typing.Tuple[bool, str, float, float], typing.Tuple[str, float]]]] = collections.OrderedDict()  # type: ignore[annotation-unchecked]
 
     #
-    # PUBLIC
+    # PRIVATE
     #
 
-    def apply(
-        self,
-        operands: typing.List[PDFType],
-        page: Page,
-        source: Source,
-    ) -> None:
-        """
-        Apply the operator's logic to the given `Page`.
-
-        This method executes the operator using the provided operands, applying its
-        effects to the specified `Page` via the `Source` processor. Subclasses should
-        override this method to implement specific operator behavior.
-
-        :param page: The `Page` object to which the operator is applied.
-        :param source: The `Source` object managing the content stream.
-        :param operands: A list of `PDFType` objects representing the operator's operands.
-        """
-        assert isinstance(operands[0], str)
-
+    @staticmethod
+    def __decode(
+        operand: str, font: Font, character_spacing: float, word_spacing: float
+    ) -> typing.Tuple[str, float]:
         # Determine text being rendered
         text_being_rendered: typing.Optional[str] = None
-        if isinstance(source.font, SimpleFont):
+        if isinstance(font, SimpleFont):
             unescaped_operand: bytes = b""
-            if isinstance(operands[0], hexstr):
-                unescaped_operand = operands[0].to_bytes()
-            if isinstance(operands[0], str) and not isinstance(operands[0], hexstr):
+            if isinstance(operand, hexstr):
+                unescaped_operand = operand.to_bytes()
+            if isinstance(operand, str) and not isinstance(operand, hexstr):
                 # fmt: off
-                unescaped_operand = OperatorTj.__unescape_special_chars_in_ascii_mode(operands[0]).encode("latin-1")
+                unescaped_operand = OperatorTj.__unescape_special_chars_in_ascii_mode(operand).encode("latin-1")
                 # fmt: on
             text_being_rendered = "".join(
-                [source.font.get_character(c) for c in unescaped_operand]
+                [font.get_character(c) for c in unescaped_operand]
             )
 
-        if isinstance(source.font, CompositeFont):
-            if isinstance(operands[0], hexstr):
+        if isinstance(font, CompositeFont):
+            if isinstance(operand, hexstr):
                 i: int = 0
-                hexstr_as_bytes: bytes = operands[0].to_bytes()
+                hexstr_as_bytes: bytes = operand.to_bytes()
+                characters: typing.List[str] = []
                 while i < len(hexstr_as_bytes):
                     # IF a two byte code is present to map the next two (hex) bytes to a char
                     # THEN use this two byte code
@@ -198,52 +117,158 @@ class OperatorTj(Operator):
                         two_byte_code: int = (
                             hexstr_as_bytes[i] * 256 + hexstr_as_bytes[i + 1]
                         )
-                        if source.font.get_character(two_byte_code) not in ["�", None]:  # type: ignore[attr-defined]
-                            text_being_rendered = (text_being_rendered or "") + source.font.get_character(  # type: ignore[attr-defined, operator]
-                                two_byte_code
-                            )
+                        character: typing.Optional[str] = font.get_character(two_byte_code)  # type: ignore[attr-defined]
+                        if character not in ["�", None]:
+                            characters += [character]  # type: ignore[list-item]
                             i += 2
                             continue
 
                     # default (single byte code)
-                    text_being_rendered = (text_being_rendered or "") + source.font.get_character(hexstr_as_bytes[i])  # type: ignore[attr-defined, operator]
+                    characters += [font.get_character(hexstr_as_bytes[i])]  # type: ignore[attr-defined]
                     i += 1
+                if len(characters) > 0:
+                    text_being_rendered = "".join(characters)
 
-            if isinstance(operands[0], str) and not isinstance(operands[0], hexstr):
+            if isinstance(operand, str) and not isinstance(operand, hexstr):
                 # fmt: off
-                unescaped_operand = OperatorTj.__unescape_special_chars_in_ascii_mode(operands[0]).encode("latin-1")
-                text_being_rendered = "".join([source.font.get_character(c) for c in unescaped_operand])
+                unescaped_operand = OperatorTj.__unescape_special_chars_in_ascii_mode(operand).encode("latin-1")
+                text_being_rendered = "".join([font.get_character(c) for c in unescaped_operand])
                 # fmt: on
 
         assert text_being_rendered is not None
 
         # Determine width
         width: float = 0.0
-        if isinstance(source.font, SimpleFont):
-            assert text_being_rendered is not None
+        if isinstance(font, SimpleFont):
             width = (
-                source.font.get_width(
+                font.get_width(
                     font_size=1000,
                     text=text_being_rendered,
-                    character_spacing=source.character_spacing,
-                    word_spacing=source.word_spacing,
+                    character_spacing=character_spacing,
+                    word_spacing=word_spacing,
                 )
                 / 1000
             )
 
-        # Determine x,y
-        mtx = OperatorTj.__mul(
-            source.text_matrix,
-            source.transformation_matrix,
+        # return
+        return text_being_rendered, width
+
+    def __decode_using_cache(
+        self, operand: str, source: Source
+    ) -> typing.Tuple[str, float]:
+        # look up the cache of the font
+        # (the font is kept alongside its cache, so that its id can not be re-used)
+        font_id: int = id(source.font)
+        font_and_cache = self.__decoded_operands_per_font.get(font_id, None)
+        if font_and_cache is None:
+            font_and_cache = (source.font, collections.OrderedDict())
+            self.__decoded_operands_per_font[font_id] = font_and_cache
+            # IF there are too many fonts in the cache
+            # THEN evict the least recently used font
+            if (
+                len(self.__decoded_operands_per_font)
+                > OperatorTj.MAX_NUMBER_OF_CACHED_FONTS
+            ):
+                self.__decoded_operands_per_font.popitem(last=False)
+        else:
+            self.__decoded_operands_per_font.move_to_end(font_id)
+        cache = font_and_cache[1]
+
+        # IF the operand has been decoded before (using the same spacing)
+        # THEN return the cached result
+        key: typing.Tuple[bool, str, float, float] = (
+            isinstance(operand, hexstr),
+            operand,
+            source.character_spacing,
+            source.word_spacing,
+        )
+        text_and_width: typing.Optional[typing.Tuple[str, float]] = cache.get(key, None)
+        if text_and_width is not None:
+            cache.move_to_end(key)
+            return text_and_width
+
+        # decode the operand
+        text_and_width = OperatorTj.__decode(
+            operand=operand,
+            font=source.font,
+            character_spacing=source.character_spacing,
+            word_spacing=source.word_spacing,
         )
-        mtx[0][0] *= source.font_size
-        mtx[1][1] *= source.font_size
-        p0 = OperatorTj.__cross(mtx, [0, source.text_rise, 1])
-        p1 = OperatorTj.__cross(
-            mtx,
-            [width, source.text_rise, 1],
+
+        # IF there are too many operands in the cache
+        # THEN evict the least recently used operand
+        cache[key] = text_and_width
+        if len(cache) > OperatorTj.MAX_NUMBER_OF_CACHED_OPERANDS_PER_FONT:
+            cache.popitem(last=False)
+        return text_and_width
+
+    @staticmethod
+    def __unescape_special_chars_in_ascii_mode(s: str) -> str:
+        s2: typing.List[str] = []
+        i: int = 0
+        n: int = len(s)
+        while i < n:
+            c: str = s[i]
+            if c == "\\" and i + 1 < n:
+                c2: str = s[i + 1]
+
+                # Handle single character escape sequences (\n, \r, \t, \b, \f, \(, \))
+                if c2 in OperatorTj.__ESCAPE_SEQUENCES:
+                    s2 += [OperatorTj.__ESCAPE_SEQUENCES[c2]]
+                    i += 2
+                    continue
+
+                # Handle octal escape sequences (\000 - \377)
+                if c2 in "01234567":
+                    j = i + 1
+                    while j < n and j - i <= 3 and s[j] in "01234567":
+                        j += 1
+                    s2 += [chr(int(s[i + 1 : j], 8))]  # Convert octal to character
+                    i = j  # Move past the octal sequence
+                    continue
+
+            # default
+            s2 += [c]
+            i += 1
+
+        # return
+        return "".join(s2)
+
+    #
+    # PUBLIC
+    #
+
+    def apply(
+        self,
+        operands: typing.List[PDFType],
+        page: Page,
+        source: Source,
+    ) -> None:
+        """
+        Apply the operator's logic to the given `Page`.
+
+        This method executes the operator using the provided operands, applying its
+        effects to the specified `Page` via the `Source` processor. Subclasses should
+        override this method to implement specific operator behavior.
+
+        :param page: The `Page` object to which the operator is applied.
+        :param source: The `Source` object managing the content stream.
+        :param operands: A list of `PDFType` objects representing the operator's operands.
+        """
+        assert isinstance(operands[0], str)
+
+        # Determine text being rendered (and its width)
+        text_being_rendered, width = self.__decode_using_cache(
+            operand=operands[0], source=source
         )
-        p2 = OperatorTj.__cross(mtx, [0, source.text_rise + source.font_size, 1])
+
+        # Determine x,y
+        mtx: Matrix = source.text_matrix.mul(source.transformation_matrix)
+        mtx.a *= source.font_size
+        mtx.d *= source.font_size
+        p0 = mtx.cross(0, source.text_rise)
+        p1 = mtx.cross(width, source.text_rise)
+        p2 = mtx.cross(0, source.text_rise + source.font_size)
         x = round(min([p0[0], p1[0]]))
         y = round(min([p0[1], p1[1]]))
         absolute_width: int = round(abs(p0[0] - p1[0]))
@@ -263,13 +288,21 @@ class OperatorTj(Operator):
 
         # Update text rendering location
         # This code only takes into account the text-matrix
-        p0 = OperatorTj.__cross(source.text_matrix, [0, 1, 1])
-        p1 = OperatorTj.__cross(
-            source.text_matrix,
-            [width, 1, 1],
-        )
+        p0 = source.text_matrix.cross(0, 1)
+        p1 = source.text_matrix.cross(width, 1)
         width_in_text_matrix_space: int = round(abs(p0[0] - p1[0]))
-        source.text_matrix[2][0] += absolute_width
+        source.text_matrix.e += absolute_width
+
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects (the position, state or content of) text,
+        so it can be skipped when `TextEvent` is not needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {TextEvent}
 
     def get_name(self) -> str:
         """
@@ -23,6 +23,9 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.matrix import Matrix
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -90,18 +93,21 @@ class OperatorTm(Operator):
         d: typing.Union[float, int] = operands[3]
         e: typing.Union[float, int] = operands[4]
         f: typing.Union[float, int] = operands[5]
-        source.text_matrix = [
-            [a, b, 0.0],
-            [c, d, 0.0],
-            [e, f, 1.0],
-        ]
-        source.text_line_matrix = [
-            [a, b, 0.0],
-            [c, d, 0.0],
-            [e, f, 1.0],
-        ]
+        source.text_matrix = Matrix(a, b, c, d, e, f)
+        source.text_line_matrix = Matrix(a, b, c, d, e, f)
         pass
 
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        """
+        Retrieve the types of `Event` this operator (contributes to) produce(s).
+
+        This operator only affects (the position, state or content of) text,
+        so it can be skipped when `TextEvent` is not needed.
+
+        :return: The types of `Event` this operator contributes to.
+        """
+        return {TextEvent}
+
     def get_name(self) -> str:
         """
         Retrieve the name of the operator.
@@ -24,6 +24,7 @@ import typing
 
 from borb.pdf.page import Page
 from borb.pdf.primitives import PDFType
+from borb.pdf.toolkit.source.operator.matrix import Matrix
 from borb.pdf.toolkit.source.operator.operator import Operator
 from borb.pdf.toolkit.source.operator.source import (
     Source,
@@ -60,28 +61,6 @@ class Operatorcm(Operator):
     # PRIVATE
     #
 
-    @staticmethod
-    def __mul(
-        m0: typing.List[typing.List[float]], m1: typing.List[typing.List[float]]
-    ) -> typing.List[typing.List[float]]:
-        return [
-            [
-                m0[0][0] * m1[0][0] + m0[0][1] * m1[1][0] + m0[0][2] * m1[2][0],
-                m0[0][0] * m1[0][1] + m0[0][1] * m1[1][1] + m0[0][2] * m1[2][1],
-                m0[0][0] * m1[0][2] + m0[0][1] * m1[1][2] + m0[0][2] * m1[2][2],
-            ],
-            [
-                m0[1][0] * m1[0][0] + m0[1][1] * m1[1][0] + m0[1][2] * m1[2][0],
-                m0[1][0] * m1[0][1] + m0[1][1] * m1[1][1] + m0[1][2] * m1[2][1],
-                m0[1][0] * m1[0][2] + m0[1][1] * m1[1][2] + m0[1][2] * m1[2][2],
-            ],
-            [
-                m0[2][0] * m1[0][0] + m0[2][1] * m1[1][0] + m0[2][2] * m1[2][0],
-                m0[2][0] * m1[0][1] + m0[2][1] * m1[1][1] + m0[2][2] * m1[2][1],
-                m0[2][0] * m1[0][2] + m0[2][1] * m1[1][2] + m0[2][2] * m1[2][2],
-            ],
-        ]
-
     #
     # PUBLIC
     #
@@ -115,9 +94,8 @@ class Operatorcm(Operator):
         d: typing.Union[float, int] = operands[3]
         e: typing.Union[float, int] = operands[4]
         f: typing.Union[float, int] = operands[5]
-        source.transformation_matrix = Operatorcm.__mul(
-            source.transformation_matrix,
-            [[a, b, 0], [c, d, 0], [e, f, 1]],
+        source.transformation_matrix = source.transformation_matrix.mul(
+            Matrix(a, b, c, d, e, f)
         )
         pass
 
@@ -12,6 +12,7 @@ extracting images or text, and other content manipulations.
 The class can be extended to implement specific processing behaviors, enabling the
 ability to perform complex transformations on the page's content.
 """
+import collections
 import typing
 
 from borb.pdf.color.color import Color
@@ -19,10 +20,12 @@ from borb.pdf.color.x11_color import X11Color
 from borb.pdf.font.font import Font
 from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
 from borb.pdf.page import Page
-from borb.pdf.primitives import PDFType, name, stream, hexstr
+from borb.pdf.primitives import PDFType, name, stream
 from borb.pdf.toolkit.event import Event
 from borb.pdf.toolkit.pipe import Pipe
-from borb.pdf.visitor.read.compression.decode_stream import decode_stream
+from borb.pdf.toolkit.source.operator.content_stream_lexer import lex_content_stream
+from borb.pdf.toolkit.source.operator.matrix import Matrix
+from borb.pdf.visitor.read.compression.decode_stream import decode_stream_in_chunks
 
 PointType: typing.TypeAlias = typing.Tuple[float, float]  # x, y
 LineType: typing.TypeAlias = typing.Tuple[PointType, PointType]  # from_point, to_point
@@ -44,11 +47,13 @@ class Source(Pipe):
     ability to perform complex transformations on the page's content.
     """
 
+    MAX_NUMBER_OF_CACHED_FORMS: int = 64
+
     #
     # CONSTRUCTOR
     #
 
-    def __init__(self):
+    def __init__(self, deliver_events_per_page: bool = False):
         """
         Initialize a `Source` instance.
 
@@ -62,6 +67,10 @@ class Source(Pipe):
         The `Source` class can be extended to implement specific
         processing behaviors, and the page passed to the constructor will be the subject
         of those transformations or manipulations.
+
+        :param deliver_events_per_page: When True, the events of a page are not passed down the pipe
+                                        one by one (by calling `process`), but collected and passed down
+                                        as a single list (by calling `process_events`) once the page has been processed.
         """
         super().__init__()
         from borb.pdf.toolkit.source.operator.operator import Operator
@@ -216,6 +225,8 @@ class Source(Pipe):
             OperatorSingleQuote(),
             OperatorDoubleQuote(),
         ]
+        helvetica: typing.Optional[Font] = Standard14Fonts.get("Helvetica")
+        assert helvetica is not None, "Helvetica is one of the standard 14 fonts."
         self.color_rendering_intent: name = name("DeviceRGB")  # type: ignore[annotation-unchecked]
         self.dash_array: typing.List[int] = []  # type: ignore[annotation-unchecked]
         self.dash_phase: int = 0  # type: ignore[annotation-unchecked]
@@ -234,32 +245,99 @@ class Source(Pipe):
         self.non_stroke_color: Color = X11Color.BLACK  # type: ignore[annotation-unchecked]
         self.non_stroke_color_space: name = name("DeviceRGB")  # type: ignore[annotation-unchecked]
         self.path: typing.List[ShapeType] = []  # type: ignore[annotation-unchecked]
+        self.resources: dict = {}  # type: ignore[annotation-unchecked]
         self.stroke_color: Color = X11Color.BLACK  # type: ignore[annotation-unchecked]
         self.stroke_color_space: name = name("DeviceRGB")  # type: ignore[annotation-unchecked]
-        self.font: Font = Standard14Fonts.get("Helvetica")  # type: ignore[annotation-unchecked]
-        self.text_line_matrix: typing.List[typing.List[float]] = [  # type: ignore[annotation-unchecked]
-            [1.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0],
-            [0.0, 0.0, 1.0],
-        ]
-        self.text_matrix: typing.List[typing.List[float]] = [  # type: ignore[annotation-unchecked]
-            [1.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0],
-            [0.0, 0.0, 1.0],
-        ]
+        self.font: Font = helvetica
+        self.text_line_matrix: Matrix = Matrix()  # type: ignore[annotation-unchecked]
+        self.text_matrix: Matrix = Matrix()  # type: ignore[annotation-unchecked]
         self.text_rendering_mode: int = 0  # type: ignore[annotation-unchecked]
         self.text_rise: float = 0  # type: ignore[annotation-unchecked]
-        self.transformation_matrix: typing.List[typing.List[float]] = [  # type: ignore[annotation-unchecked]
-            [1.0, 0.0, 0.0],
-            [0.0, 1.0, 0.0],
-            [0.0, 0.0, 1.0],
-        ]
+        self.transformation_matrix: Matrix = Matrix()  # type: ignore[annotation-unchecked]
         self.__page: typing.Optional[Page] = None  # type: ignore[annotation-unchecked]
+        self.__page_nr: typing.Optional[int] = None  # type: ignore[annotation-unchecked]
+        self.__deliver_events_per_page: bool = deliver_events_per_page  # type: ignore[annotation-unchecked]
+        self.__events_on_page: typing.List[Event] = []  # type: ignore[annotation-unchecked]
+        self.__operator_per_name: typing.Dict[str, Operator] = {}  # type: ignore[annotation-unchecked]
+        self.__operators_in_lookup_table: typing.List[Operator] = []  # type: ignore[annotation-unchecked]
+        self.__forms_being_processed: typing.List[stream] = []  # type: ignore[annotation-unchecked]
+        self.__operations_per_form: collections.OrderedDict[int, typing.Tuple[stream, typing.List[typing.Tuple[typing.List[typing.Optional[PDFType]], str]]]] = collections.OrderedDict()  # type: ignore[annotation-unchecked]
+        self.__event_types_in_lookup_table: typing.Optional[typing.Set[typing.Type[Event]]] = None  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
     #
 
+    def __apply_operations(
+        self,
+        operations: typing.Iterable[
+            typing.Tuple[typing.List[typing.Optional[PDFType]], str]
+        ],
+        page: Page,
+    ) -> None:
+        from borb.pdf.toolkit.source.operator.operator import Operator
+
+        # apply each (known) operator to its operands
+        for operands, operator_name in operations:
+            operator: typing.Optional[Operator] = self.__operator_per_name.get(
+                operator_name, None
+            )
+            if operator is None:
+                continue
+            # (a null operand is passed on as None)
+            number_of_operands: int = operator.get_number_of_operands()
+            operator.apply(
+                operands=typing.cast(
+                    typing.List[PDFType],
+                    operands[max(0, len(operands) - number_of_operands) :],
+                ),
+                page=page,
+                source=self,
+            )
+
+    def __deliver(self, event: Event) -> None:
+        # IF events are delivered per page
+        # THEN hold on to the event (until the page has been processed)
+        if self.__deliver_events_per_page:
+            self.__events_on_page.append(event)
+            return
+        next: typing.Optional[Pipe] = self.get_next()
+        assert next is not None
+        next.process(event)
+
+    def __update_operator_lookup_table(
+        self, event_types: typing.Optional[typing.Set[typing.Type[Event]]]
+    ) -> None:
+        # IF the operators (and the event types that are needed) have not changed (since the lookup table was built)
+        # THEN do nothing
+        if (
+            self.__operators_in_lookup_table == self.operators
+            and self.__event_types_in_lookup_table == event_types
+        ):
+            return
+
+        # build lookup table (name -> Operator)
+        self.__operator_per_name = {}
+        for operator in self.operators:
+            self.__operator_per_name.setdefault(operator.get_name(), operator)
+
+        # IF only some event types are needed
+        # THEN remove the operators that only contribute to other event types
+        if event_types is not None:
+            for operator_name, operator in [
+                x for x in self.__operator_per_name.items()
+            ]:
+                operator_event_types: typing.Optional[
+                    typing.Set[typing.Type[Event]]
+                ] = operator.get_event_types()
+                if operator_event_types is None:
+                    continue
+                if len(operator_event_types & event_types) == 0:
+                    self.__operator_per_name.pop(operator_name)
+
+        self.__operators_in_lookup_table = [x for x in self.operators]
+        self.__event_types_in_lookup_table = event_types
+
     #
     # PUBLIC
     #
@@ -290,12 +368,13 @@ class Source(Pipe):
         from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
 
         assert self.__page is not None
-        next.process(
+        self.__deliver(
             ShapeFillEvent(
                 fill_color=fill_color,
                 shape=shape,
                 use_even_odd_rule=use_even_odd_rule,
                 page=self.__page,
+                page_nr=self.__page_nr,
             )
         )
 
@@ -330,7 +409,7 @@ class Source(Pipe):
         from borb.pdf.toolkit.source.event.image_event import ImageEvent
 
         assert self.__page is not None
-        next.process(
+        self.__deliver(
             ImageEvent(
                 x=x,
                 y=y,
@@ -339,6 +418,7 @@ class Source(Pipe):
                 image=image,
                 xobject_resource=xobject_resource,
                 page=self.__page,
+                page_nr=self.__page_nr,
             )
         )
 
@@ -355,7 +435,76 @@ class Source(Pipe):
         if next is not None:
             next.process(event)
 
-    def process_page(self, page: Page) -> None:
+    def process_form_xobject(self, form: stream) -> None:
+        """
+        Process the content stream of a Form XObject, as if it were part of the current page.
+
+        The graphics state is saved (as by the "q" operator), the /Matrix of the form is
+        concatenated to the current transformation matrix, and the content stream of the form
+        is interpreted using the /Resources of the form (or the current resources, if the form has none).
+        Afterwards, the graphics state and the resources are restored.
+
+        The (decoded and lexed) content stream of each form is kept in a (least recently used) cache,
+        by object identity, so a form that is used on many pages (e.g. a header or footer) is only parsed once.
+        A form that (directly or indirectly) uses itself is not processed again.
+
+        :param form: The Form XObject (a stream with /Subtype /Form)
+        """
+        # IF the form is already being processed
+        # THEN do not process it again
+        if any([x is form for x in self.__forms_being_processed]):
+            return
+
+        # lex the content stream (once per form)
+        cached_form_and_operations = self.__operations_per_form.get(id(form), None)
+        if (
+            cached_form_and_operations is None
+            or cached_form_and_operations[0] is not form
+        ):
+            cached_form_and_operations = (
+                form,
+                (
+                    [x for x in lex_content_stream(decode_stream_in_chunks(form))]
+                    if "Bytes" in form or "DecodedBytes" in form
+                    else []
+                ),
+            )
+            self.__operations_per_form[id(form)] = cached_form_and_operations
+            # IF there are too many forms in the cache
+            # THEN evict the least recently used form
+            if len(self.__operations_per_form) > Source.MAX_NUMBER_OF_CACHED_FORMS:
+                self.__operations_per_form.popitem(last=False)
+        else:
+            self.__operations_per_form.move_to_end(id(form))
+
+        # save the graphics state (q)
+        from borb.pdf.toolkit.source.operator.operator_q import Operatorq
+        from borb.pdf.toolkit.source.operator.operator_Q import OperatorQ
+
+        assert self.__page is not None
+        Operatorq().apply(operands=[], page=self.__page, source=self)
+        previous_resources: dict = self.resources
+        self.__forms_being_processed += [form]
+
+        # concatenate /Matrix to the transformation matrix
+        form_matrix: typing.List[float] = form.get("Matrix", [1, 0, 0, 1, 0, 0])
+        self.transformation_matrix = Matrix(*form_matrix).mul(
+            self.transformation_matrix
+        )
+
+        # apply the operations of the form (using its own /Resources, if it has any)
+        self.resources = form.get("Resources", previous_resources)
+        try:
+            self.__apply_operations(
+                operations=cached_form_and_operations[1], page=self.__page
+            )
+        finally:
+            # restore the graphics state (Q)
+            self.__forms_being_processed.pop(-1)
+            self.resources = previous_resources
+            OperatorQ().apply(operands=[], page=self.__page, source=self)
+
+    def process_page(self, page: Page, page_nr: typing.Optional[int] = None) -> None:
         """
         Process the content stream of a PDF page, executing operations based on the PDF operators encountered.
 
@@ -369,205 +518,47 @@ class Source(Pipe):
         implementation.
 
         :param page: The Page
+        :param page_nr: The (zero-based) index of the Page in its Document, if known (it is stamped on every Event)
         """
-        # fmt: off
-        from borb.pdf.toolkit.source.operator.operator import Operator
-        self.operators = sorted(self.operators, key=lambda x: x.get_name())
-        self.operators = sorted(self.operators, key=lambda x: len(x.get_name()), reverse=True)
-        # fmt: on
+        # (re)build the operator lookup table (if needed)
+        # (skipping the operators that only produce events the next Pipe does not need)
+        next: typing.Optional[Pipe] = self.get_next()
+        self.__update_operator_lookup_table(
+            event_types=None if next is None else next.get_event_types()
+        )
 
-        # set __page
+        # set __page, __page_nr, resources
         self.__page = page
+        self.__page_nr = page_nr
+        self.__events_on_page = []
+        self.resources = page.get("Resources", {})
 
-        # decompress /Contents /Bytes
-
-        content_stream_bytes: bytes = b""
+        # decompress /Contents /Bytes, one chunk at a time
+        # (without storing /DecodedBytes on the content stream(s))
+        content_streams: typing.List[stream] = []
         if isinstance(page["Contents"], list):
-            content_stream_bytes = b"".join(
-                [decode_stream(cs).get("DecodedBytes", b"") for cs in page["Contents"]]
-            )
+            content_streams = page["Contents"]
         if isinstance(page["Contents"], stream):
-            content_stream_bytes = decode_stream(page["Contents"]).get(
-                "DecodedBytes", b""
-            )
-
-        operands: typing.List[
-            typing.Union[PDFType, typing.Literal[b"<<"], typing.Literal[b"["]]
-        ] = []
-        i: int = 0
-        while i < len(content_stream_bytes):
-
-            # float
-            if content_stream_bytes[i] in b"0123456789.-":
-                j: int = i
-                has_leading_digits: bool = False
-                has_trailing_digits: bool = False
-                has_dot: bool = False
-                if content_stream_bytes[j] in b"-":
-                    j += 1
-                while content_stream_bytes[j] in b"0123456789":
-                    has_leading_digits = True
-                    j += 1
-                if content_stream_bytes[j] in b".":
-                    has_dot = True
-                    j += 1
-                while content_stream_bytes[j] in b"0123456789":
-                    has_trailing_digits = True
-                    j += 1
-                if has_dot and (has_leading_digits or has_trailing_digits):
-                    operands += [float(content_stream_bytes[i:j].decode())]
-                    i = j
-                    continue
-
-            # integer
-            if content_stream_bytes[i] in b"0123456789-":
-                j = i
-                if content_stream_bytes[j] in b"-":
-                    j += 1
-                while content_stream_bytes[j] in b"0123456789":
-                    j += 1
-                operands += [int(content_stream_bytes[i:j].decode())]
-                i = j
-                continue
-
-            # name
-            if content_stream_bytes[i] in b"/":
-                j = i + 1
-                while (
-                    (content_stream_bytes[j : j + 1] != b" ")
-                    and (content_stream_bytes[j : j + 2] != b"\n\r")
-                    and (content_stream_bytes[j : j + 2] != b"\r\n")
-                    and (content_stream_bytes[j : j + 1] != b"\n")
-                    and (content_stream_bytes[j : j + 1] != b"\r")
-                    and (content_stream_bytes[j : j + 1] != b"[")
-                    and (content_stream_bytes[j : j + 1] != b"]")
-                    and (content_stream_bytes[j : j + 1] != b"<")
-                    and (content_stream_bytes[j : j + 1] != b">")
-                    and (content_stream_bytes[j : j + 1] != b"/")
-                ):
-                    j += 1
-                operands += [name(content_stream_bytes[i:j].decode())]
-                i = j
-                continue
-
-            # string
-            if content_stream_bytes[i] in b"(":
-                j = i
-                while content_stream_bytes[j : j + 1] != b")":
-                    if content_stream_bytes[j:].startswith(b"\\n"):
-                        j += 2
-                        continue
-                    if content_stream_bytes[j:].startswith(b"\\r"):
-                        j += 2
-                        continue
-                    if content_stream_bytes[j:].startswith(b"\\t"):
-                        j += 2
-                        continue
-                    if content_stream_bytes[j:].startswith(b"\\b"):
-                        j += 2
-                        continue
-                    if content_stream_bytes[j:].startswith(b"\\f"):
-                        j += 2
-                        continue
-                    if content_stream_bytes[j:].startswith(b"\\("):
-                        j += 2
-                        continue
-                    if content_stream_bytes[j:].startswith(b"\\)"):
-                        j += 2
-                        continue
-                    j += 1
-                j += 1
-                operands += [content_stream_bytes[i + 1 : j - 1].decode("latin1")]
-                i = j
-                continue
-
-            # hex string
-            if (content_stream_bytes[i:].startswith(b"<")) and (
-                not content_stream_bytes[i:].startswith(b"<<")
-            ):
-                j = i + 1
-                while content_stream_bytes[j] in b"0123456789ABCDEFabcdef":
-                    j += 1
-
-                j += 1
-                operands += [hexstr(content_stream_bytes[i + 1 : j - 1].decode())]
-                i = j
-                continue
-
-            # open array [
-            if content_stream_bytes[i] in b"[":
-                operands += [b"["]
-                i += 1
-                continue
-            # close array ]
-            if content_stream_bytes[i] in b"]":
-                array_open_bracket_pos: int = operands.index(b"[")
-                arr = operands[array_open_bracket_pos + 1 :]
-                operands = operands[:array_open_bracket_pos] + [arr]  # type: ignore[assignment]
-                i += 1
-                continue
-
-            # open dictionary
-            if content_stream_bytes[i:].startswith(b"<<"):
-                operands += [b"<<"]
-                i += 2
-                continue
-            if content_stream_bytes[i:].startswith(b">>"):
-                dict_open_brackets_pos: int = operands.index(b"<<")
-                arr = operands[dict_open_brackets_pos + 1 :]  # type: ignore[assignment]
-                arr_as_dict = {arr[k]: arr[k + 1] for k in range(0, len(arr), 2)}
-                operands = operands[:dict_open_brackets_pos] + [arr_as_dict]  # type: ignore[assignment]
-                i += 2
-                continue
-
-            # space
-            if content_stream_bytes[i : i + 1] == b" ":
-                i += 1
-                continue
-
-            # newline
-            if content_stream_bytes[i : i + 2] == b"\n\r":
-                i += 2
-                continue
-            if content_stream_bytes[i : i + 2] == b"\r\n":
-                i += 2
-                continue
-            if content_stream_bytes[i : i + 1] == b"\n":
-                i += 1
-                continue
-            if content_stream_bytes[i : i + 1] == b"\r":
-                i += 1
-                continue
+            content_streams = [page["Contents"]]
+        content_stream_chunks: typing.Iterator[bytes] = (
+            chunk
+            for cs in content_streams
+            if "Bytes" in cs or "DecodedBytes" in cs
+            for chunk in decode_stream_in_chunks(cs)
+        )
 
-            # operators
-            j = i + 1
-            while any(
-                [
-                    x.get_name().startswith(content_stream_bytes[i:j].decode())
-                    for x in self.operators
-                ]
-            ):
-                j += 1
-            j -= 1
-            operator_code: str = content_stream_bytes[i:j].decode()
-            operator: typing.Optional[Operator] = next(
-                iter([x for x in self.operators if x.get_name() == operator_code]), None
-            )
-            if operator is not None:
-                args: typing.List[PDFType] = []
-                for _ in range(0, operator.get_number_of_operands()):
-                    args += [operands.pop(-1)]  # type: ignore[list-item]
-                args.reverse()
-                operator.apply(
-                    operands=args,  # type: ignore[arg-type]
-                    page=page,
-                    source=self,
-                )
-                i = j
-                continue
+        # lex the content stream, apply each (known) operator to its operands
+        self.__apply_operations(
+            operations=lex_content_stream(content_stream_chunks), page=page
+        )
 
-            # move ahead 1 byte
-            i += 1
+        # IF events are delivered per page
+        # THEN pass all events (of this page) down the pipe at once
+        if self.__deliver_events_per_page:
+            events_on_page: typing.List[Event] = self.__events_on_page
+            self.__events_on_page = []
+            if next is not None and len(events_on_page) > 0:
+                next.process_events(events_on_page)
 
     def stroke(self, line_width: float, shape: ShapeType, stroke_color: Color):
         """
@@ -589,12 +580,13 @@ class Source(Pipe):
         from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
 
         assert self.__page is not None
-        next.process(
+        self.__deliver(
             ShapeStrokeEvent(
                 line_width=line_width,
                 shape=shape,
                 stroke_color=stroke_color,
                 page=self.__page,
+                page_nr=self.__page_nr,
             )
         )
 
@@ -633,7 +625,7 @@ class Source(Pipe):
         from borb.pdf.toolkit.source.event.text_event import TextEvent
 
         assert self.__page is not None
-        next.process(
+        self.__deliver(
             TextEvent(
                 s=s,
                 x=x,
@@ -644,5 +636,6 @@ class Source(Pipe):
                 font_color=font_color,
                 font_size=font_size,
                 page=self.__page,
+                page_nr=self.__page_nr,
             )
         )
@@ -7,7 +7,6 @@ The `PDF` class simplifies PDF handling by offering an interface for reading,
 writing, and managing content within PDF documents. It abstracts the complexities
 of PDF structure, allowing users to easily manipulate documents.
 """
-import io
 import pathlib
 import typing
 
@@ -31,12 +30,69 @@ class PDF:
     # PRIVATE
     #
 
+    @staticmethod
+    def __close_memory_map(memory_map: "mmap.mmap") -> None:  # type: ignore[name-defined]
+        # IF (a view on) the memory-mapped file is still in use
+        # THEN the file is unmapped once the last view is released
+        try:
+            memory_map.close()
+        except BufferError:
+            pass
+
+    @staticmethod
+    def __detach_memory_mapped_bytes(what: Document) -> None:
+        # copy the (raw) bytes of every stream that is a view on a memory-mapped file
+        from borb.pdf.primitives import name, reference, stream
+
+        memory_map_per_id: typing.Dict[int, typing.Any] = {}
+        for r in what.get("XRef", []):
+            o = r.get_referenced_object() if isinstance(r, reference) else None
+            if not isinstance(o, stream):
+                continue
+            bts = dict.get(o, "Bytes")
+            if not isinstance(bts, memoryview):
+                continue
+            memory_map_per_id[id(bts.obj)] = bts.obj
+            dict.__setitem__(o, name("Bytes"), bts.tobytes())
+            bts.release()
+
+        # unmap the file(s)
+        for memory_map in memory_map_per_id.values():
+            PDF.__close_memory_map(memory_map)
+
+    @staticmethod
+    def __write_to_binary_io(
+        what: Document,
+        where_to: typing.BinaryIO,
+        incremental_update: bool = False,
+        number_of_bytes_written: int = 0,
+        use_object_streams: bool = False,
+    ) -> None:
+        # instantiate FacadeVisitor
+        # (streaming the bytes to where_to, rather than keeping them in memory)
+        from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+
+        rv: FacadeVisitor = FacadeVisitor(
+            destination=where_to,
+            incremental_update=incremental_update,
+            number_of_bytes_written=number_of_bytes_written,
+            use_object_streams=use_object_streams,
+        )
+
+        # convert everything to bytes using visitor design pattern
+        rv.visit(node=what)
+
     #
     # PUBLIC
     #
 
     @staticmethod
-    def read(where_from: typing.Union[str, pathlib.Path]) -> typing.Optional[Document]:
+    def read(
+        where_from: typing.Union[str, pathlib.Path],
+        incremental_update: bool = False,
+        lazy: bool = False,
+        memory_map: bool = False,
+    ) -> typing.Optional[Document]:
         """
         Read a PDF file from the specified location and convert it to a `Document` object.
 
@@ -46,7 +102,23 @@ class PDF:
         `Document` object allows further manipulation and analysis of the PDF’s content
         within the application.
 
+        When `lazy` is set, indirect references are not resolved upfront. Only the top of the
+        document (trailer, catalog, page-tree root) is parsed, and each `Page` (and the objects
+        it needs) is parsed the first time it is requested using `Document.get_page`.
+
+        When `incremental_update` is set, a snapshot of every object is kept (as it is read, or resolved).
+        This allows `PDF.write` to append only the objects that were added or modified since, rather than
+        writing the Document as a whole. Keeping the snapshot costs time and memory, so it is off by default.
+
+        When `memory_map` is set, the file is memory-mapped rather than read into memory. The
+        (raw) bytes of each stream are then kept as a `memoryview` on the mapped file, and are
+        only copied into memory once they are decoded. The file is unmapped once the `Document`
+        is garbage collected, or when `PDF.write` overwrites an existing file with it.
+
         :param where_from: The file path to the PDF, specified as a string or `pathlib.Path` object, indicating the location of the PDF file to read.
+        :param incremental_update: Whether to keep the state of every object (as it is read), so that the Document can be written as an incremental update. Defaults to False.
+        :param lazy: Whether to resolve indirect objects on demand, rather than all at once. Defaults to False.
+        :param memory_map: Whether to memory-map the file, rather than reading all of its bytes. Defaults to False.
         :return: A `Document` object containing the parsed contents of the PDF, structured for further processing or display.
         """
         if isinstance(where_from, str):
@@ -55,19 +127,37 @@ class PDF:
         assert where_from.exists()
 
         # read all bytes
-        bts: bytes = b""
+        import mmap
+
+        bts: typing.Union[bytes, mmap.mmap] = b""
         with open(where_from, "rb") as pdf_file_handle:
-            bts = pdf_file_handle.read()
+            if memory_map and where_from.stat().st_size > 0:
+                bts = mmap.mmap(pdf_file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                bts = pdf_file_handle.read()
 
         # instantiate FacadeVisitor
         from borb.pdf.visitor.read.root_visitor import RootVisitor
 
-        rv = RootVisitor()
+        rv = RootVisitor(incremental_update=incremental_update, lazy=lazy)
         document_and_index = rv.visit(bts)
         if document_and_index is None:
             return None
         assert isinstance(document_and_index[0], Document)
 
+        # IF the file was memory-mapped
+        # THEN unmap it once the Document is garbage collected
+        if isinstance(bts, mmap.mmap):
+            import weakref
+
+            weakref.finalize(document_and_index[0], PDF.__close_memory_map, bts)
+
+        # keep track of the file the Document was read from
+        # (so that an incremental update can be written later on)
+        snapshot = document_and_index[0].get_incremental_update_snapshot()
+        if snapshot is not None:
+            snapshot.set_source(where_from)
+
         # UsageStatistics
         try:
             from borb.pdf import UsageStatistics
@@ -87,6 +177,8 @@ class PDF:
     def write(
         what: Document,
         where_to: typing.Union[pathlib.Path, str, typing.BinaryIO],
+        incremental_update: bool = False,
+        use_object_streams: bool = False,
     ) -> None:
         """
         Write the specified Document to a PDF file.
@@ -94,18 +186,89 @@ class PDF:
         This method saves the provided Document object into a PDF format at the
         location specified by the file path. The file path can be a string or
         a pathlib.Path object. If the file already exists, it will be overwritten.
+        Alternatively, the Document can be written to a (binary) file handle.
+
+        The bytes are streamed to the file (handle) as they are written,
+        rather than being collected (in memory) first.
+
+        When use_object_streams is set, all (non-stream) objects are packed into (Flate-compressed) object streams,
+        and a (compressed) cross-reference stream is written instead of the cross-reference table.
+        This typically produces a smaller file. It is ignored for PDF/A-1 documents (which do not allow object streams).
+
+        When incremental_update is set (and the Document was read, using PDF.read with incremental_update set,
+        from a file that has not changed since),
+        the bytes of the original file are copied verbatim, and only the objects that were added or modified
+        are appended (followed by a new cross-reference section, pointing to the original one).
+        When the Document is written to the file it was read from, the incremental update is appended to that file.
+        Otherwise (e.g. for a Document that was not read from a file) the Document is written as a whole.
+        use_object_streams is ignored for incremental updates.
 
-        :param where_to:    the path (or pathlib.Path) where the Document needs to be stored
-        :param what:        the document to be stored
+        :param where_to:            the path (or pathlib.Path, or typing.BinaryIO) where the Document needs to be stored
+        :param what:                the document to be stored
+        :param incremental_update:  whether to write the Document as an incremental update (of the file it was read from)
+        :param use_object_streams:  whether to use object streams (and a cross-reference stream)
         :return:    None
         """
-        # instantiate FacadeVisitor
-        from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+        # IF the Document can not be written as an incremental update
+        # THEN write the Document as a whole
+        snapshot = what.get_incremental_update_snapshot()
+        source: typing.Optional[pathlib.Path] = (
+            snapshot.get_source() if snapshot is not None else None
+        )
+        if source is None:
+            incremental_update = False
 
-        rv: FacadeVisitor = FacadeVisitor()
+        # IF the Document was read lazily
+        # THEN resolve everything before writing
+        # (an incremental update only writes the objects that were resolved, and modified)
+        if not incremental_update:
+            what._Document__resolve_all_references()  # type: ignore[attr-defined]
 
-        # convert everything to bytes using visitor design pattern
-        rv.visit(node=what)
+        # handle pathlib.Path and str
+        if isinstance(where_to, str):
+            where_to = pathlib.Path(where_to)
+        if isinstance(where_to, pathlib.Path):
+            if not where_to.parent.exists():
+                where_to.parent.mkdir(parents=True)
+            assert where_to.parent.exists()
+
+            # IF the incremental update is written to the file the Document was read from
+            # THEN append it (rather than copying the original bytes)
+            if (
+                incremental_update
+                and where_to.exists()
+                and where_to.samefile(source)  # type: ignore[arg-type]
+            ):
+                with open(where_to, "ab") as pdf_file_handle:
+                    PDF.__write_to_binary_io(
+                        what=what,
+                        where_to=pdf_file_handle,
+                        incremental_update=True,
+                        number_of_bytes_written=where_to.stat().st_size,
+                        use_object_streams=use_object_streams,
+                    )
+                snapshot.set_source(where_to)  # type: ignore[union-attr]
+            else:
+                # IF the file exists (and may be the memory-mapped file the Document was read from)
+                # THEN copy the stream bytes (and unmap the file) before truncating it
+                if where_to.exists():
+                    PDF.__detach_memory_mapped_bytes(what)
+                with open(where_to, "wb") as pdf_file_handle:
+                    PDF.__write_to_binary_io(
+                        what=what,
+                        where_to=pdf_file_handle,
+                        incremental_update=incremental_update,
+                        use_object_streams=use_object_streams,
+                    )
+
+        # handle typing.BinaryIO
+        else:
+            PDF.__write_to_binary_io(
+                what=what,
+                where_to=where_to,
+                incremental_update=incremental_update,
+                use_object_streams=use_object_streams,
+            )
 
         # UsageStatistics
         try:
@@ -118,24 +281,3 @@ class PDF:
             )
         except:
             pass
-
-        # handle typing.BinaryIO
-        if isinstance(where_to, io.BytesIO):
-            where_to.write(rv.bytes())
-
-        # handle pathlib.path
-        if isinstance(where_to, pathlib.Path):
-            if not where_to.parent.exists():
-                where_to.parent.mkdir(parents=True)
-            assert where_to.parent.exists()
-            with open(where_to, "wb") as pdf_file_handle:
-                pdf_file_handle.write(rv.bytes())
-
-        # handle str
-        if isinstance(where_to, str):
-            where_to = pathlib.Path(where_to)
-            if not where_to.parent.exists():
-                where_to.parent.mkdir(parents=True)
-            assert where_to.parent.exists()
-            with open(where_to, "wb") as pdf_file_handle:
-                pdf_file_handle.write(rv.bytes())
@@ -52,6 +52,10 @@ class BoolVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a boolean (`true` or `false`) may start with."""
+        return b"ft"
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
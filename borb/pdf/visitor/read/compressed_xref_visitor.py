@@ -50,6 +50,11 @@ class CompressedXRefVisitor(XRefVisitor):
     #
     # PUBLIC
     #
+
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a cross-reference stream dictionary may start with."""
+        return b"<"
+
     def visit(self, node: typing.Any) -> typing.Optional[typing.Any]:
         """
         Traverse the PDF document tree using the visitor pattern.
@@ -76,6 +81,10 @@ class CompressedXRefVisitor(XRefVisitor):
             start_of_dictionary_pos=start_of_xref_dict
         )
 
+        # IF the dictionary does not mention /XRef
+        # THEN it can not be a cross-reference stream
+        if self.get_bytes().find(b"/XRef", start_of_xref_dict, end_of_xref_dict) == -1:
+            return None
         if (
             self._get_value_from_dictionary_bytes(
                 from_byte=start_of_xref_dict, to_byte=end_of_xref_dict, key=b"Type"
@@ -116,7 +125,9 @@ class CompressedXRefVisitor(XRefVisitor):
             from_byte=start_of_xref_dict, to_byte=end_of_xref_dict, key=b"Length"
         )
         assert isinstance(length, int)
-        stream_bytes: bytes = self.get_bytes()[i : i + length]
+        stream_bytes: typing.Union[bytes, memoryview] = self.get_stream_bytes(
+            end=i + length, start=i
+        )
         i += length
 
         # read newline (\n\r)
@@ -190,6 +201,7 @@ class CompressedXRefVisitor(XRefVisitor):
         # process decoded bytes
         decoded_xref_bytes: bytes = tmp_stream["DecodedBytes"]
         xref: typing.List[reference] = []
+        decoded_xref_byte_pointer: int = 0
         for k in range(0, len(indices), 2):
             start = indices[k]
             length = indices[k + 1]
@@ -200,7 +212,6 @@ class CompressedXRefVisitor(XRefVisitor):
             # type (see Table 18). In PDF 1.5 through PDF 1.7, only types 0, 1, and 2 are allowed. Any other value shall be
             # interpreted as a reference to the null object, thus permitting new entry types to be defined in the future.
 
-            decoded_xref_byte_pointer: int = 0
             for l in range(0, length):
 
                 # object number
@@ -267,22 +278,12 @@ class CompressedXRefVisitor(XRefVisitor):
                     )
                     xref += [ref]
 
-        # for every entry that refers to a parent stream
-        # set the byte offset
-        for ref in xref:
-            if ref.get_parent_stream_object_nr() is not None:
-                ref.__byte_offset = next(
-                    iter(
-                        [
-                            x.get_byte_offset()
-                            for x in xref[::-1]
-                            if x.get_object_nr() == ref.get_parent_stream_object_nr()
-                        ]
-                    )
-                )
+        # IF an entry refers to a parent stream
+        # THEN its parent is looked up (by object_nr) in the xref index when the entry is resolved
+        # AND there is no need to scan the xref for every such entry here
 
         # add to (root) xref tables
-        self._ReadVisitor__root._RootVisitor__xref += xref  # type: ignore[attr-defined]
+        self._add_to_xref(xref)  # type: ignore[arg-type]
 
         # IF the /Prev key has been set
         # THEN process the previous xref as well
@@ -11,6 +11,8 @@ format. It converts the ASCII85-encoded string back into the original binary dat
 ASCII85 decoding is used in PDFs for more efficient storage of binary data, such as images
 or streams, by representing binary information as a set of ASCII characters.
 """
+import re
+import typing
 
 
 class ASCII85Decode:
@@ -26,6 +28,8 @@ class ASCII85Decode:
     or streams, by representing binary information as a set of ASCII characters.
     """
 
+    __COMPLETE_GROUPS = re.compile(rb"(?:z|[!-u]{5})*")
+
     #
     # CONSTRUCTOR
     #
@@ -83,3 +87,44 @@ class ASCII85Decode:
 
         # we should not be here
         raise exceptions_to_throw[0]
+
+    @staticmethod
+    def decode_in_chunks(chunks: typing.Iterable[bytes]) -> typing.Iterator[bytes]:
+        """
+        Decode data encoded in ASCII85 (Base85) representation, one chunk at a time.
+
+        This method behaves like `decode`, but rather than decoding all data at once,
+        it decodes every complete group (of 5 characters, or the `z` shorthand) as soon
+        as it becomes available. Incomplete groups (and the end-of-data marker `~>`) are
+        kept until more data arrives, or until the end of the input.
+
+        :param chunks: The ASCII85 encoded input, as an iterable of byte sequences.
+        :return: An iterator over the decoded binary data.
+        """
+        import base64
+
+        pending_bytes: bytes = b""
+        is_first_chunk: bool = True
+        for chunk in chunks:
+            # remove whitespace
+            pending_bytes += bytes(chunk).translate(None, b" \t\n\r\v")
+
+            # IF the data starts with the (adobe) start-of-data marker <~
+            # THEN remove it
+            if is_first_chunk:
+                if len(pending_bytes) < 2:
+                    continue
+                if pending_bytes.startswith(b"<~"):
+                    pending_bytes = pending_bytes[2:]
+                is_first_chunk = False
+
+            # decode all complete groups
+            n: int = ASCII85Decode.__COMPLETE_GROUPS.match(pending_bytes).end()  # type: ignore[union-attr]
+            if n == 0:
+                continue
+            yield base64.a85decode(pending_bytes[:n])
+            pending_bytes = pending_bytes[n:]
+
+        # decode whatever is left
+        if len(pending_bytes) > 0:
+            yield ASCII85Decode.decode(pending_bytes)
@@ -37,6 +37,47 @@ from borb.pdf.visitor.read.compression.run_length_decode import RunLengthDecode
 # PRIVATE
 #
 
+
+def _get_filters_and_decode_params(
+    stream_to_decode: stream,
+) -> typing.Tuple[typing.List[str], typing.List[typing.Dict]]:
+    # determine filter(s) to apply
+    filters: typing.List[str] = []
+    if "Filter" in stream_to_decode:
+        if isinstance(stream_to_decode["Filter"], list):
+            filters = stream_to_decode["Filter"]
+        else:
+            filters = [stream_to_decode["Filter"]]
+
+    decode_params: typing.List[typing.Dict] = []
+    if "DecodeParms" in stream_to_decode:
+        if (
+            isinstance(stream_to_decode["DecodeParms"], list)
+            and stream_to_decode["DecodeParms"] is not None
+        ):
+            decode_params = stream_to_decode["DecodeParms"]
+            decode_params = [x or dict() for x in decode_params]
+        if (
+            isinstance(stream_to_decode["DecodeParms"], dict)
+            and stream_to_decode["DecodeParms"] is not None
+        ):
+            decode_params = [stream_to_decode["DecodeParms"]]
+    else:
+        decode_params = [{} for x in range(0, len(filters))]
+
+    # return
+    return filters, decode_params
+
+
+def _split_in_chunks(
+    bytes_to_split: typing.Union[bytes, memoryview], chunk_size: int
+) -> typing.Iterator[typing.Union[bytes, memoryview]]:
+    # IF the bytes are a view on a memory-mapped file
+    # THEN slicing them does not copy them
+    for i in range(0, len(bytes_to_split), chunk_size):
+        yield bytes_to_split[i : i + chunk_size]
+
+
 #
 # PUBLIC
 #
@@ -71,65 +112,97 @@ def decode_stream(stream_to_decode: stream) -> stream:
     if "DecodedBytes" in stream_to_decode:
         return stream_to_decode
 
-    # determine filter(s) to apply
-    filters: typing.List[str] = []
+    # apply filter(s)
+    transformed_bytes = stream_to_decode["Bytes"]
     if "Filter" in stream_to_decode:
-        if isinstance(stream_to_decode["Filter"], list):
-            filters = stream_to_decode["Filter"]
-        else:
-            filters = [stream_to_decode["Filter"]]
+        transformed_bytes = b"".join(decode_stream_in_chunks(stream_to_decode))
 
-    decode_params: typing.List[typing.Dict] = []
-    if "DecodeParms" in stream_to_decode:
-        if (
-            isinstance(stream_to_decode["DecodeParms"], list)
-            and stream_to_decode["DecodeParms"] is not None
-        ):
-            decode_params = stream_to_decode["DecodeParms"]
-            decode_params = [x or dict() for x in decode_params]
-        if (
-            isinstance(stream_to_decode["DecodeParms"], dict)
-            and stream_to_decode["DecodeParms"] is not None
-        ):
-            decode_params = [stream_to_decode["DecodeParms"]]
-    else:
-        decode_params = [{} for x in range(0, len(filters))]
+    # IF the (raw) bytes were a view on a memory-mapped file (and no filter was applied)
+    # THEN copy them now
+    if isinstance(transformed_bytes, memoryview):
+        transformed_bytes = transformed_bytes.tobytes()
 
-    # apply filter(s)
-    transformed_bytes = stream_to_decode["Bytes"]
+    # set DecodedBytes
+    stream_to_decode[name("DecodedBytes")] = transformed_bytes
+
+    # return
+    return stream_to_decode
+
+
+def decode_stream_in_chunks(
+    stream_to_decode: stream, chunk_size: int = 65536
+) -> typing.Iterator[bytes]:
+    """
+    Decode a PDF `stream` object chunk by chunk, applying compression filters specified in the stream's `Filter` entry.
+
+    Unlike `decode_stream`, this function does not store the decoded bytes under the `DecodedBytes`
+    entry in the stream dictionary. Instead, the (raw) `Bytes` are fed (one chunk at a time) through
+    the chain of filters (such as Flate, ASCII85, LZW, or Run-Length encoding), and the decoded bytes
+    are yielded as soon as they become available. This keeps the memory needed to process a (large)
+    embedded image or attachment proportional to the chunk size, rather than to the size of the stream.
+
+    If the stream is already decoded (has a `DecodedBytes` entry), the decoded bytes are yielded
+    (in chunks) without further processing.
+
+    :param stream_to_decode:    The input `stream` object, containing raw (potentially compressed)
+                                byte data in its `Bytes` entry and metadata in `Filter` and
+                                `DecodeParms` entries for specifying the encoding filters
+                                and parameters.
+    :param chunk_size:          The (maximum) number of bytes fed to (or taken from) a filter at once
+    :return:                    An iterator over the decoded bytes
+    """
+    # fmt: off
+    assert isinstance(stream_to_decode, stream), "decode_stream_in_chunks only works on Stream objects"
+    assert ("Bytes" in stream_to_decode) or ("DecodedBytes" in stream_to_decode), "decode_stream_in_chunks only works on Stream objects with a `Bytes` key."
+    assert chunk_size > 0, "chunk_size must be a positive number."
+    # fmt: on
+
+    # IF stream already has /DecodedBytes
+    # THEN yield those
+    if "DecodedBytes" in stream_to_decode:
+        for chunk in _split_in_chunks(stream_to_decode["DecodedBytes"], chunk_size):
+            yield bytes(chunk)
+        return
+
+    # determine filter(s) to apply
+    filters, decode_params = _get_filters_and_decode_params(stream_to_decode)
+
+    # chain filter(s)
+    chunks: typing.Iterator = _split_in_chunks(stream_to_decode["Bytes"], chunk_size)
     for filter_index, filter_name in enumerate(filters):
         # FLATE
         if filter_name in ["FlateDecode", "Fl"]:
-            transformed_bytes = FlateDecode.decode(
-                bytes_in=transformed_bytes,
-                columns=int(decode_params[filter_index].get("Columns", 1)),
-                predictor=int(decode_params[filter_index].get("Predictor", 1)),
+            chunks = FlateDecode.decode_in_chunks(
+                chunks=chunks,
                 bits_per_component=int(
                     decode_params[filter_index].get("BitsPerComponent", 8)
                 ),
+                chunk_size=chunk_size,
+                columns=int(decode_params[filter_index].get("Columns", 1)),
+                predictor=int(decode_params[filter_index].get("Predictor", 1)),
             )
             continue
 
         # ASCII85
         if filter_name in ["ASCII85Decode"]:
-            transformed_bytes = ASCII85Decode.decode(transformed_bytes)
+            chunks = ASCII85Decode.decode_in_chunks(chunks)
             continue
 
         # LZW
         if filter_name in ["LZWDecode"]:
-            transformed_bytes = LZWDecode().decode(transformed_bytes)
+            chunks = LZWDecode().decode_in_chunks(chunks, chunk_size=chunk_size)
             continue
 
         # RunLengthDecode
         if filter_name in ["RunLengthDecode"]:
-            transformed_bytes = RunLengthDecode.decode(transformed_bytes)
+            chunks = RunLengthDecode.decode_in_chunks(chunks)
             continue
 
         # unknown filter
         assert False, "Unknown /Filter %s" % filter_name
 
-    # set DecodedBytes
-    stream_to_decode[name("DecodedBytes")] = transformed_bytes
-
-    # return
-    return stream_to_decode
+    # yield
+    for chunk in chunks:
+        if isinstance(chunk, memoryview):
+            chunk = chunk.tobytes()
+        yield chunk
@@ -45,6 +45,271 @@ class FlateDecode:
     # PRIVATE
     #
 
+    @staticmethod
+    def __decompress_in_chunks(
+        chunks: typing.Iterable[bytes], chunk_size: int
+    ) -> typing.Iterator[bytes]:
+        import zlib
+
+        decompressor = zlib.decompressobj()
+        has_seen_input: bool = False
+        for chunk in chunks:
+            has_seen_input = has_seen_input or len(chunk) > 0
+            while len(chunk) > 0 and not decompressor.eof:
+                bytes_after_zlib: bytes = decompressor.decompress(chunk, chunk_size)
+                chunk = decompressor.unconsumed_tail
+                if len(bytes_after_zlib) > 0:
+                    yield bytes_after_zlib
+        if not has_seen_input:
+            return
+        bytes_after_zlib = decompressor.flush()
+        if len(bytes_after_zlib) > 0:
+            yield bytes_after_zlib
+        if not decompressor.eof:
+            raise zlib.error(
+                "Error -5 while decompressing data: incomplete or truncated stream"
+            )
+
+    @staticmethod
+    def __undo_png_average_or_paeth_on_row(
+        filter_type: int,
+        current_row: bytearray,
+        prior_row: bytearray,
+        bytes_per_pixel: int,
+    ) -> None:
+        # PNG_FILTER_AVERAGE
+        # Predicts the average of the sample to the left and the
+        # sample above
+        if filter_type == 3:
+            for i in range(0, min(bytes_per_pixel, len(current_row))):
+                current_row[i] = (current_row[i] + (prior_row[i] >> 1)) & 0xFF
+            for i in range(bytes_per_pixel, len(current_row)):
+                current_row[i] = (
+                    current_row[i]
+                    + ((current_row[i - bytes_per_pixel] + prior_row[i]) >> 1)
+                ) & 0xFF
+            return
+
+        # PNG_FILTER_PAETH
+        if filter_type == 4:
+            for i in range(0, min(bytes_per_pixel, len(current_row))):
+                current_row[i] = (current_row[i] + prior_row[i]) & 0xFF
+            for i in range(bytes_per_pixel, len(current_row)):
+                a: int = current_row[i - bytes_per_pixel]
+                b: int = prior_row[i]
+                c: int = prior_row[i - bytes_per_pixel]
+                pa: int = abs(b - c)
+                pb: int = abs(a - c)
+                pc: int = abs(a + b - c - c)
+                if pa <= pb and pa <= pc:
+                    current_row[i] = (current_row[i] + a) & 0xFF
+                elif pb <= pc:
+                    current_row[i] = (current_row[i] + b) & 0xFF
+                else:
+                    current_row[i] = (current_row[i] + c) & 0xFF
+            return
+
+    @staticmethod
+    def __undo_png_predictor_using_bytearray(
+        bytes_after_zlib: bytes, bytes_per_row: int, bytes_per_pixel: int
+    ) -> bytes:
+        bytes_after_predictor: bytearray = bytearray()
+        prior_row: bytearray = bytearray(bytes_per_row)
+        pos: int = 0
+        while pos < len(bytes_after_zlib):
+            # Read the filter type byte and a row of data
+            filter_type: int = bytes_after_zlib[pos]
+            current_row: bytearray = bytearray(
+                bytes_after_zlib[pos + 1 : pos + 1 + bytes_per_row]
+            )
+            pos += 1 + bytes_per_row
+
+            # PNG_FILTER_SUB
+            # Predicts the same as the sample to the left
+            if filter_type == 1:
+                for i in range(bytes_per_pixel, len(current_row)):
+                    current_row[i] = (
+                        current_row[i] + current_row[i - bytes_per_pixel]
+                    ) & 0xFF
+
+            # PNG_FILTER_UP
+            # Predicts the same as the sample above
+            elif filter_type == 2:
+                current_row = bytearray(
+                    [(x + y) & 0xFF for x, y in zip(current_row, prior_row)]
+                )
+
+            # PNG_FILTER_AVERAGE, PNG_FILTER_PAETH
+            elif filter_type in [3, 4]:
+                FlateDecode.__undo_png_average_or_paeth_on_row(
+                    filter_type=filter_type,
+                    current_row=current_row,
+                    prior_row=prior_row,
+                    bytes_per_pixel=bytes_per_pixel,
+                )
+
+            # write current row
+            bytes_after_predictor += current_row
+
+            # swap current and prior
+            prior_row = current_row + prior_row[len(current_row) :]
+
+        # return
+        return bytes(bytes_after_predictor)
+
+    @staticmethod
+    def __undo_png_predictor_using_numpy(
+        bytes_after_zlib: bytes, bytes_per_row: int, bytes_per_pixel: int
+    ) -> bytes:
+        import numpy  # type: ignore[import-not-found]
+
+        # IF the last row is incomplete
+        # THEN pad it (it will be trimmed again at the end)
+        number_of_rows: int = -(-len(bytes_after_zlib) // (bytes_per_row + 1))
+        number_of_padding_bytes: int = number_of_rows * (bytes_per_row + 1) - len(
+            bytes_after_zlib
+        )
+        rows = numpy.frombuffer(
+            bytes_after_zlib + bytes(number_of_padding_bytes), dtype=numpy.uint8
+        ).reshape(number_of_rows, bytes_per_row + 1)
+        filter_types = rows[:, 0]
+        bytes_after_predictor = rows[:, 1:].copy()
+
+        # PNG_FILTER_SUB
+        # does not depend on the prior row, so all rows are processed at once
+        # (as a running sum, per component, along the row)
+        is_sub = filter_types == 1
+        if is_sub.any():
+            if bytes_per_row % bytes_per_pixel == 0:
+                bytes_after_predictor[is_sub] = numpy.cumsum(
+                    bytes_after_predictor[is_sub].reshape(
+                        -1, bytes_per_row // bytes_per_pixel, bytes_per_pixel
+                    ),
+                    axis=1,
+                    dtype=numpy.uint8,
+                ).reshape(-1, bytes_per_row)
+            else:
+                for row_index in numpy.flatnonzero(is_sub):
+                    sub_row: bytearray = bytearray(
+                        bytes_after_predictor[row_index].tobytes()
+                    )
+                    for i in range(bytes_per_pixel, bytes_per_row):
+                        sub_row[i] = (sub_row[i] + sub_row[i - bytes_per_pixel]) & 0xFF
+                    bytes_after_predictor[row_index] = numpy.frombuffer(
+                        sub_row, dtype=numpy.uint8
+                    )
+
+        # PNG_FILTER_UP, PNG_FILTER_AVERAGE, PNG_FILTER_PAETH
+        # depend on the prior row, so the rows are processed in runs of the same filter type
+        # a run of PNG_FILTER_UP rows is a running sum (along the columns) on top of the row before the run
+        run_starts = numpy.flatnonzero(
+            numpy.concatenate(([True], filter_types[1:] != filter_types[:-1]))
+        ).tolist() + [number_of_rows]
+        for run_start, run_end in zip(run_starts[:-1], run_starts[1:]):
+            filter_type: int = int(filter_types[run_start])
+            if filter_type == 2:
+                bytes_after_predictor[run_start:run_end] = numpy.cumsum(
+                    bytes_after_predictor[run_start:run_end], axis=0, dtype=numpy.uint8
+                )
+                if run_start > 0:
+                    bytes_after_predictor[run_start:run_end] += bytes_after_predictor[
+                        run_start - 1
+                    ]
+                continue
+            if filter_type in [3, 4]:
+                prior_row: bytearray = (
+                    bytearray(bytes_after_predictor[run_start - 1].tobytes())
+                    if run_start > 0
+                    else bytearray(bytes_per_row)
+                )
+                for row_index in range(run_start, run_end):
+                    current_row: bytearray = bytearray(
+                        bytes_after_predictor[row_index].tobytes()
+                    )
+                    FlateDecode.__undo_png_average_or_paeth_on_row(
+                        filter_type=filter_type,
+                        current_row=current_row,
+                        prior_row=prior_row,
+                        bytes_per_pixel=bytes_per_pixel,
+                    )
+                    bytes_after_predictor[row_index] = numpy.frombuffer(
+                        current_row, dtype=numpy.uint8
+                    )
+                    prior_row = current_row
+
+        # return
+        return bytes_after_predictor.tobytes()[: len(bytes_after_zlib) - number_of_rows]
+
+    @staticmethod
+    def __undo_predictor(
+        bytes_after_zlib: bytes,
+        bits_per_component: int,
+        columns: int,
+        predictor: int,
+        prior_row: typing.Optional[bytes] = None,
+    ) -> bytes:
+        # set up everything to do PNG prediction
+        bytes_per_row: int = int((columns * bits_per_component + 7) / 8)
+        bytes_per_pixel: int = max(1, int(bits_per_component / 8))
+
+        # easy case
+        if predictor == 2 and bits_per_component == 8:
+            return FlateDecode.__undo_tiff_predictor(
+                bytes_after_zlib=bytes_after_zlib, bytes_per_row=bytes_per_row
+            )
+
+        # harder cases
+        # IF numpy is installed
+        # THEN use it to undo the predictor (a whole row, or a run of rows at a time)
+        # ELSE undo the predictor one row at a time
+        # IF a prior row is given (e.g. the last row of the previous chunk)
+        # THEN prepend it (as an unfiltered row) and strip it again afterwards
+        if prior_row is not None:
+            bytes_after_zlib = b"\x00" + prior_row + bytes_after_zlib
+        bytes_after_predictor: bytes = b""
+        try:
+            import numpy  # type: ignore[import-not-found]  # noqa: F401
+
+            bytes_after_predictor = FlateDecode.__undo_png_predictor_using_numpy(
+                bytes_after_zlib=bytes_after_zlib,
+                bytes_per_row=bytes_per_row,
+                bytes_per_pixel=bytes_per_pixel,
+            )
+        except ImportError:
+            bytes_after_predictor = FlateDecode.__undo_png_predictor_using_bytearray(
+                bytes_after_zlib=bytes_after_zlib,
+                bytes_per_row=bytes_per_row,
+                bytes_per_pixel=bytes_per_pixel,
+            )
+        if prior_row is not None:
+            bytes_after_predictor = bytes_after_predictor[len(prior_row) :]
+        return bytes_after_predictor
+
+    @staticmethod
+    def __undo_tiff_predictor(bytes_after_zlib: bytes, bytes_per_row: int) -> bytes:
+        number_of_rows: int = len(bytes_after_zlib) // bytes_per_row
+        try:
+            import numpy  # type: ignore[import-not-found]
+
+            bytes_after_predictor = numpy.frombuffer(
+                bytes_after_zlib, dtype=numpy.uint8
+            ).copy()
+            bytes_after_predictor[: number_of_rows * bytes_per_row] = numpy.cumsum(
+                bytes_after_predictor[: number_of_rows * bytes_per_row].reshape(
+                    number_of_rows, bytes_per_row
+                ),
+                axis=1,
+                dtype=numpy.uint8,
+            ).reshape(-1)
+            return bytes_after_predictor.tobytes()
+        except ImportError:
+            pass
+        out: bytearray = bytearray(bytes_after_zlib)
+        for row_start_index in range(0, number_of_rows * bytes_per_row, bytes_per_row):
+            for i in range(row_start_index + 1, row_start_index + bytes_per_row):
+                out[i] = (out[i] + out[i - 1]) & 0xFF
+        return bytes(out)
+
     #
     # PUBLIC
     #
@@ -103,103 +368,90 @@ class FlateDecode:
         if predictor == 1:
             return bytes_after_zlib
 
-        # set up everything to do PNG prediction
-        bytes_per_row: int = int((columns * bits_per_component + 7) / 8)
-        bytes_per_pixel = int(bits_per_component / 8)
-
-        current_row: typing.List[int] = [0 for _ in range(0, bytes_per_row)]
-        prior_row: typing.List[int] = [0 for _ in range(0, bytes_per_row)]
-        number_of_rows = int(len(bytes_after_zlib) / bytes_per_row)
-
-        # easy case
-        bytes_after_predictor = [int(x) for x in bytes_after_zlib]
-        if predictor == 2:
-            if bits_per_component == 8:
-                for row in range(0, number_of_rows):
-                    row_start_index = row * bytes_per_row
-                    for col in range(1, bytes_per_row):
-                        bytes_after_predictor[row_start_index + col] = (
-                            bytes_after_predictor[row_start_index + col]
-                            + bytes_after_predictor[row_start_index + col - 1]
-                        ) % 256
-                return bytes([(int(x) % 256) for x in bytes_after_predictor])
-
-        # harder cases
-        bytes_after_predictor = []
-        pos = 0
-        while pos + bytes_per_row <= len(bytes_after_zlib):
-            # Read the filter type byte and a row of data
-            filter_type = bytes_after_zlib[pos]
-            pos += 1
-
-            current_row = [x for x in bytes_after_zlib[pos : pos + bytes_per_row]]
-            pos += bytes_per_row
-
-            # PNG_FILTER_NONE
-            if filter_type == 0:
-                # DO NOTHING
-                pass
-
-            # PNG_FILTER_SUB
-            # Predicts the same as the sample to the left
-            if filter_type == 1:
-                for i in range(bytes_per_pixel, bytes_per_row):
-                    current_row[i] = (
-                        current_row[i] + current_row[i - bytes_per_pixel]
-                    ) % 256
-
-            # PNG_FILTER_UP
-            # Predicts the same as the sample above
-            if filter_type == 2:
-                for i in range(0, bytes_per_row):
-                    current_row[i] = (current_row[i] + prior_row[i]) % 256
-
-            # PNG_FILTER_AVERAGE
-            # Predicts the average of the sample to the left and the
-            # sample above
-            if filter_type == 3:
-                for i in range(0, bytes_per_pixel):
-                    current_row[i] += int(prior_row[i] / 2)
-
-                for i in range(bytes_per_pixel, bytes_per_row):
-                    current_row[i] += (int)(
-                        (current_row[i - bytes_per_pixel] + prior_row[i]) / 2
-                    )
-                    current_row[i] %= 256
-
-            # PNG_FILTER_PAETH
-            if filter_type == 4:
-                for i in range(0, bytes_per_pixel):
-                    current_row[i] += prior_row[i]
+        # undo predictor
+        return FlateDecode.__undo_predictor(
+            bytes_after_zlib=bytes_after_zlib,
+            bits_per_component=bits_per_component,
+            columns=columns,
+            predictor=predictor,
+        )
 
-                for i in range(bytes_per_pixel, bytes_per_row):
-                    a = current_row[i - bytes_per_pixel]
-                    b = prior_row[i]
-                    c = prior_row[i - bytes_per_pixel]
-
-                    p = a + b - c
-                    pa = abs(p - a)
-                    pb = abs(p - b)
-                    pc = abs(p - c)
-
-                    ret = 0
-                    if pa <= pb and pa <= pc:
-                        ret = a
-                    elif pb <= pc:
-                        ret = b
-                    else:
-                        ret = c
-
-                    current_row[i] = (current_row[i] + ret) % 256
-
-            # write current row
-            for i in range(0, len(current_row)):
-                bytes_after_predictor.append(current_row[i])
+    @staticmethod
+    def decode_in_chunks(
+        chunks: typing.Iterable[bytes],
+        bits_per_component: int = 8,
+        chunk_size: int = 65536,
+        columns: int = 1,
+        predictor: int = 1,
+    ) -> typing.Iterator[bytes]:
+        """
+        Decode data compressed using the Flate algorithm, one chunk at a time.
+
+        This method behaves like `decode`, but rather than decompressing (and un-predicting) all data at once,
+        it feeds the compressed chunks to a `zlib.decompressobj` and yields the decompressed bytes as soon as
+        they become available. Each call to the decompressor produces at most `chunk_size` bytes. When a predictor
+        is used, only complete rows are un-predicted (and yielded), the last row of each batch is kept as the
+        prior row of the next batch.
+
+        :param chunks:                The compressed input, as an iterable of byte sequences.
+        :param bits_per_component:    The number of bits per sample/component of the data (default is 8).
+        :param chunk_size:            The maximum number of bytes produced by a single call to the decompressor.
+        :param columns:               The number of columns in the data (default is 1).
+        :param predictor:             The type of predictor function applied to the data before compression. Default is 1 (no prediction).
+        :return:                      An iterator over the decompressed byte sequence.
+        """
+        # check /Predictor
+        # fmt: off
+        assert predictor in [1, 2, 10, 11, 12, 13, 14, 15,], "Illegal argument exception. predictor must be in [1, 2, 10, 11, 12, 13, 14, 15]."
+        # fmt: on
 
-            # Swap curr and prior
-            import copy
+        # check /BitsPerComponent
+        # fmt: off
+        assert bits_per_component in [1, 2, 4, 8], "Illegal argument exception. bits_per_component must be in [1, 2, 4, 8]."
+        # fmt: on
 
-            prior_row = copy.deepcopy(current_row)
+        # check predictor
+        if predictor == 1:
+            yield from FlateDecode.__decompress_in_chunks(
+                chunks=chunks, chunk_size=chunk_size
+            )
+            return
 
-        # return
-        return bytes([(int(x) % 256) for x in bytes_after_predictor])
+        # IF a predictor is used
+        # THEN only process complete rows (and keep the last one around)
+        bytes_per_row: int = int((columns * bits_per_component + 7) / 8)
+        bytes_per_row_after_zlib: int = bytes_per_row
+        if predictor != 2 or bits_per_component != 8:
+            bytes_per_row_after_zlib += 1
+        pending_bytes: bytearray = bytearray()
+        prior_row: typing.Optional[bytes] = None
+        for chunk in FlateDecode.__decompress_in_chunks(
+            chunks=chunks, chunk_size=chunk_size
+        ):
+            pending_bytes += chunk
+            n: int = (
+                len(pending_bytes) // bytes_per_row_after_zlib
+            ) * bytes_per_row_after_zlib
+            if n == 0:
+                continue
+            bytes_after_predictor: bytes = FlateDecode.__undo_predictor(
+                bytes_after_zlib=bytes(pending_bytes[:n]),
+                bits_per_component=bits_per_component,
+                columns=columns,
+                predictor=predictor,
+                prior_row=prior_row,
+            )
+            del pending_bytes[:n]
+            prior_row = bytes_after_predictor[-bytes_per_row:]
+            yield bytes_after_predictor
+
+        # IF there is an incomplete row left
+        # THEN process it
+        if len(pending_bytes) > 0:
+            yield FlateDecode.__undo_predictor(
+                bytes_after_zlib=bytes(pending_bytes),
+                bits_per_component=bits_per_component,
+                columns=columns,
+                predictor=predictor,
+                prior_row=prior_row,
+            )
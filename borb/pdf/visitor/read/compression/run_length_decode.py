@@ -15,6 +15,7 @@ The algorithm identifies runs of the same byte value and decompresses them by re
 the byte for the specified number of times, thus reproducing the original data.
 """
 import logging
+import typing
 
 logger = logging.getLogger(__name__)
 
@@ -104,3 +105,46 @@ class RunLengthDecode:
 
         # return
         return bytes(bytes_out)
+
+    @staticmethod
+    def decode_in_chunks(chunks: typing.Iterable[bytes]) -> typing.Iterator[bytes]:
+        """
+        Decompress data encoded using a byte-oriented run-length encoding (RLE) algorithm, one chunk at a time.
+
+        This method behaves like `decode`, but rather than decompressing all data at once,
+        it decompresses every complete run as soon as it becomes available. A run that is
+        split across two chunks is kept until the next chunk arrives.
+
+        :param chunks:      The input bytes compressed using run-length encoding, as an iterable of byte sequences.
+        :return:            An iterator over the decompressed output bytes.
+        """
+        pending_bytes: bytes = b""
+        for chunk in chunks:
+            pending_bytes += bytes(chunk)
+            bytes_out = bytearray()
+            i: int = 0
+            while i < len(pending_bytes):
+                b = pending_bytes[i]
+
+                # end-of-data
+                if b == 128:
+                    yield bytes(bytes_out)
+                    return
+
+                # literal run
+                if 0 <= b <= 127:
+                    if i + b + 2 > len(pending_bytes):
+                        break
+                    bytes_out += pending_bytes[i + 1 : i + b + 2]
+                    i += b + 2
+                    continue
+
+                # repeated run
+                if i + 2 > len(pending_bytes):
+                    break
+                bytes_out += pending_bytes[i + 1 : i + 2] * (257 - b)
+                i += 2
+
+            pending_bytes = pending_bytes[i:]
+            if len(bytes_out) > 0:
+                yield bytes(bytes_out)
@@ -40,6 +40,11 @@ class DateStrVisitor(ReadVisitor):
     #
     # PUBLIC
     #
+
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a date string may start with."""
+        return b"("
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -19,6 +19,8 @@ and other dictionary-based elements in the PDF.
 import typing
 
 from borb.pdf.primitives import PDFType, name
+from borb.pdf.visitor.read.lazy_dict import LazyDict
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -42,7 +44,6 @@ class DictVisitor(ReadVisitor):
 
     __DICT_CLOSE_BRACKETS = b">>"
     __DICT_OPEN_BRACKETS = b"<<"
-    __SPACE = b" "
 
     #
     # CONSTRUCTOR
@@ -407,6 +408,10 @@ class DictVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a dictionary may start with."""
+        return b"<"
+
     def visit(
         self, node: typing.Union[int, bytes]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -427,7 +432,11 @@ class DictVisitor(ReadVisitor):
         if self.get_bytes()[node : node + 2] != DictVisitor.__DICT_OPEN_BRACKETS:
             return None
 
+        # IF we are reading lazily
+        # THEN the dictionary resolves its references (later) on access
         retval: typing.Dict[typing.Union[name, str], "PDFType"] = {}
+        if self._ReadVisitor__root._RootVisitor__lazy:  # type: ignore[attr-defined]
+            retval = LazyDict()
         i: int = node + 2
         expect_key: bool = True
         previous_key: typing.Optional[name] = None
@@ -439,25 +448,11 @@ class DictVisitor(ReadVisitor):
                 i += 2
                 break
 
-            # IF we see a space
+            # IF we see whitespace (SPACE, \n, \r)
             # THEN skip
-            if self.get_bytes()[i : i + 1] == DictVisitor.__SPACE:
-                i += 1
-                continue
-
-            # IF we see a newline (\n\r)
-            # THEN skip
-            if self.get_bytes()[i : i + 2] == b"\n\r":
-                i += 2
-                continue
-            if self.get_bytes()[i : i + 2] == b"\r\n":
-                i += 2
-                continue
-            if self.get_bytes()[i : i + 1] == b"\n":
-                i += 1
-                continue
-            if self.get_bytes()[i : i + 1] == b"\r":
-                i += 1
+            j: int = PDFLexer.skip_whitespace(pdf_bytes=self.get_bytes(), start=i)
+            if j != i:
+                i = j
                 continue
 
             # read a key
@@ -17,8 +17,12 @@ information and assembling it into the `Document` object.
 import typing
 
 from borb.pdf.primitives import PDFType
+from borb.pdf.visitor.read.lazy_dict import LazyDict
 from borb.pdf.visitor.read.pdf_bytes import PDFBytes
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
+from borb.pdf.visitor.write_existing.incremental_update_snapshot import (
+    IncrementalUpdateSnapshot,
+)
 
 
 class DocumentVisitor(ReadVisitor):
@@ -49,6 +53,10 @@ class DocumentVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a PDF document (i.e. `%PDF-`) may start with."""
+        return b"%"
+
     def visit(
         self, node: typing.Union[int, bytes]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -158,6 +166,41 @@ class DocumentVisitor(ReadVisitor):
         retval["XRef"] = self._ReadVisitor__root._RootVisitor__xref  # type: ignore[attr-defined]
         retval["Trailer"] = trailer_dictionary
 
+        # IF we are asked to keep the state of every object (as it is read)
+        # AND the PDF starts at the first byte of the file
+        # THEN an incremental update can (later) be appended to it
+        snapshot: typing.Optional[IncrementalUpdateSnapshot] = None
+        if self._ReadVisitor__root._RootVisitor__incremental_update and pdf_start_byte_pos == 0:  # type: ignore[attr-defined]
+            snapshot = IncrementalUpdateSnapshot(start_of_xref=start_of_xref)
+            retval._Document__incremental_update_snapshot = snapshot  # type: ignore[attr-defined]
+
+        # IF we are reading lazily
+        # THEN resolve nothing (yet)
+        # every (resolved) object resolves its references on access, starting at the trailer
+        if self._ReadVisitor__root._RootVisitor__lazy:  # type: ignore[attr-defined]
+            from borb.pdf.visitor.read.reference_visitor import ReferenceVisitor
+
+            reference_visitor: ReferenceVisitor = next(
+                iter(
+                    [
+                        x
+                        for x in self._ReadVisitor__root._RootVisitor__visitors  # type: ignore[attr-defined]
+                        if isinstance(x, ReferenceVisitor)
+                    ]
+                )
+            )
+            retval._Document__lazy_reference_resolver = reference_visitor.resolve  # type: ignore[attr-defined]
+            LazyDict.make_lazy(
+                reference_resolver=retval._Document__resolve_lazily,  # type: ignore[attr-defined]
+                referenced_object=trailer_dictionary,
+            )
+
+            # keep track of the state of every (resolved) object
+            # (other objects are tracked as they are resolved)
+            if snapshot is not None:
+                snapshot.take_snapshot_of_all_references(retval["XRef"])
+            return retval, len(self.get_bytes())
+
         # handle recursive references
         from borb.pdf.visitor.read.recursive_reference_visitor import (
             RecursiveReferenceVisitor,
@@ -166,6 +209,10 @@ class DocumentVisitor(ReadVisitor):
         retval = RecursiveReferenceVisitor().visit(retval)  # type: ignore[assignment]
         assert isinstance(retval, Document)
 
+        # keep track of the state of every object
+        if snapshot is not None:
+            snapshot.take_snapshot_of_all_references(retval["XRef"])
+
         # (back)link Page(s) to Document
         for i in range(0, retval.get_number_of_pages()):
             try:
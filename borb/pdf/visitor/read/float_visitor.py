@@ -17,6 +17,7 @@ measurements and other numerical data in a PDF document.
 import typing
 
 from borb.pdf.primitives import PDFType
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -47,6 +48,10 @@ class FloatVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a float may start with."""
+        return b"-.0123456789"
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -64,35 +69,5 @@ class FloatVisitor(ReadVisitor):
         """
         if not isinstance(node, int):
             return None
-        if self.get_bytes()[node] not in b"-.0123456789":
-            return None
-
-        i: int = node
-        j: int = node
-        if self.get_bytes()[j : j + 1] == b"-":
-            j += 1
-
-        # process any number of leading digits
-        has_seen_leading_digits: bool = False
-        while self.get_bytes()[j] in b"0123456789":
-            has_seen_leading_digits = True
-            j += 1
-
-        # process period
-        has_seen_period: bool = False
-        if self.get_bytes()[j : j + 1] == b".":
-            has_seen_period = True
-            j += 1
-
-        # process any number of trailing digits
-        has_seen_trailing_digits: bool = False
-        while self.get_bytes()[j] in b"0123456789":
-            has_seen_trailing_digits = True
-            j += 1
-
-        if not has_seen_period:
-            return None
-        if not (has_seen_leading_digits or has_seen_trailing_digits):
-            return None
 
-        return float(self.get_bytes()[i:j]), j
+        return PDFLexer.read_float(pdf_bytes=self.get_bytes(), start=node)
@@ -12,6 +12,7 @@ text content in the document.
 import typing
 
 from borb.pdf.primitives import PDFType
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -26,7 +27,6 @@ class HexStrVisitor(ReadVisitor):
     text content in the document.
     """
 
-    __STR_CLOSE_BRACKET = b">"
     __STR_OPEN_BRACKET = b"<"
 
     #
@@ -40,6 +40,11 @@ class HexStrVisitor(ReadVisitor):
     #
     # PUBLIC
     #
+
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a hexadecimal string may start with."""
+        return b"<"
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -60,12 +65,5 @@ class HexStrVisitor(ReadVisitor):
         if self.get_bytes()[node : node + 1] != HexStrVisitor.__STR_OPEN_BRACKET:
             return None
 
-        i: int = node
-        j: int = self.get_bytes().find(HexStrVisitor.__STR_CLOSE_BRACKET, node)
-        if any(
-            [x not in b"0123456789abcdefABCDEF" for x in self.get_bytes()[i + 1 : j]]
-        ):
-            return None
-
         # return
-        return self.get_bytes()[i + 1 : j].decode(), j + 1
+        return PDFLexer.read_hex_str(pdf_bytes=self.get_bytes(), start=node)
@@ -12,6 +12,7 @@ handling logic.
 import typing
 
 from borb.pdf.primitives import PDFType
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -38,6 +39,10 @@ class IntVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that an integer may start with."""
+        return b"-0123456789"
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -55,14 +60,5 @@ class IntVisitor(ReadVisitor):
         """
         if not isinstance(node, int):
             return None
-        if self.get_bytes()[node] not in b"-0123456789":
-            return None
-
-        i: int = node
-        j: int = node
-        if self.get_bytes()[j : j + 1] == b"-":
-            j += 1
-        while self.get_bytes()[j] in b"0123456789":
-            j += 1
 
-        return int(self.get_bytes()[i:j]), j
+        return PDFLexer.read_int(pdf_bytes=self.get_bytes(), start=node)
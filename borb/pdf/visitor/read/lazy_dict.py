@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A dictionary that resolves the indirect references it holds, as they are accessed.
+
+When a PDF is read lazily, the dictionaries in the document are instances of `LazyDict`.
+Indirect references inside such a dictionary are left unresolved while parsing. Once the
+dictionary is given a reference resolver, every access (`[]`, `get`, `items`, `values`, ..)
+resolves the references it touches, and replaces them (in place) by the objects they point to.
+Anything that is never accessed is never read.
+
+Dictionaries that have a more specific type (such as `Page`, `stream` or a `Font`) keep that
+type. They are given a (cached) subclass of both `LazyDict` and their own type.
+"""
+import typing
+
+from borb.pdf.primitives import PDFType, reference
+from borb.pdf.visitor.read.lazy_list import LazyList
+
+
+class LazyDict(dict):
+    """
+    A dictionary that resolves the indirect references it holds, as they are accessed.
+
+    When a PDF is read lazily, the dictionaries in the document are instances of `LazyDict`.
+    Indirect references inside such a dictionary are left unresolved while parsing. Once the
+    dictionary is given a reference resolver, every access (`[]`, `get`, `items`, `values`, ..)
+    resolves the references it touches, and replaces them (in place) by the objects they point to.
+    Anything that is never accessed is never read.
+
+    Dictionaries that have a more specific type (such as `Page`, `stream` or a `Font`) keep that
+    type. They are given a (cached) subclass of both `LazyDict` and their own type.
+    """
+
+    __LAZY_CLASS_PER_CLASS: typing.Dict[type, type] = {}
+    __reference_resolver: typing.Optional[typing.Callable[[reference], PDFType]] = None
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    @staticmethod
+    def __get_lazy_class(cls: type) -> type:
+        if cls not in LazyDict.__LAZY_CLASS_PER_CLASS:
+            LazyDict.__LAZY_CLASS_PER_CLASS[cls] = type(
+                f"Lazy{cls.__name__}", (LazyDict, cls), {}
+            )
+        return LazyDict.__LAZY_CLASS_PER_CLASS[cls]
+
+    def __getitem__(self, key):
+        """Return self[key]."""
+        return self.__resolve(key, super().__getitem__(key))
+
+    def __reduce_ex__(self, protocol):
+        """Return the state of this LazyDict (as its non-lazy type) for copy and pickle."""
+        # the reference resolver is not copied (or pickled)
+        # every object that is copied (or pickled) is resolved first
+        # (pickle refuses copyreg.__newobj__ for an instance of another class, hence cls.__new__)
+        cls: type = next(
+            iter([x for x in type(self).__mro__ if not issubclass(x, LazyDict)])
+        )
+        state: typing.Dict[str, typing.Any] = {
+            k: v for k, v in vars(self).items() if k != "_LazyDict__reference_resolver"
+        }
+        return cls.__new__, (cls,), state or None, None, iter(self.items())
+
+    def __resolve(self, key: typing.Any, value: PDFType) -> PDFType:
+        if self.__reference_resolver is None or not isinstance(value, reference):
+            return value
+        resolved_value: PDFType = self.__reference_resolver(value)
+        dict.__setitem__(self, key, resolved_value)
+        return resolved_value
+
+    #
+    # PUBLIC
+    #
+
+    def get(self, key: typing.Any, default: typing.Any = None) -> typing.Any:
+        """
+        Return the value for key if key is in the dictionary, else default.
+
+        :param key:     the key
+        :param default: the value to return if the key is not in the dictionary
+        :return:        the (resolved) value, or the default
+        """
+        if key not in self:
+            return default
+        return self.__resolve(key, dict.__getitem__(self, key))
+
+    def get_reference_resolver(
+        self,
+    ) -> typing.Optional[typing.Callable[[reference], PDFType]]:
+        """
+        Return the function this LazyDict uses to resolve the indirect references it holds.
+
+        :return:    the reference resolver, or None if references are not (yet) resolved on access
+        """
+        return self.__reference_resolver
+
+    def items(self):  # type: ignore[override]
+        """
+        Return a view of the (key, value) pairs of the dictionary, resolving every value.
+
+        :return:    the (key, value) pairs of the dictionary
+        """
+        for k in [x for x in self.keys()]:
+            self.__resolve(k, dict.get(self, k))
+        return super().items()
+
+    @staticmethod
+    def make_lazy(
+        reference_resolver: typing.Callable[[reference], PDFType],
+        referenced_object: PDFType,
+    ) -> None:
+        """
+        Make an object (and every container it holds directly) resolve its references on access.
+
+        This method is called on every object that is resolved while reading lazily.
+        Every (direct) dictionary and list inside the object is given the reference resolver.
+        Dictionaries of a more specific type (such as `Page`, `stream` or a `Font`) are given
+        a lazy subclass of their own type. Objects behind (unresolved) references are left
+        untouched, they are made lazy when they are resolved.
+
+        :param reference_resolver:  the function that maps a reference onto the object it points to
+        :param referenced_object:   the (resolved) object
+        :return:                    None
+        """
+        stk: typing.List[PDFType] = [referenced_object]
+        while len(stk) > 0:
+            m: PDFType = stk.pop()
+
+            # IF the object is already lazy (e.g. an object resolved earlier)
+            # THEN its content is lazy as well
+            if isinstance(m, (LazyDict, LazyList)):
+                if m.get_reference_resolver() is not None:
+                    continue
+                m.set_reference_resolver(reference_resolver)
+
+            # IF the object is a dictionary of a specific type (e.g. Page, stream, Font)
+            # THEN give it the lazy subclass of its type
+            elif isinstance(m, dict) and type(m) is not dict:
+                try:
+                    m.__class__ = LazyDict.__get_lazy_class(type(m))
+                    m.set_reference_resolver(reference_resolver)  # type: ignore[union-attr]
+                except TypeError:
+                    # the type does not allow its instances to change type (e.g. __slots__)
+                    pass
+
+            # handle dictionaries
+            if isinstance(m, dict):
+                stk += [v for v in dict.values(m) if isinstance(v, (dict, list))]
+
+            # handle lists
+            if isinstance(m, list):
+                stk += [v for v in list.__iter__(m) if isinstance(v, (dict, list))]
+
+    def pop(self, key: typing.Any, *args) -> typing.Any:
+        """
+        Remove the specified key and return the corresponding value.
+
+        :param key:     the key
+        :param args:    the value to return if the key is not in the dictionary
+        :return:        the (resolved) value
+        """
+        if key in self:
+            self.__resolve(key, dict.__getitem__(self, key))
+        return super().pop(key, *args)
+
+    @staticmethod
+    def resolve_all_references(referenced_object: PDFType) -> None:
+        """
+        Resolve every reference that can be reached from an object.
+
+        Every (lazy) dictionary and list that is reached resolves the references it holds,
+        so that afterwards the object (and everything it refers to) is fully resolved.
+
+        :param referenced_object:   the object to start from (e.g. the trailer)
+        :return:                    None
+        """
+        stk: typing.List[PDFType] = [referenced_object]
+        done_ids: typing.Set[int] = set()
+        while len(stk) > 0:
+            m: PDFType = stk.pop()
+
+            # avoid circles
+            if id(m) in done_ids:
+                continue
+            done_ids.add(id(m))
+
+            # handle dictionaries
+            if isinstance(m, dict):
+                stk += [v for v in m.values() if isinstance(v, (dict, list))]
+
+            # handle lists
+            if isinstance(m, list):
+                stk += [v for v in m if isinstance(v, (dict, list))]
+
+    def set_reference_resolver(
+        self, reference_resolver: typing.Callable[[reference], PDFType]
+    ) -> "LazyDict":
+        """
+        Set the function this LazyDict uses to resolve the indirect references it holds.
+
+        :param reference_resolver:  the function that maps a reference onto the object it points to
+        :return:                    self
+        """
+        self.__reference_resolver = reference_resolver
+        return self
+
+    def values(self):  # type: ignore[override]
+        """
+        Return a view of the values of the dictionary, resolving every value.
+
+        :return:    the values of the dictionary
+        """
+        self.items()
+        return super().values()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A list that resolves the indirect references it holds, as they are accessed.
+
+When a PDF is read lazily, the lists in the document are instances of `LazyList`.
+Indirect references inside such a list are left unresolved while parsing. Once the
+list is given a reference resolver, every access (by index, slice or iteration)
+resolves the references it touches, and replaces them (in place) by the objects
+they point to. Anything that is never accessed is never read.
+"""
+import typing
+
+from borb.pdf.primitives import PDFType, reference
+
+
+class LazyList(list):
+    """
+    A list that resolves the indirect references it holds, as they are accessed.
+
+    When a PDF is read lazily, the lists in the document are instances of `LazyList`.
+    Indirect references inside such a list are left unresolved while parsing. Once the
+    list is given a reference resolver, every access (by index, slice or iteration)
+    resolves the references it touches, and replaces them (in place) by the objects
+    they point to. Anything that is never accessed is never read.
+    """
+
+    __reference_resolver: typing.Optional[typing.Callable[[reference], PDFType]] = None
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    def __getitem__(self, index):
+        """Return self[index]."""
+        if isinstance(index, slice):
+            for i in range(*index.indices(len(self))):
+                self.__resolve(i)
+            return super().__getitem__(index)
+        return self.__resolve(index)
+
+    def __iter__(self):
+        """Implement iter(self)."""
+        for i in range(0, len(self)):
+            yield self.__resolve(i)
+
+    def __reduce_ex__(self, protocol):
+        """Return the state of this LazyList (as a list) for copy and pickle."""
+        # the reference resolver is not copied (or pickled)
+        # every object that is copied (or pickled) is resolved first
+        return list.__new__, (list,), None, iter(self), None
+
+    def __resolve(self, index: int) -> PDFType:
+        value: PDFType = super().__getitem__(index)
+        if self.__reference_resolver is None or not isinstance(value, reference):
+            return value
+        resolved_value: PDFType = self.__reference_resolver(value)
+        super().__setitem__(index, resolved_value)
+        return resolved_value
+
+    def __reversed__(self):
+        """Implement reversed(self)."""
+        for i in range(len(self) - 1, -1, -1):
+            yield self.__resolve(i)
+
+    #
+    # PUBLIC
+    #
+
+    def get_reference_resolver(
+        self,
+    ) -> typing.Optional[typing.Callable[[reference], PDFType]]:
+        """
+        Return the function this LazyList uses to resolve the indirect references it holds.
+
+        :return:    the reference resolver, or None if references are not (yet) resolved on access
+        """
+        return self.__reference_resolver
+
+    def pop(self, index: typing.SupportsIndex = -1) -> PDFType:
+        """
+        Remove and return the item at the given index (default last).
+
+        :param index:   the index of the item to remove
+        :return:        the (resolved) item
+        """
+        self.__resolve(int(index))
+        return super().pop(index)
+
+    def set_reference_resolver(
+        self, reference_resolver: typing.Callable[[reference], PDFType]
+    ) -> "LazyList":
+        """
+        Set the function this LazyList uses to resolve the indirect references it holds.
+
+        :param reference_resolver:  the function that maps a reference onto the object it points to
+        :return:                    self
+        """
+        self.__reference_resolver = reference_resolver
+        return self
@@ -12,6 +12,8 @@ Python lists, with each element processed and converted based on its type.
 import typing
 
 from borb.pdf.primitives import PDFType
+from borb.pdf.visitor.read.lazy_list import LazyList
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -28,7 +30,6 @@ class ListVisitor(ReadVisitor):
 
     __LIST_CLOSE_BRACKETS = b"]"
     __LIST_OPEN_BRACKETS = b"["
-    __SPACE = b" "
 
     #
     # CONSTRUCTOR
@@ -41,6 +42,11 @@ class ListVisitor(ReadVisitor):
     #
     # PUBLIC
     #
+
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a list may start with."""
+        return b"["
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -61,7 +67,11 @@ class ListVisitor(ReadVisitor):
         if self.get_bytes()[node : node + 1] != ListVisitor.__LIST_OPEN_BRACKETS:
             return None
 
+        # IF we are reading lazily
+        # THEN the list resolves its references (later) on access
         retval: typing.List[PDFType] = []
+        if self._ReadVisitor__root._RootVisitor__lazy:  # type: ignore[attr-defined]
+            retval = LazyList()
         i: int = node + 1
         while i < len(self.get_bytes()):
 
@@ -70,24 +80,11 @@ class ListVisitor(ReadVisitor):
                 i += 1
                 break
 
-            # read a space
-            if self.get_bytes()[i : i + 1] == ListVisitor.__SPACE:
-                i += 1
-                continue
-
-            # IF we see a newline (\n\r)
+            # IF we see whitespace (SPACE, \n, \r)
             # THEN skip
-            if self.get_bytes()[i : i + 2] == b"\n\r":
-                i += 2
-                continue
-            if self.get_bytes()[i : i + 2] == b"\r\n":
-                i += 2
-                continue
-            if self.get_bytes()[i : i + 1] == b"\n":
-                i += 1
-                continue
-            if self.get_bytes()[i : i + 1] == b"\r":
-                i += 1
+            j: int = PDFLexer.skip_whitespace(pdf_bytes=self.get_bytes(), start=i)
+            if j != i:
+                i = j
                 continue
 
             val_and_i = self.root_generic_visit(i)
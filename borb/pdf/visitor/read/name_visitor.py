@@ -11,6 +11,7 @@ specification, facilitating structured parsing of named resources and keys.
 import typing
 
 from borb.pdf.primitives import PDFType, name
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -36,6 +37,10 @@ class NameVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a name may start with."""
+        return b"/"
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -53,14 +58,11 @@ class NameVisitor(ReadVisitor):
         """
         if not isinstance(node, int):
             return None
-        if self.get_bytes()[node : node + 1] != b"/":
-            return None
 
-        # find
-        i: int = node
-        j: int = node + 1
-        while self.get_bytes()[j] not in b"()<>[]{}/%\x00\x09\x0a\x0c\x0d\x20":
-            j += 1
+        # read
+        name_and_j = PDFLexer.read_name(pdf_bytes=self.get_bytes(), start=node)
+        if name_and_j is None:
+            return None
 
         # return
-        return name(self.get_bytes()[i + 1 : j].decode()), j
+        return name(name_and_j[0]), name_and_j[1]
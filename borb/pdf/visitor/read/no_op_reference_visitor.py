@@ -16,6 +16,7 @@ content in PDFs.
 import typing
 
 from borb.pdf.primitives import PDFType, reference
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -46,6 +47,10 @@ class NoOpReferenceVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a reference may start with."""
+        return b"0123456789"
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -66,39 +71,12 @@ class NoOpReferenceVisitor(ReadVisitor):
         if self.get_bytes()[node] not in b"0123456789":
             return None
 
-        # read object nr
-        i: int = node
-        j: int = node
-        while self.get_bytes()[j] in b"0123456789":
-            j += 1
-        object_nr: int = int(self.get_bytes()[i:j].decode())
-
-        # read space
-        i = j
-        if self.get_bytes()[i : i + 1] != b" ":
-            return None
-        while self.get_bytes()[j : j + 1] == b" ":
-            j += 1
-
-        # read generation number
-        i = j
-        if self.get_bytes()[i] not in b"0123456789":
-            return None
-        while self.get_bytes()[j] in b"0123456789":
-            j += 1
-        generation_nr: int = int(self.get_bytes()[i:j].decode())
-
-        # read space
-        i = j
-        if self.get_bytes()[i : i + 1] != b" ":
-            return None
-        while self.get_bytes()[j : j + 1] == b" ":
-            j += 1
-
-        # read 'R'
-        i = j
-        if self.get_bytes()[i : i + 1] != b"R":
+        # read object nr, generation nr and 'R'
+        reference_and_i = PDFLexer.read_reference(
+            pdf_bytes=self.get_bytes(), start=node
+        )
+        if reference_and_i is None:
             return None
-        i += 1
+        object_nr, generation_nr, i = reference_and_i
 
         return reference(object_nr=object_nr, generation_nr=generation_nr), i
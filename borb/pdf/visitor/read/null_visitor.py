@@ -42,6 +42,11 @@ class NullVisitor(ReadVisitor):
     #
     # PUBLIC
     #
+
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that the null object may start with."""
+        return b"n"
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -19,6 +19,7 @@ supporting detailed and low-level PDF content processing.
 import typing
 
 from borb.pdf.primitives import PDFType, stream
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -51,6 +52,10 @@ class ObjVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that an indirect object may start with."""
+        return b"0123456789"
+
     def visit(
         self, node: typing.Union[int, bytes]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -71,40 +76,13 @@ class ObjVisitor(ReadVisitor):
         if self.get_bytes()[node] not in b"0123456789":
             return None
 
-        # read object nr
-        i: int = node
-        j: int = node
-        while self.get_bytes()[j] in b"0123456789":
-            j += 1
-        object_nr: int = int(self.get_bytes()[i:j].decode())
-
-        # read space
-        i = j
-        if self.get_bytes()[i : i + 1] != b" ":
-            return None
-        while self.get_bytes()[j : j + 1] == b" ":
-            j += 1
-
-        # read generation number
-        i = j
-        if self.get_bytes()[i] not in b"0123456789":
-            return None
-        while self.get_bytes()[j] in b"0123456789":
-            j += 1
-        generation_nr: int = int(self.get_bytes()[i:j].decode())
-
-        # read space
-        i = j
-        if self.get_bytes()[i : i + 1] != b" ":
-            return None
-        while self.get_bytes()[j : j + 1] == b" ":
-            j += 1
-
-        # read 'obj'
-        i = j
-        if self.get_bytes()[i : i + 3] != b"obj":
+        # read object nr, generation nr and 'obj'
+        obj_header_and_i = PDFLexer.read_obj_header(
+            pdf_bytes=self.get_bytes(), start=node
+        )
+        if obj_header_and_i is None:
             return None
-        i += 3
+        object_nr, generation_nr, i = obj_header_and_i
 
         # read newline or SPACE (\n\r )
         if self.get_bytes()[i : i + 2] == b"\n\r":
@@ -179,7 +157,9 @@ class ObjVisitor(ReadVisitor):
         assert "Length" in obj_or_dict
         assert isinstance(obj_or_dict["Length"], int)
         length: int = obj_or_dict["Length"]
-        stream_bytes: bytes = self.get_bytes()[i : i + length]
+        stream_bytes: typing.Union[bytes, memoryview] = self.get_stream_bytes(
+            end=i + length, start=i
+        )
         i += length
 
         # read newline (\n\r)
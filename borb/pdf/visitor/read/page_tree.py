@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Utility class for looking up Page objects in the page-tree of a PDF.
+
+The Page objects of a PDF are not stored in a flat list, but in a tree (the page-tree).
+Each intermediate node (/Type /Pages) holds its children in /Kids, and the number of Page
+objects below it in /Count. `PageTree` uses /Count to find a Page without visiting (and
+thus without resolving, when the PDF was read lazily) the subtrees in front of it.
+"""
+import typing
+
+from borb.pdf.page import Page
+from borb.pdf.primitives import PDFType
+
+
+class PageTree:
+    """
+    Utility class for looking up Page objects in the page-tree of a PDF.
+
+    The Page objects of a PDF are not stored in a flat list, but in a tree (the page-tree).
+    Each intermediate node (/Type /Pages) holds its children in /Kids, and the number of Page
+    objects below it in /Count. `PageTree` uses /Count to find a Page without visiting (and
+    thus without resolving, when the PDF was read lazily) the subtrees in front of it.
+    """
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    #
+    # PUBLIC
+    #
+
+    @staticmethod
+    def get_page(index: int, pages: PDFType) -> Page:
+        """
+        Return the Page at the given (zero-based) index, below the given page-tree node.
+
+        The /Count of each kid is used to skip entire subtrees. Only the kids in front of
+        the Page (on each level of the page-tree) are visited, and thus resolved (when the
+        PDF was read lazily). Negative indexes count back from /Count, as they do for a list.
+
+        :param index:   the (zero-based) index of the Page
+        :param pages:   the page-tree node (i.e. /Root /Pages)
+        :return:        the Page
+        """
+        parent, index_in_kids = PageTree.get_path_to_page(index=index, pages=pages)[-1]
+        page: PDFType = parent["Kids"][index_in_kids]  # type: ignore[index]
+        assert isinstance(page, Page)
+        return page
+
+    @staticmethod
+    def get_pages(pages: PDFType) -> typing.List[Page]:
+        """
+        Return every Page below the given page-tree node, in order.
+
+        This walks the entire page-tree (depth-first), resolving the page-tree node(s)
+        and Page(s), but not their content (when the PDF was read lazily).
+
+        :param pages:   the page-tree node (i.e. /Root /Pages)
+        :return:        the Page(s), in order
+        """
+        pages_in_order: typing.List[Page] = []
+        stk: typing.List[PDFType] = [pages]
+        while len(stk) > 0:
+            n: PDFType = stk.pop()
+            if isinstance(n, Page):
+                pages_in_order += [n]
+                continue
+            if isinstance(n, dict) and "Kids" in n:
+                kids: PDFType = n["Kids"]
+                assert isinstance(kids, list)
+                stk += [x for x in reversed(kids)]
+        return pages_in_order
+
+    @staticmethod
+    def get_path_to_page(
+        index: int, pages: PDFType
+    ) -> typing.List[typing.Tuple[typing.Dict, int]]:
+        """
+        Return the path from the given page-tree node to the Page at the given (zero-based) index.
+
+        The path holds a (page-tree node, index in /Kids) pair for every level of the page-tree,
+        starting at the given node. The last pair points to the Page itself. This is the path
+        along which /Count changes when a Page is inserted (or removed).
+
+        :param index:   the (zero-based) index of the Page
+        :param pages:   the page-tree node (i.e. /Root /Pages)
+        :return:        the (page-tree node, index in /Kids) pairs leading to the Page
+        """
+        assert isinstance(pages, dict)
+        n: int = index
+        if n < 0:
+            count: PDFType = pages.get("Count", 0)
+            assert isinstance(count, int)
+            n += count
+        if n < 0:
+            raise IndexError(f"page index {index} out of range")
+
+        path: typing.List[typing.Tuple[typing.Dict, int]] = []
+        parent: PDFType = pages
+        while True:
+            assert isinstance(parent, dict)
+            kids: PDFType = parent.get("Kids", [])
+            assert isinstance(kids, list)
+
+            # walk the kids, using /Count to skip entire subtrees
+            # (kid n is only Page n if every kid in front of it is a Page)
+            next_parent: typing.Optional[PDFType] = None
+            for i, kid in enumerate(kids):
+                # IF we found a Page
+                # THEN either return (the path to) it, or move ahead by 1
+                if isinstance(kid, Page):
+                    if n == 0:
+                        return path + [(parent, i)]
+                    n -= 1
+                    continue
+
+                # IF we found a page-tree node
+                # THEN either descend into it, or skip all of its Page(s)
+                if isinstance(kid, dict) and "Kids" in kid:
+                    kid_count: PDFType = kid.get("Count", 0)
+                    assert isinstance(kid_count, int)
+                    if n < kid_count:
+                        path += [(parent, i)]
+                        next_parent = kid
+                        break
+                    n -= kid_count
+
+            # IF we did not find a subtree containing the Page
+            # THEN the index is out of range
+            if next_parent is None:
+                raise IndexError(f"page index {index} out of range")
+            parent = next_parent
@@ -15,6 +15,7 @@ location of PDF-specific keywords, such as locating the end-of-file marker or
 header indicator, which are important for tasks like validation, content extraction,
 and structural analysis.
 """
+import re
 import typing
 
 
@@ -35,6 +36,8 @@ class PDFBytes:
     and structural analysis.
     """
 
+    __DIGIT = re.compile(rb"[0-9]")
+
     #
     # CONSTRUCTOR
     #
@@ -127,16 +130,12 @@ class PDFBytes:
         """
         start = start or 0
         end = end or (start + 1024)
-        i: int = start
-        while i < min(end, len(pdf_bytes)) and pdf_bytes[i] not in [
-            x[0] for x in [b"0", b"1", b"2", b"3", b"4", b"5", b"6", b"7", b"8", b"9"]
-        ]:
-            i += 1
-        if i < min(end, len(pdf_bytes)) and pdf_bytes[i] in [
-            x[0] for x in [b"0", b"1", b"2", b"3", b"4", b"5", b"6", b"7", b"8", b"9"]
-        ]:
-            return i
-        return -1
+        m: typing.Optional[re.Match] = PDFBytes.__DIGIT.search(
+            pdf_bytes, start, min(end, len(pdf_bytes))
+        )
+        if m is None:
+            return -1
+        return m.start()
 
     @staticmethod
     def next_newline(
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Shared lexer for the tokens of the PDF object syntax.
+
+The `PDFLexer` class provides static methods that recognise a single token (an integer,
+a float, a name, a string, a reference, an object header, a cross-reference entry, ...)
+starting at a given byte offset in a PDF byte stream. Each token type is described by a
+precompiled regular expression, which is matched directly against the (bytes or memory-mapped)
+buffer. This means a token is recognised in a single pass, without slicing the buffer, and
+without looping over its bytes in Python.
+
+Each method returns the value of the token along with the byte offset just past the token,
+or `None` if the bytes at the given offset do not form a token of that type. This mirrors the
+contract of the `ReadVisitor` classes, which use the `PDFLexer` to consume tokens.
+"""
+import re
+import typing
+
+
+class PDFLexer:
+    """
+    Shared lexer for the tokens of the PDF object syntax.
+
+    The `PDFLexer` class provides static methods that recognise a single token (an integer,
+    a float, a name, a string, a reference, an object header, a cross-reference entry, ...)
+    starting at a given byte offset in a PDF byte stream. Each token type is described by a
+    precompiled regular expression, which is matched directly against the (bytes or memory-mapped)
+    buffer. This means a token is recognised in a single pass, without slicing the buffer, and
+    without looping over its bytes in Python.
+
+    Each method returns the value of the token along with the byte offset just past the token,
+    or `None` if the bytes at the given offset do not form a token of that type. This mirrors the
+    contract of the `ReadVisitor` classes, which use the `PDFLexer` to consume tokens.
+    """
+
+    __FLOAT = re.compile(rb"-?(?:[0-9]+\.[0-9]*|\.[0-9]+)")
+    __HEX_STR = re.compile(rb"<([0-9a-fA-F]*)>")
+    __INT = re.compile(rb"-?[0-9]+")
+    __LITERAL_STR_RUN = re.compile(rb"[^\\)]*")
+    __NAME = re.compile(rb"/([^()<>\[\]{}/%\x00\x09\x0a\x0c\x0d\x20]*)")
+    __OBJ_HEADER = re.compile(rb"([0-9]+) +([0-9]+) +obj")
+    __REFERENCE = re.compile(rb"([0-9]+) +([0-9]+) +R")
+    __WHITESPACE = re.compile(rb"[ \r\n]*")
+    __XREF_ENTRY = re.compile(rb"[ \r\n]*([0-9]+) ([0-9]+) ([fn])")
+
+    #
+    # CONSTRUCTOR
+    #
+
+    #
+    # PRIVATE
+    #
+
+    #
+    # PUBLIC
+    #
+
+    @staticmethod
+    def read_float(
+        pdf_bytes: typing.Union[bytes, typing.Any], start: int
+    ) -> typing.Optional[typing.Tuple[float, int]]:
+        """
+        Read a float (a number containing a period, e.g. `-3.14`, `5.` or `.5`) at the given byte offset.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which the token starts
+        :return:            the float and the byte offset just past it, or None
+        """
+        m: typing.Optional[re.Match] = PDFLexer.__FLOAT.match(pdf_bytes, start)
+        if m is None:
+            return None
+        return float(m.group()), m.end()
+
+    @staticmethod
+    def read_hex_str(
+        pdf_bytes: typing.Union[bytes, typing.Any], start: int
+    ) -> typing.Optional[typing.Tuple[str, int]]:
+        """
+        Read a hexadecimal string (e.g. `<48656C6C6F>`) at the given byte offset.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which the token starts
+        :return:            the (hexadecimal) content of the string and the byte offset just past it, or None
+        """
+        m: typing.Optional[re.Match] = PDFLexer.__HEX_STR.match(pdf_bytes, start)
+        if m is None:
+            return None
+        return m.group(1).decode(), m.end()
+
+    @staticmethod
+    def read_int(
+        pdf_bytes: typing.Union[bytes, typing.Any], start: int
+    ) -> typing.Optional[typing.Tuple[int, int]]:
+        """
+        Read an integer (e.g. `42` or `-7`) at the given byte offset.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which the token starts
+        :return:            the integer and the byte offset just past it, or None
+        """
+        m: typing.Optional[re.Match] = PDFLexer.__INT.match(pdf_bytes, start)
+        if m is None:
+            return None
+        return int(m.group()), m.end()
+
+    @staticmethod
+    def read_literal_str(
+        pdf_bytes: typing.Union[bytes, typing.Any], start: int
+    ) -> typing.Optional[typing.Tuple[bytes, int]]:
+        r"""
+        Read a literal string (e.g. `(Hello World)`) at the given byte offset.
+
+        Runs of ordinary bytes are consumed in one match. A REVERSE SOLIDUS followed by
+        one of `nrtbf()` is replaced by the character that follows it, any other REVERSE
+        SOLIDUS is kept as is.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which the token starts (i.e. the opening parenthesis)
+        :return:            the content of the string and the byte offset just past it, or None
+        """
+        if pdf_bytes[start : start + 1] != b"(":
+            return None
+        retval: bytes = b""
+        j: int = start + 1
+        n: int = len(pdf_bytes)
+        while j < n:
+            m: typing.Optional[re.Match] = PDFLexer.__LITERAL_STR_RUN.match(
+                pdf_bytes, j
+            )
+            assert m is not None
+            retval += m.group()
+            j = m.end()
+            if j >= n:
+                break
+
+            # IF we see the closing parenthesis
+            # THEN return
+            if pdf_bytes[j : j + 1] == b")":
+                return retval, j + 1
+
+            # Within a literal string, the REVERSE SOLIDUS is used as an escape character. The character immediately
+            # following the REVERSE SOLIDUS determines its precise interpretation as shown in Table 3.
+            # Sequence              Meaning
+            # \nLINE FEED           (0Ah) (LF)
+            # \rCARRIAGE RETURN     (0Dh) (CR)
+            # \tHORIZONTAL TAB      (09h) (HT)
+            # \bBACKSPACE           (08h) (BS)
+            # \fFORM FEED           (FF)
+            # \(LEFT PARENTHESIS    (28h)
+            # \)RIGHT PARENTHESIS   (29h)
+            escaped_char: bytes = pdf_bytes[j + 1 : j + 2]
+            if escaped_char != b"" and escaped_char in b"nrtbf()":
+                retval += escaped_char
+                j += 2
+                continue
+
+            # default
+            retval += b"\\"
+            j += 1
+
+        # IF the string is never closed
+        # THEN return None
+        return None
+
+    @staticmethod
+    def read_name(
+        pdf_bytes: typing.Union[bytes, typing.Any], start: int
+    ) -> typing.Optional[typing.Tuple[str, int]]:
+        """
+        Read a name (e.g. `/Type`) at the given byte offset.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which the token starts (i.e. the SOLIDUS)
+        :return:            the name (without its leading SOLIDUS) and the byte offset just past it, or None
+        """
+        m: typing.Optional[re.Match] = PDFLexer.__NAME.match(pdf_bytes, start)
+        if m is None:
+            return None
+        return m.group(1).decode(), m.end()
+
+    @staticmethod
+    def read_obj_header(
+        pdf_bytes: typing.Union[bytes, typing.Any], start: int
+    ) -> typing.Optional[typing.Tuple[int, int, int]]:
+        """
+        Read the header of an indirect object (e.g. `12 0 obj`) at the given byte offset.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which the token starts
+        :return:            the object number, generation number and the byte offset just past `obj`, or None
+        """
+        m: typing.Optional[re.Match] = PDFLexer.__OBJ_HEADER.match(pdf_bytes, start)
+        if m is None:
+            return None
+        return int(m.group(1)), int(m.group(2)), m.end()
+
+    @staticmethod
+    def read_reference(
+        pdf_bytes: typing.Union[bytes, typing.Any], start: int
+    ) -> typing.Optional[typing.Tuple[int, int, int]]:
+        """
+        Read an indirect reference (e.g. `12 0 R`) at the given byte offset.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which the token starts
+        :return:            the object number, generation number and the byte offset just past `R`, or None
+        """
+        m: typing.Optional[re.Match] = PDFLexer.__REFERENCE.match(pdf_bytes, start)
+        if m is None:
+            return None
+        return int(m.group(1)), int(m.group(2)), m.end()
+
+    @staticmethod
+    def read_xref_entry(
+        pdf_bytes: typing.Union[bytes, typing.Any], start: int
+    ) -> typing.Optional[typing.Tuple[int, int, bool, int]]:
+        """
+        Read a single (plaintext) cross-reference table entry (e.g. `0000000015 00000 n`) at the given byte offset.
+
+        Any leading whitespace (e.g. the end-of-line of the previous entry) is skipped.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which to start looking for the entry
+        :return:            the byte offset, generation number, whether the entry is in use, and the byte offset just past the entry, or None
+        """
+        m: typing.Optional[re.Match] = PDFLexer.__XREF_ENTRY.match(pdf_bytes, start)
+        if m is None:
+            return None
+        return int(m.group(1)), int(m.group(2)), m.group(3) == b"n", m.end()
+
+    @staticmethod
+    def skip_whitespace(pdf_bytes: typing.Union[bytes, typing.Any], start: int) -> int:
+        r"""
+        Skip any whitespace (SPACE, `\r` and `\n`) starting at the given byte offset.
+
+        :param pdf_bytes:   the byte sequence representing the PDF file
+        :param start:       the byte offset at which to start skipping
+        :return:            the byte offset of the first byte that is not whitespace
+        """
+        m: typing.Optional[re.Match] = PDFLexer.__WHITESPACE.match(pdf_bytes, start)
+        assert m is not None
+        return m.end()
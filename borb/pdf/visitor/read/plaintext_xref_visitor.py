@@ -23,6 +23,7 @@ import typing
 
 from borb.pdf.primitives import PDFType, reference
 from borb.pdf.visitor.read.pdf_bytes import PDFBytes
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.xref_visitor import XRefVisitor
 
 
@@ -58,6 +59,11 @@ class PlaintextXRefVisitor(XRefVisitor):
     #
     # PUBLIC
     #
+
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a (plaintext) cross-reference table may start with."""
+        return b"x"
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -80,47 +86,60 @@ class PlaintextXRefVisitor(XRefVisitor):
         if self.get_bytes()[node : node + 4] != b"xref":
             return None
 
-        # read the start object nr
-        i: int = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=node)
-        j: int = PDFBytes.next_space(pdf_bytes=self.get_bytes(), start=i + 1)
-        start_object_nr: int = int(self.get_bytes()[i:j].decode())
-
-        # read how many objects the XREF contains
-        i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j + 1)
-        j = PDFBytes.next_newline(pdf_bytes=self.get_bytes(), start=i + 1)
-        number_of_objects: int = int(self.get_bytes()[i:j].decode())
-
-        # process each line of the XREF
+        # the XREF contains one or more subsections
+        # (an incremental update typically only lists the objects it added or modified)
         xref: typing.List[PDFType] = []
-        for object_nr in range(start_object_nr, start_object_nr + number_of_objects):
+        j: int = node + 4
+        while True:
 
-            # read first number of each XREF line
-            i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j)
-            j = PDFBytes.next_space(pdf_bytes=self.get_bytes(), start=i + 1)
-            byte_offset: int = int(self.get_bytes()[i:j].decode())
+            # IF the next token is not an integer (e.g. 'trailer')
+            # THEN there are no more subsections
+            k: int = PDFLexer.skip_whitespace(pdf_bytes=self.get_bytes(), start=j)
+            if not bytes(self.get_bytes()[k : k + 1]).isdigit():
+                break
 
-            # read second nr
-            i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j + 1)
+            # read the start object nr
+            i: int = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j)
             j = PDFBytes.next_space(pdf_bytes=self.get_bytes(), start=i + 1)
-            generation_number: int = int(self.get_bytes()[i:j].decode())
+            start_object_nr: int = int(self.get_bytes()[i:j].decode())
 
-            # read 'f' or 'n'
-            i = j + 1
+            # read how many objects the subsection contains
+            i = PDFBytes.next_integer(pdf_bytes=self.get_bytes(), start=j + 1)
             j = PDFBytes.next_newline(pdf_bytes=self.get_bytes(), start=i + 1)
-            f_or_n: str = self.get_bytes()[i:j].decode()
-
-            # add to XREF
-            xref += [
-                reference(
-                    object_nr=object_nr,
-                    generation_nr=generation_number,
-                    byte_offset=byte_offset,
-                    is_in_use=(f_or_n == "n"),
+            number_of_objects: int = int(self.get_bytes()[i:j].decode())
+
+            # process each line of the subsection
+            is_complete: bool = True
+            for object_nr in range(
+                start_object_nr, start_object_nr + number_of_objects
+            ):
+
+                # read each XREF line (byte offset, generation number and 'f' or 'n')
+                xref_entry = PDFLexer.read_xref_entry(
+                    pdf_bytes=self.get_bytes(), start=j
                 )
-            ]
+                if xref_entry is None:
+                    is_complete = False
+                    break
+                byte_offset, generation_number, is_in_use, j = xref_entry
+
+                # add to XREF
+                xref += [
+                    reference(
+                        object_nr=object_nr,
+                        generation_nr=generation_number,
+                        byte_offset=byte_offset,
+                        is_in_use=is_in_use,
+                    )
+                ]
+
+            # IF a line could not be read
+            # THEN stop processing the XREF
+            if not is_complete:
+                break
 
         # add to (root) xref tables
-        self._ReadVisitor__root._RootVisitor__xref += xref  # type: ignore[attr-defined]
+        self._add_to_xref(xref)  # type: ignore[arg-type]
 
         # IF the /Prev key has been set
         # THEN process the previous xref as well
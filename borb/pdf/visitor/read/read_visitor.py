@@ -60,7 +60,7 @@ class ReadVisitor(NodeVisitor):
     # PUBLIC
     #
 
-    def get_bytes(self) -> bytes:
+    def get_bytes(self) -> typing.Union[bytes, "mmap.mmap"]:  # type: ignore[name-defined]
         """
         Retrieve the raw PDF byte data being processed.
 
@@ -69,11 +69,41 @@ class ReadVisitor(NodeVisitor):
         and can be accessed through this method. It allows subclasses of `ReadVisitor`
         to access the PDF content for further processing or analysis.
 
-        :return: The raw PDF byte data as a `bytes` object.
+        :return: The raw PDF byte data as a `bytes` (or memory-mapped) object.
         """
         assert self.__root is not None
         return self.__root._RootVisitor__source  # type: ignore[attr-defined]
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """
+        Return the bytes that a token handled by this visitor may start with.
+
+        The `RootVisitor` uses this to build a dispatch table, mapping the first byte
+        of a token onto the visitors that could possibly handle that token. That way,
+        a byte offset is not offered to every visitor (in order) until one accepts it.
+        A return value of `None` means the visitor is offered every byte offset.
+
+        :return:    the bytes that a token handled by this visitor may start with, or None
+        """
+        return None
+
+    def get_stream_bytes(self, end: int, start: int) -> typing.Union[bytes, memoryview]:
+        """
+        Retrieve the (raw) bytes of a stream, between the given byte offsets.
+
+        If the PDF byte data is memory-mapped, this method returns a `memoryview` on the
+        mapped file, rather than a copy of the bytes. The stream bytes are then only read
+        from disk (and copied) once they are decoded. Otherwise, a `bytes` object is returned.
+
+        :param end:     the byte offset at which the stream ends
+        :param start:   the byte offset at which the stream starts
+        :return:        the bytes of the stream, as a `bytes` or `memoryview` object
+        """
+        source = self.get_bytes()
+        if isinstance(source, bytes):
+            return source[start:end]
+        return memoryview(source)[start:end]
+
     def root_generic_visit(
         self, node: typing.Union[bytes, int]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
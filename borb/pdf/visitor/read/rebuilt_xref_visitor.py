@@ -10,7 +10,7 @@ recovering XREF tables in corrupted or linearized PDFs.
 import re
 import typing
 
-from borb.pdf.primitives import PDFType, reference
+from borb.pdf.primitives import reference
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -52,7 +52,7 @@ class RebuiltXREFVisitor(ReadVisitor):
         :param node:    the node (PDFType) to be processed
         :return:        True if the visitor processed the node False otherwise
         """
-        xref: typing.List[PDFType] = []
+        xref: typing.List[reference] = []
         i: int = 0
         while i < len(self.get_bytes()):
             # IF we did not read a number
@@ -90,5 +90,16 @@ class RebuiltXREFVisitor(ReadVisitor):
         # add to (root) xref tables
         self._ReadVisitor__root._RootVisitor__xref += xref  # type: ignore[attr-defined]
 
+        # IF an object is defined more than once in the file
+        # THEN the last definition (i.e. the latest incremental update) wins
+        xref_index: typing.Dict[typing.Tuple[int, int], reference] = self._ReadVisitor__root._RootVisitor__xref_index  # type: ignore[attr-defined]
+        r: reference
+        for r in xref:
+            object_nr: typing.Optional[int] = r.get_object_nr()
+            generation_nr: typing.Optional[int] = r.get_generation_nr()
+            if object_nr is None or generation_nr is None:
+                continue
+            xref_index[(object_nr, generation_nr)] = r
+
         # return
         return xref, -1
@@ -25,6 +25,7 @@ from borb.pdf.visitor.read.compression.decode_stream import decode_stream
 from borb.pdf.visitor.read.document_visitor import DocumentVisitor
 from borb.pdf.visitor.read.no_op_reference_visitor import NoOpReferenceVisitor
 from borb.pdf.visitor.read.plaintext_xref_visitor import PlaintextXRefVisitor
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 from borb.pdf.visitor.read.root_visitor import RootVisitor
 
@@ -59,47 +60,139 @@ class ReferenceVisitor(ReadVisitor):
     def __get_modified_root_visitor(self) -> ReadVisitor:
         # build a (modified) FacadeVisitor
         # fmt: off
-        rv = RootVisitor()
+        rv = RootVisitor(lazy=self.__is_lazy())
         rv._RootVisitor__visitors = [x for x in rv._RootVisitor__visitors if not isinstance(x, DocumentVisitor)]                                        # type: ignore[attr-defined]
         rv._RootVisitor__visitors = [x for x in rv._RootVisitor__visitors if not isinstance(x, PlaintextXRefVisitor)]                                   # type: ignore[attr-defined]
         rv._RootVisitor__visitors = [x for x in rv._RootVisitor__visitors if not isinstance(x, CompressedXRefVisitor)]                                  # type: ignore[attr-defined]
         rv._RootVisitor__visitors = [x if not isinstance(x, ReferenceVisitor) else NoOpReferenceVisitor(root=rv) for x in rv._RootVisitor__visitors]    # type: ignore[attr-defined]
         rv._ReadVisitor__root._RootVisitor__xref = self._ReadVisitor__root._RootVisitor__xref                                                           # type: ignore[attr-defined]
+        rv._ReadVisitor__root._RootVisitor__xref_index = self._ReadVisitor__root._RootVisitor__xref_index                                               # type: ignore[attr-defined]
         # fmt: on
 
         # return
         return rv
 
+    def __get_object_stm(
+        self, parent_stream_object_nr: int
+    ) -> typing.Optional[
+        typing.Tuple[bytes, typing.Dict[int, PDFType], typing.List[int], ReadVisitor]
+    ]:
+        # IF the object stream has been parsed before
+        # THEN return it from the cache
+        # (bytes without header, objects per index, offset per index, RootVisitor)
+        object_stm_cache: typing.Dict[int, typing.Optional[typing.Tuple[bytes, typing.Dict[int, PDFType], typing.List[int], ReadVisitor]]] = self._ReadVisitor__root._RootVisitor__object_stm_cache  # type: ignore[attr-defined]
+        if parent_stream_object_nr in object_stm_cache:
+            return object_stm_cache[parent_stream_object_nr]
+        object_stm_cache[parent_stream_object_nr] = None
+
+        # look up the object stream
+        r2: typing.Optional[reference] = self.__look_up_reference(
+            object_nr=parent_stream_object_nr, generation_nr=0
+        )
+        byte_offset: typing.Optional[int] = (
+            r2.get_byte_offset() if r2 is not None else None
+        )
+        if byte_offset is None:
+            return None
+        try:
+            referenced_object_and_blank = self.root_generic_visit(byte_offset)
+        except (IndexError, ValueError):
+            return None
+        if referenced_object_and_blank is None:
+            return None
+
+        # get the object stream
+        object_stm = referenced_object_and_blank[0]
+        if not isinstance(object_stm, stream):
+            return None
+
+        # decode
+        decode_stream(object_stm)
+
+        # split header and objects
+        # fmt: off
+        header_offset: int = object_stm.get("First", 0)
+        object_stm_header: bytes = object_stm["DecodedBytes"][:header_offset]
+        object_stm_bytes_without_header: bytes = object_stm["DecodedBytes"][header_offset:]
+        # fmt: on
+
+        # header:  list of object numbers and their offsets (within the stream)
+        offsets: typing.List[int] = []
+        try:
+            header: typing.List[int] = [int(x) for x in object_stm_header.split()]
+            offsets = header[1::2]
+        except ValueError:
+            pass
+
+        # a single (modified) RootVisitor is used to parse every object in the stream
+        rv = self.__get_modified_root_visitor()
+        rv._ReadVisitor__root._RootVisitor__source = object_stm_bytes_without_header  # type: ignore[attr-defined]
+
+        # store in cache
+        object_stm_cache[parent_stream_object_nr] = (
+            object_stm_bytes_without_header,
+            {},
+            offsets,
+            rv,
+        )
+        return object_stm_cache[parent_stream_object_nr]
+
+    def __get_object_stm_member_by_parsing_sequentially(
+        self,
+        object_stm: typing.Tuple[
+            bytes, typing.Dict[int, PDFType], typing.List[int], ReadVisitor
+        ],
+        index_in_parent_stream: int,
+    ) -> typing.Optional[PDFType]:
+        i: int = 0
+        n: int = 0
+        object_stm_bytes_without_header, objects, _, rv = object_stm
+        while i < len(object_stm_bytes_without_header):
+
+            # IF we see whitespace (space, \n, \r)
+            # THEN skip
+            if object_stm_bytes_without_header[i : i + 1] in [b" ", b"\n", b"\r"]:
+                i += 1
+                continue
+
+            referenced_object_and_i = rv.visit(i)
+            if referenced_object_and_i is None:
+                break
+            objects[n] = referenced_object_and_i[0]
+            if n == index_in_parent_stream:
+                return referenced_object_and_i[0]
+            i = referenced_object_and_i[1]
+            n += 1
+
+        # default
+        return None
+
+    def __is_lazy(self) -> bool:
+        return self._ReadVisitor__root._RootVisitor__lazy  # type: ignore[attr-defined]
+
     def __look_up_reference(
         self, object_nr: int, generation_nr: int
     ) -> typing.Optional[reference]:
-        for xref_table_entry in self._ReadVisitor__root._RootVisitor__xref[::-1]:  # type: ignore[attr-defined]
-            if (
-                xref_table_entry.get_object_nr() == object_nr
-                and xref_table_entry.get_generation_nr() == generation_nr
-            ):
-                return xref_table_entry
-        return None
+        return self._ReadVisitor__root._RootVisitor__xref_index.get((object_nr, generation_nr))  # type: ignore[attr-defined]
 
     def __mark_reference_as_being_resolved(self, r: reference):
-        self._ReadVisitor__root._RootVisitor__references_being_resolved += [r]  # type: ignore[attr-defined]
+        self._ReadVisitor__root._RootVisitor__references_being_resolved.add((r.get_object_nr(), r.get_generation_nr(), r.get_byte_offset()))  # type: ignore[attr-defined]
 
     def __reference_is_being_resolved(self, r: reference) -> bool:
-        for ref in self._ReadVisitor__root._RootVisitor__references_being_resolved:  # type: ignore[attr-defined]
-            if ref.get_object_nr() != r.get_object_nr():
-                continue
-            if ref.get_generation_nr() != r.get_generation_nr():
-                continue
-            if ref.get_byte_offset() != r.get_byte_offset():
-                continue
-            return True
-        return False
+        return (r.get_object_nr(), r.get_generation_nr(), r.get_byte_offset()) in self._ReadVisitor__root._RootVisitor__references_being_resolved  # type: ignore[attr-defined]
 
     def __resolve_references(self, o: PDFType) -> PDFType:
+        # IF the object is a list or dict
+        # THEN resolve its members in place
+        # (so that subclasses such as Page and Font are kept)
         if isinstance(o, list):
-            return [self.__resolve_references(x) for x in o]
+            for i in range(0, len(o)):
+                o[i] = self.__resolve_references(o[i])
+            return o
         if isinstance(o, dict):
-            return {k: self.__resolve_references(v) for k, v in o.items()}
+            for k in o.keys():
+                o[k] = self.__resolve_references(o[k])
+            return o
         if isinstance(o, reference):
             object_nr: typing.Optional[int] = o.get_object_nr()
             generation_nr: typing.Optional[int] = o.get_generation_nr()
@@ -111,7 +204,14 @@ class ReferenceVisitor(ReadVisitor):
                 )
                 or o
             )
-            return self.__visit_reference(o)
+            # IF we are reading lazily
+            # THEN the reference is resolved (later) on demand
+            if self.__is_lazy():
+                return o.get_referenced_object() or o
+            referenced_object: typing.Optional[PDFType] = self.__visit_reference(o)
+            if referenced_object is None:
+                return o
+            return referenced_object
         return o
 
     def __visit_byte_offset_reference(self, r: reference) -> typing.Optional[PDFType]:
@@ -138,75 +238,42 @@ class ReferenceVisitor(ReadVisitor):
         index_in_parent_stream: typing.Optional[int] = r.get_index_in_parent_stream()
         assert parent_stream_object_nr is not None
         assert index_in_parent_stream is not None
-        r2: typing.Optional[reference] = self.__look_up_reference(
-            object_nr=parent_stream_object_nr, generation_nr=0
-        )
-
-        try:
-            assert r2 is not None
-            byte_offset: typing.Optional[int] = r2.get_byte_offset()
-            assert byte_offset is not None
-            referenced_object_and_blank = self.root_generic_visit(byte_offset)
-            if referenced_object_and_blank is None:
-                return None
-        except:
-            return None
 
-        # get the object stream
-        object_stm = referenced_object_and_blank[0]
-        assert isinstance(object_stm, stream)
-
-        # decode
-        decode_stream(object_stm)
-
-        # decode the bytes
-        # fmt: off
-        header_offset: int = object_stm.get("First", 0)
-        object_stm_header: bytes = object_stm["DecodedBytes"][:header_offset]
-        object_stm_bytes_without_header: bytes = object_stm["DecodedBytes"][header_offset:]
-        # fmt: on
-
-        objs: typing.List[PDFType] = []
-        while len(object_stm_bytes_without_header) > 0:
-
-            # IF we see a space
-            # THEN skip
-            if object_stm_bytes_without_header[0:1] == b" ":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[1:]
-                continue
-
-            # IF we see a newline (\n\r)
-            # THEN skip
-            if object_stm_bytes_without_header[0:2] == b"\n\r":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[2:]
-                continue
-            if object_stm_bytes_without_header[0:2] == b"\r\n":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[2:]
-                continue
-            if object_stm_bytes_without_header[0:1] == b"\n":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[1:]
-                continue
-            if object_stm_bytes_without_header[0:1] == b"\r":
-                object_stm_bytes_without_header = object_stm_bytes_without_header[1:]
-                continue
-
-            rv = self.__get_modified_root_visitor()
-            rv._ReadVisitor__root._RootVisitor__source = b""  # type: ignore[attr-defined]
-            referenced_object_and_i = rv.visit(object_stm_bytes_without_header)
-            if referenced_object_and_i is None:
-                break
-            objs += [referenced_object_and_i[0]]
-            object_stm_bytes_without_header = object_stm_bytes_without_header[
-                referenced_object_and_i[1] :
+        # get the (cached) object stream
+        object_stm: typing.Optional[
+            typing.Tuple[
+                bytes, typing.Dict[int, PDFType], typing.List[int], ReadVisitor
             ]
-
-        # header:  list of object numbers and their offsets (within the stream)
-        header: typing.List[int] = [int(x) for x in object_stm_header.split()]
+        ] = self.__get_object_stm(parent_stream_object_nr)
+        if object_stm is None:
+            return None
+        _, objects, offsets, rv = object_stm
+
+        # IF the object has been parsed before
+        # THEN return it
+        # ELSE IF the header tells us where the object starts
+        # THEN parse (only) that object
+        # ELSE parse the objects in the stream one by one
+        referenced_object: typing.Optional[PDFType] = objects.get(
+            index_in_parent_stream
+        )
+        if referenced_object is None and index_in_parent_stream < len(offsets):
+            try:
+                referenced_object_and_i = rv.visit(offsets[index_in_parent_stream])
+                if referenced_object_and_i is not None:
+                    referenced_object = referenced_object_and_i[0]
+                    objects[index_in_parent_stream] = referenced_object
+            except (IndexError, ValueError):
+                pass
+        if referenced_object is None:
+            referenced_object = self.__get_object_stm_member_by_parsing_sequentially(
+                object_stm=object_stm, index_in_parent_stream=index_in_parent_stream
+            )
+        if referenced_object is None:
+            return None
 
         # return
-        referenced_object = objs[index_in_parent_stream]
-        referenced_object = self.__resolve_references(referenced_object)
-        return referenced_object
+        return self.__resolve_references(referenced_object)
 
     def __visit_reference(self, r: reference) -> typing.Optional[PDFType]:
         # IF we are already resolving that reference (for instance /Parent)
@@ -242,6 +309,36 @@ class ReferenceVisitor(ReadVisitor):
     #
     # PUBLIC
     #
+
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a reference may start with."""
+        return b"0123456789"
+
+    def resolve(self, indirect_reference: reference) -> PDFType:
+        """
+        Resolve a single (cross-reference table) reference on demand.
+
+        This method is used when the PDF is read lazily. In that mode, indirect references
+        are left unresolved while parsing, and are only resolved when the object they point
+        to is actually needed. Resolving a reference parses the referenced object, but leaves
+        any references nested inside that object unresolved.
+
+        :param indirect_reference:  the reference to resolve
+        :return:                    the referenced object, or the reference itself if it could not be resolved
+        """
+        referenced_object: typing.Optional[PDFType] = (
+            indirect_reference.get_referenced_object()
+        )
+        if referenced_object is not None:
+            return referenced_object
+        if not indirect_reference.is_in_use():
+            return indirect_reference
+        self.__visit_reference(indirect_reference)
+        referenced_object = indirect_reference.get_referenced_object()
+        if referenced_object is None:
+            return indirect_reference
+        return referenced_object
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -262,40 +359,13 @@ class ReferenceVisitor(ReadVisitor):
         if self.get_bytes()[node] not in b"0123456789":
             return None
 
-        # read object nr
-        i: int = node
-        j: int = node
-        while self.get_bytes()[j] in b"0123456789":
-            j += 1
-        object_nr: int = int(self.get_bytes()[i:j].decode())
-
-        # read space
-        i = j
-        if self.get_bytes()[i : i + 1] != b" ":
-            return None
-        while self.get_bytes()[j : j + 1] == b" ":
-            j += 1
-
-        # read generation number
-        i = j
-        if self.get_bytes()[i] not in b"0123456789":
-            return None
-        while self.get_bytes()[j] in b"0123456789":
-            j += 1
-        generation_nr: int = int(self.get_bytes()[i:j].decode())
-
-        # read space
-        i = j
-        if self.get_bytes()[i : i + 1] != b" ":
-            return None
-        while self.get_bytes()[j : j + 1] == b" ":
-            j += 1
-
-        # read 'R'
-        i = j
-        if self.get_bytes()[i : i + 1] != b"R":
+        # read object nr, generation nr and 'R'
+        reference_and_i = PDFLexer.read_reference(
+            pdf_bytes=self.get_bytes(), start=node
+        )
+        if reference_and_i is None:
             return None
-        i += 1
+        object_nr, generation_nr, i = reference_and_i
 
         matching_ref: typing.Optional[reference] = self.__look_up_reference(
             object_nr=object_nr, generation_nr=generation_nr
@@ -314,5 +384,10 @@ class ReferenceVisitor(ReadVisitor):
                 i,
             )
 
+        # IF we are reading lazily
+        # THEN return the (unresolved) xref entry
+        if self.__is_lazy():
+            return matching_ref.get_referenced_object() or matching_ref, i
+
         # default
         return self.__visit_reference(matching_ref), i
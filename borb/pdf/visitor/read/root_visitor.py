@@ -54,7 +54,7 @@ class RootVisitor(ReadVisitor):
     # CONSTRUCTOR
     #
 
-    def __init__(self):
+    def __init__(self, incremental_update: bool = False, lazy: bool = False):
         """
         Initialize the FacadeVisitor instance and set up the necessary visitors for processing a PDF document.
 
@@ -68,6 +68,9 @@ class RootVisitor(ReadVisitor):
         PDF document, including processing objects, dictionaries, lists, strings,
         and primitive types. The `FacadeVisitor` acts as the central coordinator
         for dispatching PDF nodes to the appropriate visitor.
+
+        :param incremental_update:  whether to keep the state of every object as it is read (to write an incremental update later on)
+        :param lazy:                whether indirect references should be resolved on demand (rather than upfront)
         """
         super().__init__(root=self)
         from borb.pdf.visitor.read.read_visitor import ReadVisitor
@@ -107,10 +110,17 @@ class RootVisitor(ReadVisitor):
             FloatVisitor(root=self),
             IntVisitor(root=self),
         ]
-        self.__source: bytes = b""  # type: ignore[annotation-unchecked]
-        self.__references_being_resolved: typing.List[reference] = []  # type: ignore[annotation-unchecked]
+        self.__source: typing.Union[bytes, "mmap.mmap"] = b""  # type: ignore[annotation-unchecked, name-defined]
+        self.__references_being_resolved: typing.Set[typing.Tuple[typing.Optional[int], typing.Optional[int], typing.Optional[int]]] = set()  # type: ignore[annotation-unchecked]
         self.__xref: typing.List[reference] = []  # type: ignore[annotation-unchecked]
+        self.__xref_index: typing.Dict[typing.Tuple[int, int], reference] = {}  # type: ignore[annotation-unchecked]
         self.__cache: typing.Dict[int, typing.Any] = {}
+        self.__object_stm_cache: typing.Dict[int, typing.Optional[typing.Tuple[bytes, typing.Dict[int, PDFType], typing.List[int], ReadVisitor]]] = {}  # type: ignore[annotation-unchecked]
+        self.__dispatch_table: typing.List[typing.List[ReadVisitor]] = []  # type: ignore[annotation-unchecked]
+        self.__dispatch_table_visitors: typing.Optional[typing.List[ReadVisitor]] = None  # type: ignore[annotation-unchecked]
+        self.__number_of_attempts_per_token: typing.Dict[int, int] = {}
+        self.__incremental_update: bool = incremental_update
+        self.__lazy: bool = lazy
 
     #
     # PRIVATE
@@ -129,12 +139,52 @@ class RootVisitor(ReadVisitor):
                 return size
         return 0
 
+    def __get_visitors_for_byte_offset(
+        self, node: typing.Any
+    ) -> typing.List[ReadVisitor]:
+        # IF the node is not a byte offset (in range)
+        # OR the node is the start of the document
+        # THEN all visitors are tried (in order)
+        if not isinstance(node, int) or node == 0 or node >= len(self.__source):
+            return self.__visitors
+
+        # IF the visitors have changed (e.g. a modified RootVisitor)
+        # THEN (re)build the dispatch table
+        if self.__dispatch_table_visitors is not self.__visitors:
+            self.__dispatch_table = []
+            for b in range(0, 256):
+                self.__dispatch_table += [
+                    [
+                        v
+                        for v in self.__visitors
+                        if v is not self
+                        and (v.get_leading_bytes() is None or b in v.get_leading_bytes())  # type: ignore[operator]
+                    ]
+                ]
+            self.__dispatch_table_visitors = self.__visitors
+
+        # look up the first byte of the token
+        return self.__dispatch_table[self.__source[node]]
+
     #
     # PUBLIC
     #
 
+    def get_number_of_attempts_per_token(self) -> typing.Dict[int, int]:
+        """
+        Return how many visitor attempts it took to parse each token.
+
+        Every time a byte offset is visited, the `RootVisitor` offers it to (a subset of)
+        its visitors until one of them accepts it. This method returns a histogram of those
+        attempts, mapping the number of visitors that were tried onto the number of tokens
+        that needed that many attempts. This is useful when profiling `PDF.read`.
+
+        :return:    a dictionary mapping the number of attempts onto the number of tokens
+        """
+        return self.__number_of_attempts_per_token
+
     def visit(
-        self, node: typing.Union[bytes, PDFType]
+        self, node: typing.Union[bytes, "mmap.mmap", PDFType]  # type: ignore[name-defined]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
         """
         Traverse the PDF document tree using the visitor pattern.
@@ -150,19 +200,28 @@ class RootVisitor(ReadVisitor):
         """
         if (
             isinstance(self, RootVisitor)
-            and isinstance(node, bytes)
+            and isinstance(self.__source, bytes)
             and self.__source == b""
         ):
-            self.__source = node
-            node = 0
+            import mmap
+
+            if isinstance(node, (bytes, mmap.mmap)):
+                self.__source = node
+                node = 0
         # print(f'stack depth: {RootVisitor.__get_stack_size()}, byte pos: {node}')
         if isinstance(node, int) and node in self.__cache:
             return self.__cache[node]
-        for v in self.__visitors:
+        number_of_attempts: int = 0
+        for v in self.__get_visitors_for_byte_offset(node):
             if v is self:
                 continue
+            number_of_attempts += 1
             w = v.visit(node)
             if w is not None:
+                # keep track of the number of attempts
+                self.__number_of_attempts_per_token[number_of_attempts] = (
+                    self.__number_of_attempts_per_token.get(number_of_attempts, 0) + 1
+                )
                 # store in cache
                 if (
                     isinstance(node, int)
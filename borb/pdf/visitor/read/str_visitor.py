@@ -12,6 +12,7 @@ text content in the document.
 import typing
 
 from borb.pdf.primitives import PDFType
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -26,7 +27,6 @@ class StrVisitor(ReadVisitor):
     text content in the document.
     """
 
-    __STR_CLOSE_BRACKET = b")"
     __STR_OPEN_BRACKET = b"("
 
     #
@@ -41,6 +41,10 @@ class StrVisitor(ReadVisitor):
     # PUBLIC
     #
 
+    def get_leading_bytes(self) -> typing.Optional[bytes]:
+        """Return the bytes that a string may start with."""
+        return b"("
+
     def visit(
         self, node: typing.Union[int, PDFType]
     ) -> typing.Optional[typing.Tuple[PDFType, int]]:
@@ -62,38 +66,9 @@ class StrVisitor(ReadVisitor):
             return None
 
         # 7.3.4.2 Literal Strings
-        retval: bytes = b""
-        i: int = node
-        j: int = node + 1
-        while self.get_bytes()[j : j + 1] != StrVisitor.__STR_CLOSE_BRACKET:
-
-            # Within a literal string, the REVERSE SOLIDUS is used as an escape character. The character immediately
-            # following the REVERSE SOLIDUS determines its precise interpretation as shown in Table 3. If the character
-            # following the REVERSE SOLIDUS is not one of those shown in Table 3, the REVERSE SOLIDUS shall be
-            # ignored.
-            if self.get_bytes()[j : j + 1] == b"\\":
-
-                # Sequence              Meaning
-                # \nLINE FEED           (0Ah) (LF)
-                # \rCARRIAGE RETURN     (0Dh) (CR)
-                # \tHORIZONTAL TAB      (09h) (HT)
-                # \bBACKSPACE           (08h) (BS)
-                # \fFORM FEED           (FF)
-                # \(LEFT PARENTHESIS    (28h)
-                # \)RIGHT PARENTHESIS   (29h)
-                # \\REVERSE SOLIDUS     (5Ch) (Backslash)
-                if self.get_bytes()[j + 1 : j + 2] in b"nrtbf()":
-                    retval += self.get_bytes()[j + 1 : j + 2]
-                    j += 2
-                    continue
-
-                # \ddd                  Character code ddd (octal)
-                try:
-                    tmp: bytes = self.get_bytes()[j : j + 3]
-                except:
-                    pass
-            # default
-            retval += self.get_bytes()[j : j + 1]
-            j += 1
+        str_and_j = PDFLexer.read_literal_str(pdf_bytes=self.get_bytes(), start=node)
+        if str_and_j is None:
+            return None
 
-        return retval.decode(encoding="latin-1"), j + 1
+        # return
+        return str_and_j[0].decode(encoding="latin-1"), str_and_j[1]
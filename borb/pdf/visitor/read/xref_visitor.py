@@ -17,7 +17,7 @@ supporting robust and optimized PDF parsing.
 """
 import typing
 
-from borb.pdf.primitives import PDFType
+from borb.pdf.primitives import PDFType, reference
 from borb.pdf.visitor.read.read_visitor import ReadVisitor
 
 
@@ -50,25 +50,42 @@ class XRefVisitor(ReadVisitor):
     # PRIVATE
     #
 
+    def _add_to_xref(self, xref: typing.List[reference]) -> None:
+        # keep the (ordered) xref, as it is passed on to the Document
+        self._ReadVisitor__root._RootVisitor__xref += xref  # type: ignore[attr-defined]
+
+        # IF an (object_nr, generation_nr) is already in the index
+        # THEN it was defined by a newer xref section (the /Prev chain is processed newest first)
+        # AND the newer entry wins
+        xref_index: typing.Dict[typing.Tuple[int, int], reference] = self._ReadVisitor__root._RootVisitor__xref_index  # type: ignore[attr-defined]
+        for r in xref:
+            object_nr: typing.Optional[int] = r.get_object_nr()
+            generation_nr: typing.Optional[int] = r.get_generation_nr()
+            if object_nr is None or generation_nr is None:
+                continue
+            xref_index.setdefault((object_nr, generation_nr), r)
+
     def _get_matching_dictionary_close(self, start_of_dictionary_pos: int) -> int:
+        # jump from one dictionary delimiter to the next (rather than looking at every byte)
         end_of_dictionary_pos: int = start_of_dictionary_pos + 2
         dict_nesting_level: int = 1
         while end_of_dictionary_pos < len(self.get_bytes()) and dict_nesting_level != 0:
-            if (
-                self.get_bytes()[end_of_dictionary_pos : end_of_dictionary_pos + 2]
-                == XRefVisitor.__DICT_OPEN_BRACKETS
-            ):
+            next_close_pos: int = self.get_bytes().find(
+                XRefVisitor.__DICT_CLOSE_BRACKETS, end_of_dictionary_pos
+            )
+            if next_close_pos == -1:
+                return len(self.get_bytes())
+            next_open_pos: int = self.get_bytes().find(
+                XRefVisitor.__DICT_OPEN_BRACKETS,
+                end_of_dictionary_pos,
+                next_close_pos + 1,
+            )
+            if next_open_pos != -1 and next_open_pos < next_close_pos:
                 dict_nesting_level += 1
-                end_of_dictionary_pos += 2
-                continue
-            if (
-                self.get_bytes()[end_of_dictionary_pos : end_of_dictionary_pos + 2]
-                == XRefVisitor.__DICT_CLOSE_BRACKETS
-            ):
-                dict_nesting_level -= 1
-                end_of_dictionary_pos += 2
+                end_of_dictionary_pos = next_open_pos + 2
                 continue
-            end_of_dictionary_pos += 1
+            dict_nesting_level -= 1
+            end_of_dictionary_pos = next_close_pos + 2
         return end_of_dictionary_pos
 
     def _get_value_from_dictionary_bytes(
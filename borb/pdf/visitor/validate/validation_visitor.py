@@ -57,6 +57,7 @@ class ValidationVisitor(NodeVisitor):
         super().__init__()
         self.__root: typing.Optional[NodeVisitor] = root
         self.__has_been_used: bool = False
+        self.__reference_per_id: typing.Optional[typing.Dict[int, reference]] = None
 
     #
     # PRIVATE
@@ -86,6 +87,26 @@ class ValidationVisitor(NodeVisitor):
                 continue
         return obj_done
 
+    def __get_reference(
+        self, document: Document, obj: PDFType
+    ) -> typing.Optional[reference]:
+        # IF the root keeps an id -> reference map (e.g. FacadeVisitor)
+        # THEN use it
+        from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+
+        if isinstance(self.__root, FacadeVisitor):
+            obj_ref: PDFType = self.__root.get_reference(obj)
+            return obj_ref if isinstance(obj_ref, reference) else None
+
+        # default (build an id -> reference map of our own, once)
+        if self.__reference_per_id is None:
+            self.__reference_per_id = {}
+            for x in document.get("XRef", []):
+                if not isinstance(x, reference):
+                    continue
+                self.__reference_per_id.setdefault(id(x.get_referenced_object()), x)
+        return self.__reference_per_id.get(id(obj), None)
+
     @staticmethod
     def __print_warning(c: ConformanceCheck, r: typing.Optional[reference]) -> None:
         ref_str = f"{r}" if r else "<unknown object reference>"
@@ -155,16 +176,7 @@ class ValidationVisitor(NodeVisitor):
         for obj in all_objects:
             for check in all_checks:
                 if check.check_whether_object_violates_clause(obj):
-                    obj_ref = next(
-                        iter(
-                            [
-                                x
-                                for x in node.get("XRef", [])
-                                if id(x.get_referenced_object()) == id(obj)
-                            ]
-                        ),
-                        None,
-                    )
+                    obj_ref = self.__get_reference(document=node, obj=obj)
                     if on_non_conformance_print_warning:
                         ValidationVisitor.__print_warning(c=check, r=obj_ref)
                     if on_non_conformance_throw_assert:
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+The state of a PDF document at the time it was read, used to write it as an incremental update.
+
+An incremental update only appends the objects that were added or modified since the document
+was read. `IncrementalUpdateSnapshot` keeps track of the file the document was read from, and of
+the (direct) content of every indirect object at the time it was read (or, for a lazily read
+document, at the time it was first resolved). Comparing an object with its snapshot tells whether
+it was modified.
+
+Taking a snapshot costs time and memory, so it is only done when `PDF.read` is asked to.
+"""
+import pathlib
+import typing
+
+from borb.pdf.primitives import PDFType, reference, stream
+
+
+class IncrementalUpdateSnapshot:
+    """
+    The state of a PDF document at the time it was read, used to write it as an incremental update.
+
+    An incremental update only appends the objects that were added or modified since the document
+    was read. `IncrementalUpdateSnapshot` keeps track of the file the document was read from, and of
+    the (direct) content of every indirect object at the time it was read (or, for a lazily read
+    document, at the time it was first resolved). Comparing an object with its snapshot tells whether
+    it was modified.
+    """
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(self, start_of_xref: int):
+        """
+        Initialize the IncrementalUpdateSnapshot.
+
+        :param start_of_xref:   the byte offset of the (last) cross-reference section of the file
+        """
+        self.__source: typing.Optional[pathlib.Path] = None
+        self.__source_stat: typing.Tuple[int, int] = (0, 0)
+        self.__start_of_xref: int = start_of_xref
+        self.__snapshot_per_id: typing.Dict[
+            int,
+            typing.Tuple[typing.Tuple[int, int], typing.Any, typing.Dict[int, PDFType]],
+        ] = {}
+
+    #
+    # PRIVATE
+    #
+
+    def __get_snapshot(
+        self,
+        o: PDFType,
+        direct_object_per_id: typing.Dict[int, PDFType],
+        is_root: bool = True,
+    ) -> typing.Any:
+        # IF the object is not a container (i.e. bool, float, int, str, ..)
+        # THEN its type and value matter
+        # (the type is kept, so that (for instance) a str that becomes a name is a modification)
+        if not isinstance(o, (dict, list, reference)):
+            return o.__class__, o
+
+        # IF the object is a reference (or an indirect object nested inside another object)
+        # THEN only its object number and generation number matter
+        if isinstance(o, reference):
+            return "R", o.get_object_nr(), o.get_generation_nr()
+        if not is_root and id(o) in self.__snapshot_per_id:
+            return ("R",) + self.__snapshot_per_id[id(o)][0]
+
+        # IF the (direct) object was seen before (in this snapshot)
+        # THEN do not recurse (again)
+        if id(o) in direct_object_per_id:
+            return ("C",)
+        direct_object_per_id[id(o)] = o
+
+        # IF the object is a stream
+        # THEN keep the (raw) bytes (which are never copied)
+        # AND keep /DecodedBytes only when it was set after /Bytes
+        if isinstance(o, stream):
+            return (
+                "S",
+                tuple(
+                    (k, self.__get_snapshot(v, direct_object_per_id, False))
+                    for k, v in dict.items(o)
+                    if k not in ["Bytes", "DecodedBytes"]
+                ),
+                dict.get(o, "Bytes"),
+                (
+                    None
+                    if getattr(o, "_stream__bytes_is_up_to_date", True)
+                    else dict.get(o, "DecodedBytes")
+                ),
+            )
+
+        # IF the object is a dictionary
+        # THEN take a snapshot of its (direct) content
+        if isinstance(o, dict):
+            return (
+                "D",
+                tuple(
+                    (k, self.__get_snapshot(v, direct_object_per_id, False))
+                    for k, v in dict.items(o)
+                ),
+            )
+
+        # IF the object is a list
+        # THEN take a snapshot of its (direct) content
+        return "L", tuple(
+            self.__get_snapshot(v, direct_object_per_id, False)
+            for v in list.__iter__(o)
+        )
+
+    #
+    # PUBLIC
+    #
+
+    def get_direct_objects(
+        self, referenced_object: PDFType
+    ) -> typing.Dict[int, PDFType]:
+        """
+        Return the (direct) objects nested inside an indirect object, at the time it was read.
+
+        These objects were written as direct objects in the original file. They remain
+        direct objects when the indirect object is written (again) as part of an incremental update.
+
+        :param referenced_object:   the indirect object
+        :return:                    a dictionary mapping id(object) onto each (direct) object
+        """
+        return self.__snapshot_per_id.get(id(referenced_object), (None, None, {}))[2]
+
+    def get_modified_references(
+        self, xref: typing.List[reference]
+    ) -> typing.List[reference]:
+        """
+        Return the references (in the cross-reference table) whose object was added or modified since it was read.
+
+        :param xref:    the cross-reference table of the document
+        :return:        the references whose object was added or modified
+        """
+        modified_references: typing.List[reference] = []
+        done_ids: typing.Set[int] = set()
+        for r in xref:
+            if not isinstance(r, reference):
+                continue
+
+            # IF the object was never resolved
+            # THEN it can not have been modified
+            o: typing.Optional[PDFType] = r.get_referenced_object()
+            if o is None or id(o) in done_ids:
+                continue
+            done_ids.add(id(o))
+
+            # IF the object was added (since it was read)
+            # OR the object differs from its snapshot
+            # THEN it was modified
+            reference_snapshot_and_direct_objects = self.__snapshot_per_id.get(id(o))
+            if (
+                reference_snapshot_and_direct_objects is None
+                or reference_snapshot_and_direct_objects[0]
+                != (r.get_object_nr(), r.get_generation_nr())
+                or reference_snapshot_and_direct_objects[1]
+                != self.__get_snapshot(o, {})
+            ):
+                modified_references += [r]
+
+        # return
+        return modified_references
+
+    def get_source(self) -> typing.Optional[pathlib.Path]:
+        """
+        Return the file the document was read from, if an incremental update can be appended to it.
+
+        An incremental update can not be appended to a file that changed since it was read.
+
+        :return:    the file the document was read from, or None
+        """
+        # IF this Document was not read from a file
+        # THEN it can not be written incrementally
+        if self.__source is None:
+            return None
+
+        # IF the file changed since it was read
+        # THEN it can not be written incrementally
+        try:
+            stat = self.__source.stat()
+        except OSError:
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != self.__source_stat:
+            return None
+
+        # return
+        return self.__source
+
+    def get_start_of_xref(self) -> int:
+        """
+        Return the byte offset of the (last) cross-reference section of the file the document was read from.
+
+        :return:    the byte offset of the (last) cross-reference section
+        """
+        return self.__start_of_xref
+
+    def set_source(self, source: pathlib.Path) -> "IncrementalUpdateSnapshot":
+        """
+        Set the file the document was read from (or an incremental update was appended to).
+
+        :param source:  the file
+        :return:        self
+        """
+        stat = source.stat()
+        self.__source = source
+        self.__source_stat = (stat.st_size, stat.st_mtime_ns)
+        return self
+
+    def take_snapshot(
+        self, indirect_reference: reference, referenced_object: PDFType
+    ) -> None:
+        """
+        Take a snapshot of an indirect object, unless a snapshot of it was taken before.
+
+        :param indirect_reference:  the reference (object number and generation number) of the object
+        :param referenced_object:   the indirect object
+        :return:                    None
+        """
+        if not isinstance(referenced_object, (dict, list)):
+            return
+        if id(referenced_object) in self.__snapshot_per_id:
+            return
+
+        # the (direct) objects in the snapshot are kept as well
+        # these are not turned into indirect objects when they are written again
+        direct_object_per_id: typing.Dict[int, PDFType] = {}
+        self.__snapshot_per_id[id(referenced_object)] = (
+            (indirect_reference.get_object_nr(), indirect_reference.get_generation_nr()),  # type: ignore[arg-type]
+            self.__get_snapshot(referenced_object, direct_object_per_id),
+            direct_object_per_id,
+        )
+
+    def take_snapshot_of_all_references(self, xref: typing.List[reference]) -> None:
+        """
+        Take a snapshot of every (resolved) indirect object in the cross-reference table.
+
+        :param xref:    the cross-reference table of the document
+        :return:        None
+        """
+        # register every (resolved) object first
+        # so that indirect objects are not part of the snapshot of the object(s) they are nested in
+        references_and_objects: typing.List[typing.Tuple[reference, PDFType]] = []
+        for r in xref:
+            if not isinstance(r, reference):
+                continue
+            o: typing.Optional[PDFType] = r.get_referenced_object()
+            if not isinstance(o, (dict, list)) or id(o) in self.__snapshot_per_id:
+                continue
+            self.__snapshot_per_id[id(o)] = (
+                (r.get_object_nr(), r.get_generation_nr()),  # type: ignore[dict-item]
+                None,
+                {},
+            )
+            references_and_objects += [(r, o)]
+
+        # take a snapshot of every (resolved) object
+        for r, o in references_and_objects:
+            self.__snapshot_per_id.pop(id(o))
+            self.take_snapshot(indirect_reference=r, referenced_object=o)
+
+    def update(self, start_of_xref: int, xref: typing.List[reference]) -> None:
+        """
+        Take a new snapshot of every (resolved) indirect object, after an incremental update was appended to the file.
+
+        :param start_of_xref:   the byte offset of the (new) cross-reference section
+        :param xref:            the cross-reference table of the document
+        :return:                None
+        """
+        self.__start_of_xref = start_of_xref
+        self.__snapshot_per_id = {}
+        self.take_snapshot_of_all_references(xref)
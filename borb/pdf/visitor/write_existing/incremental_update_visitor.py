@@ -0,0 +1,385 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+A visitor that writes an existing PDF document as an incremental update.
+
+Rather than writing every object of the document again, this visitor copies the bytes of the
+file the document was read from (verbatim), and appends only the objects that were added or
+modified since. These objects are followed by a new cross-reference section, whose trailer
+points (using /Prev) to the cross-reference section of the original file.
+"""
+import pathlib
+import typing
+
+from borb.pdf.document import Document
+from borb.pdf.primitives import name, reference, stream, PDFType
+from borb.pdf.visitor.node_visitor import NodeVisitor
+from borb.pdf.visitor.write_existing.incremental_update_snapshot import (
+    IncrementalUpdateSnapshot,
+)
+from borb.pdf.visitor.write_new.document_visitor import DocumentVisitor
+from borb.pdf.visitor.write_new.write_new_visitor import WriteNewVisitor
+
+
+class IncrementalUpdateVisitor(WriteNewVisitor):
+    """
+    A visitor that writes an existing PDF document as an incremental update.
+
+    Rather than writing every object of the document again, this visitor copies the bytes of the
+    file the document was read from (verbatim), and appends only the objects that were added or
+    modified since. These objects are followed by a new cross-reference section, whose trailer
+    points (using /Prev) to the cross-reference section of the original file.
+
+    When the original file used a cross-reference stream, the new cross-reference section is a
+    cross-reference stream as well. Otherwise, it is a (plaintext) cross-reference table.
+    """
+
+    NUMBER_OF_BYTES_PER_COPY: int = 1024 * 1024
+
+    #
+    # CONSTRUCTOR
+    #
+
+    def __init__(self, root: typing.Optional[NodeVisitor] = None) -> None:
+        """
+        Initialize the IncrementalUpdateVisitor.
+
+        :param root: Optional root visitor to start the traversal of the document.
+        """
+        super().__init__(root=root)
+
+    #
+    # PRIVATE
+    #
+
+    def __copy_original_bytes(self, source: pathlib.Path) -> None:
+        with open(source, "rb") as source_file_handle:
+            while True:
+                bts: bytes = source_file_handle.read(
+                    IncrementalUpdateVisitor.NUMBER_OF_BYTES_PER_COPY
+                )
+                if len(bts) == 0:
+                    break
+                self._append_bytes_or_str(bts)
+
+    @staticmethod
+    def __get_new_references(
+        modified_references: typing.List[reference],
+        node: Document,
+        snapshot: IncrementalUpdateSnapshot,
+    ) -> typing.List[reference]:
+        from borb.pdf.visitor.write_new.build_xref_visitor import BuildXRefVisitor
+
+        # every object that already has an object number
+        xref: typing.List[reference] = node["XRef"]
+        ids_in_xref: typing.Set[int] = {
+            id(r.get_referenced_object())
+            for r in xref
+            if r.get_referenced_object() is not None
+        }
+
+        # the next available object number
+        next_object_nr: int = IncrementalUpdateVisitor.__get_next_object_nr(node)
+
+        # a new object can only be reached through the trailer, or through a modified object
+        # the (direct) objects that were read remain direct objects
+        roots_and_direct_objects: typing.List[
+            typing.Tuple[PDFType, typing.Dict[int, PDFType]]
+        ] = [(node["Trailer"], {})]
+        for r in modified_references:
+            o: PDFType = r.get_referenced_object()  # type: ignore[assignment]
+            roots_and_direct_objects += [(o, snapshot.get_direct_objects(o))]
+
+        new_references: typing.List[reference] = []
+        done_ids: typing.Set[int] = set()
+        for root, direct_object_per_id in roots_and_direct_objects:
+            stk: typing.List[typing.Tuple[PDFType, typing.Optional[PDFType]]] = [
+                (root, None)
+            ]
+            while len(stk) > 0:
+                m, p = stk.pop()
+
+                # IF the object is an (existing) indirect object
+                # THEN it is only written if it was modified
+                if m is not root and id(m) in ids_in_xref:
+                    continue
+
+                # avoid circles
+                if id(m) in done_ids:
+                    continue
+                done_ids.add(id(m))
+
+                # IF the object is a new object (that should not be a direct object)
+                # THEN get the next available reference
+                if (
+                    m is not root
+                    and id(m) not in direct_object_per_id
+                    and not BuildXRefVisitor.is_direct_object(node=m, parent=p)
+                ):
+                    new_references += [
+                        reference(
+                            object_nr=next_object_nr,
+                            generation_nr=0,
+                            id=id(m),
+                            referenced_object=m,
+                        )
+                    ]
+                    ids_in_xref.add(id(m))
+                    next_object_nr += 1
+
+                # handle dictionaries
+                if isinstance(m, dict):
+                    for k in sorted(m.keys(), reverse=True):
+                        v = dict.get(m, k)
+                        if isinstance(v, dict) or isinstance(v, list):
+                            stk += [(v, m)]
+
+                # handle lists
+                if isinstance(m, list):
+                    for v in list.__reversed__(m):
+                        if isinstance(v, dict) or isinstance(v, list):
+                            stk += [(v, m)]
+
+        # return
+        return new_references
+
+    @staticmethod
+    def __get_next_object_nr(node: Document) -> int:
+        size: PDFType = node["Trailer"].get("Size", 0)
+        return (
+            max(
+                [r.get_object_nr() for r in node["XRef"]]
+                + [(size - 1) if isinstance(size, int) else 0]
+            )
+            + 1
+        )
+
+    @staticmethod
+    def __get_xref_subsections(
+        entries: typing.List[typing.Tuple[int, int, int]]
+    ) -> typing.List[typing.List[typing.Tuple[int, int, int]]]:
+        # split the (sorted) entries in runs of consecutive object numbers
+        subsections: typing.List[typing.List[typing.Tuple[int, int, int]]] = []
+        for e in entries:
+            if len(subsections) > 0 and subsections[-1][-1][0] + 1 == e[0]:
+                subsections[-1] += [e]
+                continue
+            subsections += [[e]]
+        return subsections
+
+    @staticmethod
+    def __resolve_direct_content(
+        modified_references: typing.List[reference], node: Document
+    ) -> None:
+        # IF the Document was read lazily
+        # THEN the (modified) objects may hold references that were never resolved
+        # these are resolved (before anything is written) so that they are written as references
+        ids_in_xref: typing.Set[int] = {
+            id(r.get_referenced_object())
+            for r in node["XRef"]
+            if r.get_referenced_object() is not None
+        }
+        done_ids: typing.Set[int] = set()
+        for r in modified_references:
+            stk: typing.List[PDFType] = [r.get_referenced_object()]  # type: ignore[list-item]
+            while len(stk) > 0:
+                m: PDFType = stk.pop()
+
+                # avoid circles
+                if id(m) in done_ids:
+                    continue
+                done_ids.add(id(m))
+
+                # handle dictionaries
+                if isinstance(m, dict):
+                    for k, v in [x for x in dict.items(m)]:
+                        if isinstance(v, reference):
+                            m.get(k)
+                        elif isinstance(v, (dict, list)) and id(v) not in ids_in_xref:
+                            stk += [v]
+
+                # handle lists
+                if isinstance(m, list):
+                    for i, v in enumerate([x for x in list.__iter__(m)]):
+                        if isinstance(v, reference):
+                            m[i]
+                        elif isinstance(v, (dict, list)) and id(v) not in ids_in_xref:
+                            stk += [v]
+
+    def __write_xref_stream(
+        self,
+        node: Document,
+        entries: typing.List[typing.Tuple[int, int, int]],
+        start_of_xref: int,
+    ) -> None:
+        # the cross-reference stream contains its own entry
+        xref_tell: int = self.tell()
+        object_nr: int = IncrementalUpdateVisitor.__get_next_object_nr(node)
+        entries = entries + [(object_nr, 0, xref_tell)]
+
+        # determine the width of each field
+        w2: int = max(1, (max([e[2] for e in entries]).bit_length() + 7) // 8)
+        w3: int = max(1, (max([e[1] for e in entries]).bit_length() + 7) // 8)
+
+        # build the cross-reference stream
+        subsections = IncrementalUpdateVisitor.__get_xref_subsections(entries)
+        xref_stream: stream = stream(DocumentVisitor.get_trailer(node))
+        xref_stream[name("Type")] = name("XRef")
+        xref_stream[name("Size")] = object_nr + 1
+        xref_stream[name("Prev")] = start_of_xref
+        xref_stream[name("Index")] = [x for s in subsections for x in [s[0][0], len(s)]]
+        xref_stream[name("W")] = [1, w2, w3]
+        xref_stream[name("DecodedBytes")] = b"".join(
+            [
+                b"\x01" + e[2].to_bytes(w2, "big") + e[1].to_bytes(w3, "big")
+                for s in subsections
+                for e in s
+            ]
+        )
+
+        # write the cross-reference stream
+        self._append_bytes_or_str(f"{object_nr} 0 obj\n")
+        self.go_to_root_and_visit(xref_stream)
+        self._append_newline_to_output_stream()
+        self._append_bytes_or_str("endobj\n\n")
+
+        # write startxref
+        self._append_bytes_or_str(b"startxref\n")
+        self._append_bytes_or_str(f"{xref_tell}\n")
+        self._append_bytes_or_str(b"%%EOF\n")
+
+    def __write_xref_table(
+        self,
+        node: Document,
+        entries: typing.List[typing.Tuple[int, int, int]],
+        start_of_xref: int,
+    ) -> None:
+        # write xref
+        xref_tell: int = self.tell()
+        self._append_bytes_or_str(b"xref\n")
+        for s in IncrementalUpdateVisitor.__get_xref_subsections(entries):
+            self._append_bytes_or_str(f"{s[0][0]} {len(s)}\n")
+            for e in s:
+                self._append_bytes_or_str(f"{e[2]:010d} {e[1]:05d} n\r\n")
+
+        # write trailer
+        trailer: typing.Dict[name, PDFType] = DocumentVisitor.get_trailer(node)
+        trailer[name("Size")] = IncrementalUpdateVisitor.__get_next_object_nr(node)
+        trailer[name("Prev")] = start_of_xref
+        self._append_bytes_or_str(b"trailer\n")
+        self.go_to_root_and_visit(trailer)
+        self._append_bytes_or_str(b"\n")
+
+        # write startxref
+        self._append_bytes_or_str(b"startxref\n")
+        self._append_bytes_or_str(f"{xref_tell}\n")
+        self._append_bytes_or_str(b"%%EOF\n")
+
+    #
+    # PUBLIC
+    #
+
+    def visit(self, node: typing.Any) -> bool:
+        """
+        Traverse the PDF document tree using the visitor pattern.
+
+        This method is called when a node does not have a specialized handler.
+        Subclasses can override this method to provide default behavior or logging
+        for unsupported nodes. If any operation is performed on the node (e.g.,
+        writing or persisting), the method returns `True`. Otherwise, it returns
+        `False` to indicate that the visitor did not process the node.
+
+        :param node:    the node (PDFType) to be processed
+        :return:        True if the visitor processed the node False otherwise
+        """
+        # check whether this is a document
+        if not isinstance(node, Document):
+            return False
+        if "XRef" not in node:
+            return False
+        if "Trailer" not in node:
+            return False
+
+        # IF the Document was not read from a file (or that file has changed since)
+        # THEN it can not be written as an incremental update
+        snapshot: typing.Optional[IncrementalUpdateSnapshot] = (
+            node.get_incremental_update_snapshot()
+        )
+        if snapshot is None:
+            return False
+        source: typing.Optional[pathlib.Path] = snapshot.get_source()
+        if source is None:
+            return False
+        start_of_xref: int = snapshot.get_start_of_xref()
+
+        # IF the destination does not hold the original bytes (yet)
+        # THEN copy them (verbatim)
+        # ELSE the incremental update is appended to the original file
+        is_appending: bool = self.tell() != 0
+        if not is_appending:
+            self.__copy_original_bytes(source)
+        assert self.tell() == source.stat().st_size
+
+        # determine which objects need to be written
+        modified_references: typing.List[reference] = snapshot.get_modified_references(
+            node["XRef"]
+        )
+        IncrementalUpdateVisitor.__resolve_direct_content(
+            modified_references=modified_references, node=node
+        )
+        new_references: typing.List[reference] = (
+            IncrementalUpdateVisitor.__get_new_references(
+                modified_references=modified_references,
+                node=node,
+                snapshot=snapshot,
+            )
+        )
+        node["XRef"] += new_references
+
+        # IF nothing was added or modified
+        # THEN there is nothing to append
+        if len(modified_references) == 0 and len(new_references) == 0:
+            return True
+
+        # write the (added and modified) objects
+        from borb.pdf.visitor.write_new.document_visitor import ReferencedObjectType
+
+        self._append_newline_to_output_stream()
+        entries: typing.List[typing.Tuple[int, int, int]] = []
+        for r in sorted(
+            modified_references + new_references, key=lambda x: x.get_object_nr()
+        ):
+            r2: reference = reference(
+                object_nr=r.get_object_nr(),
+                generation_nr=r.get_generation_nr(),
+                byte_offset=self.tell(),
+                referenced_object=r.get_referenced_object(),
+            )
+            obj = ReferencedObjectType(
+                reference=r2,  # type: ignore[call-arg]
+                object=r2.get_referenced_object(),  # type: ignore[call-arg]
+            )
+            self.go_to_root_and_visit(obj)  # type: ignore[arg-type]
+            entries += [(r2.get_object_nr(), r2.get_generation_nr(), r2.get_byte_offset())]  # type: ignore[list-item]
+
+        # write the cross-reference section (of the same kind as the original)
+        with open(source, "rb") as source_file_handle:
+            source_file_handle.seek(start_of_xref)
+            is_xref_table: bool = source_file_handle.read(4) == b"xref"
+        xref_tell: int = self.tell()
+        if is_xref_table:
+            self.__write_xref_table(
+                node=node, entries=entries, start_of_xref=start_of_xref
+            )
+        else:
+            self.__write_xref_stream(
+                node=node, entries=entries, start_of_xref=start_of_xref
+            )
+
+        # IF the incremental update was appended to the original file
+        # THEN the objects that were written are no longer modified (compared to that file)
+        if is_appending:
+            snapshot.update(start_of_xref=xref_tell, xref=node["XRef"])
+
+        # return
+        return True
@@ -52,6 +52,7 @@ class BuildXRefVisitor(WriteNewVisitor):
 
         id_to_parent_dict: typing.Dict[int, PDFType] = {}
         xref: typing.List[reference] = []
+        ids_in_xref: typing.Set[int] = set()
         stk: typing.List[PDFType] = [document]
         while len(stk) > 0:
 
@@ -60,7 +61,7 @@ class BuildXRefVisitor(WriteNewVisitor):
 
             # IF the object is already in the XREF
             # THEN skip
-            if any([id(x.get_referenced_object()) == id(m) for x in xref]):
+            if id(m) in ids_in_xref:
                 continue
 
             # handle parent link for dictionaries
@@ -78,7 +79,7 @@ class BuildXRefVisitor(WriteNewVisitor):
 
             # IF the object should be a direct object
             # THEN skip
-            if BuildXRefVisitor.__is_direct_object(m, p):
+            if BuildXRefVisitor.is_direct_object(node=m, parent=p):
                 continue
 
             # IF the object is the xref
@@ -93,126 +94,135 @@ class BuildXRefVisitor(WriteNewVisitor):
 
             # IF the object is not a direct object
             # THEN get the next available reference
+            # (object numbers are handed out in order, starting at 1)
             if isinstance(m, list) or isinstance(m, dict):
-                max_obj_nr = max(
-                    [xref_entry.get_object_nr() for xref_entry in xref] + [0]
-                )
                 xref += [
                     reference(
-                        object_nr=max_obj_nr + 1,
+                        object_nr=len(xref) + 1,
                         generation_nr=0,
                         id=id(m),
                         referenced_object=m,
                     )
                 ]
+                ids_in_xref.add(id(m))
 
         # return
         return xref
 
+    #
+    # PUBLIC
+    #
+
     @staticmethod
-    def __is_direct_object(n: PDFType, p: typing.Optional[PDFType]) -> bool:
+    def is_direct_object(node: PDFType, parent: typing.Optional[PDFType]) -> bool:
+        """
+        Determine whether an object is written as a direct object (rather than an indirect one).
 
+        :param node:    the object
+        :param parent:  the (direct) parent of the object, or None
+        :return:        True if the object is written as a direct object, False otherwise
+        """
         # /
-        if isinstance(n, Document):
+        if isinstance(node, Document):
             return True
 
         # /Trailer
         if (
-            p is not None
-            and isinstance(p, Document)
-            and isinstance(n, dict)
-            and "Root" in n
-            and "Info" in n
+            parent is not None
+            and isinstance(parent, Document)
+            and isinstance(node, dict)
+            and "Root" in node
+            and "Info" in node
         ):
             return True
 
         # /Trailer /ID
         if (
-            p is not None
-            and isinstance(p, dict)
-            and "ID" in p
-            and p["ID"] == n
-            and isinstance(n, list)
-            and len(n) == 2
+            parent is not None
+            and isinstance(parent, dict)
+            and "ID" in parent
+            and parent["ID"] == node
+            and isinstance(node, list)
+            and len(node) == 2
         ):
             return True
 
         # /Trailer /Root /Pages /Kids
         if (
-            p is not None
-            and isinstance(p, dict)
-            and "Type" in p
-            and p["Type"] == "Pages"
-            and "Kids" in p
-            and p["Kids"] == n
+            parent is not None
+            and isinstance(parent, dict)
+            and "Type" in parent
+            and parent["Type"] == "Pages"
+            and "Kids" in parent
+            and parent["Kids"] == node
         ):
             return True
 
         # /Trailer /Root /MarkInfo
         if (
-            p is not None
-            and isinstance(p, dict)
-            and "MarkInfo" in p
-            and p["MarkInfo"] == n
+            parent is not None
+            and isinstance(parent, dict)
+            and "MarkInfo" in parent
+            and parent["MarkInfo"] == node
         ):
             return True
 
         # /Trailer /Root /StructTreeRoot /K
         if (
-            p is not None
-            and isinstance(p, dict)
-            and "Type" in p
-            and p["Type"] == "StructTreeRoot"
-            and "K" in p
-            and p["K"] == n
+            parent is not None
+            and isinstance(parent, dict)
+            and "Type" in parent
+            and parent["Type"] == "StructTreeRoot"
+            and "K" in parent
+            and parent["K"] == node
         ):
             return True
 
         # /Trailer /Root /Pages /Kids <index> /CropBox
         if (
-            p is not None
-            and isinstance(p, dict)
-            and "Type" in p
-            and p["Type"] == "Page"
-            and "CropBox" in p
-            and p["CropBox"] == n
+            parent is not None
+            and isinstance(parent, dict)
+            and "Type" in parent
+            and parent["Type"] == "Page"
+            and "CropBox" in parent
+            and parent["CropBox"] == node
         ):
             return True
 
         # /Trailer /Root /Pages /Kids <index> /MediaBox
         if (
-            p is not None
-            and isinstance(p, dict)
-            and "Type" in p
-            and p["Type"] == "Page"
-            and "MediaBox" in p
-            and p["MediaBox"] == n
+            parent is not None
+            and isinstance(parent, dict)
+            and "Type" in parent
+            and parent["Type"] == "Page"
+            and "MediaBox" in parent
+            and parent["MediaBox"] == node
         ):
             return True
 
         # /Trailer /Root /Pages /Kids <index> /ProcSet
         if (
-            p is not None
-            and isinstance(p, dict)
-            and "Type" in p
-            and p["Type"] == "Page"
-            and "ProcSet" in p
-            and p["ProcSet"] == n
+            parent is not None
+            and isinstance(parent, dict)
+            and "Type" in parent
+            and parent["Type"] == "Page"
+            and "ProcSet" in parent
+            and parent["ProcSet"] == node
         ):
             return True
 
         # lists of 4 (primitive) elements or fewer
         if (
-            n is not None
-            and isinstance(n, list)
-            and len(n) <= 4
+            node is not None
+            and isinstance(node, list)
+            and len(node) <= 4
             and all(
                 [
                     isinstance(x, int)
                     or isinstance(x, float)
                     or isinstance(x, bool)
                     or isinstance(x, reference)
-                    for x in n
+                    for x in node
                 ]
             )
         ):
@@ -221,10 +231,6 @@ class BuildXRefVisitor(WriteNewVisitor):
         # default
         return False
 
-    #
-    # PUBLIC
-    #
-
     def visit(self, node: typing.Any) -> bool:
         """
         Traverse the PDF document tree using the visitor pattern.
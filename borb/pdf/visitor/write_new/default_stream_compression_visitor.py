@@ -70,6 +70,12 @@ class DefaultStreamCompressionVisitor(WriteNewVisitor):
             obj = ref.get_referenced_object()
             if not isinstance(obj, stream):
                 continue
+
+            # IF the bytes are a view on a memory-mapped file
+            # THEN copy them (without invalidating /DecodedBytes)
+            if isinstance(obj.get("Bytes"), memoryview):
+                dict.__setitem__(obj, name("Bytes"), obj.get("Bytes").tobytes())  # type: ignore[union-attr]
+
             if "DecodedBytes" not in obj:
                 continue
             if (
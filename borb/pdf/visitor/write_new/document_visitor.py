@@ -10,8 +10,10 @@ elements of the document are correctly written and formatted in accordance with
 import collections
 import typing
 
+from borb.pdf.conformance import Conformance
 from borb.pdf.document import Document
-from borb.pdf.primitives import reference
+from borb.pdf.primitives import name, reference, stream
+from borb.pdf.visitor.node_visitor import NodeVisitor
 from borb.pdf.visitor.write_new.write_new_visitor import WriteNewVisitor
 
 ReferencedObjectType = collections.namedtuple(
@@ -28,18 +30,240 @@ class DocumentVisitor(WriteNewVisitor):
     elements of the document are correctly written and formatted in accordance with PDF standards.
     """
 
+    MAX_NUMBER_OF_OBJECTS_PER_OBJECT_STREAM: int = 100
+
     #
     # CONSTRUCTOR
     #
 
+    def __init__(
+        self,
+        root: typing.Optional[NodeVisitor] = None,
+        use_object_streams: bool = False,
+    ) -> None:
+        """
+        Initialize the DocumentVisitor.
+
+        By default, every indirect object is written as a (plaintext) 'n 0 obj ... endobj',
+        and the document ends with a (plaintext) cross-reference table and trailer.
+        When object streams are used, every (non-stream) object is packed into a (compressed) object stream,
+        and the document ends with a (compressed) cross-reference stream instead (PDF 1.5).
+
+        :param root:                The root visitor, used to delegate the writing of (nested) objects.
+        :param use_object_streams:  Whether to use object streams and a cross-reference stream.
+        """
+        super().__init__(root=root)
+        self.__use_object_streams: bool = use_object_streams
+
     #
     # PRIVATE
     #
 
+    def __write_object_stream(
+        self, object_nr: int, xref_entries: typing.List[reference]
+    ) -> reference:
+
+        # serialize every object (and keep track of its offset)
+        header: typing.List[str] = []
+        objects_as_bytes: typing.List[bytes] = []
+        offset: int = 0
+        for xref_entry in xref_entries:
+            self._push_output_stream()
+            self.go_to_root_and_visit(xref_entry.get_referenced_object())
+            object_as_bytes: bytes = self._pop_output_stream()
+            header += [f"{xref_entry.get_object_nr()} {offset}"]
+            objects_as_bytes += [object_as_bytes]
+            offset += len(object_as_bytes) + 1
+        header_as_bytes: bytes = (" ".join(header) + "\n").encode("latin1")
+
+        # build the object stream
+        object_stream: stream = stream(
+            {
+                name("Type"): name("ObjStm"),
+                name("N"): len(xref_entries),
+                name("First"): len(header_as_bytes),
+                name("DecodedBytes"): header_as_bytes + b"\n".join(objects_as_bytes),
+            }
+        )
+
+        # write the object stream
+        object_stream_reference: reference = reference(
+            object_nr=object_nr,
+            generation_nr=0,
+            byte_offset=self.tell(),
+            referenced_object=object_stream,
+        )
+        obj = ReferencedObjectType(
+            reference=object_stream_reference,  # type: ignore[call-arg]
+            object=object_stream,  # type: ignore[call-arg]
+        )
+        self.go_to_root_and_visit(obj)  # type: ignore[arg-type]
+
+        # return
+        return object_stream_reference
+
+    def __write_objects_and_xref_stream(self, node: Document) -> None:
+
+        # the (type, field 2, field 3) of every entry in the cross-reference stream
+        entry_per_object_nr: typing.Dict[int, typing.Tuple[int, int, int]] = {
+            0: (0, 0, 65535)
+        }
+
+        # write_new objects
+        # (streams are written as before, everything else is packed in object streams)
+        xref: typing.List[reference] = node["XRef"]
+        xref_entries_to_compress: typing.List[reference] = []
+        for i, xref_entry in enumerate(xref):
+
+            # IF we are handling the special '0 65535 R'
+            # THEN skip
+            if (
+                xref_entry.get_object_nr() == 0
+                and xref_entry.get_generation_nr() == 65535
+            ):
+                continue
+
+            # IF the xref entry is not in use (or does not have an associated object)
+            # THEN don't write it
+            if not xref_entry.is_in_use() or xref_entry.get_referenced_object() is None:
+                entry_per_object_nr[xref_entry.get_object_nr()] = (
+                    0,
+                    0,
+                    xref_entry.get_generation_nr(),
+                )
+                continue
+
+            # IF the object can be stored in an object stream
+            # THEN do so (later)
+            if xref_entry.get_generation_nr() == 0 and not isinstance(
+                xref_entry.get_referenced_object(), stream
+            ):
+                xref_entries_to_compress += [xref_entry]
+                continue
+
+            # start obj
+            xref[i] = reference(
+                object_nr=xref_entry.get_object_nr(),
+                generation_nr=xref_entry.get_generation_nr(),
+                byte_offset=self.tell(),
+                referenced_object=xref_entry.get_referenced_object(),
+                id=xref_entry.get_id(),
+            )
+
+            # wrap in ReferencedObjectType
+            obj = ReferencedObjectType(
+                reference=xref[i],  # type: ignore[call-arg]
+                object=xref[i].get_referenced_object(),  # type: ignore[call-arg]
+            )
+
+            # recurse
+            self.go_to_root_and_visit(obj)  # type: ignore[arg-type]
+            entry_per_object_nr[xref_entry.get_object_nr()] = (
+                1,
+                xref[i].get_byte_offset() or 0,
+                xref_entry.get_generation_nr(),
+            )
+
+        # write_new object streams
+        # (the object streams, and the cross-reference stream, are numbered after all other objects)
+        next_object_nr: int = (
+            max([xref_entry.get_object_nr() for xref_entry in xref] + [0]) + 1
+        )
+        n: int = DocumentVisitor.MAX_NUMBER_OF_OBJECTS_PER_OBJECT_STREAM
+        for i in range(0, len(xref_entries_to_compress), n):
+            object_stream_reference: reference = self.__write_object_stream(
+                object_nr=next_object_nr,
+                xref_entries=xref_entries_to_compress[i : i + n],
+            )
+            entry_per_object_nr[next_object_nr] = (
+                1,
+                object_stream_reference.get_byte_offset() or 0,
+                0,
+            )
+            for j, xref_entry in enumerate(xref_entries_to_compress[i : i + n]):
+                entry_per_object_nr[xref_entry.get_object_nr()] = (
+                    2,
+                    next_object_nr,
+                    j,
+                )
+            next_object_nr += 1
+
+        # build the cross-reference stream (which contains its own entry)
+        xref_tell: int = self.tell()
+        entry_per_object_nr[next_object_nr] = (1, xref_tell, 0)
+        size: int = max(entry_per_object_nr.keys()) + 1
+        w2: int = max(
+            1,
+            (max([e[1] for e in entry_per_object_nr.values()]).bit_length() + 7) // 8,
+        )
+        w3: int = max(
+            1,
+            (max([e[2] for e in entry_per_object_nr.values()]).bit_length() + 7) // 8,
+        )
+        xref_stream_bytes: bytes = b"".join(
+            [
+                bytes([e[0]]) + e[1].to_bytes(w2, "big") + e[2].to_bytes(w3, "big")
+                for e in [entry_per_object_nr.get(i, (0, 0, 0)) for i in range(0, size)]
+            ]
+        )
+
+        # the cross-reference stream takes on the role of the trailer
+        xref_stream: stream = stream(DocumentVisitor.get_trailer(node))
+        xref_stream[name("Type")] = name("XRef")
+        xref_stream[name("Size")] = size
+        xref_stream[name("W")] = [1, w2, w3]
+        xref_stream[name("DecodedBytes")] = xref_stream_bytes
+
+        # write_new the cross-reference stream
+        self._append_bytes_or_str(f"{next_object_nr} 0 obj\n")
+        self.go_to_root_and_visit(xref_stream)
+        self._append_newline_to_output_stream()
+        self._append_bytes_or_str("endobj\n\n")
+
+        # write_new startxref
+        self._append_bytes_or_str(b"startxref\n")
+
+        # write_new
+        self._append_bytes_or_str(f"{xref_tell}\n")
+
+        # write_new EOF
+        self._append_bytes_or_str(b"%%EOF\n")
+
     #
     # PUBLIC
     #
 
+    @staticmethod
+    def get_trailer(node: Document) -> typing.Dict[name, typing.Any]:
+        """
+        Return the trailer of a Document, without the keys that belong to its (original) cross-reference section.
+
+        The (original) trailer may be the dictionary of a cross-reference stream.
+        Keys such as /Filter, /Index, /Prev, /Size and /W describe that cross-reference section,
+        and are left out, so that they can be (re)computed for the cross-reference section being written.
+
+        :param node:    the Document
+        :return:        the trailer (without the keys of its cross-reference section)
+        """
+        return {
+            name(k): v
+            for k, v in node["Trailer"].items()
+            if k
+            not in [
+                "Bytes",
+                "DecodeParms",
+                "DecodedBytes",
+                "Filter",
+                "Index",
+                "Length",
+                "Prev",
+                "Size",
+                "Type",
+                "W",
+                "XRefStm",
+            ]
+        }
+
     def visit(self, node: typing.Any) -> bool:
         """
         Traverse the PDF document tree using the visitor pattern.
@@ -73,6 +297,16 @@ class DocumentVisitor(WriteNewVisitor):
         self._append_bytes_or_str(b"\n")
         # fmt: on
 
+        # IF object streams are to be used (and the conformance level allows it)
+        # THEN write the objects (and the cross-reference stream) accordingly
+        # (PDF/A-1 is based on PDF 1.4, which does not know object streams)
+        if self.__use_object_streams and node.get_conformance_at_create() not in [
+            Conformance.PDF_A_1A,
+            Conformance.PDF_A_1B,
+        ]:
+            self.__write_objects_and_xref_stream(node)
+            return True
+
         # write_new objects
         xref: typing.List[reference] = node["XRef"]
         for i, xref_entry in enumerate(xref):
@@ -122,18 +356,30 @@ class DocumentVisitor(WriteNewVisitor):
             self.go_to_root_and_visit(obj)  # type: ignore[arg-type]
 
         # write_new xref
+        # (the special '0 65535 R' is not in the XRef of a new Document,
+        # but it is in the XRef of a Document that was read from a cross-reference stream)
+        xref_entries: typing.List[reference] = [
+            x for x in xref if x.get_object_nr() != 0 or x.get_generation_nr() != 65535
+        ]
         xref_tell: int = self.tell()
         self._append_bytes_or_str(b"xref\n")
-        self._append_bytes_or_str(f"0 {len(xref)+1}\n")
+        self._append_bytes_or_str(f"0 {len(xref_entries)+1}\n")
         self._append_bytes_or_str("0000000000 65535 f\r\n")
-        for xref_entry in xref:
+        for xref_entry in xref_entries:
+            # IF the xref entry is not in use
+            # THEN mark it as free
+            if not xref_entry.is_in_use():
+                self._append_bytes_or_str("0000000000 00000 f\r\n")
+                continue
             self._append_bytes_or_str(
                 f"{xref_entry.get_byte_offset():010d} 00000 n\r\n"
             )
 
         # write_new trailer
+        trailer: typing.Dict[name, typing.Any] = DocumentVisitor.get_trailer(node)
+        trailer[name("Size")] = len(xref_entries) + 1
         self._append_bytes_or_str(b"trailer\n")
-        self.go_to_root_and_visit(node["Trailer"])
+        self.go_to_root_and_visit(trailer)
         self._append_bytes_or_str(b"\n")
 
         # write_new xref
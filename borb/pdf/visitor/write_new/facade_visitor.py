@@ -12,6 +12,7 @@ section is handled properly, streamlining the PDF writing process.
 This class serves as a central access point, facilitating easier extension or
 modification of document writing behavior by coordinating multiple visitors.
 """
+import io
 import typing
 
 from borb.pdf.primitives import PDFType, reference
@@ -39,7 +40,13 @@ class FacadeVisitor(WriteNewVisitor):
     # CONSTRUCTOR
     #
 
-    def __init__(self):
+    def __init__(
+        self,
+        destination: typing.Optional[typing.BinaryIO] = None,
+        use_object_streams: bool = False,
+        incremental_update: bool = False,
+        number_of_bytes_written: int = 0,
+    ):
         """
         Initialize the FacadeVisitor object to manage and coordinate multiple WriteNewVisitor instances.
 
@@ -49,6 +56,16 @@ class FacadeVisitor(WriteNewVisitor):
         initialization process enables the `FacadeVisitor` to serve as the central
         controller for document writing and persistence, ensuring that all sections
         of the PDF are handled by the appropriate visitor.
+
+        :param destination: The (binary) file handle the PDF content is streamed to, as it is written.
+                            When no destination is given, the content is kept in an internal buffer,
+                            and can be retrieved (afterwards) by calling `bytes`.
+        :param use_object_streams:  Whether to pack (non-stream) objects into compressed object streams,
+                                    and to write a cross-reference stream (rather than a cross-reference table).
+        :param incremental_update:  Whether to write (a Document that was read) as an incremental update,
+                                    appending only the objects that were added or modified to the original bytes.
+        :param number_of_bytes_written: The number of bytes the destination already holds (of this PDF).
+                                        This is used when an incremental update is appended to the original file.
         """
         super().__init__()
         from borb.pdf.document import Document
@@ -56,6 +73,7 @@ class FacadeVisitor(WriteNewVisitor):
         self.__document: typing.Optional[Document] = None
         # imports
         # fmt: off
+        from borb.pdf.visitor.node_visitor import NodeVisitor
         from borb.pdf.visitor.validate.validation_visitor import ValidationVisitor
         from borb.pdf.visitor.write_new.bool_visitor import BoolVisitor
         from borb.pdf.visitor.write_new.build_xref_visitor import BuildXRefVisitor
@@ -76,11 +94,12 @@ class FacadeVisitor(WriteNewVisitor):
         from borb.pdf.visitor.write_new.replace_str_by_name_visitor import ReplaceStrByNameVisitor
         from borb.pdf.visitor.write_new.stream_visitor import StreamVisitor
         from borb.pdf.visitor.write_new.str_visitor import StrVisitor
-        from borb.pdf.visitor.write_new.write_new_visitor import WriteNewVisitor
+        from borb.pdf.visitor.write_existing.incremental_update_visitor import IncrementalUpdateVisitor
         # fmt: on
 
-        # build typing.List[WriteNewVisitor]
-        self.__visitors: typing.List[WriteNewVisitor] = [  # type: ignore[annotation-unchecked]
+        # build typing.List[NodeVisitor]
+        # (the ValidationVisitor is a NodeVisitor, not a WriteNewVisitor)
+        self.__visitors: typing.List[NodeVisitor] = [  # type: ignore[annotation-unchecked]
             # PDF/A
             InjectMarkInfoVisitor(root=self),
             InjectsRGBOutputIntentVisitor(root=self),
@@ -94,7 +113,7 @@ class FacadeVisitor(WriteNewVisitor):
             # Conformance
             ValidationVisitor(root=self),
             # Types (prio)
-            DocumentVisitor(root=self),
+            DocumentVisitor(root=self, use_object_streams=use_object_streams),
             InjectVersionAsCommentVisitor(root=self),
             ReferencedObjectVisitor(root=self),
             # Types
@@ -109,14 +128,86 @@ class FacadeVisitor(WriteNewVisitor):
             StrVisitor(root=self),
         ]
 
-        self.__destination: bytes = b""  # type: ignore[annotation-unchecked]
+        # IF the Document is written as an incremental update
+        # THEN the IncrementalUpdateVisitor takes precedence (over the PDF/A and XREF visitors)
+        if incremental_update:
+            self.__visitors.insert(0, IncrementalUpdateVisitor(root=self))
+
+        # the PDF content is written (only ever appended) to the destination,
+        # keeping track of the number of bytes (for the xref) and the last byte written
+        self.__buffer: typing.Optional[io.BytesIO] = None  # type: ignore[annotation-unchecked]
+        if destination is None:
+            self.__buffer = io.BytesIO()
+            destination = self.__buffer
+        self.__destination: typing.BinaryIO = destination  # type: ignore[annotation-unchecked]
+        self.__number_of_bytes_written: int = number_of_bytes_written  # type: ignore[annotation-unchecked]
+        self.__last_byte_written: typing.Optional[int] = None  # type: ignore[annotation-unchecked]
+        self.__destination_stack: typing.List[typing.Tuple[typing.BinaryIO, int, typing.Optional[int]]] = []  # type: ignore[annotation-unchecked]
+
+        # the id (of the referenced object) -> index (in the XRef) map, and the XRef it was built from
+        # (the index is kept, rather than the reference, since references are replaced as they are written)
+        self.__reference_index_per_id: typing.Dict[int, int] = {}  # type: ignore[annotation-unchecked]
+        self.__xref_used_for_reference_index_per_id: typing.Optional[typing.List[reference]] = None  # type: ignore[annotation-unchecked]
+        self.__xref_length_used_for_reference_index_per_id: int = 0  # type: ignore[annotation-unchecked]
 
     #
     # PRIVATE
     #
 
+    def __update_reference_index_per_id(self, xref: typing.List[reference]) -> None:
+        # IF the map was built from this XRef (and the XRef did not change since)
+        # THEN return
+        if (
+            self.__xref_used_for_reference_index_per_id is xref
+            and self.__xref_length_used_for_reference_index_per_id == len(xref)
+        ):
+            return
+
+        # build the map (keeping the first reference to each object)
+        self.__reference_index_per_id = {}
+        for i, x in enumerate(xref):
+            if not isinstance(x, reference):
+                continue
+            if x.get_referenced_object() is None:
+                continue
+            self.__reference_index_per_id.setdefault(id(x.get_referenced_object()), i)
+        self.__xref_used_for_reference_index_per_id = xref
+        self.__xref_length_used_for_reference_index_per_id = len(xref)
+
     def _append_bytes(self, b: bytes) -> "FacadeVisitor":
-        self.__destination += b
+        if len(b) == 0:
+            return self
+        self.__destination.write(b)
+        self.__number_of_bytes_written += len(b)
+        self.__last_byte_written = b[-1]
+        return self
+
+    def _get_last_byte(self) -> typing.Optional[int]:
+        return self.__last_byte_written
+
+    def _pop_destination(self) -> bytes:
+        # return the bytes written since _push_destination (and restore the previous destination)
+        assert len(self.__destination_stack) > 0
+        bts: bytes = self.__destination.getvalue()  # type: ignore[attr-defined]
+        (
+            self.__destination,
+            self.__number_of_bytes_written,
+            self.__last_byte_written,
+        ) = self.__destination_stack.pop()
+        return bts
+
+    def _push_destination(self) -> "FacadeVisitor":
+        # write to a (new, empty) buffer until _pop_destination is called
+        self.__destination_stack += [
+            (
+                self.__destination,
+                self.__number_of_bytes_written,
+                self.__last_byte_written,
+            )
+        ]
+        self.__destination = io.BytesIO()
+        self.__number_of_bytes_written = 0
+        self.__last_byte_written = None
         return self
 
     #
@@ -132,9 +223,15 @@ class FacadeVisitor(WriteNewVisitor):
         includes all elements processed by the visitor and is suitable for saving
         or further processing, such as writing to a file or sending over a network.
 
+        The bytes are only kept if the `FacadeVisitor` was created without a destination.
+        When the PDF content is streamed to a destination, it is not kept in memory.
+
         :return: A `bytes` object containing the written PDF content.
         """
-        return self.__destination
+        assert (
+            self.__buffer is not None
+        ), "The PDF content was streamed to a destination, and was not kept in memory"
+        return self.__buffer.getvalue()
 
     def get_reference(self, node: PDFType) -> PDFType:
         """
@@ -150,13 +247,15 @@ class FacadeVisitor(WriteNewVisitor):
         """
         if self.__document is None:
             return node
+
+        # look up the reference using the id -> index map
+        # (which is built once, as soon as the XRef has been built)
         xref = self.__document.get("XRef", [])
-        matching_reference: typing.Optional[reference] = next(
-            iter([x for x in xref if id(x.get_referenced_object()) == id(node)]), None
-        )
-        if matching_reference is None:
+        self.__update_reference_index_per_id(xref)
+        i: typing.Optional[int] = self.__reference_index_per_id.get(id(node), None)
+        if i is None:
             return node
-        return matching_reference
+        return xref[i]
 
     def tell(self) -> int:
         """
@@ -169,7 +268,7 @@ class FacadeVisitor(WriteNewVisitor):
 
         :return: The current position in the PDF byte stream as an integer.
         """
-        return len(self.__destination)
+        return self.__number_of_bytes_written
 
     def visit(self, node: typing.Any) -> bool:
         """
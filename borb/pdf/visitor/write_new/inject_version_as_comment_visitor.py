@@ -97,7 +97,7 @@ class InjectVersionAsCommentVisitor(WriteNewVisitor):
 
         # IF we are in the first 1Kb
         # THEN do nothing
-        N: int = len(self.bytes())
+        N: int = self.tell()
         if N < 1024:
             return False
 
@@ -125,6 +125,10 @@ class InjectVersionAsCommentVisitor(WriteNewVisitor):
 
         self.__has_been_used = True
 
+        # IF the comment was written in front of the object
+        # THEN the byte offset of the object (in the xref) needs to move as well
+        node.reference._reference__byte_offset = self.tell()  # type: ignore[attr-defined]
+
         # call root
         super().go_to_root_and_visit(node=node)
 
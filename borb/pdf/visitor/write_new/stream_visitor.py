@@ -60,6 +60,11 @@ class StreamVisitor(WriteNewVisitor):
         # deflate the bytes
         deflated_bytes: bytes = node["Bytes"]
 
+        # IF the bytes are a view on a memory-mapped file
+        # THEN copy them
+        if isinstance(deflated_bytes, memoryview):
+            deflated_bytes = deflated_bytes.tobytes()
+
         # update /Length
         node["Length"] = len(deflated_bytes)
 
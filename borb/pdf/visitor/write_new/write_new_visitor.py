@@ -98,12 +98,13 @@ class WriteNewVisitor(NodeVisitor):
 
         # IF we have not yet persisted any bytes
         # THEN the space is not needed
-        if len(root.bytes()) == 0:
+        last_byte: typing.Optional[int] = root._get_last_byte()
+        if last_byte is None:
             return self
 
         # IF the last character persisted was a newline
         # THEN newline is not needed
-        if root.bytes()[-1] == b"\n"[0]:
+        if last_byte == b"\n"[0]:
             return self
 
         root._append_bytes(b"\n")
@@ -125,17 +126,51 @@ class WriteNewVisitor(NodeVisitor):
 
         # IF we have not yet persisted any bytes
         # THEN the space is not needed
-        if len(root.bytes()) == 0:
+        last_byte: typing.Optional[int] = root._get_last_byte()
+        if last_byte is None:
             return self
 
         # IF the last character persisted was a newline
         # THEN newline is not needed
-        if root.bytes()[-1] == b" "[0]:
+        if last_byte == b" "[0]:
             return self
 
         root._append_bytes(b" ")
         return self
 
+    def _pop_output_stream(self) -> bytes:
+        # IF the root is None
+        # THEN return
+        root: typing.Optional[NodeVisitor] = self.__root
+        if root is None:
+            return b""
+
+        # IF the root is not a FacadeVisitor
+        # THEN return
+        from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+
+        if not isinstance(root, FacadeVisitor):
+            return b""
+
+        return root._pop_destination()
+
+    def _push_output_stream(self) -> "WriteNewVisitor":
+        # IF the root is None
+        # THEN return
+        root: typing.Optional[NodeVisitor] = self.__root
+        if root is None:
+            return self
+
+        # IF the root is not a FacadeVisitor
+        # THEN return
+        from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+
+        if not isinstance(root, FacadeVisitor):
+            return self
+
+        root._push_destination()
+        return self
+
     #
     # PUBLIC
     #
@@ -0,0 +1,113 @@
+import typing
+import unittest
+
+from borb.pdf.primitives import PDFType, hexstr, name
+from borb.pdf.toolkit.source.operator.content_stream_lexer import lex_content_stream
+
+
+class TestContentStreamLexer(unittest.TestCase):
+
+    def test_lex_numbers_and_names(self):
+        tokens: typing.List[typing.Tuple[typing.List[PDFType], str]] = [
+            x for x in lex_content_stream(b"BT /F1 12 Tf -.5 0.25 +3 4. Td ET")
+        ]
+        assert tokens == [
+            ([], "BT"),
+            ([name("/F1"), 12], "Tf"),
+            ([-0.5, 0.25, 3, 4.0], "Td"),
+            ([], "ET"),
+        ]
+
+    def test_lex_strings(self):
+        tokens: typing.List[typing.Tuple[typing.List[PDFType], str]] = [
+            x
+            for x in lex_content_stream(
+                b"(a\\)b) Tj (a(b)c) Tj (a\\\\) Tj <48 65 6C6C6F> Tj (x) ' 1 2 (y) \""
+            )
+        ]
+        assert tokens == [
+            (["a\\)b"], "Tj"),
+            (["a(b)c"], "Tj"),
+            (["a\\\\"], "Tj"),
+            ([hexstr("48656C6C6F")], "Tj"),
+            (["x"], "'"),
+            ([1, 2, "y"], '"'),
+        ]
+
+    def test_lex_nested_arrays_and_dictionaries(self):
+        tokens: typing.List[typing.Tuple[typing.List[PDFType], str]] = [
+            x
+            for x in lex_content_stream(
+                b"[(a) -10 [(b)] (c)] TJ /Span <</MCID 0 /A <</B [1 2] /C true>>>> BDC"
+            )
+        ]
+        assert tokens == [
+            ([["a", -10, ["b"], "c"]], "TJ"),
+            (
+                [
+                    name("/Span"),
+                    {
+                        name("/MCID"): 0,
+                        name("/A"): {name("/B"): [1, 2], name("/C"): True},
+                    },
+                ],
+                "BDC",
+            ),
+        ]
+
+    def test_lex_comments_and_inline_images(self):
+        tokens: typing.List[typing.Tuple[typing.List[PDFType], str]] = [
+            x
+            for x in lex_content_stream(
+                b"q % 1 0 0 1 0 0 cm\nBI /W 2 /H 1 /BPC 8 /CS /G ID \x00EI\xff EI Q"
+            )
+        ]
+        assert tokens == [
+            ([], "q"),
+            ([], "BI"),
+            (
+                [
+                    name("/W"),
+                    2,
+                    name("/H"),
+                    1,
+                    name("/BPC"),
+                    8,
+                    name("/CS"),
+                    name("/G"),
+                ],
+                "ID",
+            ),
+            ([], "EI"),
+            ([], "Q"),
+        ]
+
+    def test_lex_content_stream_in_chunks(self):
+        content_stream_bytes: bytes = (
+            b"BT /F1 12 Tf [(a\\)b) -10 <48 65 6C6C6F>] TJ ET % comment\n"
+            b"BI /W 2 /H 2 ID \x00EI\xff\x01 EI Q <</A [1 2]>> BDC -.5 +3 4. Td"
+        )
+        tokens: typing.List[typing.Tuple[typing.List[PDFType], str]] = [
+            x for x in lex_content_stream(content_stream_bytes)
+        ]
+        for chunk_size in [1, 2, 3, 5, 7, 11, 1024]:
+            assert [
+                x
+                for x in lex_content_stream(
+                    content_stream_bytes[i : i + chunk_size]
+                    for i in range(0, len(content_stream_bytes), chunk_size)
+                )
+            ] == tokens
+
+    def test_lex_content_stream_performance(self):
+        content_stream_bytes: bytes = b"".join(
+            [
+                b"q 1 0 0 1 0 0 cm BT /F1 12 Tf 1 0 0 1 72 %d Tm [(Hello) -250 (World \\(%d\\))] TJ ET Q\n"
+                % (i % 800, i)
+                for i in range(0, 10000)
+            ]
+        )
+        number_of_operators: int = sum(
+            [1 for _ in lex_content_stream(content_stream_bytes)]
+        )
+        assert number_of_operators == 80000
@@ -0,0 +1,141 @@
+import tracemalloc
+import typing
+import unittest
+
+from borb.pdf import Document, Page, X11Color
+from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class RecordingSink(Sink):
+    def __init__(self):
+        super().__init__()
+        self.calls: typing.List[typing.Union[Event, typing.List[Event]]] = []
+
+    def process(self, event: Event) -> None:
+        self.calls += [event]
+
+    def process_events(self, events: typing.List[Event]) -> None:
+        self.calls += [events]
+
+
+class TestDeliverEventsPerPage(unittest.TestCase):
+    def test_events_are_slotted(self):
+        e: TextEvent = TextEvent(
+            s="Hello",
+            x=1,
+            y=2,
+            width=3,
+            height=4,
+            font=Standard14Fonts.get("Helvetica"),
+            font_color=X11Color.BLACK,
+            font_size=12,
+            page=Page(),
+            page_nr=0,
+        )
+        assert not hasattr(e, "__dict__")
+        assert e.get_text() == "Hello"
+        assert e.get_x() == 1
+        assert e.get_page_nr() == 0
+
+    def test_deliver_events_per_page(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 3):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream(
+                {
+                    name("DecodedBytes"): b"".join(
+                        [
+                            b"BT 1 0 0 1 72 %d Tm (Page %d, line %d) Tj ET\n"
+                            % (800 - 10 * j, i, j)
+                            for j in range(0, 5)
+                        ]
+                    )
+                }
+            )
+
+        # step 2: process
+        sink: RecordingSink = RecordingSink()
+        Pipeline([Source(deliver_events_per_page=True), sink]).process(d)
+
+        # step 3: check some stuff
+        # one list (of 5 TextEvent objects) and one EndPageEvent per page
+        assert len(sink.calls) == 6
+        for i in range(0, 3):
+            events = sink.calls[2 * i]
+            assert isinstance(events, list)
+            assert len(events) == 5
+            assert all([isinstance(e, TextEvent) for e in events])
+            assert all([e.get_page_nr() == i for e in events])
+            assert isinstance(sink.calls[2 * i + 1], EndPageEvent)
+
+    def test_deliver_events_per_page_get_text(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 3):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream(
+                {
+                    name("DecodedBytes"): b"".join(
+                        [
+                            b"BT 1 0 0 1 72 %d Tm (Page %d, line %d) Tj ET\n"
+                            % (800 - 10 * j, i, j)
+                            for j in range(0, 5)
+                        ]
+                    )
+                }
+            )
+
+        # step 2: process (delivering events one by one, and per page)
+        text_per_page_0 = Pipeline([Source(), GetText()]).process(d)
+        text_per_page_1 = Pipeline(
+            [Source(deliver_events_per_page=True), GetText()]
+        ).process(d)
+
+        # step 3: check some stuff
+        assert text_per_page_0 == text_per_page_1
+        assert len(text_per_page_0) == 3
+
+    def test_event_memory(self):
+        page: Page = Page()
+        font = Standard14Fonts.get("Helvetica")
+
+        # every class (an Event inherits from) declares __slots__
+        assert all(["__slots__" in c.__dict__ for c in TextEvent.__mro__[:-1]])
+
+        # memory to create 100000 TextEvent objects
+        tracemalloc.start()
+        events: typing.List[TextEvent] = [
+            TextEvent(
+                s="Hello",
+                x=i,
+                y=i,
+                width=10,
+                height=12,
+                font=font,
+                font_color=X11Color.BLACK,
+                font_size=12,
+                page=page,
+                page_nr=0,
+            )
+            for i in range(0, 100000)
+        ]
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # a (slotted) TextEvent takes (about) 150 bytes
+        # the same object with a __dict__ takes (about) 200 bytes
+        assert len(events) == 100000
+        assert peak < 180 * len(events)
@@ -0,0 +1,87 @@
+import typing
+import unittest
+
+from borb.pdf import Document, Page
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class TestEventPageNr(unittest.TestCase):
+
+    def test_document_get_page_nr(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream(
+                {
+                    name("DecodedBytes"): b"BT 1 0 0 1 72 700 Tm (Page %d) Tj ET"
+                    % (i + 1)
+                }
+            )
+
+        # step 2: check some stuff
+        pages: typing.List[Page] = [d.get_page(i) for i in range(0, 10)]
+        for i in range(0, 10):
+            assert d.get_page_nr(pages[i]) == i
+
+        # a Page that does not belong to the Document
+        assert d.get_page_nr(Page()) == -1
+
+        # insert a Page
+        p: Page = Page()
+        d.insert_page(p, 3)
+        assert d.get_page_nr(p) == 3
+        assert d.get_page_nr(pages[3]) == 4
+
+        # remove a Page
+        d.pop_page(0)
+        assert d.get_page_nr(pages[0]) == -1
+        assert d.get_page_nr(p) == 2
+        assert d.get_page(2) is p
+
+    def test_event_get_page_nr_without_page_nr(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream(
+                {
+                    name("DecodedBytes"): b"BT 1 0 0 1 72 700 Tm (Page %d) Tj ET"
+                    % (i + 1)
+                }
+            )
+
+        # step 2: check some stuff
+        assert EndPageEvent(page=d.get_page(7)).get_page_nr() == 7
+        assert EndPageEvent(page=d.get_page(7), page_nr=7).get_page_nr() == 7
+
+    def test_get_text_on_many_pages(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 1000):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream(
+                {
+                    name("DecodedBytes"): b"BT 1 0 0 1 72 700 Tm (Page %d) Tj ET"
+                    % (i + 1)
+                }
+            )
+
+        # step 2: process
+        text_per_page: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(
+            d
+        )
+
+        # step 3: check some stuff
+        for i in range(0, 1000):
+            assert text_per_page[i].strip() == f"Page {i + 1}"
@@ -0,0 +1,246 @@
+import typing
+import unittest
+
+from borb.pdf import Document, Page
+from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class RecordingSink(Sink):
+
+    def __init__(self):
+        super().__init__()
+        self.events: typing.List[Event] = []
+
+    def process(self, event: Event) -> None:
+        self.events += [event]
+
+
+class TestFormXObject(unittest.TestCase):
+
+    def test_form_xobject_text_is_extracted(self):
+        # step 1: build PDF
+        # every page draws the same (footer) form
+        form: stream = stream(
+            {
+                name("Type"): name("XObject"),
+                name("Subtype"): name("Form"),
+                name("Matrix"): [1, 0, 0, 1, 72, 20],
+                name("Resources"): {
+                    name("Font"): {name("F2"): Standard14Fonts.get("Courier")}
+                },
+                name(
+                    "DecodedBytes"
+                ): b"BT /F2 1 Tf 8 0 0 8 0 0 Tm (Confidential) Tj ET",
+            }
+        )
+        d: Document = Document()
+        for i in range(0, 3):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Resources")] = {
+                name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")},
+                name("XObject"): {name("Fm1"): form},
+            }
+            p[name("Contents")] = stream(
+                {
+                    name(
+                        "DecodedBytes"
+                    ): b"BT /F1 1 Tf 12 0 0 12 72 700 Tm (Page %d) Tj ET q /Fm1 Do Q"
+                    % (i + 1)
+                }
+            )
+
+        # step 2: process PDF
+        sink: RecordingSink = RecordingSink()
+        Pipeline([Source(), sink]).process(d)
+        text_events: typing.List[TextEvent] = [
+            e for e in sink.events if isinstance(e, TextEvent)
+        ]
+
+        # step 3: check some stuff
+        assert len(text_events) == 6
+
+        # the footer is positioned using /Matrix, and uses the /Resources of the form
+        footer: TextEvent = text_events[1]
+        assert footer.get_text() == "Confidential"
+        assert footer.get_x() == 72
+        assert footer.get_y() == 20
+        assert footer.get_font() == Standard14Fonts.get("Courier")
+        assert footer.get_page_nr() == 0
+
+        # the resources of the page are restored afterwards
+        text_per_page: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(
+            d
+        )
+        for i in range(0, 3):
+            assert text_per_page[i].strip().split("\n") == [
+                f"Page {i + 1}",
+                "Confidential",
+            ]
+
+    def test_form_xobject_inherits_resources(self):
+        # step 1: build PDF
+        # the form has no /Resources of its own
+        form: stream = stream(
+            {
+                name("Type"): name("XObject"),
+                name("Subtype"): name("Form"),
+                name("Matrix"): [1, 0, 0, 1, 72, 20],
+                name(
+                    "DecodedBytes"
+                ): b"BT /F1 1 Tf 8 0 0 8 0 0 Tm (Confidential) Tj ET",
+            }
+        )
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Resources")] = {
+            name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")},
+            name("XObject"): {name("Fm1"): form},
+        }
+        p[name("Contents")] = stream(
+            {
+                name(
+                    "DecodedBytes"
+                ): b"BT /F1 1 Tf 12 0 0 12 72 700 Tm (Page 1) Tj ET q /Fm1 Do Q"
+            }
+        )
+
+        # step 2: process PDF
+        sink: RecordingSink = RecordingSink()
+        Pipeline([Source(), sink]).process(d)
+        text_events: typing.List[TextEvent] = [
+            e for e in sink.events if isinstance(e, TextEvent)
+        ]
+
+        # step 3: check some stuff
+        assert text_events[1].get_font() == Standard14Fonts.get("Helvetica")
+
+    def test_form_xobject_that_uses_itself(self):
+        # step 1: build PDF
+        # the form draws itself
+        form: stream = stream(
+            {
+                name("Type"): name("XObject"),
+                name("Subtype"): name("Form"),
+                name("Matrix"): [1, 0, 0, 1, 72, 20],
+                name("Resources"): {
+                    name("Font"): {name("F2"): Standard14Fonts.get("Courier")}
+                },
+                name(
+                    "DecodedBytes"
+                ): b"BT /F2 1 Tf 8 0 0 8 0 0 Tm (Confidential) Tj ET /Fm9 Do",
+            }
+        )
+        form[name("Resources")][name("XObject")] = {name("Fm9"): form}
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Resources")] = {
+            name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")},
+            name("XObject"): {name("Fm1"): form},
+        }
+        p[name("Contents")] = stream(
+            {
+                name(
+                    "DecodedBytes"
+                ): b"BT /F1 1 Tf 12 0 0 12 72 700 Tm (Page 1) Tj ET q /Fm1 Do Q"
+            }
+        )
+
+        # step 2: process PDF
+        text: str = Pipeline([Source(), GetText()]).process(d)[0]
+
+        # step 3: check some stuff
+        assert text.strip().split("\n") == ["Page 1", "Confidential"]
+
+    def test_form_xobject_is_parsed_once(self):
+        # step 1: build PDF
+        # every page draws the same (footer) form
+        form: stream = stream(
+            {
+                name("Type"): name("XObject"),
+                name("Subtype"): name("Form"),
+                name("Matrix"): [1, 0, 0, 1, 72, 20],
+                name("Resources"): {
+                    name("Font"): {name("F2"): Standard14Fonts.get("Courier")}
+                },
+                name(
+                    "DecodedBytes"
+                ): b"BT /F2 1 Tf 8 0 0 8 0 0 Tm (Confidential) Tj ET",
+            }
+        )
+        d: Document = Document()
+        for i in range(0, 2000):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Resources")] = {
+                name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")},
+                name("XObject"): {name("Fm1"): form},
+            }
+            p[name("Contents")] = stream(
+                {
+                    name(
+                        "DecodedBytes"
+                    ): b"BT /F1 1 Tf 12 0 0 12 72 700 Tm (Page %d) Tj ET q /Fm1 Do Q"
+                    % (i + 1)
+                }
+            )
+
+        # step 2: process PDF
+        source: Source = Source()
+        text_per_page: typing.Dict[int, str] = Pipeline([source, GetText()]).process(d)
+
+        # step 3: check some stuff
+        assert len(source._Source__operations_per_form) == 1  # type: ignore[attr-defined]
+        assert all(
+            [text_per_page[i].strip().endswith("Confidential") for i in range(0, 2000)]
+        )
+
+    def test_form_xobject_cache_is_bounded(self):
+        # step 1: build PDF
+        # every page draws a different (footer) form
+        d: Document = Document()
+        for i in range(0, 10):
+            form: stream = stream(
+                {
+                    name("Type"): name("XObject"),
+                    name("Subtype"): name("Form"),
+                    name("Matrix"): [1, 0, 0, 1, 72, 20],
+                    name("Resources"): {
+                        name("Font"): {name("F2"): Standard14Fonts.get("Courier")}
+                    },
+                    name(
+                        "DecodedBytes"
+                    ): b"BT /F2 1 Tf 8 0 0 8 0 0 Tm (Footer %d) Tj ET"
+                    % i,
+                }
+            )
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Resources")] = {name("XObject"): {name("Fm1"): form}}
+            p[name("Contents")] = stream({name("DecodedBytes"): b"q /Fm1 Do Q"})
+
+        # step 2: process PDF (with a small cache)
+        source: Source = Source()
+        prev_max: int = Source.MAX_NUMBER_OF_CACHED_FORMS
+        try:
+            Source.MAX_NUMBER_OF_CACHED_FORMS = 4
+            text_per_page: typing.Dict[int, str] = Pipeline(
+                [source, GetText()]
+            ).process(d)
+        finally:
+            Source.MAX_NUMBER_OF_CACHED_FORMS = prev_max
+
+        # step 3: check some stuff
+        assert len(source._Source__operations_per_form) == 4  # type: ignore[attr-defined]
+        assert [text_per_page[i].strip() for i in range(0, 10)] == [
+            f"Footer {i}" for i in range(0, 10)
+        ]
@@ -0,0 +1,100 @@
+import typing
+import unittest
+
+from borb.pdf import Document, Page
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_regular_expression import GetRegularExpression
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class TestGetTextOnDensePage(unittest.TestCase):
+
+    def test_get_text_on_dense_page(self):
+
+        # step 1: build PDF
+        # a (dense) table, written column by column (rather than in reading order)
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream(
+            {
+                name("DecodedBytes"): b"".join(
+                    [
+                        b"BT 1 0 0 1 %d %d Tm (r%dc%d) Tj ET\n"
+                        % (20 + 40 * j, 800 - 10 * i, i, j)
+                        for j in range(0, 4)
+                        for i in range(0, 10)
+                    ]
+                )
+            }
+        )
+
+        # step 2: process
+        text: str = Pipeline([Source(), GetText()]).process(d)[0]
+
+        # step 3: check some stuff
+        lines: typing.List[str] = text.strip().split("\n")
+        assert len(lines) == 10
+        for i in range(0, 10):
+            assert lines[i].split() == [f"r{i}c{j}" for j in range(0, 4)]
+
+    def test_get_regular_expression_on_dense_page(self):
+
+        # step 1: build PDF
+        # a (dense) table, written column by column (rather than in reading order)
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream(
+            {
+                name("DecodedBytes"): b"".join(
+                    [
+                        b"BT 1 0 0 1 %d %d Tm (r%dc%d) Tj ET\n"
+                        % (20 + 40 * j, 800 - 10 * i, i, j)
+                        for j in range(0, 4)
+                        for i in range(0, 10)
+                    ]
+                )
+            }
+        )
+
+        # step 2: process
+        matches = Pipeline(
+            [Source(), GetRegularExpression("r[0-9]+c2 r[0-9]+c3")]
+        ).process(d)
+
+        # step 3: check some stuff
+        assert [m.re_match.group(0) for m in matches[0]] == [
+            f"r{i}c2 r{i}c3" for i in range(0, 10)
+        ]
+        assert all([m.bounding_boxes[0][0] == 100 for m in matches[0]])
+
+    def test_get_text_on_large_dense_page(self):
+
+        # step 1: build PDF
+        # a (dense) table, written column by column (rather than in reading order)
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream(
+            {
+                name("DecodedBytes"): b"".join(
+                    [
+                        b"BT 1 0 0 1 %d %d Tm (r%dc%d) Tj ET\n"
+                        % (20 + 40 * j, 800 - 10 * i, i, j)
+                        for j in range(0, 125)
+                        for i in range(0, 80)
+                    ]
+                )
+            }
+        )
+
+        # step 2: process
+        text: str = Pipeline([Source(), GetText()]).process(d)[0]
+
+        # step 3: check some stuff
+        lines: typing.List[str] = text.strip().split("\n")
+        assert len(lines) == 80
+        assert lines[79].split() == [f"r79c{j}" for j in range(0, 125)]
@@ -0,0 +1,51 @@
+import random
+import typing
+import unittest
+
+from borb.pdf import Document, Page
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.source.operator.matrix import Matrix
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class TestMatrix(unittest.TestCase):
+
+    @staticmethod
+    def _as_3_by_3(m: Matrix) -> typing.List[typing.List[float]]:
+        return [[m.a, m.b, 0.0], [m.c, m.d, 0.0], [m.e, m.f, 1.0]]
+
+    def test_mul_matches_3_by_3_matrix_product(self):
+        random.seed(0)
+        for _ in range(0, 100):
+            m0: Matrix = Matrix(*[random.uniform(-10, 10) for _ in range(0, 6)])
+            m1: Matrix = Matrix(*[random.uniform(-10, 10) for _ in range(0, 6)])
+            a: typing.List[typing.List[float]] = TestMatrix._as_3_by_3(m0)
+            b: typing.List[typing.List[float]] = TestMatrix._as_3_by_3(m1)
+            expected: typing.List[typing.List[float]] = [
+                [sum([a[i][k] * b[k][j] for k in range(0, 3)]) for j in range(0, 3)]
+                for i in range(0, 3)
+            ]
+            actual: typing.List[typing.List[float]] = TestMatrix._as_3_by_3(m0.mul(m1))
+            for i in range(0, 3):
+                for j in range(0, 3):
+                    assert abs(expected[i][j] - actual[i][j]) < 1e-9
+
+    def test_cross(self):
+        m: Matrix = Matrix(2, 0, 0, 3, 10, 20)
+        assert m.cross(1, 1) == (12, 23)
+        assert m.cross_vector(1, 1) == (2, 3)
+
+    def test_q_and_Q_restore_matrices(self):
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream(
+            {
+                name("DecodedBytes"): b"q 2 0 0 2 10 10 cm BT 1 0 0 1 5 5 Tm Q",
+            }
+        )
+        source: Source = Source()
+        source.process_page(p)
+        assert source.transformation_matrix == Matrix()
+        assert source.text_matrix == Matrix()
+        assert source.text_line_matrix == Matrix()
@@ -0,0 +1,184 @@
+import typing
+import unittest
+
+from borb.pdf import Document, Page
+from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.operator_Tj import OperatorTj
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class RecordingSink(Sink):
+
+    def __init__(self):
+        super().__init__()
+        self.events: typing.List[Event] = []
+
+    def process(self, event: Event) -> None:
+        self.events += [event]
+
+
+class TestOperatorTjDecodeCache(unittest.TestCase):
+
+    def test_unescape_special_chars_in_ascii_mode(self):
+        # step 1: build PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream(
+            {
+                name(
+                    "DecodedBytes"
+                ): b"BT 1 0 0 1 72 700 Tm (\\(a\\) \\101\\102C \\62x \\\\ \\q) Tj ET"
+            }
+        )
+
+        # step 2: process PDF
+        sink: RecordingSink = RecordingSink()
+        Pipeline([Source(), sink]).process(d)
+        text_events: typing.List[TextEvent] = [
+            e for e in sink.events if isinstance(e, TextEvent)
+        ]
+
+        # step 3: check some stuff
+        assert len(text_events) == 1
+        assert text_events[0].get_text() == "(a) ABC 2x \\\\ \\q"
+
+    def test_cache_does_not_change_events(self):
+        # step 1: build PDF
+        # a table (on every page) alternating between two fonts
+        d: Document = Document()
+        for i in range(0, 2):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Resources")] = {
+                name("Font"): {
+                    name("F1"): Standard14Fonts.get("Helvetica"),
+                    name("F2"): Standard14Fonts.get("Courier"),
+                }
+            }
+            p[name("Contents")] = stream(
+                {
+                    name("DecodedBytes"): b"".join(
+                        [
+                            b"BT /F%d 1 Tf 10 0 0 10 72 %d Tm [(Qty) -250 (\\(%d\\)) 120 (Unit price \\050EUR\\051)] TJ ET\n"
+                            % (1 + j % 2, 800 - 11 * j, j % 10)
+                            for j in range(0, 50)
+                        ]
+                    )
+                }
+            )
+
+        # step 2: process PDF (with cache)
+        sink: RecordingSink = RecordingSink()
+        Pipeline([Source(), sink]).process(d)
+        text_events_with_cache: typing.List[TextEvent] = [
+            e for e in sink.events if isinstance(e, TextEvent)
+        ]
+
+        # step 3: process PDF (without cache)
+        sink = RecordingSink()
+        prev_max: int = OperatorTj.MAX_NUMBER_OF_CACHED_OPERANDS_PER_FONT
+        try:
+            OperatorTj.MAX_NUMBER_OF_CACHED_OPERANDS_PER_FONT = 0
+            Pipeline([Source(), sink]).process(d)
+        finally:
+            OperatorTj.MAX_NUMBER_OF_CACHED_OPERANDS_PER_FONT = prev_max
+        text_events_without_cache: typing.List[TextEvent] = [
+            e for e in sink.events if isinstance(e, TextEvent)
+        ]
+
+        # step 4: check some stuff
+        assert len(text_events_with_cache) == 300
+        assert [
+            (e.get_text(), e.get_x(), e.get_y(), e.get_width(), e.get_font())
+            for e in text_events_with_cache
+        ] == [
+            (e.get_text(), e.get_x(), e.get_y(), e.get_width(), e.get_font())
+            for e in text_events_without_cache
+        ]
+
+    def test_cache_is_bounded(self):
+        # step 1: build PDF
+        # a table (on every page) alternating between two fonts
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Resources")] = {
+            name("Font"): {
+                name("F1"): Standard14Fonts.get("Helvetica"),
+                name("F2"): Standard14Fonts.get("Courier"),
+            }
+        }
+        p[name("Contents")] = stream(
+            {
+                name("DecodedBytes"): b"".join(
+                    [
+                        b"BT /F%d 1 Tf 10 0 0 10 72 %d Tm [(Qty) -250 (\\(%d\\)) 120 (Unit price \\050EUR\\051)] TJ ET\n"
+                        % (1 + j % 2, 800 - 11 * j, j % 10)
+                        for j in range(0, 50)
+                    ]
+                )
+            }
+        )
+
+        # step 2: process PDF (with a small cache)
+        source: Source = Source()
+        prev_max: int = OperatorTj.MAX_NUMBER_OF_CACHED_OPERANDS_PER_FONT
+        try:
+            OperatorTj.MAX_NUMBER_OF_CACHED_OPERANDS_PER_FONT = 4
+            Pipeline([source, GetText()]).process(d)
+        finally:
+            OperatorTj.MAX_NUMBER_OF_CACHED_OPERANDS_PER_FONT = prev_max
+        Tj: OperatorTj = next(x for x in source.operators if x.get_name() == "Tj")  # type: ignore[assignment]
+        decoded_operands_per_font = Tj._OperatorTj__decoded_operands_per_font  # type: ignore[attr-defined]
+
+        # step 3: check some stuff
+        # one cache per font
+        assert len(decoded_operands_per_font) == 2
+        for _, cache in decoded_operands_per_font.values():
+            assert len(cache) == 4
+
+        # the most recently used operand (of the last row) is kept
+        assert (False, "Unit price \\050EUR\\051", 0, 0) in list(
+            decoded_operands_per_font.values()
+        )[-1][1]
+
+    def test_get_text_on_table(self):
+        # step 1: build PDF
+        # a table (on every page) alternating between two fonts
+        d: Document = Document()
+        for i in range(0, 20):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Resources")] = {
+                name("Font"): {
+                    name("F1"): Standard14Fonts.get("Helvetica"),
+                    name("F2"): Standard14Fonts.get("Courier"),
+                }
+            }
+            p[name("Contents")] = stream(
+                {
+                    name("DecodedBytes"): b"".join(
+                        [
+                            b"BT /F%d 1 Tf 10 0 0 10 72 %d Tm [(Qty) -250 (\\(%d\\)) 120 (Unit price \\050EUR\\051)] TJ ET\n"
+                            % (1 + j % 2, 800 - 11 * j, j % 10)
+                            for j in range(0, 700)
+                        ]
+                    )
+                }
+            )
+
+        # step 2: process PDF
+        text_per_page: typing.Dict[int, str] = Pipeline([Source(), GetText()]).process(
+            d
+        )
+
+        # step 3: check some stuff
+        assert len(text_per_page) == 20
+        assert text_per_page[0].count("Unit price (EUR)") == 700
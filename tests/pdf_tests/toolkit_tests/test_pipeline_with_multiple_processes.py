@@ -0,0 +1,90 @@
+import unittest
+
+from borb.pdf import (
+    PDF,
+    Document,
+    Page,
+    PageLayout,
+    Paragraph,
+    SingleColumnLayout,
+    Lipsum,
+)
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.draw_bounding_boxes import DrawBoundingBoxes
+from borb.pdf.toolkit.sink.get_regular_expression import GetRegularExpression
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class TestPipelineWithMultipleProcesses(unittest.TestCase):
+
+    def test_get_text_with_multiple_processes(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 12):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(f"This is page {i}"))
+            l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(256)))
+        PDF.write(what=d, where_to="assets/test_get_text_with_multiple_processes.pdf")
+
+        # step 2: process (in this process, and in 4 processes)
+        text_using_1_process = Pipeline([Source(), GetText()]).process(
+            PDF.read("assets/test_get_text_with_multiple_processes.pdf")
+        )
+        text_using_4_processes = Pipeline(
+            [Source(), GetText()], number_of_processes=4
+        ).process("assets/test_get_text_with_multiple_processes.pdf")
+
+        # step 3: check some stuff
+        # the output should be the same (and in page order)
+        assert list(text_using_4_processes.keys()) == list(range(0, 12))
+        assert text_using_4_processes == text_using_1_process
+        assert text_using_4_processes[7].startswith("This is page 7")
+
+    def test_get_regular_expression_with_multiple_processes(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 6):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(f"This is page {i}"))
+            l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(256)))
+        PDF.write(
+            what=d,
+            where_to="assets/test_get_regular_expression_with_multiple_processes.pdf",
+        )
+
+        # step 2: process
+        matches = Pipeline(
+            [Source(), GetRegularExpression("page [0-9]+")], number_of_processes=3
+        ).process("assets/test_get_regular_expression_with_multiple_processes.pdf")
+
+        # step 3: check some stuff
+        assert list(matches.keys()) == list(range(0, 6))
+        assert all([len(matches[i]) == 1 for i in range(0, 6)])
+
+    def test_draw_bounding_boxes_with_multiple_processes_is_refused(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 2):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(f"This is page {i}"))
+            l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(256)))
+        PDF.write(
+            what=d,
+            where_to="assets/test_draw_bounding_boxes_with_multiple_processes_is_refused.pdf",
+        )
+
+        # step 2: process
+        with self.assertRaises(AssertionError):
+            Pipeline([Source(), DrawBoundingBoxes()], number_of_processes=2).process(
+                "assets/test_draw_bounding_boxes_with_multiple_processes_is_refused.pdf"
+            )
@@ -0,0 +1,140 @@
+import typing
+import unittest
+
+from borb.pdf import Document, Page
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.event import Event
+from borb.pdf.toolkit.filter.below.below_image import BelowImage
+from borb.pdf.toolkit.filter.page.odd_pages import OddPages
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.sink.sink import Sink
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+from borb.pdf.toolkit.source.event.image_event import ImageEvent
+from borb.pdf.toolkit.source.event.shape_fill_event import ShapeFillEvent
+from borb.pdf.toolkit.source.event.shape_stroke_event import ShapeStrokeEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class RecordingSink(Sink):
+
+    def __init__(
+        self, event_types: typing.Optional[typing.Set[typing.Type[Event]]] = None
+    ):
+        super().__init__()
+        self.event_types: typing.Optional[typing.Set[typing.Type[Event]]] = event_types
+        self.events: typing.List[Event] = []
+
+    def get_event_types(self) -> typing.Optional[typing.Set[typing.Type[Event]]]:
+        return self.event_types
+
+    def process(self, event: Event) -> None:
+        self.events += [event]
+
+
+class TestSourceEventTypes(unittest.TestCase):
+
+    def test_source_only_emits_needed_event_types(self):
+        # step 1: build PDF
+        # a (drawing heavy) page: a grid of filled (and stroked) rectangles, and some text
+        content_stream_bytes: bytes = b"".join(
+            [
+                b"0.5 g %d %d 4 4 re f 0 G %d %d m %d %d l S\n"
+                % (
+                    i % 100 * 5,
+                    i // 100 * 5,
+                    i % 100 * 5,
+                    i // 100 * 5,
+                    i % 100 * 5 + 4,
+                    i // 100 * 5,
+                )
+                for i in range(0, 100)
+            ]
+            + [
+                b"BT 1 0 0 1 72 %d Tm (Line %d) Tj ET\n" % (700 - 12 * i, i)
+                for i in range(0, 10)
+            ]
+        )
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream({name("DecodedBytes"): content_stream_bytes})
+
+        # step 2: process PDF (all event types)
+        sink: RecordingSink = RecordingSink()
+        Pipeline([Source(), sink]).process(d)
+        number_of_fill_events: int = len(
+            [e for e in sink.events if isinstance(e, ShapeFillEvent)]
+        )
+        assert len([e for e in sink.events if isinstance(e, TextEvent)]) == 10
+        assert number_of_fill_events >= 100
+        assert len([e for e in sink.events if isinstance(e, ShapeStrokeEvent)]) == 100
+
+        # step 3: process PDF (only TextEvent)
+        sink = RecordingSink(event_types={TextEvent})
+        Pipeline([Source(), sink]).process(d)
+        assert len(sink.events) == 11
+        assert all(
+            [
+                isinstance(e, TextEvent) or isinstance(e, EndPageEvent)
+                for e in sink.events
+            ]
+        )
+
+        # step 4: process PDF (only ShapeFillEvent)
+        sink = RecordingSink(event_types={ShapeFillEvent})
+        Pipeline([Source(), sink]).process(d)
+        assert (
+            len([e for e in sink.events if isinstance(e, ShapeFillEvent)])
+            == number_of_fill_events
+        )
+        assert len([e for e in sink.events if isinstance(e, TextEvent)]) == 0
+
+    def test_filters_propagate_event_types(self):
+        odd_pages: OddPages = OddPages()
+        below_image: BelowImage = BelowImage()
+        Pipeline([Source(), odd_pages, below_image, GetText()])
+        assert below_image.get_event_types() == {TextEvent, ImageEvent}
+        assert odd_pages.get_event_types() == {TextEvent, ImageEvent}
+
+        # a Pipe that needs every type of Event
+        odd_pages = OddPages()
+        Pipeline([Source(), odd_pages, BelowImage(), RecordingSink()])
+        assert odd_pages.get_event_types() is None
+
+    def test_get_text_on_drawing_heavy_page(self):
+        # step 1: build PDF
+        # a (drawing heavy) page: a grid of filled (and stroked) rectangles, and some text
+        content_stream_bytes: bytes = b"".join(
+            [
+                b"0.5 g %d %d 4 4 re f 0 G %d %d m %d %d l S\n"
+                % (
+                    i % 100 * 5,
+                    i // 100 * 5,
+                    i % 100 * 5,
+                    i // 100 * 5,
+                    i % 100 * 5 + 4,
+                    i // 100 * 5,
+                )
+                for i in range(0, 10000)
+            ]
+            + [
+                b"BT 1 0 0 1 72 %d Tm (Line %d) Tj ET\n" % (700 - 12 * i, i)
+                for i in range(0, 10)
+            ]
+        )
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream({name("DecodedBytes"): content_stream_bytes})
+
+        # step 2: process PDF (only TextEvent)
+        text: str = Pipeline([Source(), GetText()]).process(d)[0]
+        sink: RecordingSink = RecordingSink(event_types={TextEvent})
+        Pipeline([Source(), sink]).process(d)
+
+        # step 3: check some stuff
+        # none of the 10000 shapes should have been turned into an Event
+        assert text.strip().split("\n") == [f"Line {i}" for i in range(0, 10)]
+        assert len(sink.events) == 11
@@ -0,0 +1,131 @@
+import typing
+import unittest
+
+from borb.pdf import Document, Page
+from borb.pdf.primitives import PDFType, name, stream
+from borb.pdf.toolkit.source.operator.operator import Operator
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class RecordingOperator(Operator):
+
+    def __init__(self, operator_name: str, number_of_operands: int):
+        self.__name: str = operator_name
+        self.__number_of_operands: int = number_of_operands
+        self.operands_per_call: typing.List[typing.List[PDFType]] = []
+
+    def apply(self, operands: typing.List[PDFType], page: Page, source: Source) -> None:
+        self.operands_per_call += [operands]
+
+    def get_name(self) -> str:
+        return self.__name
+
+    def get_number_of_operands(self) -> int:
+        return self.__number_of_operands
+
+
+class TestSourceOperatorLookup(unittest.TestCase):
+
+    def test_operators_with_common_prefix(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream(
+            {name("DecodedBytes"): b"BT\n(a\\)b) Tj [(c) -10 (d)] TJ T* (e) ' B b* BT"}
+        )
+
+        # step 2: process
+        source: Source = Source()
+        recording_operators: typing.Dict[str, RecordingOperator] = {
+            "B": RecordingOperator("B", 0),
+            "BT": RecordingOperator("BT", 0),
+            "b*": RecordingOperator("b*", 0),
+            "T*": RecordingOperator("T*", 0),
+            "Tj": RecordingOperator("Tj", 1),
+            "TJ": RecordingOperator("TJ", 1),
+            "'": RecordingOperator("'", 1),
+        }
+        source.operators = [x for x in recording_operators.values()]
+        source.process_page(p)
+
+        # step 3: check some stuff
+        assert len(recording_operators["BT"].operands_per_call) == 2
+        assert len(recording_operators["B"].operands_per_call) == 1
+        assert len(recording_operators["b*"].operands_per_call) == 1
+        assert len(recording_operators["T*"].operands_per_call) == 1
+        assert recording_operators["Tj"].operands_per_call == [["a\\)b"]]
+        assert recording_operators["TJ"].operands_per_call == [[["c", -10, "d"]]]
+        assert recording_operators["'"].operands_per_call == [["e"]]
+
+    def test_operators_added_after_first_page(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        for _ in range(0, 2):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"q 1 2 3 XYZ Q"})
+
+        # step 2: process (adding an operator after the first page)
+        source: Source = Source()
+        source.process_page(d.get_page(0))
+        xyz: RecordingOperator = RecordingOperator("XYZ", 3)
+        source.operators += [xyz]
+        source.process_page(d.get_page(1))
+
+        # step 3: check some stuff
+        assert xyz.operands_per_call == [[1, 2, 3]]
+
+    def test_operator_lookup_on_long_content_stream(self):
+
+        # step 1: build PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Contents")] = stream(
+            {
+                name("DecodedBytes"): b"".join(
+                    [
+                        b"q 1 0 0 1 0 0 cm BT 1 0 0 1 72 %d Tm 0.5 g (Hello World \\(%d\\)) Tj ET Q\n"
+                        % (i % 800, i)
+                        for i in range(0, 2000)
+                    ]
+                )
+            }
+        )
+
+        # step 2: process
+        source: Source = Source()
+        recording_operators: typing.Dict[str, RecordingOperator] = {
+            "q": RecordingOperator("q", 0),
+            "cm": RecordingOperator("cm", 6),
+            "BT": RecordingOperator("BT", 0),
+            "Tm": RecordingOperator("Tm", 6),
+            "g": RecordingOperator("g", 1),
+            "Tj": RecordingOperator("Tj", 1),
+            "ET": RecordingOperator("ET", 0),
+            "Q": RecordingOperator("Q", 0),
+        }
+        source.operators = [x for x in recording_operators.values()]
+        source.process_page(p)
+
+        # step 3: check some stuff
+        # every operator is dispatched (once per line) to the operator with that exact name
+        assert all(
+            [len(x.operands_per_call) == 2000 for x in recording_operators.values()]
+        )
+        assert recording_operators["cm"].operands_per_call[0] == [1, 0, 0, 1, 0, 0]
+        assert recording_operators["Tm"].operands_per_call[1999] == [
+            1,
+            0,
+            0,
+            1,
+            72,
+            1999 % 800,
+        ]
+        assert recording_operators["g"].operands_per_call[1999] == [0.5]
+        assert recording_operators["Tj"].operands_per_call[1999] == [
+            "Hello World \\(1999\\)"
+        ]
@@ -0,0 +1,270 @@
+import random
+import typing
+import unittest
+
+from borb.pdf import Document, Page, X11Color
+from borb.pdf.font.simple_font.standard_14_fonts import Standard14Fonts
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.filter.above.above_text import AboveText
+from borb.pdf.toolkit.filter.below.below_text import BelowText
+from borb.pdf.toolkit.filter.left.left_of_text import LeftOfText
+from borb.pdf.toolkit.filter.right.right_of_text import RightOfText
+from borb.pdf.toolkit.filter.spatial_index import SpatialIndex
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.event.end_page_event import EndPageEvent
+from borb.pdf.toolkit.source.event.text_event import TextEvent
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class TestSpatialIndex(unittest.TestCase):
+
+    def test_get_events_in_region_matches_brute_force(self):
+        random.seed(0)
+        page: Page = Page()
+        font = Standard14Fonts.get("Helvetica")
+        events: typing.List[TextEvent] = [
+            TextEvent(
+                s="Hello",
+                x=random.uniform(0, 595),
+                y=random.uniform(0, 842),
+                width=random.uniform(0, 100),
+                height=random.uniform(0, 20),
+                font=font,
+                font_color=X11Color.BLACK,
+                font_size=12,
+                page=page,
+                page_nr=0,
+            )
+            for _ in range(0, 1000)
+        ]
+        spatial_index: SpatialIndex = SpatialIndex()
+        for e in events:
+            spatial_index.add(e)
+        spatial_index.add(EndPageEvent(page=page, page_nr=0))
+        assert len(spatial_index) == 1001
+        for _ in range(0, 100):
+            x0: float = random.uniform(-100, 700)
+            y0: float = random.uniform(-100, 900)
+            x1: float = x0 + random.uniform(0, 300)
+            y1: float = y0 + random.uniform(0, 300)
+            expected: typing.List[TextEvent] = [
+                e
+                for e in events
+                if e.get_x() <= x1
+                and x0 <= e.get_x() + e.get_width()
+                and e.get_y() <= y1
+                and y0 <= e.get_y() + e.get_height()
+            ]
+            assert (
+                spatial_index.get_events_in_region(
+                    max_x=x1, max_y=y1, min_x=x0, min_y=y0
+                )
+                == expected
+            )
+
+        # unbounded regions
+        assert spatial_index.get_events_in_region() == events
+        assert spatial_index.get_events_in_region(min_y=10**9) == []
+
+    def test_right_of_text(self):
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 3):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Resources")] = {
+                name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")}
+            }
+            content_stream_bytes: bytes = (
+                b"BT /F1 1 Tf 10 0 0 10 72 800 Tm (Invoice %d) Tj ET\n" % i
+            )
+            for j in range(0, 5):
+                content_stream_bytes += (
+                    b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Item %d) Tj ET\n"
+                    % (780 - 12 * j, j)
+                )
+                content_stream_bytes += (
+                    b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n"
+                    % (780 - 12 * j, j)
+                )
+            y: int = 780 - 12 * 5
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Total:) Tj ET\n" % y
+            )
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n" % (y, 100 + i)
+            )
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Thank you) Tj ET\n" % (y - 24)
+            )
+            p[name("Contents")] = stream({name("DecodedBytes"): content_stream_bytes})
+
+        # step 2: process PDF
+        text_per_page: typing.Dict[int, str] = Pipeline(
+            [Source(), RightOfText("Total:"), GetText()]
+        ).process(d)
+
+        # step 3: check some stuff
+        for i in range(0, 3):
+            assert text_per_page[i].strip() == f"{100 + i}.00"
+
+    def test_left_of_text(self):
+        # step 1: build PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Resources")] = {
+            name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")}
+        }
+        content_stream_bytes: bytes = (
+            b"BT /F1 1 Tf 10 0 0 10 72 800 Tm (Invoice 0) Tj ET\n"
+        )
+        for j in range(0, 5):
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Item %d) Tj ET\n" % (780 - 12 * j, j)
+            )
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n" % (780 - 12 * j, j)
+            )
+        y: int = 780 - 12 * 5
+        content_stream_bytes += b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Total:) Tj ET\n" % y
+        content_stream_bytes += b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n" % (
+            y,
+            100,
+        )
+        content_stream_bytes += (
+            b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Thank you) Tj ET\n" % (y - 24)
+        )
+        p[name("Contents")] = stream({name("DecodedBytes"): content_stream_bytes})
+
+        # step 2: process PDF
+        text_per_page: typing.Dict[int, str] = Pipeline(
+            [Source(), LeftOfText("3.00"), GetText()]
+        ).process(d)
+
+        # step 3: check some stuff
+        assert text_per_page[0].strip() == "Item 3"
+
+    def test_above_and_below_text(self):
+        # step 1: build PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Resources")] = {
+            name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")}
+        }
+        content_stream_bytes: bytes = (
+            b"BT /F1 1 Tf 10 0 0 10 72 800 Tm (Invoice 0) Tj ET\n"
+        )
+        for j in range(0, 5):
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Item %d) Tj ET\n" % (780 - 12 * j, j)
+            )
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n" % (780 - 12 * j, j)
+            )
+        y: int = 780 - 12 * 5
+        content_stream_bytes += b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Total:) Tj ET\n" % y
+        content_stream_bytes += b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n" % (
+            y,
+            100,
+        )
+        content_stream_bytes += (
+            b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Thank you) Tj ET\n" % (y - 24)
+        )
+        p[name("Contents")] = stream({name("DecodedBytes"): content_stream_bytes})
+
+        # step 2: process PDF
+        text_per_page: typing.Dict[int, str] = Pipeline(
+            [Source(), BelowText("Total:"), GetText()]
+        ).process(d)
+
+        # step 3: check some stuff
+        assert text_per_page[0].strip() == "Thank you"
+        text_per_page = Pipeline([Source(), AboveText("Item 0"), GetText()]).process(d)
+
+        # step 3: check some stuff
+        assert text_per_page[0].strip() == "Invoice 0"
+
+    def test_anchor_not_on_page(self):
+        # step 1: build PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        p[name("Resources")] = {
+            name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")}
+        }
+        content_stream_bytes: bytes = (
+            b"BT /F1 1 Tf 10 0 0 10 72 800 Tm (Invoice 0) Tj ET\n"
+        )
+        for j in range(0, 5):
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Item %d) Tj ET\n" % (780 - 12 * j, j)
+            )
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n" % (780 - 12 * j, j)
+            )
+        y: int = 780 - 12 * 5
+        content_stream_bytes += b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Total:) Tj ET\n" % y
+        content_stream_bytes += b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n" % (
+            y,
+            100,
+        )
+        content_stream_bytes += (
+            b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Thank you) Tj ET\n" % (y - 24)
+        )
+        p[name("Contents")] = stream({name("DecodedBytes"): content_stream_bytes})
+
+        # step 2: process PDF
+        # step 3: check some stuff
+        for p in [
+            AboveText("Lorem Ipsum"),
+            BelowText("Lorem Ipsum"),
+            LeftOfText("Lorem Ipsum"),
+            RightOfText("Lorem Ipsum"),
+        ]:
+            assert Pipeline([Source(), p, GetText()]).process(d).get(0, "") == ""
+
+    def test_left_of_text_on_many_pages(self):
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 100):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Resources")] = {
+                name("Font"): {name("F1"): Standard14Fonts.get("Helvetica")}
+            }
+            content_stream_bytes: bytes = (
+                b"BT /F1 1 Tf 10 0 0 10 72 800 Tm (Invoice %d) Tj ET\n" % i
+            )
+            for j in range(0, 60):
+                content_stream_bytes += (
+                    b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Item %d) Tj ET\n"
+                    % (780 - 12 * j, j)
+                )
+                content_stream_bytes += (
+                    b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n"
+                    % (780 - 12 * j, j)
+                )
+            y: int = 780 - 12 * 60
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Total:) Tj ET\n" % y
+            )
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 300 %d Tm (%d.00) Tj ET\n" % (y, 100 + i)
+            )
+            content_stream_bytes += (
+                b"BT /F1 1 Tf 10 0 0 10 72 %d Tm (Thank you) Tj ET\n" % (y - 24)
+            )
+            p[name("Contents")] = stream({name("DecodedBytes"): content_stream_bytes})
+
+        # step 2: process PDF
+        text_per_page: typing.Dict[int, str] = Pipeline(
+            [Source(), LeftOfText(".00"), GetText()]
+        ).process(d)
+
+        # step 3: check some stuff
+        for i in range(0, 100):
+            lines: typing.List[str] = text_per_page[i].strip().split("\n")
+            assert lines == [f"Item {j}" for j in range(0, 60)] + ["Total:"]
@@ -0,0 +1,160 @@
+import base64
+import random
+import unittest
+import zlib
+
+from borb.pdf import (
+    PDF,
+    Document,
+    Image,
+    Page,
+    PageLayout,
+    Paragraph,
+    SingleColumnLayout,
+)
+from borb.pdf.primitives import name, stream
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_images import GetImages
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+from borb.pdf.visitor.read.compression.decode_stream import (
+    decode_stream,
+    decode_stream_in_chunks,
+)
+
+
+class TestDecodeStreamInChunks(unittest.TestCase):
+
+    @staticmethod
+    def _run_length_encode(bytes_in: bytes) -> bytes:
+        out: bytes = b""
+        for i in range(0, len(bytes_in), 100):
+            block: bytes = bytes_in[i : i + 100]
+            if block == block[0:1] * len(block):
+                out += bytes([257 - len(block)]) + block[0:1]
+            else:
+                out += bytes([len(block) - 1]) + block
+        return out + b"\x80"
+
+    def _check_chunks(self, s: stream, expected_bytes: bytes) -> None:
+        for chunk_size in [1, 7, 100, 4096, 65536]:
+            chunks = [x for x in decode_stream_in_chunks(s, chunk_size=chunk_size)]
+            assert b"".join(chunks) == expected_bytes
+            assert "DecodedBytes" not in s
+        assert decode_stream(s)["DecodedBytes"] == expected_bytes
+
+    def test_flate_decode_in_chunks(self):
+        random.seed(0)
+        raw_bytes: bytes = bytes([random.choice(b"abcdefgh") for _ in range(0, 200000)])
+        self._check_chunks(
+            stream({"Bytes": zlib.compress(raw_bytes)}), expected_bytes=raw_bytes
+        )
+
+        # each chunk should be (at most) chunk_size bytes
+        assert all(
+            [
+                len(x) <= 4096
+                for x in decode_stream_in_chunks(
+                    stream({"Bytes": zlib.compress(raw_bytes)}), chunk_size=4096
+                )
+            ]
+        )
+
+    def test_flate_decode_with_png_predictor_in_chunks(self):
+        random.seed(1)
+        columns: int = 37
+        raw_bytes: bytes = bytes(
+            [random.randint(0, 255) for _ in range(0, columns * 500 + 11)]
+        )
+        encoded_bytes: bytearray = bytearray()
+        prior_row: bytes = bytes(columns)
+        for i in range(0, len(raw_bytes), columns):
+            row: bytes = raw_bytes[i : i + columns]
+            encoded_bytes += b"\x02" + bytes(
+                [(a - b) & 0xFF for a, b in zip(row, prior_row)]
+            )
+            prior_row = row
+        self._check_chunks(
+            stream(
+                {
+                    "Bytes": zlib.compress(bytes(encoded_bytes)),
+                    "DecodeParms": {"Predictor": 12, "Columns": columns},
+                }
+            ),
+            expected_bytes=raw_bytes,
+        )
+
+    def test_filter_chain_in_chunks(self):
+        random.seed(2)
+        raw_bytes: bytes = b"".join(
+            [
+                bytes([random.randint(0, 255)]) * random.randint(1, 300)
+                for _ in range(0, 500)
+            ]
+        )
+        for filters, encoded_bytes in [
+            (name("RunLengthDecode"), self._run_length_encode(raw_bytes)),
+            (
+                name("ASCII85Decode"),
+                base64.a85encode(raw_bytes, wrapcol=64, adobe=True),
+            ),
+            (
+                [name("ASCII85Decode"), name("FlateDecode")],
+                base64.a85encode(zlib.compress(raw_bytes), wrapcol=64) + b"~>",
+            ),
+            (
+                [name("FlateDecode"), name("RunLengthDecode")],
+                zlib.compress(self._run_length_encode(raw_bytes)),
+            ),
+        ]:
+            self._check_chunks(
+                stream({"Bytes": encoded_bytes, "Filter": filters}),
+                expected_bytes=raw_bytes,
+            )
+
+    def test_source_does_not_store_decoded_bytes(self):
+        d: Document = Document()
+        for i in range(0, 3):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(f"Hello World {i}!"))
+        PDF.write(what=d, where_to="assets/test_decode_stream_in_chunks.pdf")
+
+        d = PDF.read("assets/test_decode_stream_in_chunks.pdf")
+        text = Pipeline([Source(), GetText()]).process(d)
+        assert text[2] == "Hello World 2!"
+        assert all(
+            ["DecodedBytes" not in d.get_page(i)["Contents"] for i in range(0, 3)]
+        )
+
+    def test_get_images_decodes_flate_encoded_samples(self):
+        import PIL.Image  # type: ignore[import-untyped, import-not-found]
+
+        # build PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        l.append_layout_element(
+            Image(PIL.Image.new("RGB", (64, 32), (255, 0, 0)), size=(64, 32))
+        )
+        PDF.write(what=d, where_to="assets/test_decode_stream_in_chunks_image.pdf")
+
+        # replace the (JPEG) image by flate-encoded samples
+        d = PDF.read("assets/test_decode_stream_in_chunks_image.pdf")
+        image_stream: stream = next(
+            iter(d.get_page(0)["Resources"]["XObject"].values())
+        )
+        image_stream[name("Bytes")] = zlib.compress(bytes([0, 128, 255]) * 64 * 32)
+        image_stream[name("Filter")] = name("FlateDecode")
+        image_stream[name("ColorSpace")] = name("DeviceRGB")
+        image_stream[name("BitsPerComponent")] = 8
+        image_stream[name("Width")] = 64
+        image_stream[name("Height")] = 32
+
+        # process
+        images = Pipeline([Source(), GetImages()]).process(d)
+        assert images[0][0].size == (64, 32)
+        assert images[0][0].getpixel((10, 10)) == (0, 128, 255)
+        assert "DecodedBytes" not in image_stream
@@ -0,0 +1,153 @@
+import importlib.util
+import random
+import unittest
+import zlib
+
+from borb.pdf.visitor.read.compression.flate_decode import FlateDecode
+
+
+class TestFlateDecodePNGPredictor(unittest.TestCase):
+
+    @staticmethod
+    def _encode_png_predictor(
+        raw_bytes: bytes,
+        bytes_per_row: int,
+        bytes_per_pixel: int,
+        filter_types: list,
+    ) -> bytes:
+        out: bytearray = bytearray()
+        prior_row: bytes = bytes(bytes_per_row)
+        for row_index, row_start in enumerate(range(0, len(raw_bytes), bytes_per_row)):
+            row: bytes = raw_bytes[row_start : row_start + bytes_per_row]
+            filter_type: int = filter_types[row_index % len(filter_types)]
+            out += bytes([filter_type])
+            for i in range(0, len(row)):
+                a: int = row[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
+                b: int = prior_row[i]
+                c: int = prior_row[i - bytes_per_pixel] if i >= bytes_per_pixel else 0
+                if filter_type == 0:
+                    predicted: int = 0
+                elif filter_type == 1:
+                    predicted = a
+                elif filter_type == 2:
+                    predicted = b
+                elif filter_type == 3:
+                    predicted = (a + b) >> 1
+                else:
+                    pa: int = abs(b - c)
+                    pb: int = abs(a - c)
+                    pc: int = abs(a + b - c - c)
+                    if pa <= pb and pa <= pc:
+                        predicted = a
+                    elif pb <= pc:
+                        predicted = b
+                    else:
+                        predicted = c
+                out += bytes([(row[i] - predicted) & 0xFF])
+            prior_row = row + prior_row[len(row) :]
+        return bytes(out)
+
+    def test_png_predictor_round_trip(self):
+        random.seed(2024)
+        for bits_per_component in [1, 2, 4, 8]:
+            for columns in [1, 3, 7, 64]:
+                for filter_types in [
+                    [0],
+                    [1],
+                    [2],
+                    [3],
+                    [4],
+                    [0, 1, 2, 3, 4],
+                    [2, 2, 4, 2, 2, 2, 1],
+                ]:
+                    bytes_per_row: int = (columns * bits_per_component + 7) // 8
+                    bytes_per_pixel: int = max(1, bits_per_component // 8)
+                    raw_bytes: bytes = bytes(
+                        [random.randint(0, 255) for _ in range(0, bytes_per_row * 23)]
+                    )
+                    encoded_bytes: bytes = zlib.compress(
+                        TestFlateDecodePNGPredictor._encode_png_predictor(
+                            raw_bytes, bytes_per_row, bytes_per_pixel, filter_types
+                        )
+                    )
+                    assert (
+                        FlateDecode.decode(
+                            encoded_bytes,
+                            bits_per_component=bits_per_component,
+                            columns=columns,
+                            predictor=15,
+                        )
+                        == raw_bytes
+                    )
+
+    def test_png_predictor_multi_byte_pixels(self):
+        # 3 components (e.g. RGB) per pixel, 8 bits per component
+        random.seed(2025)
+        raw_bytes: bytes = bytes(
+            [random.randint(0, 255) for _ in range(0, 3 * 50 * 40)]
+        )
+        encoded_bytes: bytes = TestFlateDecodePNGPredictor._encode_png_predictor(
+            raw_bytes, 3 * 50, 3, [0, 1, 2, 3, 4]
+        )
+        engines: list = [FlateDecode._FlateDecode__undo_png_predictor_using_bytearray]
+        if importlib.util.find_spec("numpy") is not None:
+            engines += [FlateDecode._FlateDecode__undo_png_predictor_using_numpy]
+        for engine in engines:
+            assert engine(encoded_bytes, 3 * 50, 3) == raw_bytes
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("numpy") is not None, "numpy is not installed"
+    )
+    def test_png_predictor_engines_agree(self):
+        random.seed(2026)
+        for filter_types in [[1], [2], [3], [4], [0, 1, 2, 3, 4]]:
+            encoded_bytes: bytes = bytes(
+                [
+                    (
+                        filter_types[i % len(filter_types)]
+                        if i % 33 == 0
+                        else random.randint(0, 255)
+                    )
+                    for i in range(0, 33 * 100 + 17)
+                ]
+            )
+            assert FlateDecode._FlateDecode__undo_png_predictor_using_numpy(
+                encoded_bytes, 32, 1
+            ) == FlateDecode._FlateDecode__undo_png_predictor_using_bytearray(
+                encoded_bytes, 32, 1
+            )
+
+    def test_tiff_predictor(self):
+        random.seed(2027)
+        raw_bytes: bytes = bytes([random.randint(0, 255) for _ in range(0, 16 * 10)])
+        encoded_bytes: bytearray = bytearray(raw_bytes)
+        for row_start in range(0, len(raw_bytes), 16):
+            for i in range(row_start + 1, row_start + 16):
+                encoded_bytes[i] = (raw_bytes[i] - raw_bytes[i - 1]) & 0xFF
+        assert (
+            FlateDecode.decode(
+                zlib.compress(bytes(encoded_bytes)),
+                bits_per_component=8,
+                columns=16,
+                predictor=2,
+            )
+            == raw_bytes
+        )
+
+    def test_png_predictor_performance(self):
+        random.seed(2028)
+        bytes_per_row: int = 3000
+        raw_bytes: bytes = bytes(
+            [random.randint(0, 255) for _ in range(0, bytes_per_row * 200)]
+        )
+        encoded_bytes: bytes = zlib.compress(
+            TestFlateDecodePNGPredictor._encode_png_predictor(
+                raw_bytes, bytes_per_row, 1, [1, 2, 2, 2]
+            )
+        )
+        assert (
+            FlateDecode.decode(
+                encoded_bytes, bits_per_component=8, columns=3000, predictor=15
+            )
+            == raw_bytes
+        )
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from borb.pdf.visitor.read.compression.lzw_decode import LZWDecode
+
+
+class TestLZWDecode(unittest.TestCase):
+
+    @staticmethod
+    def _lzw_encode(bytes_in: bytes) -> bytes:
+        bytes_out: bytearray = bytearray()
+        bit_buffer: int = 0
+        number_of_bits_in_buffer: int = 0
+
+        def _code_width(table_index: int) -> int:
+            # the decoder switches (early) to a wider code when its table reaches 511, 1023, 2047 entries
+            if table_index < 511:
+                return 9
+            if table_index < 1023:
+                return 10
+            if table_index < 2047:
+                return 11
+            return 12
+
+        def _write(code: int, width: int) -> None:
+            nonlocal bit_buffer, number_of_bits_in_buffer
+            bit_buffer = (bit_buffer << width) | code
+            number_of_bits_in_buffer += width
+            while number_of_bits_in_buffer >= 8:
+                number_of_bits_in_buffer -= 8
+                bytes_out.append((bit_buffer >> number_of_bits_in_buffer) & 0xFF)
+            bit_buffer &= (1 << number_of_bits_in_buffer) - 1
+
+        lookup_table: dict = {bytes([i]): i for i in range(0, 256)}
+        next_code: int = 258
+        _write(256, 9)
+        w: bytes = b""
+        for c in bytes_in:
+            wc: bytes = w + bytes([c])
+            if wc in lookup_table:
+                w = wc
+                continue
+            _write(lookup_table[w], _code_width(next_code - 1))
+            lookup_table[wc] = next_code
+            next_code += 1
+            w = bytes([c])
+            if next_code == 4000:
+                _write(256, _code_width(next_code - 1))
+                lookup_table = {bytes([i]): i for i in range(0, 256)}
+                next_code = 258
+        if len(w) > 0:
+            _write(lookup_table[w], _code_width(next_code - 1))
+            next_code += 1
+        _write(257, _code_width(next_code - 1))
+        if number_of_bits_in_buffer > 0:
+            bytes_out.append((bit_buffer << (8 - number_of_bits_in_buffer)) & 0xFF)
+        return bytes(bytes_out)
+
+    @staticmethod
+    def _scanline_like_bytes(n: int) -> bytes:
+        # repetitive data (like a scanned page) with some noise
+        random.seed(n)
+        return bytes(
+            [
+                (255 if (i // 37) % 5 else 0)
+                ^ (random.randint(0, 3) if i % 11 == 0 else 0)
+                for i in range(0, n)
+            ]
+        )
+
+    def test_lzw_decode_round_trip(self):
+        for raw_bytes in [
+            b"",
+            b"A",
+            b"ABABABA",
+            b"-----A---B",
+            TestLZWDecode._scanline_like_bytes(100000),
+            bytes([random.randint(0, 255) for _ in range(0, 20000)]),
+        ]:
+            encoded_bytes: bytes = TestLZWDecode._lzw_encode(raw_bytes)
+            assert LZWDecode().decode(encoded_bytes) == raw_bytes
+            for chunk_size in [1, 13, 4096]:
+                chunks = [
+                    encoded_bytes[i : i + chunk_size]
+                    for i in range(0, len(encoded_bytes), chunk_size)
+                ]
+                assert (
+                    b"".join(
+                        LZWDecode().decode_in_chunks(chunks, chunk_size=chunk_size)
+                    )
+                    == raw_bytes
+                )
+
+    def test_lzw_decode_known_value(self):
+        # example from the PDF specification (7.4.4.2)
+        assert LZWDecode().decode(bytes.fromhex("800B6050220C0C8501")) == b"-----A---B"
+
+    def test_lzw_decode_performance(self):
+        raw_bytes: bytes = TestLZWDecode._scanline_like_bytes(4 * 1024 * 1024)
+        encoded_bytes: bytes = TestLZWDecode._lzw_encode(raw_bytes)
+        assert LZWDecode().decode(encoded_bytes) == raw_bytes
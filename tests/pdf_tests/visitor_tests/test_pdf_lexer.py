@@ -0,0 +1,53 @@
+import unittest
+
+from borb.pdf.visitor.read.pdf_lexer import PDFLexer
+
+
+class TestPDFLexer(unittest.TestCase):
+
+    def test_read_int(self):
+        assert PDFLexer.read_int(b"<< /Length 42 >>", 11) == (42, 13)
+        assert PDFLexer.read_int(b"-7 ", 0) == (-7, 2)
+        assert PDFLexer.read_int(b"/Name", 0) is None
+
+    def test_read_float(self):
+        assert PDFLexer.read_float(b"[3.14 0]", 1) == (3.14, 5)
+        assert PDFLexer.read_float(b"-.5 ", 0) == (-0.5, 3)
+        assert PDFLexer.read_float(b"5. ", 0) == (5.0, 2)
+        assert PDFLexer.read_float(b"42 ", 0) is None
+
+    def test_read_name(self):
+        assert PDFLexer.read_name(b"/Type/Page", 0) == ("Type", 5)
+        assert PDFLexer.read_name(b"/Type/Page", 5) == ("Page", 10)
+        assert PDFLexer.read_name(b"/F1 12 Tf", 0) == ("F1", 3)
+        assert PDFLexer.read_name(b"Type", 0) is None
+
+    def test_read_hex_str(self):
+        assert PDFLexer.read_hex_str(b"<48656C6C6F> ", 0) == ("48656C6C6F", 12)
+        assert PDFLexer.read_hex_str(b"<< /Type >>", 0) is None
+
+    def test_read_literal_str(self):
+        assert PDFLexer.read_literal_str(b"(Hello World) Tj", 0) == (
+            b"Hello World",
+            13,
+        )
+        assert PDFLexer.read_literal_str(b"(a\\)b)", 0) == (b"a)b", 6)
+        assert PDFLexer.read_literal_str(b"(a\\\\b)", 0) == (b"a\\b", 6)
+        assert PDFLexer.read_literal_str(b"(never closed", 0) is None
+
+    def test_read_reference(self):
+        assert PDFLexer.read_reference(b"/Parent 12 0 R >>", 8) == (12, 0, 14)
+        assert PDFLexer.read_reference(b"12 0 obj", 0) is None
+
+    def test_read_obj_header(self):
+        assert PDFLexer.read_obj_header(b"12 0 obj\n<< >>", 0) == (12, 0, 8)
+        assert PDFLexer.read_obj_header(b"12 0 R", 0) is None
+
+    def test_read_xref_entry(self):
+        xref: bytes = b"xref\n0 2\n0000000000 65535 f\r\n0000000015 00000 n \n"
+        assert PDFLexer.read_xref_entry(xref, 8) == (0, 65535, False, 27)
+        assert PDFLexer.read_xref_entry(xref, 27) == (15, 0, True, 47)
+
+    def test_skip_whitespace(self):
+        assert PDFLexer.skip_whitespace(b" \r\n /Type", 0) == 4
+        assert PDFLexer.skip_whitespace(b"/Type", 0) == 0
@@ -0,0 +1,42 @@
+import unittest
+
+from borb.pdf import (
+    Document,
+    Page,
+    PageLayout,
+    SingleColumnLayout,
+    Paragraph,
+    PDF,
+)
+from borb.pdf.visitor.read.root_visitor import RootVisitor
+
+
+class TestReadDispatchTable(unittest.TestCase):
+
+    def test_read_dispatch_table(self):
+
+        # STEP 1: create PDF
+        d: Document = Document()
+        for i in range(0, 5):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(f"Lorem ipsum page {i}"))
+        PDF.write(what=d, where_to="assets/test_read_dispatch_table.pdf")
+
+        # STEP 2: read PDF
+        with open("assets/test_read_dispatch_table.pdf", "rb") as fh:
+            rv: RootVisitor = RootVisitor()
+            document_and_index = rv.visit(fh.read())
+        assert document_and_index is not None
+        assert document_and_index[0].get_number_of_pages() == 5
+
+        # STEP 3: check the number of attempts per token
+        number_of_attempts_per_token = rv.get_number_of_attempts_per_token()
+        number_of_tokens: int = sum(number_of_attempts_per_token.values())
+        number_of_attempts: int = sum(
+            [k * v for k, v in number_of_attempts_per_token.items()]
+        )
+        assert number_of_tokens > 0
+        assert max(number_of_attempts_per_token.keys()) <= 4
+        assert number_of_attempts / number_of_tokens < 2
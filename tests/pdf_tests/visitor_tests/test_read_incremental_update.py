@@ -0,0 +1,45 @@
+import pathlib
+import unittest
+
+from borb.pdf import PDF
+
+
+class TestReadIncrementalUpdate(unittest.TestCase):
+
+    def test_read_incremental_update(self):
+
+        # original revision
+        out: bytes = b"%PDF-1.7\n%" + b"0" * 1024 + b"\n"
+        byte_offsets: list = []
+        for i, obj in enumerate(
+            [
+                b"<< /Type /Catalog /Pages 2 0 R /Items 3 0 R >>",
+                b"<< /Type /Pages /Kids [] /Count 0 >>",
+                b"[4 0 R]",
+                b"<< /Value 1 >>",
+            ]
+        ):
+            byte_offsets += [len(out)]
+            out += b"%d 0 obj\n" % (i + 1) + obj + b"\nendobj\n"
+        start_of_first_xref: int = len(out)
+        out += b"xref\n0 5\n0000000000 65535 f\r\n"
+        for byte_offset in byte_offsets:
+            out += b"%010d 00000 n\r\n" % byte_offset
+        out += b"trailer\n<< /Size 5 /Root 1 0 R >>\n"
+        out += b"startxref\n%d\n%%%%EOF\n" % start_of_first_xref
+
+        # incremental update (redefines 4 0 R)
+        byte_offset_of_update: int = len(out)
+        out += b"4 0 obj\n<< /Value 2 >>\nendobj\n"
+        start_of_second_xref: int = len(out)
+        out += b"xref\n4 1\n%010d 00000 n\r\n" % byte_offset_of_update
+        out += b"trailer\n<< /Size 5 /Root 1 0 R /Prev %d >>\n" % start_of_first_xref
+        out += b"startxref\n%d\n%%%%EOF" % start_of_second_xref
+
+        path: pathlib.Path = pathlib.Path("assets/test_read_incremental_update.pdf")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(out)
+
+        # the newest revision of 4 0 R should win
+        d = PDF.read(where_from=path)
+        assert d["Trailer"]["Root"]["Items"][0]["Value"] == 2
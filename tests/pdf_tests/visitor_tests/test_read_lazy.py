@@ -0,0 +1,135 @@
+import copy
+import pickle
+import unittest
+
+from borb.pdf import (
+    Document,
+    Page,
+    PageLayout,
+    SingleColumnLayout,
+    Paragraph,
+    PDF,
+)
+from borb.pdf.primitives import name, reference
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class TestReadLazy(unittest.TestCase):
+
+    def test_read_lazy(self):
+        # STEP 1: create PDF
+        d: Document = Document()
+        for i in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(f"Lorem ipsum page {i}"))
+        PDF.write(what=d, where_to="assets/test_read_lazy.pdf")
+
+        # STEP 2: read PDF (lazily)
+        d = PDF.read(where_from="assets/test_read_lazy.pdf", lazy=True)
+        assert d.get_number_of_pages() == 10
+
+        # STEP 3: pages have not been resolved yet
+        kids = d["Trailer"]["Root"]["Pages"]["Kids"]
+        assert all([isinstance(x, reference) for x in list.__iter__(kids)])
+
+        # STEP 4: get a single Page
+        p = d.get_page(7)
+        assert isinstance(p, Page)
+        assert p.get_document() == d
+        assert not isinstance(p["Resources"], reference)
+        assert sum([1 for x in list.__iter__(kids) if isinstance(x, Page)]) <= 8
+
+        # STEP 5: (inherited) attributes are resolved on access
+        assert p["Parent"] is d["Trailer"]["Root"]["Pages"]
+        assert p["Parent"]["Kids"][7] is p
+
+        # STEP 6: process
+        text = Pipeline([Source(), GetText()]).process(d)
+        assert text[7] == "Lorem ipsum page 7"
+
+    def test_read_lazy_nested_page_tree(self):
+        # STEP 1: create PDF (with 2 intermediate page-tree nodes)
+        d: Document = Document()
+        for i in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(f"Lorem ipsum page {i}"))
+        root = d["Trailer"]["Root"]["Pages"]
+        nodes = []
+        for kids in [root["Kids"][0:4], root["Kids"][4:10]]:
+            node = {
+                name("Type"): name("Pages"),
+                name("Kids"): kids,
+                name("Count"): len(kids),
+                name("Parent"): root,
+            }
+            for k in kids:
+                k[name("Parent")] = node
+            nodes += [node]
+        root[name("Kids")] = nodes
+        PDF.write(what=d, where_to="assets/test_read_lazy_nested_page_tree.pdf")
+
+        # STEP 2: read PDF (lazily)
+        d = PDF.read(where_from="assets/test_read_lazy_nested_page_tree.pdf", lazy=True)
+        assert d.get_number_of_pages() == 10
+        for i in [7, 0, 3, 4, 9, -1]:
+            p = d.get_page(i)
+            assert isinstance(p, Page)
+            assert d.get_page_nr(p) == (i % 10)
+            assert p["Parent"]["Count"] == (4 if (i % 10) < 4 else 6)
+
+        # STEP 3: a copy of a (lazy) Page is resolved (and no longer lazy)
+        p = copy.deepcopy(d.get_page(7))
+        assert type(p) is Page
+        assert not isinstance(p["Resources"], reference)
+
+        # STEP 4: so is a pickled (lazy) Page
+        p = pickle.loads(pickle.dumps(d.get_page(4)))
+        assert type(p) is Page
+        assert not isinstance(p["Resources"], reference)
+
+    def test_read_lazy_page_tree_with_empty_and_multi_page_nodes(self):
+        # STEP 1: create PDF (/Kids [ <</Count 0>> Page <</Count 2>> ])
+        d: Document = Document()
+        for i in range(0, 3):
+            p: Page = Page()
+            d.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(f"Lorem ipsum page {i}"))
+        root = d["Trailer"]["Root"]["Pages"]
+        pages = [x for x in root["Kids"]]
+        empty_node = {
+            name("Type"): name("Pages"),
+            name("Kids"): [],
+            name("Count"): 0,
+            name("Parent"): root,
+        }
+        multi_page_node = {
+            name("Type"): name("Pages"),
+            name("Kids"): pages[1:3],
+            name("Count"): 2,
+            name("Parent"): root,
+        }
+        for k in pages[1:3]:
+            k[name("Parent")] = multi_page_node
+        root[name("Kids")] = [empty_node, pages[0], multi_page_node]
+        PDF.write(what=d, where_to="assets/test_read_lazy_empty_page_tree_node.pdf")
+
+        # STEP 2: read PDF (lazily and eagerly)
+        for lazy in [True, False]:
+            d = PDF.read(
+                where_from="assets/test_read_lazy_empty_page_tree_node.pdf", lazy=lazy
+            )
+            assert d.get_number_of_pages() == 3
+            for i in [0, 1, 2, -1, -3]:
+                p = d.get_page(i)
+                assert isinstance(p, Page)
+                assert d.get_page_nr(p) == (i % 3)
+            assert d.get_page(1)["Parent"]["Count"] == 2
+            with self.assertRaises(IndexError):
+                d.get_page(3)
@@ -0,0 +1,65 @@
+import unittest
+
+from borb.pdf import (
+    Document,
+    Page,
+    PageLayout,
+    SingleColumnLayout,
+    Paragraph,
+    Lipsum,
+    PDF,
+)
+from borb.pdf.primitives import stream
+from borb.pdf.toolkit.pipeline import Pipeline
+from borb.pdf.toolkit.sink.get_text import GetText
+from borb.pdf.toolkit.source.operator.source import Source
+
+
+class TestReadMemoryMap(unittest.TestCase):
+    def test_read_memory_map(self):
+        # STEP 1: create PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(32)))
+        PDF.write(what=d, where_to="assets/test_read_memory_map_001.pdf")
+
+        # STEP 2: read PDF (memory-mapped)
+        d = PDF.read(where_from="assets/test_read_memory_map_001.pdf", memory_map=True)
+        assert d.get_number_of_pages() == 1
+
+        # STEP 3: the (raw) stream bytes are a view on the file
+        contents: stream = d.get_page(0)["Contents"]
+        assert isinstance(contents.get("Bytes"), memoryview)
+
+        # STEP 4: process
+        text = Pipeline([Source(), GetText()]).process(d)
+        assert len(text[0]) > 0
+
+        # STEP 5: write PDF
+        PDF.write(what=d, where_to="assets/test_read_memory_map_002.pdf")
+
+    def test_write_memory_mapped_document_to_the_file_it_was_read_from(self):
+        # STEP 1: create PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(32)))
+        PDF.write(what=d, where_to="assets/test_read_memory_map_003.pdf")
+
+        # STEP 2: read PDF (memory-mapped)
+        d = PDF.read(where_from="assets/test_read_memory_map_003.pdf", memory_map=True)
+        contents: stream = d.get_page(0)["Contents"]
+        assert isinstance(contents.get("Bytes"), memoryview)
+
+        # STEP 3: write PDF to the file it was read from
+        PDF.write(what=d, where_to="assets/test_read_memory_map_003.pdf")
+        assert isinstance(contents.get("Bytes"), bytes)
+
+        # STEP 4: the file was written (rather than truncated while it was mapped)
+        with open("assets/test_read_memory_map_003.pdf", "rb") as pdf_file_handle:
+            bts: bytes = pdf_file_handle.read()
+        assert bts.startswith(b"%PDF")
+        assert contents["Bytes"] in bts
@@ -0,0 +1,88 @@
+import pathlib
+import unittest
+import zlib
+from unittest import mock
+
+from borb.pdf import PDF
+from borb.pdf.visitor.read import reference_visitor
+
+
+class TestReadObjectStream(unittest.TestCase):
+
+    def test_read_object_stream(self):
+
+        for n in [250, 1000]:
+
+            # step 1: build PDF
+            # n dictionaries (and the catalog, pages and items) are members of one object stream
+            members: list = [
+                b"<< /Type /Catalog /Pages 2 0 R /Items 3 0 R >>",
+                b"<< /Type /Pages /Kids [] /Count 0 >>",
+                b"[" + b" ".join([b"%d 0 R" % (4 + i) for i in range(0, n)]) + b"]",
+            ]
+            members += [b"<< /Value %d /Pages 2 0 R >>" % i for i in range(0, n)]
+            object_stm_header: bytes = b""
+            object_stm_body: bytes = b""
+            for i, member in enumerate(members):
+                object_stm_header += b"%d %d " % (i + 1, len(object_stm_body))
+                object_stm_body += member + b"\n"
+            object_stm_bytes: bytes = zlib.compress(object_stm_header + object_stm_body)
+            object_stm_nr: int = len(members) + 1
+            xref_stm_nr: int = len(members) + 2
+            out: bytes = b"%PDF-1.7\n%" + b"0" * 1024 + b"\n"
+            object_stm_byte_offset: int = len(out)
+            out += b"%d 0 obj\n" % object_stm_nr
+            out += (
+                b"<< /Type /ObjStm /N %d /First %d /Filter /FlateDecode /Length %d >>\n"
+                % (
+                    len(members),
+                    len(object_stm_header),
+                    len(object_stm_bytes),
+                )
+            )
+            out += b"stream\n" + object_stm_bytes + b"\nendstream\nendobj\n"
+            xref_stm_byte_offset: int = len(out)
+            xref_stm_bytes: bytes = (
+                b"\x00" + (0).to_bytes(4, "big") + (65535).to_bytes(4, "big")
+            )
+            for i in range(0, len(members)):
+                xref_stm_bytes += (
+                    b"\x02" + object_stm_nr.to_bytes(4, "big") + i.to_bytes(4, "big")
+                )
+            for byte_offset in [object_stm_byte_offset, xref_stm_byte_offset]:
+                xref_stm_bytes += (
+                    b"\x01" + byte_offset.to_bytes(4, "big") + (0).to_bytes(4, "big")
+                )
+            xref_stm_bytes = zlib.compress(xref_stm_bytes)
+            out += b"%d 0 obj\n" % xref_stm_nr
+            out += (
+                b"<< /Type /XRef /Size %d /W [1 4 4] /Root 1 0 R /Filter /FlateDecode /Length %d >>\n"
+                % (
+                    xref_stm_nr + 1,
+                    len(xref_stm_bytes),
+                )
+            )
+            out += b"stream\n" + xref_stm_bytes + b"\nendstream\nendobj\n"
+            out += b"startxref\n%d\n%%%%EOF" % xref_stm_byte_offset
+            path: pathlib.Path = pathlib.Path(f"assets/test_read_object_stream_{n}.pdf")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(out)
+
+            # step 2: read PDF
+            # count how often the object stream is decoded
+            with mock.patch.object(
+                reference_visitor,
+                "decode_stream",
+                side_effect=reference_visitor.decode_stream,
+            ) as decode_stream:
+                d = PDF.read(where_from=path)
+
+            # step 3: check some stuff
+            items = d["Trailer"]["Root"]["Items"]
+            assert len(items) == n
+            assert all([items[i]["Value"] == i for i in range(0, n)])
+            assert items[n - 1]["Pages"]["Type"] == "Pages"
+
+            # the object stream is decoded (and parsed) once
+            # rather than once for every object it holds
+            assert decode_stream.call_count == 1
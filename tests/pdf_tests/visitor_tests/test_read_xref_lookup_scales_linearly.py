@@ -0,0 +1,60 @@
+import pathlib
+import typing
+import unittest
+from unittest import mock
+
+from borb.pdf import PDF
+from borb.pdf.primitives import reference
+
+
+class TestReadXRefLookupScalesLinearly(unittest.TestCase):
+
+    def test_read_xref_lookup_scales_linearly(self):
+
+        number_of_lookups_per_size: typing.Dict[int, int] = {}
+        for n in [500, 2000]:
+
+            # step 1: build PDF
+            # every object refers to (another) object
+            # so every object triggers a lookup in the xref
+            objs: list = [
+                b"<< /Type /Catalog /Pages 2 0 R /Items 3 0 R >>",
+                b"<< /Type /Pages /Kids [] /Count 0 >>",
+                b"[" + b" ".join([b"%d 0 R" % (4 + i) for i in range(0, n)]) + b"]",
+            ]
+            objs += [b"<< /Value %d /Pages 2 0 R >>" % i for i in range(0, n)]
+            out: bytes = b"%PDF-1.7\n"
+            byte_offsets: list = []
+            for i, obj in enumerate(objs):
+                byte_offsets += [len(out)]
+                out += b"%d 0 obj\n" % (i + 1) + obj + b"\nendobj\n"
+            start_of_xref: int = len(out)
+            out += b"xref\n0 %d\n0000000000 65535 f\r\n" % (len(objs) + 1)
+            for byte_offset in byte_offsets:
+                out += b"%010d 00000 n\r\n" % byte_offset
+            out += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objs) + 1)
+            out += b"startxref\n%d\n%%%%EOF" % start_of_xref
+            path: pathlib.Path = pathlib.Path(f"assets/test_read_xref_lookup_{n}.pdf")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(out)
+
+            # step 2: read PDF
+            # count how often an object number is retrieved (from an xref entry)
+            # a linear scan of the xref does so for every entry, for every reference
+            with mock.patch.object(
+                reference,
+                "get_object_nr",
+                autospec=True,
+                side_effect=reference.get_object_nr,
+            ) as get_object_nr:
+                d = PDF.read(where_from=path)
+            number_of_lookups_per_size[n] = get_object_nr.call_count
+
+            # step 3: check some stuff
+            assert len(d["Trailer"]["Root"]["Items"]) == n
+            assert d["Trailer"]["Root"]["Items"][n - 1]["Value"] == n - 1
+
+        # step 4: compare
+        # 4 times as many objects should take (roughly) 4 times as many lookups
+        # a linear scan of the xref (for every reference) would take 16 times as many
+        assert number_of_lookups_per_size[2000] < number_of_lookups_per_size[500] * 8
@@ -0,0 +1,212 @@
+import io
+import pathlib
+import unittest
+
+from borb.pdf import (
+    Document,
+    Lipsum,
+    Page,
+    Paragraph,
+    PDF,
+    SingleColumnLayout,
+)
+from borb.pdf.primitives import name
+
+
+class TestWriteIncrementalUpdate(unittest.TestCase):
+
+    def test_write_incremental_update(self):
+        for use_object_streams, lazy in [(False, False), (False, True), (True, False)]:
+
+            # step 1: build PDF
+            d: Document = Document()
+            for i in range(0, 20):
+                p: Page = Page()
+                d.append_page(p)
+                SingleColumnLayout(p).append_layout_element(
+                    Paragraph(f"Page {i} " + Lipsum.generate_lorem_ipsum(128))
+                )
+            original: pathlib.Path = pathlib.Path(
+                f"assets/test_write_incremental_update_original_{use_object_streams}.pdf"
+            )
+            PDF.write(what=d, where_to=original, use_object_streams=use_object_streams)
+            original_bytes: bytes = original.read_bytes()
+
+            # step 2: read PDF, nothing was modified (yet)
+            d = PDF.read(where_from=original, incremental_update=True, lazy=lazy)
+            d.get_page(3)
+            assert (
+                d.get_incremental_update_snapshot().get_modified_references(d["XRef"])
+                == []
+            )
+
+            # step 3: modify a Page, and add an annotation (new objects)
+            d.get_page(3)[name("Rotate")] = 90
+            d.get_page(5)[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): "Lorem Ipsum",
+                }
+            ]
+            updated: pathlib.Path = pathlib.Path(
+                f"assets/test_write_incremental_update_{use_object_streams}_{lazy}.pdf"
+            )
+            PDF.write(what=d, where_to=updated, incremental_update=True)
+
+            # step 4: check some stuff
+            # the original bytes are kept (verbatim), only a small update is appended
+            updated_bytes: bytes = updated.read_bytes()
+            assert updated_bytes.startswith(original_bytes)
+            assert len(updated_bytes) - len(original_bytes) < 2048
+            assert b"/Prev" in updated_bytes[len(original_bytes) :]
+
+            # step 5: read PDF (again)
+            d = PDF.read(where_from=updated)
+
+            # step 6: check some stuff
+            assert d.get_number_of_pages() == 20
+            assert d.get_page(3)["Rotate"] == 90
+            assert d.get_page(4).get("Rotate", 0) == 0
+            assert d.get_page(5)["Annots"][0]["Contents"] == "Lorem Ipsum"
+
+    def test_write_incremental_update_without_modifications(self):
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 20):
+            p: Page = Page()
+            d.append_page(p)
+            SingleColumnLayout(p).append_layout_element(
+                Paragraph(f"Page {i} " + Lipsum.generate_lorem_ipsum(128))
+            )
+        original: pathlib.Path = pathlib.Path(
+            "assets/test_write_incremental_update_without_modifications.pdf"
+        )
+        PDF.write(what=d, where_to=original, use_object_streams=False)
+
+        # step 2: read PDF, and write it (as an incremental update)
+        d = PDF.read(where_from=original, incremental_update=True)
+        bytes_io: io.BytesIO = io.BytesIO()
+        PDF.write(what=d, where_to=bytes_io, incremental_update=True)
+
+        # step 3: check some stuff
+        assert bytes_io.getvalue() == original.read_bytes()
+
+    def test_write_incremental_update_appends_to_original_file(self):
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 20):
+            p: Page = Page()
+            d.append_page(p)
+            SingleColumnLayout(p).append_layout_element(
+                Paragraph(f"Page {i} " + Lipsum.generate_lorem_ipsum(128))
+            )
+        original: pathlib.Path = pathlib.Path(
+            "assets/test_write_incremental_update_appends_to_original_file.pdf"
+        )
+        PDF.write(what=d, where_to=original, use_object_streams=False)
+        original_size: int = original.stat().st_size
+
+        # step 2: read PDF, and write (twice) to the file the Document was read from
+        d = PDF.read(where_from=original, incremental_update=True, memory_map=True)
+        d.get_page(1)[name("Rotate")] = 90
+        PDF.write(what=d, where_to=original, incremental_update=True)
+        assert (
+            d.get_incremental_update_snapshot().get_modified_references(d["XRef"]) == []
+        )
+        d.get_page(2)[name("Rotate")] = 180
+        PDF.write(what=d, where_to=original, incremental_update=True)
+        assert original.stat().st_size - original_size < 2048
+
+        # step 3: read PDF (again)
+        d = PDF.read(where_from=original)
+        assert d.get_page(1)["Rotate"] == 90
+        assert d.get_page(2)["Rotate"] == 180
+
+    def test_write_incremental_update_falls_back_to_full_write(self):
+        # a Document that was not read from a file is written as a whole
+        d: Document = Document()
+        d.append_page(Page())
+        bytes_io: io.BytesIO = io.BytesIO()
+        PDF.write(what=d, where_to=bytes_io, incremental_update=True)
+        assert bytes_io.getvalue().startswith(b"%PDF")
+
+        # a Document whose file has changed (since it was read) is written as a whole
+        d = Document()
+        for i in range(0, 20):
+            p: Page = Page()
+            d.append_page(p)
+            SingleColumnLayout(p).append_layout_element(
+                Paragraph(f"Page {i} " + Lipsum.generate_lorem_ipsum(128))
+            )
+        original: pathlib.Path = pathlib.Path(
+            "assets/test_write_incremental_update_falls_back_to_full_write.pdf"
+        )
+        PDF.write(what=d, where_to=original, use_object_streams=False)
+        d = PDF.read(where_from=original, incremental_update=True)
+        with open(original, "ab") as fh:
+            fh.write(b"% modified\n")
+        assert d.get_incremental_update_snapshot().get_source() is None
+        bytes_io = io.BytesIO()
+        PDF.write(what=d, where_to=bytes_io, incremental_update=True)
+        assert not bytes_io.getvalue().startswith(original.read_bytes())
+        assert PDF.read(where_from=original).get_number_of_pages() == 20
+
+    def test_write_incremental_update_appended_page(self):
+        # step 1: build PDF
+        # the page-tree holds a cycle (/Parent -> /Kids -> Page)
+        d: Document = Document()
+        for i in range(0, 20):
+            p: Page = Page()
+            d.append_page(p)
+            SingleColumnLayout(p).append_layout_element(
+                Paragraph(f"Page {i} " + Lipsum.generate_lorem_ipsum(128))
+            )
+        original: pathlib.Path = pathlib.Path(
+            "assets/test_write_incremental_update_appended_page.pdf"
+        )
+        PDF.write(what=d, where_to=original, use_object_streams=False)
+
+        # step 2: read PDF, append a Page, and write it (as an incremental update)
+        d = PDF.read(where_from=original, incremental_update=True)
+        p = Page()
+        d.append_page(p)
+        SingleColumnLayout(p).append_layout_element(Paragraph("Lorem Ipsum"))
+        PDF.write(
+            what=d,
+            where_to="assets/test_write_incremental_update_appended_page_001.pdf",
+            incremental_update=True,
+        )
+        updated: pathlib.Path = pathlib.Path(
+            "assets/test_write_incremental_update_appended_page_001.pdf"
+        )
+        assert updated.read_bytes().startswith(original.read_bytes())
+
+        # step 3: read PDF (again)
+        d = PDF.read(where_from=updated)
+        assert d.get_number_of_pages() == 21
+        assert d.get_page(20)["Parent"] is d["Trailer"]["Root"]["Pages"]
+
+    def test_read_without_incremental_update_keeps_no_snapshot(self):
+        # step 1: build PDF
+        d: Document = Document()
+        for i in range(0, 20):
+            p: Page = Page()
+            d.append_page(p)
+            SingleColumnLayout(p).append_layout_element(
+                Paragraph(f"Page {i} " + Lipsum.generate_lorem_ipsum(128))
+            )
+        original: pathlib.Path = pathlib.Path(
+            "assets/test_read_without_incremental_update_keeps_no_snapshot.pdf"
+        )
+        PDF.write(what=d, where_to=original, use_object_streams=False)
+
+        # step 2: read PDF (without incremental update)
+        d = PDF.read(where_from=original)
+        assert d.get_incremental_update_snapshot() is None
+
+        # step 3: write PDF (the Document is written as a whole)
+        bytes_io: io.BytesIO = io.BytesIO()
+        PDF.write(what=d, where_to=bytes_io, incremental_update=True)
+        assert not bytes_io.getvalue().startswith(original.read_bytes())
@@ -0,0 +1,158 @@
+import copy
+import io
+import unittest
+
+from borb.pdf import Document, Page, PDF
+from borb.pdf.conformance import Conformance
+from borb.pdf.primitives import name, stream
+
+
+class TestWriteObjectStreams(unittest.TestCase):
+
+    def test_write_object_streams_is_smaller(self):
+        # step 1: build PDF
+        # every page holds a content stream and an annotation
+        d: Document = Document()
+        for i in range(0, 200):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"BT ET"})
+            p[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): f"Note {i}",
+                }
+            ]
+
+        # step 2: write PDF (without object streams)
+        bytes_io: io.BytesIO = io.BytesIO()
+        PDF.write(what=copy.deepcopy(d), where_to=bytes_io, use_object_streams=False)
+        bts_001: bytes = bytes_io.getvalue()
+
+        # step 3: write PDF (with object streams)
+        bytes_io = io.BytesIO()
+        PDF.write(what=copy.deepcopy(d), where_to=bytes_io, use_object_streams=True)
+        bts_002: bytes = bytes_io.getvalue()
+
+        # step 4: check some stuff
+        assert b"/ObjStm" not in bts_001
+        assert b"/ObjStm" in bts_002
+        assert b"/Type /XRef" in bts_002
+        assert b"\nxref\n" not in bts_002
+        assert len(bts_002) < len(bts_001) * 0.8
+
+    def test_write_object_streams_can_be_read(self):
+        # step 1: build PDF
+        # every page holds a content stream and an annotation
+        d: Document = Document()
+        for i in range(0, 200):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"BT ET"})
+            p[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): f"Note {i}",
+                }
+            ]
+
+        # step 2: write PDF
+        PDF.write(
+            what=d,
+            where_to="assets/test_write_object_streams_can_be_read.pdf",
+            use_object_streams=True,
+        )
+
+        # step 3: read PDF
+        d = PDF.read(where_from="assets/test_write_object_streams_can_be_read.pdf")
+
+        # step 4: check some stuff
+        assert d.get_number_of_pages() == 200
+        assert isinstance(d.get_page(0), Page)
+        assert d.get_page(0)["Annots"][0]["Contents"] == "Note 0"
+        assert d.get_page(199)["Annots"][0]["Contents"] == "Note 199"
+        assert d.get_page(199)["Contents"]["DecodedBytes"] == b"BT ET"
+
+    def test_write_object_streams_can_be_read_and_written_again(self):
+        # step 1: build PDF
+        # every page holds a content stream and an annotation
+        d: Document = Document()
+        for i in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"BT ET"})
+            p[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): f"Note {i}",
+                }
+            ]
+
+        # step 2: write PDF
+        PDF.write(
+            what=d,
+            where_to="assets/test_write_object_streams_can_be_read_and_written_again_001.pdf",
+            use_object_streams=True,
+        )
+
+        # step 3: read PDF, and write it (without object streams)
+        d = PDF.read(
+            where_from="assets/test_write_object_streams_can_be_read_and_written_again_001.pdf"
+        )
+        PDF.write(
+            what=d,
+            where_to="assets/test_write_object_streams_can_be_read_and_written_again_002.pdf",
+        )
+
+        # step 4: check some stuff
+        # the trailer is not the dictionary of a cross-reference stream
+        with open(
+            "assets/test_write_object_streams_can_be_read_and_written_again_002.pdf",
+            "rb",
+        ) as pdf_file_handle:
+            bts: bytes = pdf_file_handle.read()
+        trailer: bytes = bts[bts.rfind(b"trailer") :]
+        assert b"/Filter" not in trailer
+        assert b"/XRef" not in trailer
+
+        # step 5: read PDF (again)
+        d = PDF.read(
+            where_from="assets/test_write_object_streams_can_be_read_and_written_again_002.pdf"
+        )
+
+        # step 6: check some stuff
+        assert d.get_number_of_pages() == 10
+        assert d.get_page(9)["Annots"][0]["Contents"] == "Note 9"
+        assert d.get_page(9)["Contents"]["DecodedBytes"] == b"BT ET"
+
+    def test_write_object_streams_is_ignored_for_pdf_a_1(self):
+        # step 1: build PDF
+        # every page holds a content stream and an annotation
+        d: Document = Document(Conformance.PDF_A_1B)
+        for i in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"BT ET"})
+            p[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): f"Note {i}",
+                }
+            ]
+
+        # step 2: write PDF (with object streams)
+        bytes_io: io.BytesIO = io.BytesIO()
+        PDF.write(what=d, where_to=bytes_io, use_object_streams=True)
+        bts: bytes = bytes_io.getvalue()
+
+        # step 3: check some stuff
+        assert b"/ObjStm" not in bts
+        assert b"\nxref\n" in bts
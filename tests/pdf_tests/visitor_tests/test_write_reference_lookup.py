@@ -0,0 +1,107 @@
+import io
+import typing
+import unittest
+
+from borb.pdf import Document, Page, PDF
+from borb.pdf.primitives import name, reference, stream
+from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+
+
+class TestWriteReferenceLookup(unittest.TestCase):
+
+    def test_get_reference(self):
+        # step 1: build PDF
+        # every page has a (text) annotation
+        d: Document = Document()
+        for i in range(0, 10):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"BT ET"})
+            p[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): f"Note {i}",
+                }
+            ]
+
+        # step 2: write PDF
+        rv: FacadeVisitor = FacadeVisitor()
+        rv.visit(node=d)
+
+        # step 3: check some stuff
+        # every object in the XRef is found
+        xref: typing.List[reference] = d["XRef"]
+        assert len(xref) > 0
+        for x in xref:
+            assert rv.get_reference(x.get_referenced_object()) is x
+
+        # objects that are not in the XRef are returned as-is
+        rect: typing.List[int] = [0, 0, 10, 10]
+        assert rv.get_reference(rect) is rect
+
+    def test_get_reference_after_xref_changes(self):
+        # step 1: build PDF
+        # every page has a (text) annotation
+        d: Document = Document()
+        for i in range(0, 2):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"BT ET"})
+            p[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): f"Note {i}",
+                }
+            ]
+
+        # step 2: write PDF
+        rv: FacadeVisitor = FacadeVisitor()
+        rv.visit(node=d)
+
+        # step 3: check some stuff
+        obj: dict = {name("Type"): name("Foo")}
+        assert rv.get_reference(obj) is obj
+
+        # add an object to the XRef
+        xref: typing.List[reference] = d["XRef"]
+        obj_ref: reference = reference(
+            object_nr=len(xref) + 1,
+            generation_nr=0,
+            referenced_object=obj,
+        )
+        xref += [obj_ref]
+        assert rv.get_reference(obj) is obj_ref
+
+    def test_write_many_objects(self):
+        # step 1: build PDF
+        # every page has a (text) annotation
+        d: Document = Document()
+        for i in range(0, 200):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"BT ET"})
+            p[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): f"Note {i}",
+                }
+            ]
+
+        # step 2: write PDF
+        bytes_io: io.BytesIO = io.BytesIO()
+        PDF.write(what=d, where_to=bytes_io)
+
+        # step 3: read PDF
+        with open("assets/test_write_many_objects.pdf", "wb") as fh:
+            fh.write(bytes_io.getvalue())
+        d = PDF.read(where_from="assets/test_write_many_objects.pdf")
+
+        # step 4: check some stuff
+        assert d.get_number_of_pages() == 200
+        assert d.get_page(199)["Annots"][0]["Contents"] == "Note 199"
@@ -0,0 +1,54 @@
+import pathlib
+import re
+import typing
+import unittest
+
+from borb.pdf import Document, Page, PDF
+from borb.pdf.primitives import name, reference, stream
+
+
+class TestWriteScalesLinearly(unittest.TestCase):
+
+    def test_write_scales_linearly(self):
+
+        # step 1: build PDF
+        # every page holds a content stream and an annotation
+        # so every page adds 5 objects to the xref
+        d: Document = Document()
+        for i in range(0, 1000):
+            p: Page = Page()
+            d.append_page(p)
+            p[name("Contents")] = stream({name("DecodedBytes"): b"BT ET"})
+            p[name("Annots")] = [
+                {
+                    name("Type"): name("Annot"),
+                    name("Subtype"): name("Text"),
+                    name("Rect"): [0, 0, 10, 10],
+                    name("Contents"): f"Note {i}",
+                }
+            ]
+
+        # step 2: write PDF
+        PDF.write(what=d, where_to="assets/test_write_scales_linearly.pdf")
+        bts: bytes = pathlib.Path("assets/test_write_scales_linearly.pdf").read_bytes()
+
+        # step 3: check some stuff
+        # object numbers are handed out in order, starting at 1
+        xref: typing.List[reference] = d["XRef"]
+        assert len(xref) == 5 * 1000 + 3
+        assert [x.get_object_nr() for x in xref] == list(range(1, len(xref) + 1))
+
+        # every object is written exactly once
+        object_nrs: typing.List[int] = [
+            int(m.group(1)) for m in re.finditer(rb"(?m)^(\d+) 0 obj", bts)
+        ]
+        assert sorted(object_nrs) == list(range(1, len(xref) + 1))
+
+        # the xref (of the written PDF) has an entry for every object
+        # and every entry points to the object it belongs to
+        start_of_xref: int = bts.rindex(b"\nxref\n") + 1
+        xref_lines: typing.List[bytes] = bts[start_of_xref:].split(b"\n")
+        assert xref_lines[1] == b"0 %d" % (len(xref) + 1)
+        for i in range(1, len(xref) + 1):
+            byte_offset: int = int(xref_lines[2 + i][0:10])
+            assert bts.startswith(b"%d 0 obj" % i, byte_offset)
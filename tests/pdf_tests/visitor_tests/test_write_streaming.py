@@ -0,0 +1,115 @@
+import copy
+import io
+import os
+import pathlib
+import tracemalloc
+import unittest
+import zlib
+
+from borb.pdf import (
+    Document,
+    PageLayout,
+    SingleColumnLayout,
+    Paragraph,
+    Lipsum,
+    Page,
+    PDF,
+)
+from borb.pdf.primitives import name, stream
+from borb.pdf.visitor.write_new.facade_visitor import FacadeVisitor
+
+
+class TestWriteStreaming(unittest.TestCase):
+
+    def test_write_to_bytes_io_path_and_buffer_is_identical(self):
+        # step 1: build PDF
+        # the same Document (/ID, /CreationDate, etc) is written 3 times
+        d0: Document = Document()
+        for _ in range(0, 5):
+            p: Page = Page()
+            d0.append_page(p)
+            l: PageLayout = SingleColumnLayout(p)
+            l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(256)))
+
+        # step 2: write PDF to FacadeVisitor (internal buffer)
+        d: Document = copy.deepcopy(d0)
+        rv: FacadeVisitor = FacadeVisitor()
+        d._Document__resolve_all_references()  # type: ignore[attr-defined]
+        rv.visit(node=d)
+        bts_001: bytes = rv.bytes()
+        assert rv.tell() == len(bts_001)
+
+        # step 3: write PDF to io.BytesIO (that already holds some bytes)
+        d = copy.deepcopy(d0)
+        bytes_io: io.BytesIO = io.BytesIO()
+        bytes_io.write(b"Lorem Ipsum")
+        PDF.write(what=d, where_to=bytes_io)
+        bts_002: bytes = bytes_io.getvalue()[len(b"Lorem Ipsum") :]
+
+        # step 4: write PDF to pathlib.Path
+        d = copy.deepcopy(d0)
+        PDF.write(what=d, where_to="assets/test_write_streaming.pdf")
+        bts_003: bytes = pathlib.Path("assets/test_write_streaming.pdf").read_bytes()
+
+        # step 5: check some stuff
+        assert bts_001 == bts_002
+        assert bts_001 == bts_003
+
+        # the xref offsets are relative to the start of the PDF (not the start of the file handle)
+        d = PDF.read(where_from="assets/test_write_streaming.pdf")
+        assert d.get_number_of_pages() == 5
+
+    def test_bytes_are_not_kept_when_streaming(self):
+        # step 1: build PDF
+        d: Document = Document()
+        p: Page = Page()
+        d.append_page(p)
+        l: PageLayout = SingleColumnLayout(p)
+        l.append_layout_element(Paragraph(Lipsum.generate_lorem_ipsum(256)))
+
+        # step 2: write PDF (to a file handle)
+        d._Document__resolve_all_references()  # type: ignore[attr-defined]
+        rv: FacadeVisitor = FacadeVisitor(destination=io.BytesIO())
+        rv.visit(node=d)
+
+        # step 3: check some stuff
+        assert rv.tell() > 0
+        with self.assertRaises(AssertionError):
+            rv.bytes()
+
+    def test_write_does_not_keep_output_in_memory(self):
+        # step 1: build PDF
+        # a Document with (incompressible) content streams of 128Kb each
+        d: Document = Document()
+        for _ in range(0, 40):
+            p: Page = Page()
+            d.append_page(p)
+            bts: bytes = os.urandom(128 * 1024)
+            p[name("Contents")] = stream(
+                {
+                    name("DecodedBytes"): bts,
+                    name("Bytes"): zlib.compress(bts),
+                    name("Filter"): name("FlateDecode"),
+                }
+            )
+
+        # step 2: write PDF
+        # write once, so that everything the Document itself keeps is in place
+        PDF.write(
+            what=d, where_to="assets/test_write_does_not_keep_output_in_memory.pdf"
+        )
+
+        # step 3: write PDF again (measuring memory)
+        tracemalloc.start()
+        PDF.write(
+            what=d, where_to="assets/test_write_does_not_keep_output_in_memory.pdf"
+        )
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        size: int = os.path.getsize(
+            "assets/test_write_does_not_keep_output_in_memory.pdf"
+        )
+
+        # step 4: check some stuff
+        assert size > 5 * 2**20
+        assert peak < size / 2